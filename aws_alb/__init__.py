@@ -0,0 +1,90 @@
+"""
+Public API of the library.
+
+Names are resolved lazily on the first access: "import aws_alb" does not import CDK. Modules with
+constructs (e.g. ApplicationLoadbalancer) load CDK only when they are accessed, while enums and
+params classes can be used by tooling (e.g. config validators) without loading CDK at all.
+"""
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
+# Public name and a module which defines it.
+_PUBLIC_API = {
+    # Constructs and construct helpers (import CDK).
+    'ApplicationLoadbalancer': 'aws_alb.application_loadbalancer',
+    'CloudFrontLoadbalancer': 'aws_alb.cloudfront_loadbalancer',
+    'ListenerActions': 'aws_alb.listener_actions',
+    'LoadBalancerListeners': 'aws_alb.loadbalancer_listeners',
+    'LoadBalancerSecurityGroup': 'aws_alb.loadbalancer_sg',
+    'RequestCountScaling': 'aws_alb.request_count_scaling',
+    # Enums.
+    'AlbPerformanceProfile': 'aws_alb.alb_performance_profile',
+    'AlbTrafficEnum': 'aws_alb.alb_traffic_enum',
+    'AlbType': 'aws_alb.alb_type',
+    'LatencySloPreset': 'aws_alb.latency_slo_preset',
+    'TrafficShiftEnum': 'aws_alb.traffic_shift_enum',
+    # Calculators and validators.
+    'HealthCheckCalculator': 'aws_alb.health_check_calculator',
+    'ListenerRuleOptimizer': 'aws_alb.listener_rule_optimizer',
+    'ListenerRulePatterns': 'aws_alb.listener_rule_patterns',
+    'TemplateBudgetAnalyzer': 'aws_alb.template_budget_analyzer',
+    'TrafficShiftSchedule': 'aws_alb.traffic_shift_schedule',
+    # Params.
+    'AccessLogsParams': 'aws_alb.params.access_logs_params',
+    'CacheBehaviorParams': 'aws_alb.params.cache_behavior_params',
+    'CloudFrontParams': 'aws_alb.params.cloudfront_params',
+    'ListenerParams': 'aws_alb.params.listener_params',
+    'ListenerRuleParams': 'aws_alb.params.listener_rule_params',
+    'LoadBalancerAttributes': 'aws_alb.params.loadbalancer_attributes',
+    'MonitoringParams': 'aws_alb.params.monitoring_params',
+    'TargetGroupAttributes': 'aws_alb.params.target_group_attributes',
+    'TargetGroupParams': 'aws_alb.params.target_group_params',
+    'TemplateBudgetParams': 'aws_alb.params.template_budget_params',
+}
+
+__all__ = list(_PUBLIC_API)
+
+if TYPE_CHECKING:
+    from aws_alb.alb_performance_profile import AlbPerformanceProfile
+    from aws_alb.alb_traffic_enum import AlbTrafficEnum
+    from aws_alb.alb_type import AlbType
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+    from aws_alb.cloudfront_loadbalancer import CloudFrontLoadbalancer
+    from aws_alb.health_check_calculator import HealthCheckCalculator
+    from aws_alb.latency_slo_preset import LatencySloPreset
+    from aws_alb.listener_actions import ListenerActions
+    from aws_alb.listener_rule_optimizer import ListenerRuleOptimizer
+    from aws_alb.listener_rule_patterns import ListenerRulePatterns
+    from aws_alb.loadbalancer_listeners import LoadBalancerListeners
+    from aws_alb.loadbalancer_sg import LoadBalancerSecurityGroup
+    from aws_alb.params.access_logs_params import AccessLogsParams
+    from aws_alb.params.cache_behavior_params import CacheBehaviorParams
+    from aws_alb.params.cloudfront_params import CloudFrontParams
+    from aws_alb.params.listener_params import ListenerParams
+    from aws_alb.params.listener_rule_params import ListenerRuleParams
+    from aws_alb.params.loadbalancer_attributes import LoadBalancerAttributes
+    from aws_alb.params.monitoring_params import MonitoringParams
+    from aws_alb.params.target_group_attributes import TargetGroupAttributes
+    from aws_alb.params.target_group_params import TargetGroupParams
+    from aws_alb.params.template_budget_params import TemplateBudgetParams
+    from aws_alb.request_count_scaling import RequestCountScaling
+    from aws_alb.template_budget_analyzer import TemplateBudgetAnalyzer
+    from aws_alb.traffic_shift_enum import TrafficShiftEnum
+    from aws_alb.traffic_shift_schedule import TrafficShiftSchedule
+
+
+def __getattr__(name: str) -> Any:
+    module = _PUBLIC_API.get(name)
+
+    if module is None:
+        raise AttributeError(f'Module {__name__} has no attribute {name}.')
+
+    value = getattr(import_module(module), name)
+    # Cache the value, hence __getattr__ is called only once per name.
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
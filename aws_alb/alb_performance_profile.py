@@ -0,0 +1,13 @@
+from enum import auto, Enum
+
+
+class AlbPerformanceProfile(Enum):
+    """
+    Enum class which tells how loadbalancer attributes should be tuned for a given workload.
+    """
+    # Short request/response APIs. Short idle timeout, HTTP/2 and strict header handling.
+    LOW_LATENCY_API = auto()
+    # Long-polling and websocket connections. Long idle timeout to keep connections open.
+    LONG_POLLING = auto()
+    # Large request bodies. Long idle timeout and HTTP/1.1 connections to avoid multiplexing large streams.
+    BULK_UPLOAD = auto()
@@ -12,3 +12,14 @@ class AlbTrafficEnum(Enum):
     VPC = auto()
     # Do not allow traffic.
     NONE = auto()
+    # Allow IPv6 traffic to/from whole internet.
+    INTERNET_IPV6 = auto()
+    # Allow IPv4 and IPv6 traffic to/from whole internet.
+    INTERNET_DUALSTACK = auto()
+    # Allow IPv6 traffic to/from within VPC only. VPC must have an Amazon provided IPv6 CIDR block
+    # (CfnVPCCidrBlock) defined in the VPC or its stack.
+    VPC_IPV6 = auto()
+    # Allow IPv4 and IPv6 traffic to/from within VPC only. VPC must have an IPv6 CIDR block as above.
+    VPC_DUALSTACK = auto()
+    # Allow traffic to/from managed prefix lists only (e.g. CloudFront origin-facing servers).
+    PREFIX_LIST = auto()
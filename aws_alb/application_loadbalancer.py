@@ -1,11 +1,16 @@
 from typing import List, Optional
 from aws_alb.alb_traffic_enum import AlbTrafficEnum
 from aws_alb.alb_type import AlbType
+from aws_alb.loadbalancer_access_logs import LoadBalancerAccessLogs
 from aws_alb.loadbalancer_listeners import LoadBalancerListeners
+from aws_alb.loadbalancer_monitoring import LoadBalancerMonitoring
 from aws_cdk import core, aws_ec2
 from aws_cdk.aws_certificatemanager import CfnCertificate
 from aws_cdk.aws_elasticloadbalancingv2 import CfnLoadBalancer, CfnListener
 from aws_alb.loadbalancer_sg import LoadBalancerSecurityGroup
+from aws_alb.params.access_logs_params import AccessLogsParams
+from aws_alb.params.loadbalancer_attributes import LoadBalancerAttributes
+from aws_alb.params.monitoring_params import MonitoringParams
 
 
 class ApplicationLoadbalancer(CfnLoadBalancer):
@@ -23,7 +28,16 @@ class ApplicationLoadbalancer(CfnLoadBalancer):
             loadbalancer_subnets: List[aws_ec2.Subnet],
             security_groups: Optional[List[aws_ec2.ISecurityGroup]] = None,
             certificate: Optional[CfnCertificate] = None,
-            alb_type: AlbType = AlbType.PUBLIC
+            alb_type: AlbType = AlbType.PUBLIC,
+            attributes: Optional[LoadBalancerAttributes] = None,
+            additional_certificates: Optional[List[CfnCertificate]] = None,
+            ssl_policy: Optional[str] = None,
+            monitoring: Optional[MonitoringParams] = None,
+            access_logs: Optional[AccessLogsParams] = None,
+            ip_address_type: str = 'ipv4',
+            inbound_traffic: Optional[AlbTrafficEnum] = None,
+            prefix_list_ids: Optional[List[str]] = None,
+            loadbalancer_security_group: Optional[LoadBalancerSecurityGroup] = None
     ) -> None:
         """
         Constructor.
@@ -35,25 +49,56 @@ class ApplicationLoadbalancer(CfnLoadBalancer):
         :param security_groups: Additional security groups for a loadbalancer.
         :param certificate: Certificate to enable https traffic.
         :param alb_type: The type of a loadbalancer.
+        :param attributes: Loadbalancer attributes e.g. idle timeout or HTTP/2 support. Use
+        LoadBalancerAttributes.from_profile() to apply a named performance profile.
+        :param additional_certificates: Additional certificates to serve multiple domains (SNI)
+        by default https listeners.
+        :param ssl_policy: Security policy for default https listeners.
+        :param monitoring: If given, alarms and a dashboard are created for the loadbalancer
+        and every target group created through its listeners manager.
+        :param access_logs: If given, access logs are enabled and stored in a newly created bucket.
+        :param ip_address_type: Either ipv4 or dualstack. Dualstack loadbalancers accept IPv6 clients
+        directly. Subnets must have IPv6 CIDR blocks.
+        :param inbound_traffic: Inbound traffic of default listeners. If not given, it is derived from
+        the loadbalancer type and ip address type.
+        :param prefix_list_ids: Managed prefix list ids for AlbTrafficEnum.PREFIX_LIST inbound traffic
+        e.g. CloudFront origin-facing prefix list. Note, AWS counts a prefix list reference as
+        many rules as the maximum number of the prefix list entries.
+        :param loadbalancer_security_group: Security group shared by a fleet of loadbalancers with the same
+        traffic profile. Listener ports of all loadbalancers are opened in it and identical rules are written
+        once. If not given, a security group is created for this loadbalancer.
         """
-        self.__loadbalancer_security_group = LoadBalancerSecurityGroup(
+        assert ip_address_type in ('ipv4', 'dualstack'), 'Ip address type must be either ipv4 or dualstack.'
+
+        self.__loadbalancer_security_group = loadbalancer_security_group or LoadBalancerSecurityGroup(
             scope=scope,
             prefix=prefix,
             vpc=vpc,
         )
 
-        security_groups = security_groups or []
+        # Copied, hence the same list can be passed to every loadbalancer of a fleet.
+        security_groups = list(security_groups or [])
         security_groups.append(self.__loadbalancer_security_group)
 
+        dualstack = ip_address_type == 'dualstack'
+
         if alb_type == AlbType.PUBLIC:
             scheme = 'internet-facing'
-            inbound = AlbTrafficEnum.INTERNET
+            inbound = AlbTrafficEnum.INTERNET_DUALSTACK if dualstack else AlbTrafficEnum.INTERNET
         elif alb_type == AlbType.INTERNAL:
             scheme = 'internal'
-            inbound = AlbTrafficEnum.VPC
+            inbound = AlbTrafficEnum.VPC_DUALSTACK if dualstack else AlbTrafficEnum.VPC
         else:
             scheme = 'internet-facing'
-            inbound = AlbTrafficEnum.INTERNET
+            inbound = AlbTrafficEnum.INTERNET_DUALSTACK if dualstack else AlbTrafficEnum.INTERNET
+
+        inbound = inbound_traffic or inbound
+
+        self.__access_logs = LoadBalancerAccessLogs(scope, prefix, access_logs) if access_logs else None
+
+        load_balancer_attributes = attributes.to_attributes() if attributes else []
+        if self.__access_logs:
+            load_balancer_attributes += self.__access_logs.to_attributes()
 
         super().__init__(
             scope,
@@ -62,18 +107,56 @@ class ApplicationLoadbalancer(CfnLoadBalancer):
             subnets=[subnet.subnet_id for subnet in loadbalancer_subnets],
             type='application',
             scheme=scheme,
-            name=prefix + 'AppLoadBalancer'
+            name=prefix + 'AppLoadBalancer',
+            ip_address_type=ip_address_type if dualstack else None,
+            load_balancer_attributes=load_balancer_attributes or None
         )
 
-        self.__listeners_manager = LoadBalancerListeners(scope)
+        if self.__access_logs:
+            # Loadbalancer checks whether it can write to the bucket when access logs are enabled.
+            self.add_depends_on(self.__access_logs.bucket_policy)
+
+        self.__monitoring = LoadBalancerMonitoring(scope, prefix, self, monitoring) if monitoring else None
+
+        self.__listeners_manager = LoadBalancerListeners(scope, self.__monitoring)
         self.__prod_listener, self.__test_listener = self.__listeners_manager.create_default_listeners(
             prefix,
             self,
             certificate,
             inbound_traffic=inbound,
-            outbound_traffic=AlbTrafficEnum.VPC
+            outbound_traffic=AlbTrafficEnum.VPC,
+            certificates=additional_certificates,
+            ssl_policy=ssl_policy,
+            prefix_list_ids=prefix_list_ids
         )
 
+    @property
+    def listeners(self) -> LoadBalancerListeners:
+        """
+        Listeners manager of the loadbalancer. Use it to create additional listeners and target groups.
+
+        :return: Listeners manager.
+        """
+        return self.__listeners_manager
+
+    @property
+    def access_logs(self) -> Optional[LoadBalancerAccessLogs]:
+        """
+        Access logs bucket of the loadbalancer.
+
+        :return: Access logs instance or None if access logs are not enabled.
+        """
+        return self.__access_logs
+
+    @property
+    def monitoring(self) -> Optional[LoadBalancerMonitoring]:
+        """
+        Alarms and dashboard of the loadbalancer.
+
+        :return: Monitoring instance or None if monitoring is not enabled.
+        """
+        return self.__monitoring
+
     @property
     def default_prod_listener(self) -> CfnListener:
         return self.__prod_listener
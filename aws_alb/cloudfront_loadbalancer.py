@@ -0,0 +1,164 @@
+from typing import List, Optional
+from aws_cdk import core, aws_ec2
+from aws_cdk.aws_cloudfront import CfnDistribution
+from aws_cdk.aws_elasticloadbalancingv2 import CfnListener, CfnListenerRule
+from aws_alb.alb_traffic_enum import AlbTrafficEnum
+from aws_alb.alb_type import AlbType
+from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+from aws_alb.params.cloudfront_params import CloudFrontParams
+from aws_alb.params.listener_rule_params import ListenerRuleParams
+
+
+class CloudFrontLoadbalancer(ApplicationLoadbalancer):
+    """
+    Application loadbalancer fronted by a CloudFront distribution.
+
+    The loadbalancer accepts traffic only from CloudFront origin-facing servers and only on the
+    production port (443 with a certificate, 80 otherwise). Requests which do not carry the secret
+    origin header are answered with a 404 by the default action of the production listener,
+    hence do not replace that default action.
+
+    More about restricting access to loadbalancers:
+    https://docs.aws.amazon.com/AmazonCloudFront/latest/DeveloperGuide/restrict-access-to-load-balancer.html
+    """
+    ORIGIN_ID = 'Loadbalancer'
+
+    def __init__(
+            self,
+            scope: core.Stack,
+            prefix: str,
+            vpc: aws_ec2.Vpc,
+            loadbalancer_subnets: List[aws_ec2.Subnet],
+            cloudfront: CloudFrontParams,
+            origin_action: Optional[CfnListener.ActionProperty] = None,
+            **kwargs
+    ) -> None:
+        """
+        Constructor.
+
+        :param scope: A CloudFormation stack in which the resources should be added.
+        :param prefix: A prefix for newly created resources.
+        :param vpc: Virtual private cloud in which the security groups and a loadbalancer itself should be placed.
+        :param loadbalancer_subnets: Subnets in which the loadbalancer can live.
+        :param cloudfront: CloudFront distribution configuration.
+        :param origin_action: Action for requests coming from CloudFront e.g. forward to a target group.
+        If not given, call forward_origin_requests() later.
+        :param kwargs: Other ApplicationLoadbalancer parameters e.g. certificate.
+        """
+        cloudfront.validate()
+
+        assert not {'alb_type', 'inbound_traffic', 'prefix_list_ids'} & set(kwargs), (
+            'Traffic of a CloudFront fronted loadbalancer can not be configured.'
+        )
+
+        https = kwargs.get('certificate') is not None
+        # CloudFront verifies the origin certificate against the origin domain name. The loadbalancer
+        # DNS name (*.elb.amazonaws.com) never matches a certificate, hence every request would fail.
+        assert not https or cloudfront.origin_domain_name, (
+            'Origin domain name matching the loadbalancer certificate must be specified for https.'
+        )
+
+        # Default listeners do not accept any traffic. Only the production port is opened below.
+        super().__init__(
+            scope=scope,
+            prefix=prefix,
+            vpc=vpc,
+            loadbalancer_subnets=loadbalancer_subnets,
+            alb_type=AlbType.PUBLIC,
+            inbound_traffic=AlbTrafficEnum.NONE,
+            **kwargs
+        )
+
+        self.__prefix = prefix
+        self.__cloudfront_params = cloudfront
+        self.__origin_rule: Optional[CfnListenerRule] = None
+
+        # A single rule: AWS counts a prefix list reference as many rules as the prefix list has entries.
+        sg = self.security_group
+        for peer in sg.get_peers(AlbTrafficEnum.PREFIX_LIST, [cloudfront.prefix_list_id]):
+            sg.open_port(443 if https else 80, peer)
+
+        self.__distribution = CfnDistribution(
+            scope=scope,
+            id=prefix + 'Distribution',
+            distribution_config=CfnDistribution.DistributionConfigProperty(
+                enabled=True,
+                comment=f'A {prefix} load balancer distribution.',
+                http_version='http2',
+                ipv6_enabled=True,
+                price_class=cloudfront.price_class,
+                aliases=cloudfront.aliases or None,
+                viewer_certificate=self.__create_viewer_certificate(),
+                origins=[CfnDistribution.OriginProperty(
+                    id=self.ORIGIN_ID,
+                    domain_name=cloudfront.origin_domain_name or self.attr_dns_name,
+                    custom_origin_config=CfnDistribution.CustomOriginConfigProperty(
+                        origin_protocol_policy='https-only' if https else 'http-only',
+                        http_port=80,
+                        https_port=443,
+                        origin_ssl_protocols=['TLSv1.2'],
+                        origin_read_timeout=cloudfront.origin_read_timeout_seconds,
+                        origin_keepalive_timeout=cloudfront.origin_keepalive_timeout_seconds
+                    ),
+                    origin_custom_headers=[CfnDistribution.OriginCustomHeaderProperty(
+                        header_name=CloudFrontParams.ORIGIN_HEADER_NAME,
+                        header_value=cloudfront.origin_secret
+                    )]
+                )],
+                default_cache_behavior=cloudfront.default_cache_behavior.to_default_cache_behavior(self.ORIGIN_ID),
+                cache_behaviors=[
+                    behavior.to_cache_behavior(self.ORIGIN_ID) for behavior in cloudfront.cache_behaviors
+                ] or None
+            )
+        )
+
+        if origin_action:
+            self.forward_origin_requests(origin_action)
+
+    def forward_origin_requests(self, action: CfnListener.ActionProperty) -> CfnListenerRule:
+        """
+        Creates a production listener rule which applies the given action to requests carrying
+        the secret origin header. Other requests get the default action of the listener (404).
+
+        :param action: Action for requests coming from CloudFront e.g. forward to a target group.
+
+        :return: Listener rule instance.
+        """
+        assert self.__origin_rule is None, 'Origin requests are already forwarded.'
+
+        self.__origin_rule = self.listeners.create_listener_rule(ListenerRuleParams(
+            prefix=self.__prefix + 'OriginVerify',
+            listener=self.default_prod_listener,
+            action=action,
+            http_headers={CloudFrontParams.ORIGIN_HEADER_NAME: [self.__cloudfront_params.origin_secret]}
+        ))
+
+        return self.__origin_rule
+
+    @property
+    def distribution(self) -> CfnDistribution:
+        """
+        CloudFront distribution in front of the loadbalancer.
+
+        :return: Distribution.
+        """
+        return self.__distribution
+
+    @property
+    def origin_rule(self) -> Optional[CfnListenerRule]:
+        """
+        Listener rule which accepts requests coming from CloudFront.
+
+        :return: Listener rule or None if origin requests are not forwarded yet.
+        """
+        return self.__origin_rule
+
+    def __create_viewer_certificate(self) -> CfnDistribution.ViewerCertificateProperty:
+        if not self.__cloudfront_params.viewer_certificate_arn:
+            return CfnDistribution.ViewerCertificateProperty(cloud_front_default_certificate=True)
+
+        return CfnDistribution.ViewerCertificateProperty(
+            acm_certificate_arn=self.__cloudfront_params.viewer_certificate_arn,
+            ssl_support_method='sni-only',
+            minimum_protocol_version='TLSv1.2_2021'
+        )
@@ -1,4 +1,4 @@
-from aws_cdk.aws_elasticloadbalancingv2 import CfnListener
+from aws_cdk.aws_elasticloadbalancingv2 import CfnListener, CfnListenerCertificate
 from aws_cdk.core import Stack
 from aws_alb.listener_actions import ListenerActions
 from aws_alb.params.listener_params import ListenerParams
@@ -8,6 +8,9 @@ class ListenerFactory:
     """
     Factory class which creates listeners for loadbalancer.
     """
+    # Maximum number of certificates per listener certificate resource.
+    CERTIFICATES_PER_RESOURCE = 1
+
     def __init__(self, scope: Stack) -> None:
         """
         Constructor.
@@ -27,7 +30,8 @@ class ListenerFactory:
         assert listener_params.loadbalancer is not None, 'Loadbalancer must be specified.'
         assert listener_params.port is not None, 'Port must be specified.'
 
-        protocol = 'HTTPS' if listener_params.certificate else 'HTTP'
+        protocol = 'HTTPS' if listener_params.certificates else 'HTTP'
+        additional_certificates = listener_params.certificates[1:]
 
         listener = CfnListener(
             scope=self.__scope,
@@ -42,5 +46,20 @@ class ListenerFactory:
             listener.certificates = [
                 CfnListener.CertificateProperty(certificate_arn=listener_params.certificate.ref)
             ]
+            listener.ssl_policy = listener_params.ssl_policy
+
+        # Additional certificates are served by SNI.
+        for index in range(0, len(additional_certificates), self.CERTIFICATES_PER_RESOURCE):
+            chunk = additional_certificates[index:index + self.CERTIFICATES_PER_RESOURCE]
+
+            CfnListenerCertificate(
+                scope=self.__scope,
+                id=listener.node.id + f'Certificates{index // self.CERTIFICATES_PER_RESOURCE}',
+                listener_arn=listener.ref,
+                certificates=[
+                    CfnListenerCertificate.CertificateProperty(certificate_arn=certificate.ref)
+                    for certificate in chunk
+                ]
+            )
 
         return listener
@@ -0,0 +1,85 @@
+from typing import List
+from aws_cdk.aws_elasticloadbalancingv2 import CfnListenerRule
+from aws_cdk.core import Stack
+from aws_alb.listener_actions import ListenerActions
+from aws_alb.params.listener_rule_params import ListenerRuleParams
+
+
+class ListenerRuleFactory:
+    """
+    Factory class which creates listener rules for loadbalancer listeners.
+    """
+    def __init__(self, scope: Stack) -> None:
+        """
+        Constructor.
+
+        :param scope: CloudFormation stack instance.
+        """
+        self.__scope = scope
+
+    def create(self, listener_rule_params: ListenerRuleParams, priority: int) -> CfnListenerRule:
+        """
+        Creates listener rule.
+
+        :param listener_rule_params: Configuration parameters on how to create the listener rule.
+        :param priority: Priority of the rule. Rules with lower priority are evaluated first.
+
+        :return: Listener rule instance.
+        """
+        listener_rule_params.validate()
+
+        return CfnListenerRule(
+            scope=self.__scope,
+            id=listener_rule_params.prefix + 'ListenerRule',
+            listener_arn=listener_rule_params.listener.ref,
+            priority=priority,
+            actions=[ListenerActions.to_rule_action(listener_rule_params.action)],
+            conditions=self.create_conditions(listener_rule_params)
+        )
+
+    @staticmethod
+    def create_conditions(listener_rule_params: ListenerRuleParams) -> List[CfnListenerRule.RuleConditionProperty]:
+        """
+        Creates listener rule conditions.
+
+        :param listener_rule_params: Configuration parameters of the listener rule.
+
+        :return: A list of rule conditions.
+        """
+        params = listener_rule_params
+        conditions = []
+
+        if params.host_headers:
+            conditions.append(CfnListenerRule.RuleConditionProperty(
+                field='host-header',
+                host_header_config=CfnListenerRule.HostHeaderConfigProperty(values=params.host_headers)
+            ))
+
+        if params.path_patterns:
+            conditions.append(CfnListenerRule.RuleConditionProperty(
+                field='path-pattern',
+                path_pattern_config=CfnListenerRule.PathPatternConfigProperty(values=params.path_patterns)
+            ))
+
+        for name, values in params.http_headers.items():
+            conditions.append(CfnListenerRule.RuleConditionProperty(
+                field='http-header',
+                http_header_config=CfnListenerRule.HttpHeaderConfigProperty(http_header_name=name, values=values)
+            ))
+
+        if params.query_strings:
+            conditions.append(CfnListenerRule.RuleConditionProperty(
+                field='query-string',
+                query_string_config=CfnListenerRule.QueryStringConfigProperty(values=[
+                    CfnListenerRule.QueryStringKeyValueProperty(key=key, value=value)
+                    for key, value in params.query_strings
+                ])
+            ))
+
+        if params.source_ips:
+            conditions.append(CfnListenerRule.RuleConditionProperty(
+                field='source-ip',
+                source_ip_config=CfnListenerRule.SourceIpConfigProperty(values=params.source_ips)
+            ))
+
+        return conditions
@@ -1,4 +1,6 @@
 from aws_cdk.aws_elasticloadbalancingv2 import CfnTargetGroup
+from aws_cdk.aws_lambda import CfnPermission
+from aws_alb.health_check_calculator import HealthCheckCalculator
 from aws_alb.params.target_group_params import TargetGroupParams
 from aws_cdk.core import Stack
 
@@ -7,6 +9,12 @@ class TargetGroupFactory:
     """
     Factory class to create target groups for loadbalancer.
     """
+    TARGET_TYPES = ('ip', 'instance', 'lambda')
+    PROTOCOLS = ('HTTP', 'HTTPS')
+    PROTOCOL_VERSIONS = ('HTTP1', 'HTTP2', 'GRPC')
+    # Default health check path for gRPC target groups.
+    DEFAULT_GRPC_HEALTH_CHECK_PATH = '/AWS.ALB/healthcheck'
+
     def __init__(self, scope: Stack) -> None:
         """
         Constructor.
@@ -23,21 +31,113 @@ class TargetGroupFactory:
 
         :return: Target group instance.
         """
-        # By default a healthy http code is considered to be 200.
-        healthy_http_codes = target_group_params.healthy_http_codes
-        healthy_http_codes = [str(code) for code in healthy_http_codes] if healthy_http_codes else ['200']
-        healthy_http_codes = ','.join(healthy_http_codes)
+        params = target_group_params
+        protocol_version = params.protocol_version
+
+        assert params.target_type in self.TARGET_TYPES, f'Target type must be one of {self.TARGET_TYPES}.'
+        assert params.protocol in self.PROTOCOLS, f'Protocol must be one of {self.PROTOCOLS}.'
+        assert protocol_version is None or protocol_version in self.PROTOCOL_VERSIONS, (
+            f'Protocol version must be one of {self.PROTOCOL_VERSIONS}.'
+        )
+
+        if params.is_lambda:
+            assert params.lambda_function_arn, 'Lambda target groups require a function arn.'
+            assert not params.targets, 'Lambda target groups can not have static targets.'
+            assert protocol_version is None, 'Lambda target groups do not support protocol versions.'
+        else:
+            assert not params.lambda_function_arn, 'Function arn is supported only by lambda target groups.'
+            assert params.is_health_check_enabled, f'Health checks of {params.target_type} targets can not be disabled.'
+
+        if protocol_version == 'GRPC':
+            assert not params.healthy_http_codes, 'GRPC target groups are checked by gRPC codes.'
+
+            # By default a healthy grpc code is considered to be 12 (unimplemented) as the health
+            # check method is usually not implemented by a service.
+            healthy_grpc_codes = params.healthy_grpc_codes
+            assert all(0 <= code <= 99 for code in healthy_grpc_codes or []), 'gRPC codes must be between 0 and 99.'
+            healthy_grpc_codes = [str(code) for code in healthy_grpc_codes] if healthy_grpc_codes else ['12']
+            matcher = CfnTargetGroup.MatcherProperty(grpc_code=','.join(healthy_grpc_codes))
+            default_health_check_path = self.DEFAULT_GRPC_HEALTH_CHECK_PATH
+        else:
+            assert not params.healthy_grpc_codes, 'gRPC codes are supported only by GRPC target groups.'
+
+            # By default a healthy http code is considered to be 200.
+            healthy_http_codes = params.healthy_http_codes
+            healthy_http_codes = [str(code) for code in healthy_http_codes] if healthy_http_codes else ['200']
+            matcher = CfnTargetGroup.MatcherProperty(http_code=','.join(healthy_http_codes))
+            default_health_check_path = '/'
 
-        health_check_path = target_group_params.health_check_path
+        health_check_path = params.health_check_path
 
-        return CfnTargetGroup(
+        if params.is_health_check_enabled:
+            # Fail at synth time rather than at deployment time. Defaults depend on the target type.
+            interval, timeout, healthy, unhealthy = HealthCheckCalculator.settings(params)
+            HealthCheckCalculator.validate(interval, timeout, healthy, unhealthy)
+        else:
+            assert not any(value is not None for value in (
+                params.healthy_http_codes,
+                params.health_check_path,
+                params.health_check_interval_seconds,
+                params.health_check_timeout_seconds,
+                params.healthy_threshold_count,
+                params.unhealthy_threshold_count,
+            )), 'Health check settings require health checks to be enabled.'
+
+            matcher = None
+            health_check_path = None
+            default_health_check_path = None
+            interval, timeout, healthy, unhealthy = None, None, None, None
+
+        # Attributes are validated while rendering, so unsupported combinations fail at synth time.
+        attributes = params.attributes
+        if attributes:
+            attributes.validate_target_type(params.target_type)
+        attributes = attributes.to_attributes() if attributes else None
+
+        if params.is_lambda:
+            targets = [CfnTargetGroup.TargetDescriptionProperty(id=params.lambda_function_arn)]
+        else:
+            targets = [
+                CfnTargetGroup.TargetDescriptionProperty(id=target)
+                if isinstance(target, str) else
+                CfnTargetGroup.TargetDescriptionProperty(id=target[0], port=target[1])
+                for target in params.targets
+            ]
+
+        target_group = CfnTargetGroup(
             self.__scope,
-            target_group_params.prefix + 'TargetGroup',
-            name=target_group_params.prefix + 'TargetGroup',
-            matcher=CfnTargetGroup.MatcherProperty(http_code=healthy_http_codes),
-            port=target_group_params.target_group_port,
-            protocol=target_group_params.protocol,
-            vpc_id=target_group_params.vpc.vpc_id,
-            target_type=target_group_params.target_type,
-            health_check_path=health_check_path if health_check_path else '/'
+            params.prefix + 'TargetGroup',
+            name=params.prefix + 'TargetGroup',
+            matcher=matcher,
+            # Lambda target groups have neither a port, a protocol nor a vpc.
+            port=None if params.is_lambda else params.target_group_port,
+            protocol=None if params.is_lambda else params.protocol,
+            protocol_version=protocol_version,
+            vpc_id=None if params.is_lambda else params.vpc.vpc_id,
+            target_type=params.target_type,
+            targets=targets or None,
+            health_check_enabled=params.health_check_enabled,
+            health_check_path=health_check_path if health_check_path else default_health_check_path,
+            # Lambda defaults differ from AWS::ElasticLoadBalancingV2::TargetGroup defaults, hence they are explicit.
+            health_check_interval_seconds=interval if params.is_lambda else params.health_check_interval_seconds,
+            health_check_timeout_seconds=timeout if params.is_lambda else params.health_check_timeout_seconds,
+            healthy_threshold_count=params.healthy_threshold_count,
+            unhealthy_threshold_count=params.unhealthy_threshold_count,
+            target_group_attributes=attributes
         )
+
+        if params.is_lambda:
+            # The loadbalancer must be allowed to invoke the function before the function is registered.
+            # The permission can not be scoped to the target group arn, as the target group depends on it,
+            # hence it is scoped to the account so that target groups of other accounts can not invoke the function.
+            permission = CfnPermission(
+                self.__scope,
+                params.prefix + 'TargetGroupInvokePermission',
+                action='lambda:InvokeFunction',
+                function_name=params.lambda_function_arn,
+                principal='elasticloadbalancing.amazonaws.com',
+                source_account=Stack.of(self.__scope).account
+            )
+            target_group.add_depends_on(permission)
+
+        return target_group
@@ -0,0 +1,195 @@
+from typing import Dict, Optional, Tuple
+from aws_alb.params.target_group_params import TargetGroupParams
+
+
+class HealthCheckCalculator:
+    """
+    Class which calculates how fast a target group reacts to target failures and recoveries.
+
+    More about health checks:
+    https://docs.aws.amazon.com/elasticloadbalancing/latest/application/target-group-health-checks.html
+    """
+    # AWS defaults for HTTP/HTTPS target groups.
+    DEFAULT_INTERVAL_SECONDS = 30
+    DEFAULT_TIMEOUT_SECONDS = 5
+    DEFAULT_HEALTHY_THRESHOLD_COUNT = 5
+    DEFAULT_UNHEALTHY_THRESHOLD_COUNT = 2
+
+    # AWS defaults for lambda target groups (if health checks are enabled). A function has up to
+    # the timeout to respond, hence a cold start does not fail the health check.
+    DEFAULT_LAMBDA_INTERVAL_SECONDS = 35
+    DEFAULT_LAMBDA_TIMEOUT_SECONDS = 30
+
+    # AWS limits.
+    INTERVAL_RANGE = (5, 300)
+    TIMEOUT_RANGE = (2, 120)
+    THRESHOLD_RANGE = (2, 10)
+
+    @staticmethod
+    def validate(
+            interval_seconds: int,
+            timeout_seconds: int,
+            healthy_threshold_count: int,
+            unhealthy_threshold_count: int
+    ) -> None:
+        """
+        Validates health check settings. Raises an assertion error if AWS would reject them.
+
+        :param interval_seconds: Time between health checks of an individual target.
+        :param timeout_seconds: Time during which no response means a failed health check.
+        :param healthy_threshold_count: Consecutive successful checks to consider a target healthy.
+        :param unhealthy_threshold_count: Consecutive failed checks to consider a target unhealthy.
+
+        :return: No return.
+        """
+        calc = HealthCheckCalculator
+
+        assert calc.INTERVAL_RANGE[0] <= interval_seconds <= calc.INTERVAL_RANGE[1], (
+            f'Health check interval must be between {calc.INTERVAL_RANGE[0]} and {calc.INTERVAL_RANGE[1]} seconds.'
+        )
+        assert calc.TIMEOUT_RANGE[0] <= timeout_seconds <= calc.TIMEOUT_RANGE[1], (
+            f'Health check timeout must be between {calc.TIMEOUT_RANGE[0]} and {calc.TIMEOUT_RANGE[1]} seconds.'
+        )
+        assert timeout_seconds < interval_seconds, 'Health check timeout must be shorter than the interval.'
+
+        for count in (healthy_threshold_count, unhealthy_threshold_count):
+            assert calc.THRESHOLD_RANGE[0] <= count <= calc.THRESHOLD_RANGE[1], (
+                f'Health check thresholds must be between {calc.THRESHOLD_RANGE[0]} and {calc.THRESHOLD_RANGE[1]}.'
+            )
+
+    @staticmethod
+    def time_to_detect_failure(interval_seconds: int, timeout_seconds: int, unhealthy_threshold_count: int) -> int:
+        """
+        Calculates worst-case time until a failed target is taken out of rotation.
+        The worst case is a target which stops responding right after a successful health check.
+
+        :param interval_seconds: Time between health checks of an individual target.
+        :param timeout_seconds: Time during which no response means a failed health check.
+        :param unhealthy_threshold_count: Consecutive failed checks to consider a target unhealthy.
+
+        :return: Time in seconds.
+        """
+        return unhealthy_threshold_count * interval_seconds + timeout_seconds
+
+    @staticmethod
+    def time_to_recover(interval_seconds: int, healthy_threshold_count: int) -> int:
+        """
+        Calculates worst-case time until a recovered target is put back into rotation.
+        The worst case is a target which recovers right after a failed health check.
+
+        :param interval_seconds: Time between health checks of an individual target.
+        :param healthy_threshold_count: Consecutive successful checks to consider a target healthy.
+
+        :return: Time in seconds.
+        """
+        return healthy_threshold_count * interval_seconds
+
+    @staticmethod
+    def settings(target_group_params: TargetGroupParams) -> Tuple[int, int, int, int]:
+        """
+        Resolves effective health check settings of a target group (AWS defaults are used for missing values).
+
+        :param target_group_params: Target group parameters.
+
+        :return: Tuple of interval, timeout, healthy threshold and unhealthy threshold.
+        """
+        calc = HealthCheckCalculator
+        params = target_group_params
+
+        def default(value: Optional[int], default_value: int) -> int:
+            return default_value if value is None else value
+
+        lambda_targets = params.target_type == 'lambda'
+
+        return (
+            default(
+                params.health_check_interval_seconds,
+                calc.DEFAULT_LAMBDA_INTERVAL_SECONDS if lambda_targets else calc.DEFAULT_INTERVAL_SECONDS
+            ),
+            default(
+                params.health_check_timeout_seconds,
+                calc.DEFAULT_LAMBDA_TIMEOUT_SECONDS if lambda_targets else calc.DEFAULT_TIMEOUT_SECONDS
+            ),
+            default(params.healthy_threshold_count, calc.DEFAULT_HEALTHY_THRESHOLD_COUNT),
+            default(params.unhealthy_threshold_count, calc.DEFAULT_UNHEALTHY_THRESHOLD_COUNT),
+        )
+
+    @staticmethod
+    def for_target_group(target_group_params: TargetGroupParams) -> Tuple[int, int]:
+        """
+        Calculates worst-case failure detection and recovery times of a target group.
+
+        :param target_group_params: Target group parameters.
+
+        :return: Tuple of time to detect failure and time to recover (in seconds).
+        """
+        interval, timeout, healthy, unhealthy = HealthCheckCalculator.settings(target_group_params)
+
+        return (
+            HealthCheckCalculator.time_to_detect_failure(interval, timeout, unhealthy),
+            HealthCheckCalculator.time_to_recover(interval, healthy),
+        )
+
+    @staticmethod
+    def tune(
+            max_detection_seconds: int,
+            max_recovery_seconds: Optional[int] = None,
+            unhealthy_threshold_count: int = DEFAULT_UNHEALTHY_THRESHOLD_COUNT,
+            timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS
+    ) -> Dict[str, int]:
+        """
+        Picks health check settings which detect a failed target within a given time.
+        The longest possible interval is chosen to keep health check traffic low.
+
+        :param max_detection_seconds: Maximum worst-case time to detect a failed target.
+        :param max_recovery_seconds: Maximum worst-case time to put a recovered target back into rotation.
+        :param unhealthy_threshold_count: Consecutive failed checks to consider a target unhealthy.
+        :param timeout_seconds: Preferred health check timeout. It is shortened only if no interval fits otherwise.
+
+        :return: Keyword arguments for TargetGroupParams.
+        """
+        calc = HealthCheckCalculator
+        intervals = range(calc.INTERVAL_RANGE[1], calc.INTERVAL_RANGE[0] - 1, -1)
+
+        # Prefer the requested timeout and only shorten it when no interval fits otherwise.
+        candidates = [(interval, min(timeout_seconds, interval - 1)) for interval in intervals] + [
+            (interval, min(interval - 1, max_detection_seconds - unhealthy_threshold_count * interval))
+            for interval in intervals
+        ]
+
+        for interval, timeout in candidates:
+            if timeout < calc.TIMEOUT_RANGE[0]:
+                continue
+
+            if calc.time_to_detect_failure(interval, timeout, unhealthy_threshold_count) > max_detection_seconds:
+                continue
+
+            settings = dict(
+                health_check_interval_seconds=interval,
+                health_check_timeout_seconds=timeout,
+                unhealthy_threshold_count=unhealthy_threshold_count,
+            )
+
+            if max_recovery_seconds is not None:
+                healthy = min(max_recovery_seconds // interval, calc.THRESHOLD_RANGE[1])
+
+                if healthy < calc.THRESHOLD_RANGE[0]:
+                    continue
+
+                settings['healthy_threshold_count'] = healthy
+
+            calc.validate(
+                interval,
+                timeout,
+                settings.get('healthy_threshold_count', calc.DEFAULT_HEALTHY_THRESHOLD_COUNT),
+                unhealthy_threshold_count
+            )
+
+            return settings
+
+        raise AssertionError(
+            f'Can not detect a failed target within {max_detection_seconds} seconds '
+            f'and recover within {max_recovery_seconds} seconds.'
+            if max_recovery_seconds is not None else
+            f'Can not detect a failed target within {max_detection_seconds} seconds.'
+        )
@@ -0,0 +1,13 @@
+from enum import auto, Enum
+
+
+class LatencySloPreset(Enum):
+    """
+    Enum class which tells what latency service level objective should be monitored.
+    """
+    # Interactive user facing APIs: p99 under 500 milliseconds.
+    INTERACTIVE = auto()
+    # General purpose services: p99 under 1 second.
+    STANDARD = auto()
+    # Batch and report style endpoints: p95 under 5 seconds.
+    BATCH = auto()
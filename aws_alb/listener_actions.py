@@ -1,4 +1,5 @@
-from aws_cdk.aws_elasticloadbalancingv2 import CfnListener, CfnTargetGroup
+from typing import List, Optional, Tuple
+from aws_cdk.aws_elasticloadbalancingv2 import CfnListener, CfnListenerRule, CfnTargetGroup
 
 
 class ListenerActions:
@@ -42,6 +43,47 @@ class ListenerActions:
             target_group_arn=target_group.ref
         )
 
+    @staticmethod
+    def weighted_forward_action(
+            target_groups: List[Tuple[CfnTargetGroup, int]],
+            stickiness_duration_seconds: Optional[int] = None
+    ) -> CfnListener.ActionProperty:
+        """
+        Creates forward action which splits traffic between multiple target groups by weights.
+
+        :param target_groups: A list of target group and weight pairs. Up to 5 target groups with
+        weights from 0 to 999 are supported.
+        :param stickiness_duration_seconds: If specified, a client is routed to the same target group
+        for the given period of time (1-604800 seconds).
+
+        :return: Forward action.
+        """
+        assert 1 <= len(target_groups) <= 5, 'Between 1 and 5 target groups are supported.'
+        assert all(0 <= weight <= 999 for _, weight in target_groups), 'Weights must be between 0 and 999.'
+        assert any(weight > 0 for _, weight in target_groups), 'At least one weight must be positive.'
+
+        stickiness = None
+        if stickiness_duration_seconds is not None:
+            assert 1 <= stickiness_duration_seconds <= 604800, (
+                'Stickiness duration must be between 1 and 604800 seconds.'
+            )
+
+            stickiness = CfnListener.TargetGroupStickinessConfigProperty(
+                enabled=True,
+                duration_seconds=stickiness_duration_seconds
+            )
+
+        return CfnListener.ActionProperty(
+            type='forward',
+            forward_config=CfnListener.ForwardConfigProperty(
+                target_groups=[
+                    CfnListener.TargetGroupTupleProperty(target_group_arn=target_group.ref, weight=weight)
+                    for target_group, weight in target_groups
+                ],
+                target_group_stickiness_config=stickiness
+            )
+        )
+
     @staticmethod
     def fixed_404_action() -> CfnListener.ActionProperty:
         """
@@ -56,3 +98,63 @@ class ListenerActions:
                 message_body='Not found.'
             )
         )
+
+    @staticmethod
+    def to_rule_action(action: CfnListener.ActionProperty) -> CfnListenerRule.ActionProperty:
+        """
+        Converts a listener action to a listener rule action. Listener and listener rule actions
+        are structurally the same but are different types in CloudFormation.
+
+        :param action: Listener action created by this class.
+
+        :return: Listener rule action.
+        """
+        assert action.authenticate_cognito_config is None, 'Authenticate actions are not supported.'
+        assert action.authenticate_oidc_config is None, 'Authenticate actions are not supported.'
+
+        redirect = action.redirect_config
+        if redirect is not None:
+            redirect = CfnListenerRule.RedirectConfigProperty(
+                status_code=redirect.status_code,
+                host=redirect.host,
+                path=redirect.path,
+                port=redirect.port,
+                query=redirect.query,
+                protocol=redirect.protocol
+            )
+
+        fixed_response = action.fixed_response_config
+        if fixed_response is not None:
+            fixed_response = CfnListenerRule.FixedResponseConfigProperty(
+                status_code=fixed_response.status_code,
+                content_type=fixed_response.content_type,
+                message_body=fixed_response.message_body
+            )
+
+        forward = action.forward_config
+        if forward is not None:
+            stickiness = forward.target_group_stickiness_config
+            if stickiness is not None:
+                stickiness = CfnListenerRule.TargetGroupStickinessConfigProperty(
+                    enabled=stickiness.enabled,
+                    duration_seconds=stickiness.duration_seconds
+                )
+
+            forward = CfnListenerRule.ForwardConfigProperty(
+                target_groups=[
+                    CfnListenerRule.TargetGroupTupleProperty(
+                        target_group_arn=target_group.target_group_arn,
+                        weight=target_group.weight
+                    ) for target_group in forward.target_groups or []
+                ],
+                target_group_stickiness_config=stickiness
+            )
+
+        return CfnListenerRule.ActionProperty(
+            type=action.type,
+            target_group_arn=action.target_group_arn,
+            redirect_config=redirect,
+            fixed_response_config=fixed_response,
+            forward_config=forward,
+            order=action.order
+        )
@@ -0,0 +1,157 @@
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+
+class ListenerPortPair(NamedTuple):
+    production_port: int
+    test_port: int
+
+
+class ListenerPortPool:
+    """
+    Allocator of production/test listener port pairs for blue/green services which share a loadbalancer.
+
+    Ports are handed out from the lowest free port upwards, hence allocated ports form a contiguous block
+    and security group rules of all services merge into one port range rule per peer. Allocations depend
+    on the allocation order: append new services rather than insert them to keep ports of existing
+    services (and their listeners) unchanged.
+    """
+    DEFAULT_FIRST_PORT = 10000
+    DEFAULT_LAST_PORT = 10999
+
+    def __init__(
+            self,
+            first_port: int = DEFAULT_FIRST_PORT,
+            last_port: int = DEFAULT_LAST_PORT,
+            used_ports: Optional[Set[int]] = None
+    ) -> None:
+        """
+        Constructor.
+
+        :param first_port: First port of the pool (inclusive).
+        :param last_port: Last port of the pool (inclusive).
+        :param used_ports: Ports of existing listeners. The set is read on every allocation, hence
+        it can be a live view of listener ports of a loadbalancer.
+        """
+        assert 1 <= first_port <= last_port <= 65535, f'Invalid port pool {first_port}-{last_port}.'
+
+        self.first_port = first_port
+        self.last_port = last_port
+
+        self.__used_ports = used_ports if used_ports is not None else set()
+        self.__allocations: Dict[str, ListenerPortPair] = {}
+        self.__services: Dict[int, str] = {}
+        # All ports below this one are taken, hence the search for a free port starts here.
+        self.__next_port = first_port
+
+    def allocate(self, service: str) -> ListenerPortPair:
+        """
+        Allocates a production/test port pair for a service.
+
+        :param service: Unique service name.
+
+        :return: Port pair.
+        """
+        assert service not in self.__allocations, f'Ports of service {service} are already allocated.'
+
+        production_port = self.__find_free_port(self.__next_port)
+        test_port = self.__find_free_port(production_port + 1)
+
+        return self.reserve(service, production_port, test_port)
+
+    def reserve(self, service: str, production_port: int, test_port: int) -> ListenerPortPair:
+        """
+        Reserves given ports for a service e.g. to pin ports of a service which already runs in production.
+
+        :param service: Unique service name.
+        :param production_port: Production listener port.
+        :param test_port: Test listener port.
+
+        :return: Port pair.
+        """
+        assert service not in self.__allocations, f'Ports of service {service} are already allocated.'
+
+        for port in (production_port, test_port):
+            assert self.first_port <= port <= self.last_port, (
+                f'Port {port} is out of the pool {self.first_port}-{self.last_port}.'
+            )
+            assert not self.__is_taken(port), f'Port {port} is already used.'
+
+        assert production_port != test_port, 'Production and test ports must differ.'
+
+        pair = ListenerPortPair(production_port, test_port)
+        self.__allocations[service] = pair
+        self.__services[production_port] = service
+        self.__services[test_port] = service
+
+        while self.__next_port <= self.last_port and self.__is_taken(self.__next_port):
+            self.__next_port += 1
+
+        return pair
+
+    def release(self, service: str) -> ListenerPortPair:
+        """
+        Releases ports of a service e.g. when its listeners could not be created. Released ports are
+        handed out again by the next allocation.
+
+        :param service: Service name.
+
+        :return: Released port pair.
+        """
+        assert service in self.__allocations, f'Ports of service {service} are not allocated.'
+
+        pair = self.__allocations.pop(service)
+        del self.__services[pair.production_port]
+        del self.__services[pair.test_port]
+        self.__next_port = min(self.__next_port, *pair)
+
+        return pair
+
+    def get(self, service: str) -> Optional[ListenerPortPair]:
+        """
+        Gets ports of a service.
+
+        :param service: Service name.
+
+        :return: Port pair or None if the service has no ports.
+        """
+        return self.__allocations.get(service)
+
+    def get_service(self, port: int) -> Optional[str]:
+        """
+        Gets a service which listens to a given port.
+
+        :param port: Production or test port.
+
+        :return: Service name or None if the port is not allocated from the pool.
+        """
+        return self.__services.get(port)
+
+    @property
+    def allocations(self) -> Dict[str, ListenerPortPair]:
+        """
+        Port pairs of all services in the allocation order.
+
+        :return: A dictionary of service name and port pair.
+        """
+        return dict(self.__allocations)
+
+    @property
+    def allocated_range(self) -> Optional[Tuple[int, int]]:
+        """
+        Range of allocated ports. It is contiguous unless ports in between are used by other listeners.
+
+        :return: First and last allocated ports or None if nothing is allocated.
+        """
+        if not self.__services:
+            return None
+
+        return min(self.__services), max(self.__services)
+
+    def __find_free_port(self, start: int) -> int:
+        port = next((port for port in range(start, self.last_port + 1) if not self.__is_taken(port)), None)
+        assert port is not None, f'Port pool {self.first_port}-{self.last_port} is exhausted.'
+
+        return port
+
+    def __is_taken(self, port: int) -> bool:
+        return port in self.__services or port in self.__used_ports
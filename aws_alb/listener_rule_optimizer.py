@@ -0,0 +1,298 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from aws_alb.listener_rule_patterns import ListenerRulePatterns
+from aws_alb.params.listener_rule_params import ListenerRuleParams
+
+
+class ListenerRuleOptimizationReport:
+    """
+    Report of a listener rule optimization.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.rules_before = 0
+        self.rules_after = 0
+        # Pairs of (removed rule prefix, shadowing rule prefix).
+        self.removed: List[Tuple[str, str]] = []
+        # Groups of rule prefixes which were merged into the first rule of the group.
+        self.merged: List[List[str]] = []
+        # Final evaluation order of rule prefixes.
+        self.order: List[str] = []
+        # Expected number of rule evaluations per request. Known only if traffic weights are given.
+        self.expected_evaluations_before: Optional[float] = None
+        self.expected_evaluations_after: Optional[float] = None
+
+    def __str__(self) -> str:
+        lines = [f'Listener rules: {self.rules_before} -> {self.rules_after}.']
+
+        if self.expected_evaluations_before is not None:
+            lines.append(
+                f'Expected evaluations per request: '
+                f'{self.expected_evaluations_before:.2f} -> {self.expected_evaluations_after:.2f}.'
+            )
+
+        lines.extend(f'Removed {removed} (shadowed by {shadowing}).' for removed, shadowing in self.removed)
+        lines.extend(f'Merged {", ".join(group[1:])} into {group[0]}.' for group in self.merged)
+        lines.append(f'Order: {", ".join(self.order)}.')
+
+        return '\n'.join(lines)
+
+
+class ListenerRuleOptimizer:
+    """
+    Class which minimises the number of listener rules a request has to be evaluated against.
+
+    The optimizer removes rules shadowed by higher priority rules, merges rules with the same action
+    by combining their path or host values and, if traffic weights are given, moves hot rules forward.
+    A rule is never moved across a rule it may overlap with, hence routing stays the same.
+    Rules must not have explicit priorities: the resulting order is the priority order.
+    """
+    @staticmethod
+    def optimize(rules: List[ListenerRuleParams]) -> Tuple[List[ListenerRuleParams], ListenerRuleOptimizationReport]:
+        """
+        Optimizes listener rules.
+
+        :param rules: Listener rules. Rules can belong to different listeners.
+
+        :return: Optimized rules in evaluation order and an optimization report.
+        """
+        assert all(rule.priority is None for rule in rules), 'Rules with explicit priorities can not be optimized.'
+
+        for rule in rules:
+            rule.validate()
+
+        report = ListenerRuleOptimizationReport()
+        report.rules_before = len(rules)
+
+        groups: Dict[str, List[ListenerRuleParams]] = {}
+        for rule in rules:
+            groups.setdefault(rule.listener.node.path, []).append(rule)
+
+        optimized = []
+        has_weights = any(rule.traffic_weight > 0 for rule in rules)
+        evaluations_before = 0.0
+        evaluations_after = 0.0
+
+        for group in groups.values():
+            # The same order in which priorities would be allocated without optimization.
+            order = sorted(group, key=lambda rule: (rule.specificity, rule.traffic_weight), reverse=True)
+            evaluations_before += ListenerRuleOptimizer.__expected_evaluations(order)
+
+            order = ListenerRuleOptimizer.__remove_shadowed(order, report)
+            order = ListenerRuleOptimizer.__merge(order, report)
+
+            if has_weights:
+                order = ListenerRuleOptimizer.__sort_by_weight(order)
+
+            evaluations_after += ListenerRuleOptimizer.__expected_evaluations(order)
+            optimized.extend(order)
+
+        report.rules_after = len(optimized)
+        report.order = [rule.prefix for rule in optimized]
+
+        if has_weights:
+            report.expected_evaluations_before = evaluations_before
+            report.expected_evaluations_after = evaluations_after
+
+        return optimized, report
+
+    @staticmethod
+    def covers(rule: ListenerRuleParams, other: ListenerRuleParams) -> bool:
+        """
+        Tells whether every request matched by the other rule is matched by the rule as well.
+
+        :param rule: Covering rule.
+        :param other: Covered rule.
+
+        :return: True if the rule covers the other rule.
+        """
+        covers = ListenerRulePatterns.covers
+
+        def values_covered(values: List[str], other_values: List[str], case_sensitive: bool = True) -> bool:
+            # A condition without values does not restrict anything.
+            if not values:
+                return True
+
+            return bool(other_values) and all(
+                any(covers(value, other_value, case_sensitive) for value in values)
+                for other_value in other_values
+            )
+
+        other_headers = {name.lower(): values for name, values in other.http_headers.items()}
+
+        def query_covered(key: Optional[str], value: str, other_key: Optional[str], other_value: str) -> bool:
+            key_covered = key is None or (other_key is not None and covers(key, other_key, False))
+            return key_covered and covers(value, other_value, False)
+
+        return (
+            values_covered(rule.path_patterns, other.path_patterns) and
+            values_covered(rule.host_headers, other.host_headers, False) and
+            all(
+                values_covered(values, other_headers.get(name.lower(), []), False)
+                for name, values in rule.http_headers.items()
+            ) and
+            (not rule.query_strings or bool(other.query_strings) and all(
+                any(query_covered(key, value, other_key, other_value) for key, value in rule.query_strings)
+                for other_key, other_value in other.query_strings
+            )) and
+            (not rule.source_ips or bool(other.source_ips) and all(
+                any(ListenerRulePatterns.cidr_covers(cidr, other_cidr) for cidr in rule.source_ips)
+                for other_cidr in other.source_ips
+            ))
+        )
+
+    @staticmethod
+    def may_overlap(rule: ListenerRuleParams, other: ListenerRuleParams) -> bool:
+        """
+        Tells whether a request could be matched by both rules. Only single-valued request properties
+        (path, host and source ip) are used to prove that rules are disjoint.
+
+        :param rule: Listener rule.
+        :param other: Listener rule.
+
+        :return: False if rules can not match the same request.
+        """
+        disjoint = ListenerRulePatterns.disjoint
+
+        def values_disjoint(values: List[str], other_values: List[str], case_sensitive: bool = True) -> bool:
+            return bool(values) and bool(other_values) and all(
+                disjoint(value, other_value, case_sensitive) for value in values for other_value in other_values
+            )
+
+        return not (
+            values_disjoint(rule.path_patterns, other.path_patterns) or
+            values_disjoint(rule.host_headers, other.host_headers, False) or
+            bool(rule.source_ips) and bool(other.source_ips) and all(
+                ListenerRulePatterns.cidr_disjoint(cidr, other_cidr)
+                for cidr in rule.source_ips for other_cidr in other.source_ips
+            )
+        )
+
+    @staticmethod
+    def __remove_shadowed(
+            order: List[ListenerRuleParams],
+            report: ListenerRuleOptimizationReport
+    ) -> List[ListenerRuleParams]:
+        kept = []
+
+        for rule in order:
+            shadowing = next((kept_rule for kept_rule in kept if ListenerRuleOptimizer.covers(kept_rule, rule)), None)
+
+            if shadowing:
+                report.removed.append((rule.prefix, shadowing.prefix))
+            else:
+                kept.append(rule)
+
+        return kept
+
+    @staticmethod
+    def __merge(order: List[ListenerRuleParams], report: ListenerRuleOptimizationReport) -> List[ListenerRuleParams]:
+        merged: List[ListenerRuleParams] = []
+        groups: Dict[int, List[str]] = {}
+
+        for rule in order:
+            for index, candidate in enumerate(merged):
+                combined = ListenerRuleOptimizer.__combine(candidate, rule)
+
+                if combined is None:
+                    continue
+
+                # The rule moves up to the candidate's position. It must not jump over a rule it overlaps with.
+                if any(ListenerRuleOptimizer.may_overlap(between, rule) for between in merged[index + 1:]):
+                    continue
+
+                groups[id(combined)] = groups.pop(id(candidate), [candidate.prefix]) + [rule.prefix]
+                merged[index] = combined
+                break
+            else:
+                merged.append(rule)
+
+        report.merged.extend(groups[id(rule)] for rule in merged if id(rule) in groups)
+
+        return merged
+
+    @staticmethod
+    def __combine(rule: ListenerRuleParams, other: ListenerRuleParams) -> Optional[ListenerRuleParams]:
+        if rule.action != other.action:
+            return None
+
+        def same(values: list, other_values: list, key: Optional[Callable] = None) -> bool:
+            return sorted(values, key=key) == sorted(other_values, key=key)
+
+        # A query string key can be None (a value-only match) which is not comparable with strings.
+        def query_string_key(pair: Tuple[Optional[str], str]) -> Tuple[bool, str, str]:
+            return pair[0] is not None, pair[0] or '', pair[1]
+
+        same_headers = same(
+            [(name.lower(), sorted(values)) for name, values in rule.http_headers.items()],
+            [(name.lower(), sorted(values)) for name, values in other.http_headers.items()]
+        )
+
+        same_common = (
+            same_headers and
+            same(rule.query_strings, other.query_strings, query_string_key) and
+            same(rule.source_ips, other.source_ips)
+        )
+
+        if not same_common:
+            return None
+
+        path_patterns, host_headers = rule.path_patterns, rule.host_headers
+
+        if same(rule.host_headers, other.host_headers) and rule.path_patterns and other.path_patterns:
+            path_patterns = list(dict.fromkeys(rule.path_patterns + other.path_patterns))
+        elif same(rule.path_patterns, other.path_patterns) and rule.host_headers and other.host_headers:
+            host_headers = list(dict.fromkeys(rule.host_headers + other.host_headers))
+        else:
+            return None
+
+        combined = ListenerRuleParams(
+            prefix=rule.prefix,
+            listener=rule.listener,
+            action=rule.action,
+            path_patterns=path_patterns,
+            host_headers=host_headers,
+            http_headers=rule.http_headers,
+            query_strings=rule.query_strings,
+            source_ips=rule.source_ips,
+            traffic_weight=rule.traffic_weight + other.traffic_weight
+        )
+
+        within_limits = (
+            combined.condition_values_count <= ListenerRuleParams.MAX_CONDITION_VALUES and
+            combined.wildcards_count <= ListenerRuleParams.MAX_WILDCARDS
+        )
+
+        return combined if within_limits else None
+
+    @staticmethod
+    def __sort_by_weight(order: List[ListenerRuleParams]) -> List[ListenerRuleParams]:
+        result: List[ListenerRuleParams] = []
+
+        for rule in order:
+            position = len(result)
+
+            # Move a hotter rule forward as long as it does not overlap with the rules it passes.
+            while (
+                position > 0 and
+                result[position - 1].traffic_weight < rule.traffic_weight and
+                not ListenerRuleOptimizer.may_overlap(result[position - 1], rule)
+            ):
+                position -= 1
+
+            result.insert(position, rule)
+
+        return result
+
+    @staticmethod
+    def __expected_evaluations(order: List[ListenerRuleParams]) -> float:
+        total = sum(rule.traffic_weight for rule in order)
+        scale = max(total, 1.0)
+
+        # Requests which do not match any rule are evaluated against every rule.
+        unmatched = max(1.0 - total, 0.0)
+
+        return sum(
+            rule.traffic_weight / scale * position for position, rule in enumerate(order, start=1)
+        ) + unmatched * len(order)
@@ -0,0 +1,137 @@
+import re
+from functools import lru_cache
+from ipaddress import ip_network
+from typing import Pattern
+
+
+class ListenerRulePatterns:
+    """
+    Helper class to reason about listener rule condition values.
+    Values can contain wildcards: * matches zero or more characters and ? matches exactly one character.
+    """
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def compile(pattern: str, case_sensitive: bool = True) -> Pattern:
+        """
+        Compiles a condition value to a regular expression.
+
+        :param pattern: Condition value e.g. /api/* or *.example.com.
+        :param case_sensitive: Whether matching is case sensitive. Paths are case sensitive, hosts are not.
+
+        :return: Compiled regular expression.
+        """
+        expression = ''.join(
+            '.*' if char == '*' else '.' if char == '?' else re.escape(char)
+            for char in pattern
+        )
+
+        return re.compile(f'^{expression}$', 0 if case_sensitive else re.IGNORECASE)
+
+    @staticmethod
+    def literal_prefix(pattern: str) -> str:
+        """
+        Returns a part of a pattern before the first wildcard.
+
+        :param pattern: Condition value.
+
+        :return: Literal prefix.
+        """
+        return re.split(r'[*?]', pattern, maxsplit=1)[0]
+
+    @staticmethod
+    def has_wildcards(pattern: str) -> bool:
+        """
+        Tells whether a pattern contains wildcards.
+
+        :param pattern: Condition value.
+
+        :return: True if the pattern contains wildcards.
+        """
+        return '*' in pattern or '?' in pattern
+
+    @staticmethod
+    def covers(pattern: str, other: str, case_sensitive: bool = True) -> bool:
+        """
+        Tells whether every value matched by the other pattern is matched by the pattern as well.
+        The answer is conservative: False is returned when it can not be proven.
+
+        :param pattern: Covering condition value.
+        :param other: Covered condition value.
+        :param case_sensitive: Whether matching is case sensitive.
+
+        :return: True if the pattern covers the other pattern.
+        """
+        if not case_sensitive:
+            pattern, other = pattern.lower(), other.lower()
+
+        if pattern == other:
+            return True
+
+        if not ListenerRulePatterns.has_wildcards(other):
+            return ListenerRulePatterns.compile(pattern).match(other) is not None
+
+        # A single trailing wildcard covers every pattern that starts with the same literal prefix.
+        prefix = pattern[:-1]
+        return (
+            pattern.endswith('*') and
+            not ListenerRulePatterns.has_wildcards(prefix) and
+            ListenerRulePatterns.literal_prefix(other).startswith(prefix)
+        )
+
+    @staticmethod
+    def disjoint(pattern: str, other: str, case_sensitive: bool = True) -> bool:
+        """
+        Tells whether no value can be matched by both patterns.
+        The answer is conservative: False is returned when it can not be proven.
+
+        :param pattern: Condition value.
+        :param other: Condition value.
+        :param case_sensitive: Whether matching is case sensitive.
+
+        :return: True if patterns are disjoint.
+        """
+        if not case_sensitive:
+            pattern, other = pattern.lower(), other.lower()
+
+        has_wildcards = ListenerRulePatterns.has_wildcards
+
+        if not has_wildcards(pattern) and not has_wildcards(other):
+            return pattern != other
+
+        if not has_wildcards(other):
+            return ListenerRulePatterns.compile(pattern).match(other) is None
+
+        if not has_wildcards(pattern):
+            return ListenerRulePatterns.compile(other).match(pattern) is None
+
+        # Both patterns have wildcards. They are disjoint only if their literal prefixes diverge.
+        prefix = ListenerRulePatterns.literal_prefix(pattern)
+        other_prefix = ListenerRulePatterns.literal_prefix(other)
+
+        return not (prefix.startswith(other_prefix) or other_prefix.startswith(prefix))
+
+    @staticmethod
+    def cidr_covers(cidr: str, other: str) -> bool:
+        """
+        Tells whether a CIDR block contains the other CIDR block.
+
+        :param cidr: Covering CIDR block.
+        :param other: Covered CIDR block.
+
+        :return: True if the CIDR block covers the other one.
+        """
+        network, other_network = ip_network(cidr, strict=False), ip_network(other, strict=False)
+        return network.version == other_network.version and other_network.subnet_of(network)
+
+    @staticmethod
+    def cidr_disjoint(cidr: str, other: str) -> bool:
+        """
+        Tells whether two CIDR blocks do not overlap.
+
+        :param cidr: CIDR block.
+        :param other: CIDR block.
+
+        :return: True if CIDR blocks do not overlap.
+        """
+        network, other_network = ip_network(cidr, strict=False), ip_network(other, strict=False)
+        return network.version != other_network.version or not network.overlaps(other_network)
@@ -0,0 +1,183 @@
+from typing import List, Union
+from aws_cdk.aws_elasticloadbalancingv2 import CfnLoadBalancer
+from aws_cdk.aws_s3 import CfnBucket, CfnBucketPolicy
+from aws_cdk.core import Aws, CfnCondition, CfnMapping, Fn, IResolvable, Stack, Token
+from aws_alb.params.access_logs_params import AccessLogsParams
+
+
+class LoadBalancerAccessLogs:
+    """
+    A class which manages a bucket and its policy for loadbalancer access logs.
+
+    More about access logs:
+    https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-access-logs.html
+    """
+    # Elastic load balancing accounts which deliver access logs in regions available before August 2022.
+    ELB_ACCOUNTS = {
+        'us-east-1': '127311923021',
+        'us-east-2': '033677994240',
+        'us-west-1': '027434742980',
+        'us-west-2': '797873946194',
+        'af-south-1': '098369216593',
+        'ap-east-1': '754344448648',
+        'ap-southeast-3': '589379963580',
+        'ap-south-1': '718504428378',
+        'ap-northeast-3': '383597477331',
+        'ap-northeast-2': '600734575887',
+        'ap-southeast-1': '114774131450',
+        'ap-southeast-2': '783225319266',
+        'ap-northeast-1': '582318560864',
+        'ca-central-1': '985666609251',
+        'eu-central-1': '054676820928',
+        'eu-west-1': '156460612806',
+        'eu-west-2': '652711504416',
+        'eu-south-1': '635631232127',
+        'eu-west-3': '009996457667',
+        'eu-north-1': '897822967062',
+        'me-south-1': '076674570225',
+        'sa-east-1': '507241528517',
+        'us-gov-west-1': '048591011584',
+        'us-gov-east-1': '190560391635',
+        'cn-north-1': '638102146993',
+        'cn-northwest-1': '037604701340',
+    }
+
+    # Service principal which delivers access logs in newer regions.
+    LOG_DELIVERY_SERVICE = 'logdelivery.elasticloadbalancing.amazonaws.com'
+
+    def __init__(self, scope: Stack, prefix: str, access_logs_params: AccessLogsParams) -> None:
+        """
+        Constructor.
+
+        :param scope: A CloudFormation stack in which the resources should be added.
+        :param prefix: A prefix for newly created resources.
+        :param access_logs_params: Access logs configuration.
+        """
+        params = access_logs_params
+
+        assert params.retention_days > 0, 'Retention must be at least one day.'
+        assert (
+            params.infrequent_access_after_days is None or
+            30 <= params.infrequent_access_after_days < params.retention_days
+        ), 'Logs can be moved to infrequent access after at least 30 days and before they expire.'
+
+        self.__params = params
+
+        transitions = None
+        if params.infrequent_access_after_days is not None:
+            transitions = [CfnBucket.TransitionProperty(
+                storage_class='STANDARD_IA',
+                transition_in_days=params.infrequent_access_after_days
+            )]
+
+        self.__bucket = CfnBucket(
+            scope,
+            prefix + 'AccessLogsBucket',
+            bucket_name=params.bucket_name,
+            # Access logs support only S3 managed keys.
+            bucket_encryption=CfnBucket.BucketEncryptionProperty(
+                server_side_encryption_configuration=[CfnBucket.ServerSideEncryptionRuleProperty(
+                    server_side_encryption_by_default=CfnBucket.ServerSideEncryptionByDefaultProperty(
+                        sse_algorithm='AES256'
+                    )
+                )]
+            ),
+            public_access_block_configuration=CfnBucket.PublicAccessBlockConfigurationProperty(
+                block_public_acls=True,
+                block_public_policy=True,
+                ignore_public_acls=True,
+                restrict_public_buckets=True
+            ),
+            lifecycle_configuration=CfnBucket.LifecycleConfigurationProperty(rules=[CfnBucket.RuleProperty(
+                id='AccessLogsRetention',
+                status='Enabled',
+                expiration_in_days=params.retention_days,
+                transitions=transitions
+            )])
+        )
+
+        log_path = f'{params.log_prefix}/AWSLogs' if params.log_prefix else 'AWSLogs'
+
+        self.__bucket_policy = CfnBucketPolicy(
+            scope,
+            prefix + 'AccessLogsBucketPolicy',
+            bucket=self.__bucket.ref,
+            policy_document={
+                'Version': '2012-10-17',
+                'Statement': [{
+                    'Effect': 'Allow',
+                    'Principal': self.__log_delivery_principal(scope, prefix),
+                    'Action': 's3:PutObject',
+                    'Resource': Fn.join('', [self.__bucket.attr_arn, f'/{log_path}/', Aws.ACCOUNT_ID, '/*'])
+                }]
+            }
+        )
+
+    @property
+    def bucket(self) -> CfnBucket:
+        """
+        Bucket which stores access logs.
+
+        :return: Bucket.
+        """
+        return self.__bucket
+
+    @property
+    def bucket_policy(self) -> CfnBucketPolicy:
+        """
+        Policy which allows the loadbalancer to deliver access logs.
+
+        :return: Bucket policy.
+        """
+        return self.__bucket_policy
+
+    def to_attributes(self) -> List[CfnLoadBalancer.LoadBalancerAttributeProperty]:
+        """
+        Renders loadbalancer attributes which enable access logs.
+
+        :return: A list of loadbalancer attribute properties.
+        """
+        attributes = {
+            'access_logs.s3.enabled': 'true',
+            'access_logs.s3.bucket': self.__bucket.ref,
+        }
+
+        if self.__params.log_prefix:
+            attributes['access_logs.s3.prefix'] = self.__params.log_prefix
+
+        return [
+            CfnLoadBalancer.LoadBalancerAttributeProperty(key=key, value=value)
+            for key, value in attributes.items()
+        ]
+
+    def __log_delivery_principal(self, scope: Stack, prefix: str) -> Union[dict, IResolvable]:
+        region = Stack.of(scope).region
+
+        # Region agnostic stacks resolve the principal at deployment time. Regions which are not known
+        # to have a log delivery account (e.g. regions launched later) fall back to the service principal.
+        if Token.is_unresolved(region):
+            mapping = CfnMapping(
+                scope,
+                prefix + 'ElbAccounts',
+                mapping={region: {'account': account} for region, account in self.ELB_ACCOUNTS.items()}
+            )
+
+            # Fn::Or accepts at most 10 conditions, hence region checks are grouped.
+            regions = [Fn.condition_equals(Aws.REGION, region) for region in self.ELB_ACCOUNTS]
+            while len(regions) > 1:
+                groups = [regions[index:index + 10] for index in range(0, len(regions), 10)]
+                regions = [Fn.condition_or(*group) if len(group) > 1 else group[0] for group in groups]
+
+            condition = CfnCondition(scope, prefix + 'ElbAccountRegion', expression=regions[0])
+
+            account = mapping.find_in_map(Aws.REGION, 'account')
+            return Fn.condition_if(
+                condition.logical_id,
+                {'AWS': Fn.join('', ['arn:', Aws.PARTITION, ':iam::', account, ':root'])},
+                {'Service': self.LOG_DELIVERY_SERVICE}
+            )
+
+        if region in self.ELB_ACCOUNTS:
+            return {'AWS': Fn.join('', ['arn:', Aws.PARTITION, ':iam::', self.ELB_ACCOUNTS[region], ':root'])}
+
+        return {'Service': self.LOG_DELIVERY_SERVICE}
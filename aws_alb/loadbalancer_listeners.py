@@ -1,28 +1,57 @@
-from typing import Tuple, Optional
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 from aws_alb.alb_traffic_enum import AlbTrafficEnum
 from aws_cdk import core
 from aws_cdk.aws_certificatemanager import CfnCertificate
-from aws_cdk.aws_elasticloadbalancingv2 import CfnListener, CfnTargetGroup, CfnLoadBalancer
+from aws_cdk.aws_elasticloadbalancingv2 import CfnListener, CfnListenerRule, CfnTargetGroup, CfnLoadBalancer
 from aws_alb.factories.listener_factory import ListenerFactory
+from aws_alb.factories.listener_rule_factory import ListenerRuleFactory
 from aws_alb.factories.target_group_factory import TargetGroupFactory
 from aws_alb.listener_actions import ListenerActions
+from aws_alb.listener_port_pool import ListenerPortPair, ListenerPortPool
+from aws_alb.listener_rule_optimizer import ListenerRuleOptimizer, ListenerRuleOptimizationReport
+from aws_alb.loadbalancer_monitoring import LoadBalancerMonitoring
 from aws_alb.params.listener_params import ListenerParams
+from aws_alb.params.listener_rule_params import ListenerRuleParams
 from aws_alb.params.target_group_params import TargetGroupParams
+from aws_alb.traffic_shift_enum import TrafficShiftEnum
+from aws_alb.traffic_shift_schedule import TrafficShiftSchedule
 
 
 class LoadBalancerListeners:
     """
     A class which manages listeners for a loadbalancer.
     """
+    # Maximum number of rules per listener (default rule excluded).
+    MAX_RULES_PER_LISTENER = 100
+    # Maximum number of distinct certificates per loadbalancer (default certificates of listeners excluded).
+    MAX_ADDITIONAL_CERTIFICATES = 25
 
-    def __init__(self, scope: core.Stack) -> None:
+    def __init__(self, scope: core.Stack, monitoring: Optional[LoadBalancerMonitoring] = None) -> None:
         """
         Constructor.
 
         :param scope: A CloudFormation stack in which the resources should be added.
+        :param monitoring: If given, every created target group is monitored.
         """
+        self.__monitoring = monitoring
         self.__listener_factory = ListenerFactory(scope)
         self.__target_group_factory = TargetGroupFactory(scope)
+        self.__listener_rule_factory = ListenerRuleFactory(scope)
+
+        # Ports of created listeners grouped by a loadbalancer. Loadbalancers are identified by python object
+        # identity rather than by a construct path which would cost a jsii round-trip on every call.
+        self.__listener_ports: Dict[int, Set[int]] = {}
+        # Additional (SNI) certificates of created listeners grouped by a loadbalancer. Identified by python
+        # object identity as well.
+        self.__listener_certificates: Dict[int, Set[int]] = {}
+        # Port pools of blue/green services grouped by a loadbalancer.
+        self.__port_pools: Dict[int, ListenerPortPool] = {}
+        # Listener rules and their priorities grouped by a listener.
+        self.__listener_rules: Dict[str, List[Tuple[int, ListenerRuleParams, CfnListenerRule]]] = {}
+        # Parameters of created listeners (by a listener path) and target groups (by a target group reference)
+        # to validate protocols of forward actions.
+        self.__listener_params: Dict[str, ListenerParams] = {}
+        self.__target_group_params: Dict[str, TargetGroupParams] = {}
 
     def create_default_listeners(
             self,
@@ -31,6 +60,9 @@ class LoadBalancerListeners:
             cert: Optional[CfnCertificate] = None,
             inbound_traffic: AlbTrafficEnum = None,
             outbound_traffic: AlbTrafficEnum = None,
+            certificates: Optional[List[CfnCertificate]] = None,
+            ssl_policy: Optional[str] = None,
+            prefix_list_ids: Optional[List[str]] = None,
     ) -> Tuple[CfnListener, CfnListener]:
         """
         Creates default listeners for normal loadbalancer use.
@@ -44,52 +76,64 @@ class LoadBalancerListeners:
         :param cert: Certificate to enable https.
         :param inbound_traffic: Inbound traffic configuration (for security group).
         :param outbound_traffic: Outbound traffic configuration (for security group).
+        :param certificates: Additional certificates for https listeners (SNI).
+        :param ssl_policy: Security policy for https listeners.
+        :param prefix_list_ids: Managed prefix list ids for prefix list traffic.
 
         :return: Tuple of two listeners. First one is blue (production) and the second one is green (test).
         """
-        blue = None
-        green = None
-
         kwargs = dict(
             loadbalancer=loadbalancer,
             inbound_traffic=inbound_traffic,
             outbound_traffic=outbound_traffic,
             certificate=cert,
+            prefix_list_ids=prefix_list_ids,
         )
 
-        if cert:
-            blue = self.create_listener(ListenerParams(
-                prefix + 'BlueHttps',
-                port=443,
-                action=ListenerActions.fixed_404_action(),
-                **kwargs
-            ))
+        https_kwargs = dict(
+            certificates=certificates,
+            ssl_policy=ssl_policy,
+        )
 
-            green = self.create_listener(ListenerParams(
-                prefix + 'GreenHttps',
-                port=44300,
-                action=ListenerActions.fixed_404_action(),
+        params = [
+            ListenerParams(
+                prefix + 'BlueHttp',
+                port=80,
+                action=ListenerActions.redirect_action(443) if cert else ListenerActions.fixed_404_action(),
+                **kwargs
+            ),
+            ListenerParams(
+                prefix + 'GreenHttp',
+                port=8000,
+                action=ListenerActions.redirect_action(44300) if cert else ListenerActions.fixed_404_action(),
                 **kwargs
-            ))
+            ),
+        ]
 
-        blue_http = self.create_listener(ListenerParams(
-            prefix + 'BlueHttp',
-            port=80,
-            action=ListenerActions.redirect_action(blue.port) if cert else ListenerActions.fixed_404_action(),
-            **kwargs
-        ))
+        if cert:
+            params += [
+                ListenerParams(
+                    prefix + 'BlueHttps',
+                    port=443,
+                    action=ListenerActions.fixed_404_action(),
+                    **kwargs,
+                    **https_kwargs
+                ),
+                ListenerParams(
+                    prefix + 'GreenHttps',
+                    port=44300,
+                    action=ListenerActions.fixed_404_action(),
+                    **kwargs,
+                    **https_kwargs
+                ),
+            ]
 
-        green_http = self.create_listener(ListenerParams(
-            prefix + 'GreenHttp',
-            port=8000,
-            action=ListenerActions.redirect_action(green.port) if cert else ListenerActions.fixed_404_action(),
-            **kwargs
-        ))
+        listeners = self.create_listeners(params)
 
-        blue = blue or blue_http
-        green = green or green_http
+        if cert:
+            return listeners[443], listeners[44300]
 
-        return blue, green
+        return listeners[80], listeners[8000]
 
     def create_blue_green(
             self,
@@ -109,6 +153,9 @@ class LoadBalancerListeners:
         :return: Tuple with two tuples. First tuple contains a blue pair and the second group contains a green pair.
         A pair contains two elements: a target group and a listener.
         """
+        self.validate_protocols(blue_listener_params, blue_target_group_params)
+        self.validate_protocols(green_listener_params, green_target_group_params)
+
         # Ensure prefixes tell which is green and which is blue.
         blue_target_group_params.prefix = blue_target_group_params.prefix + 'Blue'
         blue_listener_params.prefix = blue_listener_params.prefix + 'Blue'
@@ -122,11 +169,181 @@ class LoadBalancerListeners:
         green_listener_params.action = ListenerActions.target_group_action(green_group)
 
         # Create listeners.
-        blue_listener = self.create_listener(blue_listener_params)
-        green_listener = self.create_listener(green_listener_params)
+        listeners = self.create_listeners([blue_listener_params, green_listener_params])
+        blue_listener = listeners[blue_listener_params.port]
+        green_listener = listeners[green_listener_params.port]
 
         return (blue_group, blue_listener), (green_group, green_listener)
 
+    def get_port_pool(
+            self,
+            loadbalancer: CfnLoadBalancer,
+            first_port: Optional[int] = None,
+            last_port: Optional[int] = None
+    ) -> ListenerPortPool:
+        """
+        Gets a port pool of a loadbalancer. The pool is created on the first call. Ports of listeners
+        created by this manager are never handed out.
+
+        :param loadbalancer: Loadbalancer.
+        :param first_port: First port of the pool. If the pool already exists, it must match the given port.
+        If not given, ListenerPortPool.DEFAULT_FIRST_PORT is used to create the pool.
+        :param last_port: Last port of the pool. If the pool already exists, it must match the given port.
+        If not given, ListenerPortPool.DEFAULT_LAST_PORT is used to create the pool.
+
+        :return: Port pool.
+        """
+        pool = self.__port_pools.get(id(loadbalancer))
+
+        if pool is None:
+            used_ports = self.__listener_ports.setdefault(id(loadbalancer), set())
+            pool = ListenerPortPool(
+                ListenerPortPool.DEFAULT_FIRST_PORT if first_port is None else first_port,
+                ListenerPortPool.DEFAULT_LAST_PORT if last_port is None else last_port,
+                used_ports
+            )
+            self.__port_pools[id(loadbalancer)] = pool
+        else:
+            assert first_port in (None, pool.first_port) and last_port in (None, pool.last_port), (
+                f'Loadbalancer already has a port pool {pool.first_port}-{pool.last_port}.'
+            )
+
+        return pool
+
+    def create_pooled_blue_green(
+            self,
+            service: str,
+            blue_listener_params: ListenerParams,
+            green_listener_params: ListenerParams,
+            blue_target_group_params: TargetGroupParams,
+            green_target_group_params: TargetGroupParams
+    ) -> Tuple[Tuple[CfnTargetGroup, CfnListener], Tuple[CfnTargetGroup, CfnListener]]:
+        """
+        Creates blue/green listeners and target groups on ports allocated from the port pool of the loadbalancer.
+        Use it to run many services on a single loadbalancer without picking ports by hand.
+
+        :param service: Unique service name. Use get_port_pool(loadbalancer).get(service) to query its ports.
+        Ports are released if the service can not be created.
+        :param blue_listener_params: Listener parameters for the blue group. Port is ignored.
+        :param green_listener_params: Listener parameters for the green group. Port is ignored.
+        :param blue_target_group_params:  Target group parameters for the blue group.
+        :param green_target_group_params: Target group parameters for the green group.
+
+        :return: Tuple with two tuples. First tuple contains a blue pair and the second group contains a green pair.
+        A pair contains two elements: a target group and a listener.
+        """
+        assert blue_listener_params.loadbalancer is green_listener_params.loadbalancer, (
+            'Blue and green listeners must belong to the same loadbalancer.'
+        )
+
+        pool = self.get_port_pool(blue_listener_params.loadbalancer)
+        pair: ListenerPortPair = pool.allocate(service)
+        blue_listener_params.port = pair.production_port
+        green_listener_params.port = pair.test_port
+
+        try:
+            return self.create_blue_green(
+                blue_listener_params,
+                green_listener_params,
+                blue_target_group_params,
+                green_target_group_params
+            )
+        except Exception:
+            # Ports of a service which was not created must not stay allocated.
+            pool.release(service)
+            raise
+
+    @staticmethod
+    def validate_protocols(listener_params: ListenerParams, target_group_params: TargetGroupParams) -> None:
+        """
+        Validates whether a listener can forward traffic to a target group. HTTP2 and GRPC
+        target groups can only receive traffic from https listeners.
+
+        :param listener_params: Listener parameters.
+        :param target_group_params: Target group parameters.
+
+        :return: No return.
+        """
+        if target_group_params.protocol_version in ('HTTP2', 'GRPC'):
+            assert listener_params.certificates, (
+                f'{target_group_params.protocol_version} target group {target_group_params.prefix} '
+                f'requires an https listener.'
+            )
+
+    def __validate_forward_protocols(
+            self,
+            listener_params: ListenerParams,
+            action: Optional[CfnListener.ActionProperty]
+    ) -> None:
+        """
+        Validates protocols of target groups to which a listener action forwards. Target groups which
+        were not created by this manager are not validated.
+
+        :param listener_params: Parameters of a listener which owns the action (directly or by a rule).
+        :param action: Listener action.
+
+        :return: No return.
+        """
+        if not action or action.type != 'forward':
+            return
+
+        target_group_arns = [action.target_group_arn] if action.target_group_arn else []
+
+        if action.forward_config:
+            target_group_arns += [group.target_group_arn for group in action.forward_config.target_groups]
+
+        for target_group_arn in target_group_arns:
+            target_group_params = self.__target_group_params.get(target_group_arn)
+
+            if target_group_params:
+                self.validate_protocols(listener_params, target_group_params)
+
+    @staticmethod
+    def create_traffic_shift_steps(
+            steps: int,
+            traffic_shift: TrafficShiftEnum = TrafficShiftEnum.LINEAR
+    ) -> List[Tuple[int, int]]:
+        """
+        Creates a schedule of weights to gradually shift traffic from a blue target group to a green one.
+
+        :param steps: Number of steps. The last step always sends all traffic to the green target group.
+        :param traffic_shift: Shape of the schedule. Linear shifts an equal share on every step,
+        exponential doubles the green share on every step (e.g. 6, 12, 25, 50, 100 percent).
+
+        :return: A list of (blue weight, green weight) pairs. Weights of each pair sum up to 100.
+        """
+        return TrafficShiftSchedule.create_steps(steps, traffic_shift)
+
+    @staticmethod
+    def create_traffic_shift_actions(
+            blue_target_group: CfnTargetGroup,
+            green_target_group: CfnTargetGroup,
+            steps: int,
+            traffic_shift: TrafficShiftEnum = TrafficShiftEnum.LINEAR,
+            stickiness_duration_seconds: Optional[int] = None
+    ) -> List[CfnListener.ActionProperty]:
+        """
+        Creates weighted forward actions to gradually shift traffic from a blue target group to a green one.
+        Apply actions one by one (e.g. as a listener default action) to perform a canary deployment
+        without a second loadbalancer.
+
+        :param blue_target_group: Target group which currently receives traffic.
+        :param green_target_group: Target group which should receive traffic at the end.
+        :param steps: Number of steps.
+        :param traffic_shift: Shape of the schedule.
+        :param stickiness_duration_seconds: If specified, a client sticks to the same target group
+        for the given period of time.
+
+        :return: A list of forward actions, one for every step.
+        """
+        return [
+            ListenerActions.weighted_forward_action(
+                [(blue_target_group, blue), (green_target_group, green)],
+                stickiness_duration_seconds
+            )
+            for blue, green in LoadBalancerListeners.create_traffic_shift_steps(steps, traffic_shift)
+        ]
+
     def create_listener(self, listener_params: ListenerParams) -> CfnListener:
         """
         Creates a listener for a loadbalancer.
@@ -135,15 +352,234 @@ class LoadBalancerListeners:
 
         :return: Listener instance.
         """
-        sg = listener_params.loadbalancer.security_group
+        return self.create_listeners([listener_params])[listener_params.port]
 
-        inbound = sg.get_peer(listener_params.inbound_traffic)
-        outbound = sg.get_peer(listener_params.outbound_traffic)
+    def create_listeners(self, listener_params: Iterable[ListenerParams]) -> Dict[int, CfnListener]:
+        """
+        Creates listeners for a loadbalancer in one pass. All parameters are validated before
+        any listener is created and security group rules for all ports are computed at once.
 
-        sg.open_port(listener_params.port, inbound, ingress=True)
-        sg.open_port(listener_params.port, outbound, ingress=False)
+        :param listener_params: Configuration parameters for the new listeners. All listeners must
+        belong to the same loadbalancer.
 
-        return self.__listener_factory.create(listener_params)
+        :return: A dictionary of listener port and listener instance.
+        """
+        listener_params = list(listener_params)
+
+        if not listener_params:
+            return {}
+
+        loadbalancer = listener_params[0].loadbalancer
+        assert loadbalancer is not None, 'Loadbalancer must be specified.'
+        assert all(params.loadbalancer is loadbalancer for params in listener_params), (
+            'All listeners must belong to the same loadbalancer.'
+        )
+
+        used_ports = self.__listener_ports.setdefault(id(loadbalancer), set())
+        used_certificates = self.__listener_certificates.setdefault(id(loadbalancer), set())
+        self.validate_listeners(listener_params, used_ports, used_certificates)
+
+        for params in listener_params:
+            self.__validate_forward_protocols(params, params.action)
+
+        # The security group plans the combined (range-merged) rule set and writes it once at synth time.
+        sg = loadbalancer.security_group
+
+        for params in listener_params:
+            for peer in sg.get_peers(params.inbound_traffic, params.prefix_list_ids):
+                sg.open_port(params.port, peer, ingress=True)
+
+            for peer in sg.get_peers(params.outbound_traffic, params.prefix_list_ids):
+                sg.open_port(params.port, peer, ingress=False)
+
+        listeners = {}
+        for params in listener_params:
+            listeners[params.port] = self.__listener_factory.create(params)
+            self.__listener_params[listeners[params.port].node.path] = params
+            used_ports.add(params.port)
+            used_certificates.update(id(certificate) for certificate in params.certificates[1:])
+
+        return listeners
+
+    @staticmethod
+    def validate_listeners(
+            listener_params: List[ListenerParams],
+            used_ports: Optional[Set[int]] = None,
+            used_certificates: Optional[Set[int]] = None
+    ) -> None:
+        """
+        Validates listeners of a single loadbalancer. Raises an assertion error on port collisions,
+        certificate/protocol mismatches and too many certificates.
+
+        :param listener_params: Configuration parameters of listeners.
+        :param used_ports: Ports of already existing listeners.
+        :param used_certificates: Identities (id()) of additional certificates of already existing listeners.
+
+        :return: No return.
+        """
+        used_ports = set(used_ports or [])
+        used_certificates = set(used_certificates or [])
+        https_ports = {params.port for params in listener_params if params.certificates}
+
+        for params in listener_params:
+            assert params.port is not None, f'Listener {params.prefix} port must be specified.'
+            assert 1 <= params.port <= 65535, f'Listener {params.prefix} port {params.port} is invalid.'
+            assert params.port not in used_ports, f'Listener {params.prefix} port {params.port} is already used.'
+            used_ports.add(params.port)
+
+            assert not params.ssl_policy or params.certificates, (
+                f'Listener {params.prefix} has a ssl policy but no certificate.'
+            )
+            used_certificates.update(id(certificate) for certificate in params.certificates[1:])
+
+        # The quota is per loadbalancer, hence a certificate shared by many listeners is counted once.
+        assert len(used_certificates) <= LoadBalancerListeners.MAX_ADDITIONAL_CERTIFICATES, (
+            f'Loadbalancer can not have more than {LoadBalancerListeners.MAX_ADDITIONAL_CERTIFICATES} '
+            f'additional certificates.'
+        )
+
+        # A redirect to a listener of the same batch must use the protocol of that listener.
+        ports = {params.port for params in listener_params}
+        for params in listener_params:
+            redirect = params.action.redirect_config if params.action else None
+
+            if not redirect or not redirect.port or not redirect.port.isdigit() or int(redirect.port) not in ports:
+                continue
+
+            protocol = 'HTTPS' if int(redirect.port) in https_ports else 'HTTP'
+            assert redirect.protocol in (None, '#{protocol}', protocol), (
+                f'Listener {params.prefix} redirects with {redirect.protocol} to {protocol} port {redirect.port}.'
+            )
+
+    def create_listener_rule(self, listener_rule_params: ListenerRuleParams) -> CfnListenerRule:
+        """
+        Creates a listener rule for path, host, header, query string or source ip based routing.
+
+        :param listener_rule_params: Configuration parameters for the new listener rule.
+
+        :return: Listener rule instance.
+        """
+        return self.create_listener_rules([listener_rule_params])[0]
+
+    def create_listener_rules(
+            self,
+            listener_rule_params: List[ListenerRuleParams],
+            ordered: bool = False
+    ) -> List[CfnListenerRule]:
+        """
+        Creates listener rules and allocates their priorities. Rules without an explicit priority
+        get the lowest free priorities: more specific rules first and, among equally specific
+        rules, rules with a higher traffic weight first. All rules are validated against
+        AWS limits before any of them is created. An automatic rule which would be covered by a rule
+        evaluated earlier (hence would never match) or which would cover a rule evaluated later is rejected.
+        HTTP2 and GRPC target groups can be forwarded to only by rules of https listeners.
+
+        :param listener_rule_params: Configuration parameters for the new listener rules.
+        :param ordered: If true, priorities are allocated in the given order instead.
+
+        :return: Listener rule instances in the same order as given parameters.
+        """
+        for params in listener_rule_params:
+            params.validate()
+
+            listener_params = self.__listener_params.get(params.listener.node.path)
+            if listener_params:
+                self.__validate_forward_protocols(listener_params, params.action)
+
+        # Group new rules by listeners as priorities are unique only within a listener.
+        groups: Dict[str, List[ListenerRuleParams]] = {}
+        for params in listener_rule_params:
+            groups.setdefault(params.listener.node.path, []).append(params)
+
+        priorities: Dict[int, int] = {}
+        for path, group in groups.items():
+            existing = self.__listener_rules.get(path, [])
+
+            assert len(existing) + len(group) <= self.MAX_RULES_PER_LISTENER, (
+                f'Listener {path} can not have more than {self.MAX_RULES_PER_LISTENER} rules.'
+            )
+
+            used = {priority for priority, _, _ in existing}
+            for params in group:
+                if params.priority is not None:
+                    assert params.priority not in used, f'Priority {params.priority} is already used in {path}.'
+                    used.add(params.priority)
+                    priorities[id(params)] = params.priority
+
+            automatic = [params for params in group if params.priority is None]
+            if not ordered:
+                automatic.sort(key=lambda rule: (rule.specificity, rule.traffic_weight), reverse=True)
+
+            free = (priority for priority in range(1, 50001) if priority not in used)
+            for params in automatic:
+                priorities[id(params)] = next(free)
+
+            # Automatic priorities are ordered by specificity only within a call. A rule created by a later
+            # call gets a higher priority, hence it must not be covered by a rule which is evaluated earlier.
+            # It can also get a lower priority than an explicit one, hence it must not cover a rule which is
+            # evaluated later either.
+            evaluated = [(priority, rule_params) for priority, rule_params, _ in existing]
+            evaluated += [(priorities[id(rule_params)], rule_params) for rule_params in group]
+            evaluated.sort(key=lambda rule: rule[0])
+
+            for params in automatic:
+                priority = priorities[id(params)]
+                shadowing = next((
+                    (other_priority, other) for other_priority, other in evaluated
+                    if other_priority < priority and ListenerRuleOptimizer.covers(other, params)
+                ), None)
+
+                assert shadowing is None, (
+                    f'Rule {params.prefix} (priority {priority}) would never match in {path}: it is covered by '
+                    f'rule {shadowing[1].prefix} (priority {shadowing[0]}). Create more specific rules first '
+                    f'or give them explicit priorities.'
+                )
+
+                shadowed = next((
+                    (other_priority, other) for other_priority, other in evaluated
+                    if other_priority > priority and ListenerRuleOptimizer.covers(params, other)
+                ), None)
+
+                assert shadowed is None, (
+                    f'Rule {params.prefix} (priority {priority}) would shadow rule {shadowed[1].prefix} '
+                    f'(priority {shadowed[0]}) in {path}: it covers that rule. Give rule {params.prefix} '
+                    f'an explicit priority above {shadowed[0]}.'
+                )
+
+        rules = []
+        for params in listener_rule_params:
+            priority = priorities[id(params)]
+            rule = self.__listener_rule_factory.create(params, priority)
+            self.__listener_rules.setdefault(params.listener.node.path, []).append((priority, params, rule))
+            rules.append(rule)
+
+        return rules
+
+    def create_optimized_listener_rules(
+            self,
+            listener_rule_params: List[ListenerRuleParams]
+    ) -> Tuple[List[CfnListenerRule], ListenerRuleOptimizationReport]:
+        """
+        Optimizes listener rules before creating them: shadowed rules are removed, rules with the same
+        action are merged and hot rules are evaluated first (see ListenerRuleOptimizer).
+
+        :param listener_rule_params: Configuration parameters for the new listener rules.
+        Explicit priorities are not allowed.
+
+        :return: Created listener rules in evaluation order and an optimization report.
+        """
+        optimized, report = ListenerRuleOptimizer.optimize(listener_rule_params)
+        return self.create_listener_rules(optimized, ordered=True), report
+
+    def get_listener_rules(self, listener: CfnListener) -> List[Tuple[int, ListenerRuleParams, CfnListenerRule]]:
+        """
+        Returns listener rules created for a given listener.
+
+        :param listener: Listener.
+
+        :return: A list of (priority, parameters, rule) tuples sorted by priority.
+        """
+        return sorted(self.__listener_rules.get(listener.node.path, []), key=lambda rule: rule[0])
 
     def create_target_group(self, target_group_params: TargetGroupParams) -> CfnTargetGroup:
         """
@@ -153,4 +589,10 @@ class LoadBalancerListeners:
 
         :return: Target group instance.
         """
-        return self.__target_group_factory.create_target_group(target_group_params)
+        target_group = self.__target_group_factory.create_target_group(target_group_params)
+        self.__target_group_params[target_group.ref] = target_group_params
+
+        if self.__monitoring:
+            self.__monitoring.monitor_target_group(target_group)
+
+        return target_group
@@ -0,0 +1,227 @@
+from typing import Dict, List, Optional, Tuple
+from aws_cdk import aws_cloudwatch
+from aws_cdk.aws_cloudwatch import CfnAlarm
+from aws_cdk.aws_elasticloadbalancingv2 import CfnLoadBalancer, CfnTargetGroup
+from aws_cdk.core import Duration, Stack
+from aws_alb.params.monitoring_params import MonitoringParams
+
+
+class LoadBalancerMonitoring:
+    """
+    A class which manages latency and saturation alarms and a dashboard for a loadbalancer
+    and its target groups.
+
+    More about loadbalancer metrics:
+    https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-cloudwatch-metrics.html
+    """
+    NAMESPACE = 'AWS/ApplicationELB'
+
+    def __init__(
+            self,
+            scope: Stack,
+            prefix: str,
+            loadbalancer: CfnLoadBalancer,
+            monitoring_params: MonitoringParams
+    ) -> None:
+        """
+        Constructor.
+
+        :param scope: A CloudFormation stack in which the resources should be added.
+        :param prefix: A prefix for newly created resources.
+        :param loadbalancer: Loadbalancer to monitor.
+        :param monitoring_params: Alarm thresholds and other monitoring configuration.
+        """
+        monitoring_params.validate()
+
+        self.__scope = scope
+        self.__prefix = prefix
+        self.__loadbalancer = loadbalancer
+        self.__params = monitoring_params
+        self.__alarms: List[CfnAlarm] = []
+
+        params = monitoring_params
+        dimensions = self.__loadbalancer_dimensions()
+
+        self.__create_alarm(
+            prefix + 'LBLatency',
+            'TargetResponseTime',
+            dimensions,
+            params.latency_threshold_seconds,
+            extended_statistic=params.latency_percentile
+        )
+        self.__create_alarm(prefix + 'LBElb5xx', 'HTTPCode_ELB_5XX_Count', dimensions, params.elb_5xx_threshold)
+        self.__create_alarm(
+            prefix + 'LBRejectedConnections',
+            'RejectedConnectionCount',
+            dimensions,
+            params.rejected_connections_threshold,
+            comparison_operator='GreaterThanOrEqualToThreshold'
+        )
+
+        if params.consumed_lcus_threshold is not None:
+            self.__create_alarm(prefix + 'LBConsumedLcus', 'ConsumedLCUs', dimensions, params.consumed_lcus_threshold)
+
+        self.__dashboard = None
+        if params.create_dashboard:
+            self.__dashboard = aws_cloudwatch.Dashboard(
+                scope,
+                prefix + 'LBDashboard',
+                dashboard_name=prefix + 'LoadBalancer'
+            )
+
+            self.__dashboard.add_widgets(
+                self.__graph(
+                    'Target response time',
+                    [('TargetResponseTime', statistic) for statistic in ('p50', 'p90', params.latency_percentile)],
+                    dimensions,
+                    params.latency_threshold_seconds
+                ),
+                self.__graph(
+                    '5XX responses',
+                    [('HTTPCode_ELB_5XX_Count', 'Sum'), ('HTTPCode_Target_5XX_Count', 'Sum')],
+                    dimensions
+                ),
+                self.__graph(
+                    'Saturation',
+                    [('RejectedConnectionCount', 'Sum'), ('ActiveConnectionCount', 'Sum')],
+                    dimensions
+                ),
+                self.__graph(
+                    'Capacity',
+                    [('RequestCount', 'Sum'), ('ConsumedLCUs', 'Sum')],
+                    dimensions,
+                    params.consumed_lcus_threshold
+                ),
+            )
+
+    @property
+    def alarms(self) -> List[CfnAlarm]:
+        """
+        All created alarms.
+
+        :return: A list of alarms.
+        """
+        return list(self.__alarms)
+
+    @property
+    def dashboard(self) -> Optional[aws_cloudwatch.Dashboard]:
+        """
+        Created dashboard.
+
+        :return: Dashboard or None if dashboard creation is disabled.
+        """
+        return self.__dashboard
+
+    def monitor_target_group(self, target_group: CfnTargetGroup) -> List[CfnAlarm]:
+        """
+        Creates alarms and dashboard widgets for a target group of the loadbalancer.
+
+        :param target_group: Target group to monitor.
+
+        :return: A list of created alarms.
+        """
+        params = self.__params
+        prefix = target_group.node.id
+        dimensions = self.__loadbalancer_dimensions()
+        dimensions['TargetGroup'] = target_group.attr_target_group_full_name
+
+        alarms = [
+            self.__create_alarm(
+                prefix + 'Latency',
+                'TargetResponseTime',
+                dimensions,
+                params.latency_threshold_seconds,
+                extended_statistic=params.latency_percentile
+            ),
+            self.__create_alarm(
+                prefix + 'Target5xx',
+                'HTTPCode_Target_5XX_Count',
+                dimensions,
+                params.target_5xx_threshold
+            ),
+            self.__create_alarm(
+                prefix + 'UnhealthyHosts',
+                'UnHealthyHostCount',
+                dimensions,
+                params.unhealthy_hosts_threshold,
+                statistic='Maximum',
+                comparison_operator='GreaterThanOrEqualToThreshold'
+            ),
+        ]
+
+        if self.__dashboard:
+            self.__dashboard.add_widgets(
+                self.__graph(
+                    f'{prefix} response time',
+                    [('TargetResponseTime', statistic) for statistic in ('p50', 'p90', params.latency_percentile)],
+                    dimensions,
+                    params.latency_threshold_seconds
+                ),
+                self.__graph(
+                    f'{prefix} hosts',
+                    [('HealthyHostCount', 'Minimum'), ('UnHealthyHostCount', 'Maximum')],
+                    dimensions
+                ),
+            )
+
+        return alarms
+
+    def __loadbalancer_dimensions(self) -> Dict[str, str]:
+        return {'LoadBalancer': self.__loadbalancer.attr_load_balancer_full_name}
+
+    def __create_alarm(
+            self,
+            name: str,
+            metric_name: str,
+            dimensions: Dict[str, str],
+            threshold: float,
+            statistic: str = 'Sum',
+            extended_statistic: Optional[str] = None,
+            comparison_operator: str = 'GreaterThanThreshold'
+    ) -> CfnAlarm:
+        params = self.__params
+
+        alarm = CfnAlarm(
+            self.__scope,
+            name + 'Alarm',
+            alarm_name=name + 'Alarm',
+            alarm_description=f'{metric_name} {comparison_operator} {threshold}.',
+            namespace=self.NAMESPACE,
+            metric_name=metric_name,
+            dimensions=[CfnAlarm.DimensionProperty(name=key, value=value) for key, value in dimensions.items()],
+            # Statistic and extended statistic (percentile) are mutually exclusive.
+            statistic=None if extended_statistic else statistic,
+            extended_statistic=extended_statistic,
+            period=params.period_seconds,
+            evaluation_periods=params.evaluation_periods,
+            threshold=threshold,
+            comparison_operator=comparison_operator,
+            treat_missing_data='notBreaching',
+            alarm_actions=params.alarm_actions or None
+        )
+
+        self.__alarms.append(alarm)
+        return alarm
+
+    def __graph(
+            self,
+            title: str,
+            metrics: List[Tuple[str, str]],
+            dimensions: Dict[str, str],
+            threshold: Optional[float] = None
+    ) -> aws_cloudwatch.GraphWidget:
+        return aws_cloudwatch.GraphWidget(
+            title=title,
+            left=[
+                aws_cloudwatch.Metric(
+                    namespace=self.NAMESPACE,
+                    metric_name=metric_name,
+                    dimensions=dimensions,
+                    statistic=statistic,
+                    period=Duration.seconds(self.__params.period_seconds)
+                ) for metric_name, statistic in metrics
+            ],
+            left_annotations=[
+                aws_cloudwatch.HorizontalAnnotation(value=threshold, label='Alarm threshold')
+            ] if threshold is not None else None
+        )
@@ -1,13 +1,23 @@
-from typing import Optional
+from typing import List, Optional, Set, Tuple
 from aws_alb.alb_traffic_enum import AlbTrafficEnum
-from aws_cdk.aws_ec2 import SecurityGroup, IVpc, IPeer, Peer
-from aws_cdk.core import Stack
+from aws_cdk.aws_ec2 import SecurityGroup, ISecurityGroup, IVpc, IPeer, CfnVPC, CfnVPCCidrBlock
+from aws_cdk.core import Stack, Fn
 from aws_alb.loadbalancer_sg_modifier import SecurityGroupModifier
+from aws_alb.loadbalancer_sg_object_cache import SecurityGroupObjectCache
+from aws_alb.loadbalancer_sg_rule_planner import SecurityGroupRulePlanner
 
 
 class LoadBalancerSecurityGroup(SecurityGroup):
     """
     A class which manages a default security group for a loadbalancer.
+
+    Opened ports are not written immediately. They are collected by a rule planner
+    and the minimal (deduplicated and range-merged) rule set is written once at synth time.
+
+    A single security group can be shared by a fleet of loadbalancers with the same traffic profile
+    (see ApplicationLoadbalancer loadbalancer_security_group parameter): listeners of all of them
+    open the same ports, hence rules are written once, and targets need a single rule referencing
+    this security group (see grant_access()) instead of a rule per loadbalancer.
     """
     def __init__(
             self,
@@ -32,7 +42,33 @@ class LoadBalancerSecurityGroup(SecurityGroup):
         )
 
         self.__vpc = vpc
-        self.__security_group_modifier = SecurityGroupModifier(self)
+        self.__vpc_cidr_block: Optional[str] = None
+        self.__vpc_ipv6_cidr_block: Optional[str] = None
+        self.__object_cache = SecurityGroupObjectCache()
+        self.__security_group_modifier = SecurityGroupModifier(self, self.__object_cache)
+        self.__rule_planner = SecurityGroupRulePlanner()
+        self.__rules_written = False
+        # Target security groups and port ranges which were already granted access. Security groups are identified
+        # by python object identity rather than by a construct id which would cost a jsii round-trip.
+        self.__grants: Set[Tuple[int, int, int]] = set()
+
+    @property
+    def rule_planner(self) -> SecurityGroupRulePlanner:
+        """
+        Rule planner which collects all opened ports. Use it to see how many rules were saved.
+
+        :return: Rule planner.
+        """
+        return self.__rule_planner
+
+    @property
+    def object_cache(self) -> SecurityGroupObjectCache:
+        """
+        Cache of peer and port objects. Use it to see how many jsii objects were reused.
+
+        :return: Object cache.
+        """
+        return self.__object_cache
 
     def open_port(self, port: int, peer: Optional[IPeer] = None, ingress: bool = True) -> None:
         """
@@ -44,22 +80,150 @@ class LoadBalancerSecurityGroup(SecurityGroup):
 
         :return: No return.
         """
+        self.open_port_range(port, port, peer, ingress)
+
+    def open_port_range(
+            self,
+            from_port: int,
+            to_port: int,
+            peer: Optional[IPeer] = None,
+            ingress: bool = True
+    ) -> None:
+        """
+        Modifies a current security group by opening a specified port range.
+
+        :param from_port: First port of the range (inclusive).
+        :param to_port: Last port of the range (inclusive).
+        :param peer: Peer (a CIDR or another security group).
+        :param ingress: Specifies whether it is configured for ingress or egress traffic.
+
+        :return: No return.
+        """
+        assert not self.__rules_written, 'Security group rules were already written.'
+
         if peer:
-            self.__security_group_modifier.open_port(port, peer, ingress)
+            self.__rule_planner.add_range(from_port, to_port, peer, ingress)
+
+    def grant_access(
+            self,
+            target_security_group: ISecurityGroup,
+            from_port: int,
+            to_port: Optional[int] = None,
+            egress: bool = False
+    ) -> None:
+        """
+        Allows loadbalancers of this security group to reach targets with a single ingress rule which
+        references this security group instead of loadbalancer subnet CIDR blocks.
+
+        :param target_security_group: Security group of targets (e.g. ECS tasks or instances).
+        :param from_port: Target port or the first port of a target port range (inclusive).
+        :param to_port: Last port of the range (inclusive). If not given, only from_port is allowed.
+        :param egress: Whether to open the same ports for outbound traffic of this security group towards
+        targets. Not needed if outbound traffic to the VPC CIDR block is already allowed.
+
+        :return: No return.
+        """
+        to_port = from_port if to_port is None else to_port
+        assert 0 <= from_port <= to_port <= 65535, f'Invalid port range {from_port}-{to_port}.'
+
+        key = (id(target_security_group), from_port, to_port)
+
+        if key in self.__grants:
+            return
+
+        self.__grants.add(key)
+
+        target_security_group.add_ingress_rule(
+            peer=self,
+            connection=self.__object_cache.get_port(from_port, to_port, True),
+            description=f'Access from {self.node.id} load balancers.'
+        )
+
+        if egress:
+            self.open_port_range(from_port, to_port, target_security_group, ingress=False)
+
+    def _on_prepare(self) -> None:
+        """
+        Writes the planned security group rules right before the synthesis.
+
+        :return: No return.
+        """
+        if not self.__rules_written:
+            for rule in self.__rule_planner.plan():
+                self.__security_group_modifier.open_port_range(rule.from_port, rule.to_port, rule.peer, rule.ingress)
+
+            self.__rules_written = True
+
+        super()._on_prepare()
 
     def get_peer(self, traffic: AlbTrafficEnum) -> Optional[IPeer]:
         """
-        Depending on enum creates a peer.
+        Depending on enum creates a peer. Peers are cached, hence the same peer object is returned for the same enum.
 
-        :param traffic: Configuration enum.
+        :param traffic: Configuration enum. Dual-stack and prefix list traffic need more than one peer,
+        use get_peers() for them.
 
         :return: Peer.
         """
-        if traffic == AlbTrafficEnum.INTERNET:
-            cidr_peer = Peer.any_ipv4()
-        elif traffic == AlbTrafficEnum.VPC:
-            cidr_peer = Peer.ipv4(self.__vpc.vpc_cidr_block)
-        else:
-            cidr_peer = None
+        peers = self.get_peers(traffic)
+        assert len(peers) <= 1, f'{traffic} traffic requires multiple peers. Use get_peers().'
+
+        return peers[0] if peers else None
+
+    def get_peers(self, traffic: AlbTrafficEnum, prefix_list_ids: Optional[List[str]] = None) -> List[IPeer]:
+        """
+        Depending on enum creates peers. Peers are cached, hence the same peer objects are returned for the same enum.
+
+        :param traffic: Configuration enum.
+        :param prefix_list_ids: Managed prefix list ids. Required for prefix list traffic.
+
+        :return: A list of peers. Empty if traffic is not allowed.
+        """
+        cache = self.__object_cache
+        peers = []
+
+        if traffic in (AlbTrafficEnum.INTERNET, AlbTrafficEnum.INTERNET_DUALSTACK):
+            peers.append(cache.get_ipv4_peer())
+
+        if traffic in (AlbTrafficEnum.INTERNET_IPV6, AlbTrafficEnum.INTERNET_DUALSTACK):
+            peers.append(cache.get_ipv6_peer())
+
+        if traffic in (AlbTrafficEnum.VPC, AlbTrafficEnum.VPC_DUALSTACK):
+            # Reading the CIDR block is a jsii round-trip as well.
+            self.__vpc_cidr_block = self.__vpc_cidr_block or self.__vpc.vpc_cidr_block
+            peers.append(cache.get_ipv4_peer(self.__vpc_cidr_block))
+
+        if traffic in (AlbTrafficEnum.VPC_IPV6, AlbTrafficEnum.VPC_DUALSTACK):
+            self.__vpc_ipv6_cidr_block = self.__vpc_ipv6_cidr_block or self.__get_vpc_ipv6_cidr_block()
+            peers.append(cache.get_ipv6_peer(self.__vpc_ipv6_cidr_block))
+
+        if traffic == AlbTrafficEnum.PREFIX_LIST:
+            assert prefix_list_ids, 'Prefix list traffic requires prefix list ids.'
+            peers.extend(cache.get_prefix_list_peer(prefix_list_id) for prefix_list_id in prefix_list_ids)
+
+        return peers
+
+    def __get_vpc_ipv6_cidr_block(self) -> str:
+        cfn_vpc = self.__vpc.node.default_child
+
+        assert isinstance(cfn_vpc, CfnVPC), 'VPC IPv6 CIDR block is known only for VPCs defined in the same app.'
+
+        # The first Amazon provided IPv6 CIDR block. It is known only after it is associated with the VPC,
+        # hence rules referencing it must be created after the association (AWS::EC2::VPCCidrBlock).
+        scope = Stack.of(cfn_vpc)
+        vpc_ref = scope.resolve(cfn_vpc.ref)
+        association = next((
+            child for child in self.__vpc.node.children + scope.node.children
+            if isinstance(child, CfnVPCCidrBlock)
+            and child.amazon_provided_ipv6_cidr_block
+            and scope.resolve(child.vpc_id) == vpc_ref
+        ), None)
+
+        assert association is not None, (
+            'VPC IPv6 traffic requires an Amazon provided IPv6 CIDR block associated with the VPC '
+            '(CfnVPCCidrBlock in the VPC or its stack).'
+        )
+
+        self.node.add_dependency(association)
 
-        return cidr_peer
+        return Fn.select(0, cfn_vpc.attr_ipv6_cidr_blocks)
@@ -1,18 +1,21 @@
-from aws_cdk import aws_ec2
+from typing import Optional
 from aws_cdk.aws_ec2 import ISecurityGroup, IPeer
+from aws_alb.loadbalancer_sg_object_cache import SecurityGroupObjectCache
 
 
 class SecurityGroupModifier:
     """
     Class which modifies a given security group.
     """
-    def __init__(self, security_group: ISecurityGroup):
+    def __init__(self, security_group: ISecurityGroup, object_cache: Optional[SecurityGroupObjectCache] = None):
         """
         Constructor.
 
         :param security_group: Security group to modify.
+        :param object_cache: Cache of port objects. If not given, a new one is created.
         """
         self.__security_group = security_group
+        self.__object_cache = object_cache or SecurityGroupObjectCache()
 
     def open_port(self, port: int, peer: IPeer, ingress: bool = True) -> None:
         """
@@ -24,29 +27,28 @@ class SecurityGroupModifier:
 
         :return: No return.
         """
-        assert port is not None
+        self.open_port_range(port, port, peer, ingress)
+
+    def open_port_range(self, from_port: int, to_port: int, peer: IPeer, ingress: bool = True) -> None:
+        """
+        Modifies a given security group by opening a specified port range.
+
+        :param from_port: First port of the range (inclusive).
+        :param to_port: Last port of the range (inclusive).
+        :param peer: Peer (a CIDR or another security group).
+        :param ingress: Specifies whether it is configured for ingress or egress traffic.
+
+        :return: No return.
+        """
+        assert from_port is not None
+        assert to_port is not None
         assert peer is not None
         assert ingress is not None
 
         sg = self.__security_group
+        connection = self.__object_cache.get_port(from_port, to_port, ingress)
 
         if ingress:
-            sg.add_ingress_rule(
-                peer=peer,
-                connection=aws_ec2.Port(
-                    protocol=aws_ec2.Protocol.TCP,
-                    string_representation=f'Ingress {port} rule.',
-                    from_port=port,
-                    to_port=port
-                )
-            )
+            sg.add_ingress_rule(peer=peer, connection=connection)
         else:
-            sg.add_egress_rule(
-                peer=peer,
-                connection=aws_ec2.Port(
-                    protocol=aws_ec2.Protocol.TCP,
-                    string_representation=f'Egress {port} rule.',
-                    from_port=port,
-                    to_port=port
-                )
-            )
+            sg.add_egress_rule(peer=peer, connection=connection)
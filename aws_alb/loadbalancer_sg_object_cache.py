@@ -0,0 +1,114 @@
+from typing import Dict, Optional, Tuple
+from aws_cdk import aws_ec2
+from aws_cdk.aws_ec2 import IPeer, Peer
+
+
+class SecurityGroupObjectCache:
+    """
+    Per security group cache of peer and port objects.
+
+    Every peer and port is a jsii object living in the node process, hence creating one is a round-trip.
+    With hundreds of listeners the same few peers and ports are requested over and over again,
+    so they are created once and reused.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.__peers: Dict[Tuple[str, Optional[str]], IPeer] = {}
+        self.__ports: Dict[Tuple[int, int, bool], aws_ec2.Port] = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_ipv4_peer(self, cidr: Optional[str] = None) -> IPeer:
+        """
+        Returns a cached IPv4 peer or creates a new one.
+
+        :param cidr: IPv4 CIDR block. If not given, any IPv4 address is allowed.
+
+        :return: Peer.
+        """
+        return self.__get_peer('ipv4', cidr, lambda: Peer.ipv4(cidr) if cidr else Peer.any_ipv4())
+
+    def get_ipv6_peer(self, cidr: Optional[str] = None) -> IPeer:
+        """
+        Returns a cached IPv6 peer or creates a new one.
+
+        :param cidr: IPv6 CIDR block. If not given, any IPv6 address is allowed.
+
+        :return: Peer.
+        """
+        return self.__get_peer('ipv6', cidr, lambda: Peer.ipv6(cidr) if cidr else Peer.any_ipv6())
+
+    def get_prefix_list_peer(self, prefix_list_id: str) -> IPeer:
+        """
+        Returns a cached managed prefix list peer or creates a new one.
+
+        :param prefix_list_id: Managed prefix list id e.g. pl-4fa04526.
+
+        :return: Peer.
+        """
+        assert prefix_list_id, 'Prefix list id must be specified.'
+        return self.__get_peer('prefix_list', prefix_list_id, lambda: Peer.prefix_list(prefix_list_id))
+
+    def get_port(self, from_port: int, to_port: int, ingress: bool = True) -> aws_ec2.Port:
+        """
+        Returns a cached TCP port range or creates a new one.
+
+        :param from_port: First port of the range (inclusive).
+        :param to_port: Last port of the range (inclusive).
+        :param ingress: Specifies whether it is configured for ingress or egress traffic.
+
+        :return: Port range.
+        """
+        key = (from_port, to_port, ingress)
+
+        if key in self.__ports:
+            self.__hits += 1
+            return self.__ports[key]
+
+        self.__misses += 1
+
+        ports = f'{from_port}' if from_port == to_port else f'{from_port}-{to_port}'
+        direction = 'Ingress' if ingress else 'Egress'
+
+        port = aws_ec2.Port(
+            protocol=aws_ec2.Protocol.TCP,
+            string_representation=f'{direction} {ports} rule.',
+            from_port=from_port,
+            to_port=to_port
+        )
+
+        self.__ports[key] = port
+
+        return port
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of requests served from the cache.
+
+        :return: Hits count.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of requests which created a new object.
+
+        :return: Misses count.
+        """
+        return self.__misses
+
+    def __get_peer(self, kind: str, value: Optional[str], factory) -> IPeer:
+        key = (kind, value)
+
+        if key in self.__peers:
+            self.__hits += 1
+            return self.__peers[key]
+
+        self.__misses += 1
+        self.__peers[key] = factory()
+
+        return self.__peers[key]
@@ -0,0 +1,117 @@
+from typing import Dict, List, NamedTuple, Tuple
+from aws_cdk.aws_ec2 import IPeer
+
+
+class PlannedRule(NamedTuple):
+    """
+    A single security group rule produced by the planner.
+    """
+    peer: IPeer
+    from_port: int
+    to_port: int
+    ingress: bool
+
+
+class SecurityGroupRulePlanner:
+    """
+    Class which collects security group rule requests and reduces them to a minimal rule set.
+
+    Every request is a (peer, port range, direction) triple. Duplicate requests are dropped
+    and adjacent or overlapping port ranges of the same peer and direction are merged into one rule.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.__peers: Dict[str, IPeer] = {}
+        # Unique ids of already seen peer objects. Reading a unique id is a jsii round-trip.
+        self.__peer_keys: Dict[int, Tuple[IPeer, str]] = {}
+        self.__ranges: Dict[Tuple[str, bool], List[Tuple[int, int]]] = {}
+        self.__requested_rules_count = 0
+
+    def add(self, port: int, peer: IPeer, ingress: bool = True) -> None:
+        """
+        Requests a single port to be opened.
+
+        :param port: Port to open (allow traffic).
+        :param peer: Peer (a CIDR or another security group).
+        :param ingress: Specifies whether it is configured for ingress or egress traffic.
+
+        :return: No return.
+        """
+        self.add_range(port, port, peer, ingress)
+
+    def add_range(self, from_port: int, to_port: int, peer: IPeer, ingress: bool = True) -> None:
+        """
+        Requests a port range to be opened.
+
+        :param from_port: First port of the range (inclusive).
+        :param to_port: Last port of the range (inclusive).
+        :param peer: Peer (a CIDR or another security group).
+        :param ingress: Specifies whether it is configured for ingress or egress traffic.
+
+        :return: No return.
+        """
+        assert from_port is not None
+        assert to_port is not None
+        assert peer is not None
+        assert ingress is not None
+        assert 0 <= from_port <= to_port <= 65535, f'Invalid port range {from_port}-{to_port}.'
+
+        if id(peer) not in self.__peer_keys:
+            self.__peer_keys[id(peer)] = (peer, peer.unique_id)
+
+        key = self.__peer_keys[id(peer)][1]
+        self.__peers.setdefault(key, peer)
+        self.__ranges.setdefault((key, ingress), []).append((from_port, to_port))
+        self.__requested_rules_count += 1
+
+    def plan(self) -> List[PlannedRule]:
+        """
+        Computes a minimal rule set for all requests made so far.
+
+        :return: A list of rules. Rules are ordered by the first request of each peer and direction.
+        """
+        rules = []
+
+        for (key, ingress), ranges in self.__ranges.items():
+            peer = self.__peers[key]
+
+            merged: List[List[int]] = []
+            for from_port, to_port in sorted(ranges):
+                # Ports that overlap or touch the previous range extend it.
+                if merged and from_port <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], to_port)
+                else:
+                    merged.append([from_port, to_port])
+
+            rules.extend(PlannedRule(peer, from_port, to_port, ingress) for from_port, to_port in merged)
+
+        return rules
+
+    @property
+    def requested_rules_count(self) -> int:
+        """
+        Number of rules that would have been created without planning.
+
+        :return: Requested rules count.
+        """
+        return self.__requested_rules_count
+
+    @property
+    def planned_rules_count(self) -> int:
+        """
+        Number of rules in the minimal rule set.
+
+        :return: Planned rules count.
+        """
+        return len(self.plan())
+
+    @property
+    def saved_rules_count(self) -> int:
+        """
+        Number of rules that planning saved.
+
+        :return: Saved rules count.
+        """
+        return self.requested_rules_count - self.planned_rules_count
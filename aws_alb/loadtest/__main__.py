@@ -0,0 +1,64 @@
+import argparse
+import asyncio
+from aws_alb.loadtest.blue_green_load_test import BlueGreenLoadTest
+from aws_alb.loadtest.stand_in_target import StandInTarget
+from aws_alb.loadtest.target_group_model import TargetGroupModel
+from aws_alb.params.target_group_attributes import TargetGroupAttributes
+from aws_alb.params.target_group_params import TargetGroupParams
+from aws_alb.traffic_shift_enum import TrafficShiftEnum
+from aws_alb.traffic_shift_schedule import TrafficShiftSchedule
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m aws_alb.loadtest',
+        description='Load tests a blue/green traffic shift against local stand-in targets.'
+    )
+    parser.add_argument('--steps', type=int, default=5, help='Number of traffic shift steps.')
+    parser.add_argument('--shift', default='linear', choices=[shift.name.lower() for shift in TrafficShiftEnum])
+    parser.add_argument('--step-duration', type=float, default=5.0, help='Duration of every step in seconds.')
+    parser.add_argument('--rps', type=float, default=100.0, help='Requests per second.')
+    parser.add_argument('--targets', type=int, default=2, help='Number of targets per target group.')
+    parser.add_argument('--registration-interval', type=float, default=0.0, help='Seconds between green targets.')
+    parser.add_argument('--slow-start', type=int, default=0, help='Slow start duration (target group attribute).')
+    parser.add_argument(
+        '--deregistration-delay', type=int, default=300, help='Deregistration delay (target group attribute).'
+    )
+    parser.add_argument('--time-scale', type=float, default=60.0, help='Modelled delays are divided by this number.')
+    parser.add_argument('--latency', type=float, default=0.01, help='Minimum target latency in seconds.')
+    parser.add_argument('--tail-latency', type=float, default=0.05, help='Mean tail latency in seconds.')
+    parser.add_argument('--green-error-rate', type=float, default=0.0, help='Share of failing green requests.')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    steps = TrafficShiftSchedule.create_steps(args.steps, TrafficShiftEnum[args.shift.upper()])
+
+    # Delays are modelled from target group params, hence they are validated like the deployed ones.
+    attributes = TargetGroupAttributes(
+        slow_start_duration_seconds=args.slow_start,
+        deregistration_delay_seconds=args.deregistration_delay
+    )
+    attributes.validate()
+    params = TargetGroupParams('LoadTest', None, attributes=attributes)
+
+    def targets(name: str, error_rate: float = 0.0):
+        return [
+            StandInTarget(f'{name}{index}', args.latency, args.tail_latency, error_rate, args.seed)
+            for index in range(args.targets)
+        ]
+
+    load_test = BlueGreenLoadTest(
+        blue=TargetGroupModel.from_params('blue', params, targets('blue'), args.time_scale),
+        green=TargetGroupModel.from_params('green', params, targets('green', args.green_error_rate), args.time_scale),
+        steps=steps,
+        step_duration_seconds=args.step_duration,
+        requests_per_second=args.rps,
+        registration_interval_seconds=args.registration_interval,
+        seed=args.seed
+    )
+
+    print(asyncio.run(load_test.run()).to_text())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+import asyncio
+import time
+from random import Random
+from typing import List, Optional, Tuple
+from aws_alb.loadtest.load_test_report import LoadTestReport, LoadTestWindow
+from aws_alb.loadtest.stand_in_target import StandInTarget
+from aws_alb.loadtest.target_group_model import TargetGroupModel
+
+
+class BlueGreenLoadTest:
+    """
+    Load test of a blue/green traffic shift against local stand-in targets.
+
+    Requests are sent at a constant rate (open loop, like real clients which do not wait for each other).
+    Every request goes to the blue or the green target group according to the forward weights of the
+    current step (see TrafficShiftSchedule.create_steps). Green targets are registered
+    when the test starts, hence slow start applies to them. If the last step sends all traffic to green,
+    blue targets are deregistered when it starts and stopped after the deregistration delay.
+    """
+    def __init__(
+            self,
+            blue: TargetGroupModel,
+            green: TargetGroupModel,
+            steps: List[Tuple[int, int]],
+            step_duration_seconds: float,
+            requests_per_second: float,
+            registration_interval_seconds: float = 0.0,
+            request_timeout_seconds: float = 10.0,
+            seed: Optional[int] = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param blue: Target group which receives traffic before the shift.
+        :param green: Target group which receives traffic after the shift.
+        :param steps: A list of (blue weight, green weight) pairs.
+        :param step_duration_seconds: Duration of every step.
+        :param requests_per_second: Request rate.
+        :param registration_interval_seconds: Time between registrations of green targets.
+        :param request_timeout_seconds: Requests without a response within this time are failed.
+        :param seed: Seed for target choices.
+        """
+        assert steps, 'At least one step must be specified.'
+        assert step_duration_seconds > 0, 'Step duration must be positive.'
+        assert requests_per_second > 0, 'Request rate must be positive.'
+
+        self.blue = blue
+        self.green = green
+        self.steps = steps
+        self.step_duration_seconds = step_duration_seconds
+        self.requests_per_second = requests_per_second
+        self.registration_interval_seconds = registration_interval_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+
+        self.__random = Random(seed)
+
+    async def run(self) -> LoadTestReport:
+        """
+        Runs the load test.
+
+        :return: Load test report.
+        """
+        report = LoadTestReport(self.blue.name, self.green.name)
+        targets = self.blue.targets + self.green.targets
+
+        for target in targets:
+            await target.start()
+
+        start = time.perf_counter()
+        steps_end = start + len(self.steps) * self.step_duration_seconds
+
+        # Blue targets serve traffic for a long time already, hence they are not in slow start.
+        self.blue.register(start - self.blue.slow_start_seconds)
+        self.green.register(start, self.registration_interval_seconds)
+
+        # Blue targets are deregistered once they stop receiving traffic.
+        blue_stop_at = None
+        if self.steps[-1][0] == 0:
+            last_step_start = steps_end - self.step_duration_seconds
+            self.blue.deregister(last_step_start)
+            blue_stop_at = last_step_start + self.blue.deregistration_delay_seconds
+
+        windows = [report.add_window(f'step {index}', weights) for index, weights in enumerate(self.steps, start=1)]
+
+        # Keep sending requests until blue targets are stopped to see whether in-flight requests are dropped.
+        end = steps_end
+        if blue_stop_at is not None and blue_stop_at >= steps_end:
+            end = blue_stop_at + self.step_duration_seconds
+            windows.append(report.add_window('drain', self.steps[-1]))
+
+        stopper = asyncio.ensure_future(self.__stop_blue(blue_stop_at, report)) if blue_stop_at else None
+        requests = []
+        index = 0
+
+        while True:
+            send_at = start + index / self.requests_per_second
+
+            if send_at >= end:
+                break
+
+            delay = send_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            window = windows[min(int((send_at - start) / self.step_duration_seconds), len(windows) - 1)]
+            requests.append(asyncio.ensure_future(self.__send(window, report, time.perf_counter())))
+            index += 1
+
+        await asyncio.gather(*requests)
+
+        if stopper:
+            await stopper
+
+        for target in targets:
+            await target.stop()
+
+        return report
+
+    async def __stop_blue(self, stop_at: float, report: LoadTestReport) -> None:
+        await asyncio.sleep(max(0.0, stop_at - time.perf_counter()))
+
+        for target in self.blue.targets:
+            await target.stop()
+
+        report.dropped[self.blue.name] = sum(target.dropped_count for target in self.blue.targets)
+
+    async def __send(self, window: LoadTestWindow, report: LoadTestReport, now: float) -> None:
+        blue_weight, green_weight = window.weights
+        group = self.blue if self.__random.random() * (blue_weight + green_weight) < blue_weight else self.green
+        target = group.choose_target(now, self.__random)
+
+        if target is None:
+            report.record(window, None, None, None)
+            return
+
+        started = time.perf_counter()
+
+        try:
+            status_code = await asyncio.wait_for(self.__request(target), self.request_timeout_seconds)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, OSError, ValueError):
+            status_code = None
+
+        report.record(window, group.name, time.perf_counter() - started, status_code)
+
+    @staticmethod
+    async def __request(target: StandInTarget) -> int:
+        reader, writer = await asyncio.open_connection('127.0.0.1', target.port)
+
+        try:
+            writer.write(b'GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n')
+            await writer.drain()
+
+            status_line = await reader.readline()
+            # A connection closed before the status line means the request was dropped.
+            if not status_line:
+                raise ConnectionResetError('Connection closed without a response.')
+
+            await reader.read()
+
+            return int(status_line.split()[1])
+        finally:
+            writer.close()
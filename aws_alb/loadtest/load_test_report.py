@@ -0,0 +1,148 @@
+from typing import Dict, List, Optional, Tuple
+from aws_alb.logs.latency_histogram import LatencyHistogram
+
+
+class LoadTestWindow:
+    """
+    Results of requests sent during a single traffic shift step.
+    """
+    def __init__(self, name: str, weights: Tuple[int, int]) -> None:
+        """
+        Constructor.
+
+        :param name: Window name e.g. step 1.
+        :param weights: Blue and green forward weights during the window.
+        """
+        self.name = name
+        self.weights = weights
+        self.latency = LatencyHistogram()
+        # Number of requests by target group.
+        self.requests: Dict[str, int] = {}
+        # Number of 5xx responses.
+        self.errors_count = 0
+        # Number of requests which did not get a response (connection refused, reset or closed).
+        self.failures_count = 0
+        # Number of requests rejected because no target was available (503 on a real loadbalancer).
+        self.no_target_count = 0
+
+    @property
+    def requests_count(self) -> int:
+        """
+        Number of requests sent during the window.
+
+        :return: Requests count.
+        """
+        return sum(self.requests.values()) + self.no_target_count
+
+
+class LoadTestReport:
+    """
+    Report of a blue/green traffic shift load test.
+    """
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, blue_name: str, green_name: str) -> None:
+        """
+        Constructor.
+
+        :param blue_name: Name of the blue target group.
+        :param green_name: Name of the green target group.
+        """
+        self.blue_name = blue_name
+        self.green_name = green_name
+        self.windows: List[LoadTestWindow] = []
+        # In-flight requests dropped when targets were stopped after the deregistration delay.
+        self.dropped: Dict[str, int] = {}
+
+    def add_window(self, name: str, weights: Tuple[int, int]) -> LoadTestWindow:
+        """
+        Starts a new window.
+
+        :param name: Window name.
+        :param weights: Blue and green forward weights during the window.
+
+        :return: Window.
+        """
+        self.windows.append(LoadTestWindow(name, weights))
+        return self.windows[-1]
+
+    def record(
+            self,
+            window: LoadTestWindow,
+            target_group: Optional[str],
+            latency_seconds: Optional[float],
+            status_code: Optional[int]
+    ) -> None:
+        """
+        Records a result of a single request.
+
+        :param window: Window during which the request was sent.
+        :param target_group: Target group which received the request or None if no target was available.
+        :param latency_seconds: Latency or None if the request did not get a response.
+        :param status_code: Response status code or None if the request did not get a response.
+
+        :return: No return.
+        """
+        if target_group is None:
+            window.no_target_count += 1
+            return
+
+        window.requests[target_group] = window.requests.get(target_group, 0) + 1
+
+        if status_code is None:
+            window.failures_count += 1
+            return
+
+        window.latency.add(latency_seconds)
+
+        if status_code >= 500:
+            window.errors_count += 1
+
+    @property
+    def total(self) -> LoadTestWindow:
+        """
+        Results of all windows combined.
+
+        :return: Window with all results.
+        """
+        total = LoadTestWindow('total', (0, 0))
+
+        for window in self.windows:
+            total.latency.merge(window.latency)
+            total.errors_count += window.errors_count
+            total.failures_count += window.failures_count
+            total.no_target_count += window.no_target_count
+
+            for name, count in window.requests.items():
+                total.requests[name] = total.requests.get(name, 0) + count
+
+        return total
+
+    def to_text(self) -> str:
+        """
+        Renders the report as a human readable text.
+
+        :return: Report text.
+        """
+        header = f'{"window":<12}{"weights":>10}{"requests":>10}{"blue/green":>14}' + ''.join(
+            f'{f"p{percentile}":>10}' for percentile in self.PERCENTILES
+        ) + f'{"5xx":>8}{"failed":>8}{"no target":>11}'
+
+        lines = [header]
+
+        for window in self.windows + [self.total]:
+            shares = f'{window.requests.get(self.blue_name, 0)}/{window.requests.get(self.green_name, 0)}'
+            weights = f'{window.weights[0]}/{window.weights[1]}' if window.name != 'total' else ''
+            percentiles = ''.join(
+                f'{window.latency.percentile(percentile) * 1000:>8.1f}ms' for percentile in self.PERCENTILES
+            )
+
+            lines.append(
+                f'{window.name:<12}{weights:>10}{window.requests_count:>10}{shares:>14}{percentiles}'
+                f'{window.errors_count:>8}{window.failures_count:>8}{window.no_target_count:>11}'
+            )
+
+        lines.append('')
+        lines.extend(f'Dropped in-flight requests of {name}: {count}.' for name, count in self.dropped.items())
+
+        return '\n'.join(lines)
@@ -0,0 +1,132 @@
+import asyncio
+from random import Random
+from typing import Optional, Set
+
+
+class StandInTarget:
+    """
+    Local HTTP server which stands in for a loadbalancer target during load tests.
+    Every request is answered after a configurable latency, a share of requests fails with 500.
+    """
+    def __init__(
+            self,
+            name: str,
+            latency_seconds: float = 0.01,
+            tail_latency_seconds: float = 0.0,
+            error_rate: float = 0.0,
+            seed: Optional[int] = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param name: Target name.
+        :param latency_seconds: Minimum response latency.
+        :param tail_latency_seconds: Mean of an exponentially distributed latency added to the minimum one.
+        Long tails make in-flight requests outlive deregistration delays.
+        :param error_rate: Share of requests answered with 500 (0-1).
+        :param seed: Seed for latencies and errors.
+        """
+        assert latency_seconds >= 0, 'Latency can not be negative.'
+        assert tail_latency_seconds >= 0, 'Tail latency can not be negative.'
+        assert 0 <= error_rate <= 1, 'Error rate must be between 0 and 1.'
+
+        self.name = name
+        self.latency_seconds = latency_seconds
+        self.tail_latency_seconds = tail_latency_seconds
+        self.error_rate = error_rate
+
+        self.served_count = 0
+        self.dropped_count = 0
+
+        self.__random = Random(seed)
+        self.__server: Optional[asyncio.AbstractServer] = None
+        self.__port: Optional[int] = None
+        self.__in_flight: Set[asyncio.Task] = set()
+
+    @property
+    def port(self) -> int:
+        """
+        Port the target listens on.
+
+        :return: Port.
+        """
+        assert self.__port is not None, f'Target {self.name} is not started.'
+        return self.__port
+
+    @property
+    def in_flight_count(self) -> int:
+        """
+        Number of requests which are being processed.
+
+        :return: In-flight requests count.
+        """
+        return len(self.__in_flight)
+
+    @property
+    def running(self) -> bool:
+        """
+        Tells whether the target accepts connections.
+
+        :return: True if the target is started and not stopped.
+        """
+        return self.__server is not None
+
+    async def start(self) -> int:
+        """
+        Starts listening on a free local port.
+
+        :return: Port.
+        """
+        self.__server = await asyncio.start_server(self.__handle, '127.0.0.1', 0)
+        self.__port = self.__server.sockets[0].getsockname()[1]
+
+        return self.__port
+
+    async def stop(self) -> None:
+        """
+        Stops the target. Requests which are still in flight are dropped (their connections are closed).
+
+        :return: No return.
+        """
+        if self.__server is None:
+            return
+
+        server, self.__server = self.__server, None
+        server.close()
+
+        for task in list(self.__in_flight):
+            task.cancel()
+
+        await asyncio.gather(*self.__in_flight, return_exceptions=True)
+        await server.wait_closed()
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self.__in_flight.add(task)
+
+        try:
+            await reader.readuntil(b'\r\n\r\n')
+
+            latency = self.latency_seconds
+            if self.tail_latency_seconds:
+                latency += self.__random.expovariate(1 / self.tail_latency_seconds)
+
+            await asyncio.sleep(latency)
+
+            status = '500 Internal Server Error' if self.__random.random() < self.error_rate else '200 OK'
+            writer.write(
+                f'HTTP/1.1 {status}\r\nContent-Length: 0\r\nX-Target: {self.name}\r\nConnection: close\r\n\r\n'.encode()
+            )
+            await writer.drain()
+            self.served_count += 1
+        except asyncio.CancelledError:
+            self.dropped_count += 1
+            # Abort instead of a graceful close: the client sees the connection reset like on a real target.
+            writer.transport.abort()
+            return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.__in_flight.discard(task)
+
+        writer.close()
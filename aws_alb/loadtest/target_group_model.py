@@ -0,0 +1,141 @@
+from random import Random
+from typing import List, Optional
+from aws_alb.loadtest.stand_in_target import StandInTarget
+
+
+class TargetGroupModel:
+    """
+    Model of a target group with stand-in targets. Models slow start and deregistration delay:
+    a newly registered target receives a linearly increasing share of the group traffic during
+    slow start, a deregistered target receives no new requests and is stopped after the
+    deregistration delay, dropping requests which are still in flight.
+    """
+    # AWS defaults.
+    DEFAULT_SLOW_START_SECONDS = 0
+    DEFAULT_DEREGISTRATION_DELAY_SECONDS = 300
+
+    def __init__(
+            self,
+            name: str,
+            targets: List[StandInTarget],
+            slow_start_seconds: float = DEFAULT_SLOW_START_SECONDS,
+            deregistration_delay_seconds: float = DEFAULT_DEREGISTRATION_DELAY_SECONDS,
+    ) -> None:
+        """
+        Constructor.
+
+        :param name: Target group name.
+        :param targets: Stand-in targets of the group.
+        :param slow_start_seconds: Slow start duration. 0 disables slow start.
+        :param deregistration_delay_seconds: Time in-flight requests are given before a target is stopped.
+        """
+        assert targets, 'Target group must have at least one target.'
+
+        self.name = name
+        self.targets = targets
+        self.slow_start_seconds = slow_start_seconds
+        self.deregistration_delay_seconds = deregistration_delay_seconds
+
+        # Registration time of every target. None means the target is not registered (yet).
+        self.registered_at: List[Optional[float]] = [None] * len(targets)
+        self.deregistered_at: Optional[float] = None
+
+    @classmethod
+    def from_params(
+            cls,
+            name: str,
+            target_group_params,
+            targets: List[StandInTarget],
+            time_scale: float = 1.0
+    ) -> 'TargetGroupModel':
+        """
+        Creates a model with slow start and deregistration delay of target group parameters.
+
+        :param name: Target group name.
+        :param target_group_params: Target group parameters (TargetGroupParams). Type hint is not given
+        to avoid importing CDK.
+        :param targets: Stand-in targets of the group.
+        :param time_scale: Modelled delays are divided by this number to shorten test runs.
+
+        :return: Target group model.
+        """
+        attributes = target_group_params.attributes
+        slow_start = getattr(attributes, 'slow_start_duration_seconds', None)
+        deregistration_delay = getattr(attributes, 'deregistration_delay_seconds', None)
+
+        return cls(
+            name=name,
+            targets=targets,
+            slow_start_seconds=(cls.DEFAULT_SLOW_START_SECONDS if slow_start is None else slow_start) / time_scale,
+            deregistration_delay_seconds=(
+                cls.DEFAULT_DEREGISTRATION_DELAY_SECONDS if deregistration_delay is None else deregistration_delay
+            ) / time_scale
+        )
+
+    def register(self, now: float, interval_seconds: float = 0.0) -> None:
+        """
+        Registers all targets. Targets can be registered one by one e.g. like a rolling start of tasks.
+
+        :param now: Registration time of the first target.
+        :param interval_seconds: Time between registrations of subsequent targets.
+
+        :return: No return.
+        """
+        self.registered_at = [now + index * interval_seconds for index in range(len(self.targets))]
+
+    def deregister(self, now: float) -> None:
+        """
+        Deregisters all targets. They receive no new requests from now on.
+
+        :param now: Deregistration time.
+
+        :return: No return.
+        """
+        self.deregistered_at = now
+
+    def choose_target(self, now: float, random: Random) -> Optional[StandInTarget]:
+        """
+        Chooses a target for a new request.
+
+        :param now: Current time.
+        :param random: Random number generator.
+
+        :return: Target or None if the group has no healthy registered targets.
+        """
+        if self.deregistered_at is not None and now >= self.deregistered_at:
+            return None
+
+        weights = [self.target_weight(index, now) for index in range(len(self.targets))]
+        total = sum(weights)
+
+        if total <= 0:
+            return None
+
+        point = random.random() * total
+        for target, weight in zip(self.targets, weights):
+            point -= weight
+            if point < 0:
+                return target
+
+        return self.targets[-1]
+
+    def target_weight(self, index: int, now: float) -> float:
+        """
+        Relative share of a target in the group traffic.
+
+        :param index: Target index.
+        :param now: Current time.
+
+        :return: Weight between 0 and 1.
+        """
+        registered_at = self.registered_at[index]
+
+        if registered_at is None or now < registered_at or not self.targets[index].running:
+            return 0.0
+
+        if not self.slow_start_seconds:
+            return 1.0
+
+        # Weights are relative: targets which start together (or a single target) share the group traffic
+        # equally. A target in slow start gets a small share right after the registration.
+        return min(1.0, max(0.01, (now - registered_at) / self.slow_start_seconds))
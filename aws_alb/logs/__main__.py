@@ -0,0 +1,22 @@
+import argparse
+from aws_alb.logs.access_log_analyzer import AccessLogAnalyzer, AccessLogReport
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m aws_alb.logs',
+        description='Reports latency percentiles of loadbalancer access log files.'
+    )
+    parser.add_argument('paths', nargs='+', help='Gzipped (.gz) or plain text access log files.')
+    parser.add_argument('--timing', default='total', choices=AccessLogReport.TIMINGS)
+    parser.add_argument('--depth', type=int, default=1, help='Number of path segments to group requests by.')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes.')
+    parser.add_argument('--limit', type=int, default=20, help='Maximum number of rows per dimension.')
+    args = parser.parse_args()
+
+    report = AccessLogAnalyzer(path_prefix_depth=args.depth, workers=args.workers).analyze(args.paths)
+    print(report.to_text(timing=args.timing, limit=args.limit))
+
+
+if __name__ == '__main__':
+    main()
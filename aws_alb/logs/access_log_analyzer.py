@@ -0,0 +1,197 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from aws_alb.logs.access_log_entry import AccessLogEntry
+from aws_alb.logs.access_log_parser import AccessLogParser
+from aws_alb.logs.latency_histogram import LatencyHistogram
+
+
+class AccessLogReport:
+    """
+    Latency report of analyzed access logs.
+    Histograms are grouped by a dimension (target_group, path_prefix or status_code), a dimension value
+    and a timing (request, target, response or total).
+    """
+    DIMENSIONS = ('target_group', 'path_prefix', 'status_code')
+    TIMINGS = ('request', 'target', 'response', 'total')
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.entries_count = 0
+        self.histograms: Dict[str, Dict[str, Dict[str, LatencyHistogram]]] = {
+            dimension: {} for dimension in self.DIMENSIONS
+        }
+        # Number of requests (including requests which were not dispatched to a target).
+        self.counts: Dict[str, Dict[str, int]] = {dimension: {} for dimension in self.DIMENSIONS}
+
+    def add(self, entry: AccessLogEntry, path_prefix_depth: int = 1) -> None:
+        """
+        Records an access log entry.
+
+        :param entry: Access log entry.
+        :param path_prefix_depth: Number of path segments used to group requests by path.
+
+        :return: No return.
+        """
+        self.entries_count += 1
+
+        timings = (
+            ('request', entry.request_processing_time),
+            ('target', entry.target_processing_time),
+            ('response', entry.response_processing_time),
+            ('total', entry.total_time),
+        )
+
+        keys = (
+            ('target_group', entry.target_group_name),
+            ('path_prefix', entry.path_prefix(path_prefix_depth)),
+            ('status_code', entry.elb_status_code),
+        )
+
+        for dimension, key in keys:
+            self.counts[dimension][key] = self.counts[dimension].get(key, 0) + 1
+            histograms = self.histograms[dimension].get(key)
+
+            if histograms is None:
+                histograms = self.histograms[dimension][key] = {timing: LatencyHistogram() for timing in self.TIMINGS}
+
+            for timing, value in timings:
+                if value is not None:
+                    histograms[timing].add(value)
+
+    def merge(self, other: 'AccessLogReport') -> None:
+        """
+        Adds entries recorded by another report.
+
+        :param other: Another report.
+
+        :return: No return.
+        """
+        self.entries_count += other.entries_count
+
+        for dimension, counts in other.counts.items():
+            for key, count in counts.items():
+                self.counts[dimension][key] = self.counts[dimension].get(key, 0) + count
+
+        for dimension, groups in other.histograms.items():
+            for key, histograms in groups.items():
+                own = self.histograms[dimension].setdefault(
+                    key,
+                    {timing: LatencyHistogram() for timing in self.TIMINGS}
+                )
+
+                for timing, histogram in histograms.items():
+                    own[timing].merge(histogram)
+
+    def percentiles(self, dimension: str, timing: str = 'total') -> List[Tuple[str, int, Dict[int, float]]]:
+        """
+        Computes latency percentiles for every value of a dimension.
+
+        :param dimension: One of target_group, path_prefix or status_code.
+        :param timing: One of request, target, response or total.
+
+        :return: A list of (dimension value, request count, {percentile: seconds}) tuples,
+        the slowest p99 first.
+        """
+        assert dimension in self.DIMENSIONS, f'Dimension must be one of {self.DIMENSIONS}.'
+        assert timing in self.TIMINGS, f'Timing must be one of {self.TIMINGS}.'
+
+        rows = [
+            (key, self.counts[dimension][key], {p: histograms[timing].percentile(p) for p in self.PERCENTILES})
+            for key, histograms in self.histograms[dimension].items()
+        ]
+
+        return sorted(rows, key=lambda row: row[2][self.PERCENTILES[-1]], reverse=True)
+
+    def to_text(self, timing: str = 'total', limit: Optional[int] = 20) -> str:
+        """
+        Renders the report as a text table.
+
+        :param timing: One of request, target, response or total.
+        :param limit: Maximum number of rows per dimension.
+
+        :return: Report text.
+        """
+        lines = [f'Entries: {self.entries_count}. Timing: {timing} (seconds).']
+
+        for dimension in self.DIMENSIONS:
+            lines.append('')
+            lines.append(f'{dimension:<48} {"count":>10} ' + ' '.join(f'{"p" + str(p):>9}' for p in self.PERCENTILES))
+
+            for key, count, values in self.percentiles(dimension, timing)[:limit]:
+                lines.append(f'{key[:48]:<48} {count:>10} ' + ' '.join(f'{values[p]:>9.3f}' for p in self.PERCENTILES))
+
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.to_text()
+
+
+class AccessLogAnalyzer:
+    """
+    Class which analyzes loadbalancer access log files stored on a local disk.
+
+    Every file is streamed and aggregated into fixed-size histograms by a separate process,
+    hence memory usage does not depend on the size of log files.
+    """
+    def __init__(self, path_prefix_depth: int = 1, workers: Optional[int] = None) -> None:
+        """
+        Constructor.
+
+        :param path_prefix_depth: Number of path segments used to group requests by path.
+        :param workers: Number of worker processes. If not given, the number of CPUs is used.
+        If 1, files are analyzed in the current process.
+        """
+        self.path_prefix_depth = path_prefix_depth
+        self.workers = workers
+
+    def analyze(self, paths: Iterable[str]) -> AccessLogReport:
+        """
+        Analyzes access log files.
+
+        :param paths: Paths to gzipped (.gz) or plain text access log files.
+
+        :return: Latency report.
+        """
+        report = AccessLogReport()
+        jobs = ((path, self.path_prefix_depth) for path in paths)
+
+        if self.workers == 1:
+            for job in jobs:
+                report.merge(_analyze_file(job))
+
+            return report
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for file_report in executor.map(_analyze_file, jobs):
+                report.merge(file_report)
+
+        return report
+
+    def analyze_entries(self, entries: Iterable[AccessLogEntry]) -> AccessLogReport:
+        """
+        Analyzes already parsed access log entries in the current process.
+
+        :param entries: Access log entries.
+
+        :return: Latency report.
+        """
+        report = AccessLogReport()
+
+        for entry in entries:
+            report.add(entry, self.path_prefix_depth)
+
+        return report
+
+
+def _analyze_file(job: Tuple[str, int]) -> AccessLogReport:
+    # Module level function, so it can be pickled and sent to worker processes.
+    path, path_prefix_depth = job
+    report = AccessLogReport()
+
+    for entry in AccessLogParser.parse_file(path):
+        report.add(entry, path_prefix_depth)
+
+    return report
@@ -0,0 +1,62 @@
+from typing import NamedTuple, Optional
+
+
+class AccessLogEntry(NamedTuple):
+    """
+    A single parsed loadbalancer access log entry. Only fields needed for latency analysis are kept.
+
+    More about access log entries:
+    https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-access-logs.html#access-log-entry-format
+    """
+    # Request type e.g. http, https, h2, grpcs, ws or wss.
+    type: str
+    # Time when the loadbalancer generated a response (ISO 8601).
+    time: str
+    # Seconds from the time the request was received until it was sent to a target.
+    # None if the request was not dispatched to a target.
+    request_processing_time: Optional[float]
+    # Seconds from the time the request was sent to a target until the target started to respond.
+    target_processing_time: Optional[float]
+    # Seconds from the time the response was received from a target until it was sent to the client.
+    response_processing_time: Optional[float]
+    # Status code of the response sent to the client.
+    elb_status_code: str
+    # Status code of the response from the target. '-' if there was no response.
+    target_status_code: str
+    # Request method e.g. GET.
+    method: str
+    # Request path without query string.
+    path: str
+    # Target group ARN. '-' if the request was not forwarded to a target group.
+    target_group_arn: str
+
+    @property
+    def total_time(self) -> Optional[float]:
+        """
+        Total time spent by the loadbalancer and the target.
+
+        :return: Time in seconds or None if the request was not dispatched to a target.
+        """
+        times = (self.request_processing_time, self.target_processing_time, self.response_processing_time)
+        return None if None in times else sum(times)
+
+    @property
+    def target_group_name(self) -> str:
+        """
+        Target group name extracted from its ARN.
+
+        :return: Target group name or '-' if the request was not forwarded to a target group.
+        """
+        parts = self.target_group_arn.split('/')
+        return parts[1] if len(parts) > 2 else self.target_group_arn
+
+    def path_prefix(self, depth: int = 1) -> str:
+        """
+        Returns the first segments of the request path e.g. /api/users for /api/users/1 and depth 2.
+
+        :param depth: Number of path segments to keep.
+
+        :return: Path prefix.
+        """
+        segments = [segment for segment in self.path.split('/') if segment][:depth]
+        return '/' + '/'.join(segments)
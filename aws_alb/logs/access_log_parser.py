@@ -0,0 +1,97 @@
+import gzip
+import re
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+from aws_alb.logs.access_log_entry import AccessLogEntry
+
+
+class AccessLogParser:
+    """
+    Class which streams and parses loadbalancer access log files line by line.
+    Files are never loaded into memory as a whole.
+    """
+    # A field is either a quoted string (which may contain escaped quotes) or a run of non-space characters.
+    FIELD_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"|(\S+)')
+
+    @staticmethod
+    def read_lines(path: str) -> Iterator[str]:
+        """
+        Reads lines of a gzipped (.gz) or a plain text log file.
+
+        :param path: Path to the log file.
+
+        :return: Iterator of lines.
+        """
+        opener = gzip.open if path.endswith('.gz') else open
+
+        with opener(path, 'rt', encoding='utf-8', errors='replace') as file:
+            yield from file
+
+    @staticmethod
+    def parse_line(line: str) -> Optional[AccessLogEntry]:
+        """
+        Parses a single access log line.
+
+        :param line: Access log line.
+
+        :return: Access log entry or None if the line is malformed.
+        """
+        fields = [
+            match.group(1) if match.group(1) is not None else match.group(2)
+            for match in AccessLogParser.FIELD_PATTERN.finditer(line)
+        ]
+
+        if len(fields) < 17:
+            return None
+
+        def seconds(value: str) -> Optional[float]:
+            # The loadbalancer logs -1 if it could not dispatch the request or the connection was closed.
+            try:
+                value = float(value)
+            except ValueError:
+                return None
+
+            return None if value < 0 else value
+
+        request = fields[12].split(' ')
+        method = request[0] if len(request) == 3 else '-'
+        path = urlsplit(request[1]).path if len(request) == 3 else '-'
+
+        return AccessLogEntry(
+            type=fields[0],
+            time=fields[1],
+            request_processing_time=seconds(fields[5]),
+            target_processing_time=seconds(fields[6]),
+            response_processing_time=seconds(fields[7]),
+            elb_status_code=fields[8],
+            target_status_code=fields[9],
+            method=method,
+            path=path or '/',
+            target_group_arn=fields[16],
+        )
+
+    @staticmethod
+    def parse_lines(lines: Iterable[str]) -> Iterator[AccessLogEntry]:
+        """
+        Parses access log lines. Malformed lines are skipped.
+
+        :param lines: Access log lines.
+
+        :return: Iterator of access log entries.
+        """
+        for line in lines:
+            entry = AccessLogParser.parse_line(line)
+
+            if entry is not None:
+                yield entry
+
+    @staticmethod
+    def parse_file(path: str) -> Iterator[AccessLogEntry]:
+        """
+        Streams and parses an access log file.
+
+        :param path: Path to the log file.
+
+        :return: Iterator of access log entries.
+        """
+        return AccessLogParser.parse_lines(AccessLogParser.read_lines(path))
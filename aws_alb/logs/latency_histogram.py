@@ -0,0 +1,89 @@
+import math
+from typing import Dict
+
+
+class LatencyHistogram:
+    """
+    Histogram with logarithmic buckets. Memory usage does not depend on the number of recorded values
+    and percentiles are estimated with a bounded relative error. Histograms can be merged, hence
+    they can be computed in parallel.
+    """
+    def __init__(self, relative_error: float = 0.01, min_value: float = 0.000001) -> None:
+        """
+        Constructor.
+
+        :param relative_error: Maximum relative error of estimated percentiles.
+        :param min_value: Values below this value are treated as zero.
+        """
+        self.relative_error = relative_error
+        self.min_value = min_value
+        self.count = 0
+        self.zero_count = 0
+        self.max = 0.0
+        self.buckets: Dict[int, int] = {}
+
+        self.__gamma = (1 + relative_error) / (1 - relative_error)
+        self.__log_gamma = math.log(self.__gamma)
+
+    def add(self, value: float) -> None:
+        """
+        Records a value.
+
+        :param value: Value to record.
+
+        :return: No return.
+        """
+        self.count += 1
+        self.max = max(self.max, value)
+
+        if value < self.min_value:
+            self.zero_count += 1
+            return
+
+        index = math.ceil(math.log(value) / self.__log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """
+        Adds values recorded by another histogram.
+
+        :param other: Histogram with the same relative error.
+
+        :return: No return.
+        """
+        assert other.relative_error == self.relative_error, 'Histograms must have the same relative error.'
+
+        self.count += other.count
+        self.zero_count += other.zero_count
+        self.max = max(self.max, other.max)
+
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Estimates a percentile of recorded values.
+
+        :param percentile: Percentile between 0 and 100.
+
+        :return: Estimated value or 0 if no values were recorded.
+        """
+        assert 0 <= percentile <= 100, 'Percentile must be between 0 and 100.'
+
+        if self.count == 0:
+            return 0.0
+
+        rank = math.ceil(percentile / 100 * self.count)
+
+        seen = self.zero_count
+        if rank <= seen:
+            return 0.0
+
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+
+            if seen >= rank:
+                # Middle of the bucket in relative terms.
+                return min(2 * self.__gamma ** index / (self.__gamma + 1), self.max)
+
+        return self.max
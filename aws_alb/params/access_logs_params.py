@@ -0,0 +1,27 @@
+from typing import Optional
+
+
+class AccessLogsParams:
+    """
+    Parameters class for loadbalancer access logs.
+    """
+    def __init__(
+            self,
+            retention_days: int = 90,
+            infrequent_access_after_days: Optional[int] = None,
+            log_prefix: Optional[str] = None,
+            bucket_name: Optional[str] = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param retention_days: Number of days after which log files are deleted.
+        :param infrequent_access_after_days: Number of days after which log files are moved to
+        infrequent access storage class. If not given, log files are never moved.
+        :param log_prefix: Prefix (folder) for log files in the bucket.
+        :param bucket_name: Name of the bucket. If not given, a name is generated.
+        """
+        self.retention_days = retention_days
+        self.infrequent_access_after_days = infrequent_access_after_days
+        self.log_prefix = log_prefix
+        self.bucket_name = bucket_name
@@ -0,0 +1,148 @@
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aws_cdk.aws_cloudfront import CfnDistribution
+
+
+class CacheBehaviorParams:
+    """
+    Parameters class for a CloudFront cache behavior of a single path pattern.
+
+    More about cache behaviors:
+    https://docs.aws.amazon.com/AmazonCloudFront/latest/DeveloperGuide/distribution-web-values-specify.html#DownloadDistValuesCacheBehavior
+    """
+    # Allowed methods sets supported by CloudFront.
+    READ_METHODS = ['GET', 'HEAD']
+    READ_OPTIONS_METHODS = ['GET', 'HEAD', 'OPTIONS']
+    ALL_METHODS = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'POST', 'DELETE']
+
+    def __init__(
+            self,
+            path_pattern: str,
+            min_ttl_seconds: int = 0,
+            default_ttl_seconds: int = 86400,
+            max_ttl_seconds: int = 31536000,
+            forward_query_string: bool = False,
+            forwarded_headers: Optional[List[str]] = None,
+            forwarded_cookies: Optional[List[str]] = None,
+            allowed_methods: Optional[List[str]] = None,
+            compress: bool = True,
+    ) -> None:
+        """
+        Constructor.
+
+        :param path_pattern: Path pattern to which the behavior applies e.g. /static/*.
+        :param min_ttl_seconds: Minimum time objects stay in the cache.
+        :param default_ttl_seconds: Time objects stay in the cache if the origin does not send cache headers.
+        :param max_ttl_seconds: Maximum time objects stay in the cache.
+        :param forward_query_string: Whether the query string is forwarded and included in the cache key.
+        :param forwarded_headers: Headers forwarded to the origin and included in the cache key. Every
+        forwarded header lowers the cache hit ratio. ['*'] disables caching.
+        :param forwarded_cookies: Cookie names forwarded to the origin and included in the cache key.
+        ['*'] forwards all cookies.
+        :param allowed_methods: HTTP methods CloudFront accepts. One of READ_METHODS, READ_OPTIONS_METHODS
+        or ALL_METHODS. Only GET and HEAD responses are cached.
+        :param compress: Whether CloudFront compresses objects.
+        """
+        self.path_pattern = path_pattern
+        self.min_ttl_seconds = min_ttl_seconds
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_ttl_seconds = max_ttl_seconds
+        self.forward_query_string = forward_query_string
+        self.forwarded_headers = forwarded_headers or []
+        self.forwarded_cookies = forwarded_cookies or []
+        self.allowed_methods = allowed_methods or self.READ_METHODS
+        self.compress = compress
+
+    @classmethod
+    def no_cache(cls, path_pattern: str = '*') -> 'CacheBehaviorParams':
+        """
+        Creates a behavior which forwards everything to the origin and caches nothing.
+
+        :param path_pattern: Path pattern to which the behavior applies.
+
+        :return: Cache behavior parameters.
+        """
+        return cls(
+            path_pattern=path_pattern,
+            default_ttl_seconds=0,
+            max_ttl_seconds=0,
+            forward_query_string=True,
+            forwarded_headers=['*'],
+            forwarded_cookies=['*'],
+            allowed_methods=cls.ALL_METHODS,
+        )
+
+    def validate(self) -> None:
+        """
+        Validates parameters. Raises an assertion error if CloudFront would reject the behavior.
+
+        :return: No return.
+        """
+        assert self.path_pattern, 'Path pattern must be specified.'
+        assert 0 <= self.min_ttl_seconds <= self.default_ttl_seconds <= self.max_ttl_seconds, (
+            f'TTLs of {self.path_pattern} must satisfy min <= default <= max.'
+        )
+        assert self.allowed_methods in (self.READ_METHODS, self.READ_OPTIONS_METHODS, self.ALL_METHODS), (
+            f'Allowed methods of {self.path_pattern} are not supported by CloudFront.'
+        )
+
+    def to_cache_behavior(self, origin_id: str) -> 'CfnDistribution.CacheBehaviorProperty':
+        """
+        Renders the behavior for a CloudFront distribution.
+
+        :param origin_id: Id of the origin to which requests are forwarded.
+
+        :return: Cache behavior.
+        """
+        from aws_cdk.aws_cloudfront import CfnDistribution
+
+        self.validate()
+
+        return CfnDistribution.CacheBehaviorProperty(
+            path_pattern=self.path_pattern,
+            target_origin_id=origin_id,
+            **self.__behavior_kwargs()
+        )
+
+    def to_default_cache_behavior(self, origin_id: str) -> 'CfnDistribution.DefaultCacheBehaviorProperty':
+        """
+        Renders the behavior as a default behavior of a CloudFront distribution. Path pattern is ignored.
+
+        :param origin_id: Id of the origin to which requests are forwarded.
+
+        :return: Default cache behavior.
+        """
+        from aws_cdk.aws_cloudfront import CfnDistribution
+
+        self.validate()
+
+        return CfnDistribution.DefaultCacheBehaviorProperty(
+            target_origin_id=origin_id,
+            **self.__behavior_kwargs()
+        )
+
+    def __behavior_kwargs(self) -> dict:
+        from aws_cdk.aws_cloudfront import CfnDistribution
+
+        if self.forwarded_cookies == ['*']:
+            cookies = CfnDistribution.CookiesProperty(forward='all')
+        elif self.forwarded_cookies:
+            cookies = CfnDistribution.CookiesProperty(forward='whitelist', whitelisted_names=self.forwarded_cookies)
+        else:
+            cookies = CfnDistribution.CookiesProperty(forward='none')
+
+        return dict(
+            viewer_protocol_policy='redirect-to-https',
+            allowed_methods=self.allowed_methods,
+            cached_methods=self.READ_METHODS,
+            compress=self.compress,
+            min_ttl=self.min_ttl_seconds,
+            default_ttl=self.default_ttl_seconds,
+            max_ttl=self.max_ttl_seconds,
+            forwarded_values=CfnDistribution.ForwardedValuesProperty(
+                query_string=self.forward_query_string,
+                headers=self.forwarded_headers or None,
+                cookies=cookies
+            )
+        )
@@ -0,0 +1,79 @@
+from typing import List, Optional
+from aws_alb.params.cache_behavior_params import CacheBehaviorParams
+
+
+class CloudFrontParams:
+    """
+    Parameters class for a CloudFront distribution in front of a loadbalancer.
+    """
+    # Name of the managed prefix list of CloudFront origin-facing servers. Its id differs in every region.
+    ORIGIN_FACING_PREFIX_LIST_NAME = 'com.amazonaws.global.cloudfront.origin-facing'
+    # Header which CloudFront adds to every origin request.
+    ORIGIN_HEADER_NAME = 'X-Origin-Verify'
+
+    def __init__(
+            self,
+            origin_secret: str,
+            prefix_list_id: str,
+            cache_behaviors: Optional[List[CacheBehaviorParams]] = None,
+            default_cache_behavior: Optional[CacheBehaviorParams] = None,
+            aliases: Optional[List[str]] = None,
+            viewer_certificate_arn: Optional[str] = None,
+            origin_domain_name: Optional[str] = None,
+            origin_read_timeout_seconds: int = 30,
+            origin_keepalive_timeout_seconds: int = 5,
+            price_class: str = 'PriceClass_100',
+    ) -> None:
+        """
+        Constructor.
+
+        :param origin_secret: Secret value of the origin header. Requests without it are rejected by the
+        loadbalancer. Note, the value is visible in the CloudFormation template.
+        :param prefix_list_id: Id of the CloudFront origin-facing managed prefix list
+        (see ORIGIN_FACING_PREFIX_LIST_NAME) in the loadbalancer region e.g. pl-4fa04526.
+        :param cache_behaviors: Cache behaviors per path pattern e.g. for /static/*.
+        Behaviors are evaluated in the given order.
+        :param default_cache_behavior: Behavior for requests not matched by any path pattern.
+        If not given, nothing is cached (see CacheBehaviorParams.no_cache).
+        :param aliases: Domain names of the distribution. Requires a viewer certificate.
+        :param viewer_certificate_arn: ACM certificate (in us-east-1 region) for aliases.
+        :param origin_domain_name: Domain name CloudFront uses to reach the loadbalancer. It must match the
+        loadbalancer certificate and is required if the loadbalancer uses https. If not given, loadbalancer
+        DNS name is used.
+        :param origin_read_timeout_seconds: How long CloudFront waits for a response from the loadbalancer.
+        :param origin_keepalive_timeout_seconds: How long CloudFront keeps idle connections to the loadbalancer.
+        Keep it lower than the loadbalancer idle timeout.
+        :param price_class: CloudFront price class.
+        """
+        self.origin_secret = origin_secret
+        self.prefix_list_id = prefix_list_id
+        self.cache_behaviors = cache_behaviors or []
+        self.default_cache_behavior = default_cache_behavior or CacheBehaviorParams.no_cache()
+        self.aliases = aliases or []
+        self.viewer_certificate_arn = viewer_certificate_arn
+        self.origin_domain_name = origin_domain_name
+        self.origin_read_timeout_seconds = origin_read_timeout_seconds
+        self.origin_keepalive_timeout_seconds = origin_keepalive_timeout_seconds
+        self.price_class = price_class
+
+    def validate(self) -> None:
+        """
+        Validates parameters. Raises an assertion error if they are invalid.
+
+        :return: No return.
+        """
+        assert self.origin_secret, 'Origin secret must be specified.'
+        assert len(self.origin_secret) <= 128, 'Origin secret can not be longer than 128 characters.'
+        # Listener rule condition values treat these characters as wildcards.
+        assert '*' not in self.origin_secret and '?' not in self.origin_secret, (
+            'Origin secret can not contain * or ? characters.'
+        )
+        assert self.prefix_list_id, 'CloudFront prefix list id must be specified.'
+        assert not self.aliases or self.viewer_certificate_arn, 'Aliases require a viewer certificate.'
+        assert 1 <= self.origin_read_timeout_seconds <= 60, 'Origin read timeout must be between 1 and 60 seconds.'
+        assert 1 <= self.origin_keepalive_timeout_seconds <= 60, (
+            'Origin keepalive timeout must be between 1 and 60 seconds.'
+        )
+
+        patterns = [behavior.path_pattern for behavior in self.cache_behaviors]
+        assert len(patterns) == len(set(patterns)), 'Cache behavior path patterns must be unique.'
@@ -1,13 +1,19 @@
-from typing import Optional, Any
-from aws_cdk.aws_certificatemanager import CfnCertificate
-from aws_cdk.aws_elasticloadbalancingv2 import CfnListener
+from typing import Optional, Any, List, TYPE_CHECKING
 from aws_alb.alb_traffic_enum import AlbTrafficEnum
 
+# Params are imported by tooling which never builds constructs, hence CDK is imported only for type hints.
+if TYPE_CHECKING:
+    from aws_cdk.aws_certificatemanager import CfnCertificate
+    from aws_cdk.aws_elasticloadbalancingv2 import CfnListener
+
 
 class ListenerParams:
     """
     Parameters class for loadbalancer listeners.
     """
+    # TLS 1.3 policy which supports cheaper (1-RTT) handshakes.
+    TLS13_SSL_POLICY = 'ELBSecurityPolicy-TLS13-1-2-2021-06'
+
     def __init__(
             self,
             prefix: str,
@@ -15,8 +21,11 @@ class ListenerParams:
             port: int,
             inbound_traffic: AlbTrafficEnum = None,
             outbound_traffic: AlbTrafficEnum = None,
-            certificate: Optional[CfnCertificate] = None,
-            action: Optional[CfnListener.ActionProperty] = None,
+            certificate: Optional['CfnCertificate'] = None,
+            action: Optional['CfnListener.ActionProperty'] = None,
+            certificates: Optional[List['CfnCertificate']] = None,
+            ssl_policy: Optional[str] = None,
+            prefix_list_ids: Optional[List[str]] = None,
     ) -> None:
         """
         Constructor.
@@ -29,11 +38,42 @@ class ListenerParams:
         :param outbound_traffic: Outbound traffic configuration (for security group).
         :param certificate: Certificate to enable https traffic.
         :param action: Action to take when listener gets an incoming traffic.
+        :param certificates: Certificates to enable https traffic for multiple domains (SNI). The first
+        certificate (or the certificate given by the certificate parameter) is the default one.
+        :param ssl_policy: Security policy which defines supported TLS protocols and ciphers
+        e.g. ListenerParams.TLS13_SSL_POLICY. If not given, AWS default policy is used.
+        :param prefix_list_ids: Managed prefix list ids for AlbTrafficEnum.PREFIX_LIST traffic.
         """
         self.prefix = prefix
         self.loadbalancer = loadbalancer
         self.port = port
         self.inbound_traffic = inbound_traffic or AlbTrafficEnum.INTERNET
         self.outbound_traffic = outbound_traffic or AlbTrafficEnum.NONE
-        self.certificate = certificate
+        self.certificates = list(certificates or [])
+        self.certificate = certificate or self.certificate
         self.action = action
+        self.ssl_policy = ssl_policy
+        self.prefix_list_ids = prefix_list_ids or []
+
+    @property
+    def certificate(self) -> Optional['CfnCertificate']:
+        """
+        Default certificate of the listener.
+
+        :return: Certificate or None if the listener does not use https.
+        """
+        return self.certificates[0] if self.certificates else None
+
+    @certificate.setter
+    def certificate(self, certificate: Optional['CfnCertificate']) -> None:
+        """
+        Sets a default certificate of the listener.
+
+        :param certificate: Certificate.
+
+        :return: No return.
+        """
+        self.certificates = [cert for cert in self.certificates if cert is not certificate]
+
+        if certificate:
+            self.certificates.insert(0, certificate)
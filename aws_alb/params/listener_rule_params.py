@@ -0,0 +1,131 @@
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aws_cdk.aws_elasticloadbalancingv2 import CfnListener
+
+
+class ListenerRuleParams:
+    """
+    Parameters class for loadbalancer listener rules.
+
+    More about listener rules:
+    https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-listeners.html#listener-rules
+    """
+    # Maximum number of condition values (match evaluations) per rule.
+    MAX_CONDITION_VALUES = 5
+    # Maximum number of wildcards per rule.
+    MAX_WILDCARDS = 5
+
+    def __init__(
+            self,
+            prefix: str,
+            listener: 'CfnListener',
+            action: 'CfnListener.ActionProperty',
+            path_patterns: Optional[List[str]] = None,
+            host_headers: Optional[List[str]] = None,
+            http_headers: Optional[Dict[str, List[str]]] = None,
+            query_strings: Optional[List[Tuple[Optional[str], str]]] = None,
+            source_ips: Optional[List[str]] = None,
+            priority: Optional[int] = None,
+            traffic_weight: float = 0,
+    ) -> None:
+        """
+        Constructor.
+
+        :param prefix: String prefix for listener rule name.
+        :param listener: A listener to which the rule should be attached.
+        :param action: Action to take when the rule matches an incoming request.
+        :param path_patterns: Path patterns to match e.g. /api/*.
+        :param host_headers: Host names to match e.g. *.example.com.
+        :param http_headers: HTTP header names and their values to match.
+        :param query_strings: Query string key/value pairs to match. A key can be None to match any key.
+        :param source_ips: Source IP addresses in CIDR format to match.
+        :param priority: Explicit rule priority (1-50000). If not given, a priority is allocated
+        automatically: more specific and, in case of a tie, hotter rules are evaluated first.
+        :param traffic_weight: Expected share of traffic matched by this rule. Used only to order rules.
+        """
+        self.prefix = prefix
+        self.listener = listener
+        self.action = action
+        self.path_patterns = path_patterns or []
+        self.host_headers = host_headers or []
+        self.http_headers = http_headers or {}
+        self.query_strings = query_strings or []
+        self.source_ips = source_ips or []
+        self.priority = priority
+        self.traffic_weight = traffic_weight
+
+    @property
+    def condition_values_count(self) -> int:
+        """
+        Number of condition values as counted by AWS against the per-rule limit.
+
+        :return: Condition values count.
+        """
+        return (
+            len(self.path_patterns) +
+            len(self.host_headers) +
+            sum(len(values) for values in self.http_headers.values()) +
+            len(self.query_strings) +
+            len(self.source_ips)
+        )
+
+    @property
+    def wildcards_count(self) -> int:
+        """
+        Number of wildcard characters used in condition values.
+
+        :return: Wildcards count.
+        """
+        values = (
+            self.path_patterns +
+            self.host_headers +
+            [value for values in self.http_headers.values() for value in values] +
+            [part for key, value in self.query_strings for part in (key or '', value)]
+        )
+
+        return sum(value.count('*') + value.count('?') for value in values)
+
+    @property
+    def specificity(self) -> Tuple[int, int, int]:
+        """
+        Specificity of the rule. Rules with more conditions and longer literal (non-wildcard)
+        host and path values are more specific.
+
+        :return: A comparable specificity tuple.
+        """
+        def literal_length(values: List[str]) -> int:
+            # A rule is only as specific as its least specific value.
+            return min(len(value.replace('*', '').replace('?', '')) for value in values) if values else 0
+
+        conditions_count = sum(1 for condition in (
+            self.path_patterns,
+            self.host_headers,
+            self.query_strings,
+            self.source_ips,
+        ) if condition) + len(self.http_headers)
+
+        return conditions_count, literal_length(self.host_headers), literal_length(self.path_patterns)
+
+    def validate(self) -> None:
+        """
+        Validates rule conditions against AWS limits. Raises an assertion error if the rule would be rejected.
+
+        :return: No return.
+        """
+        assert self.listener is not None, 'Listener must be specified.'
+        assert self.action is not None, 'Action must be specified.'
+        assert self.condition_values_count > 0, 'At least one condition must be specified.'
+        assert self.condition_values_count <= self.MAX_CONDITION_VALUES, (
+            f'Rule {self.prefix} has {self.condition_values_count} condition values. '
+            f'Maximum is {self.MAX_CONDITION_VALUES}.'
+        )
+        assert self.wildcards_count <= self.MAX_WILDCARDS, (
+            f'Rule {self.prefix} has {self.wildcards_count} wildcards. Maximum is {self.MAX_WILDCARDS}.'
+        )
+        assert all(len(value) <= 128 for value in self.path_patterns + self.host_headers), (
+            'Path patterns and host headers can not be longer than 128 characters.'
+        )
+
+        if self.priority is not None:
+            assert 1 <= self.priority <= 50000, 'Priority must be between 1 and 50000.'
@@ -0,0 +1,125 @@
+from typing import Dict, List, Optional, TYPE_CHECKING
+from aws_alb.alb_performance_profile import AlbPerformanceProfile
+
+if TYPE_CHECKING:
+    from aws_cdk.aws_elasticloadbalancingv2 import CfnLoadBalancer
+
+
+class LoadBalancerAttributes:
+    """
+    Parameters class for loadbalancer attributes.
+
+    More about loadbalancer attributes:
+    https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#load-balancer-attributes
+    """
+    DESYNC_MITIGATION_MODES = ('monitor', 'defensive', 'strictest')
+
+    PROFILES = {
+        AlbPerformanceProfile.LOW_LATENCY_API: dict(
+            idle_timeout_seconds=30,
+            http2_enabled=True,
+            desync_mitigation_mode='defensive',
+            drop_invalid_header_fields=True,
+        ),
+        AlbPerformanceProfile.LONG_POLLING: dict(
+            idle_timeout_seconds=3600,
+            http2_enabled=True,
+            desync_mitigation_mode='defensive',
+            drop_invalid_header_fields=True,
+        ),
+        AlbPerformanceProfile.BULK_UPLOAD: dict(
+            idle_timeout_seconds=900,
+            http2_enabled=False,
+            desync_mitigation_mode='defensive',
+            drop_invalid_header_fields=True,
+        ),
+    }
+
+    def __init__(
+            self,
+            idle_timeout_seconds: Optional[int] = None,
+            http2_enabled: Optional[bool] = None,
+            desync_mitigation_mode: Optional[str] = None,
+            drop_invalid_header_fields: Optional[bool] = None,
+            deletion_protection_enabled: Optional[bool] = None,
+    ) -> None:
+        """
+        Constructor. Attributes which are not specified are left at AWS defaults.
+
+        :param idle_timeout_seconds: Seconds a connection is allowed to be idle (1-4000).
+        :param http2_enabled: Whether HTTP/2 is enabled for clients.
+        :param desync_mitigation_mode: How the loadbalancer handles requests that might pose
+        a security risk (monitor, defensive or strictest).
+        :param drop_invalid_header_fields: Whether HTTP headers with invalid header fields are removed.
+        :param deletion_protection_enabled: Whether deletion protection is enabled.
+        """
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.http2_enabled = http2_enabled
+        self.desync_mitigation_mode = desync_mitigation_mode
+        self.drop_invalid_header_fields = drop_invalid_header_fields
+        self.deletion_protection_enabled = deletion_protection_enabled
+
+    @classmethod
+    def from_profile(cls, profile: AlbPerformanceProfile, **overrides) -> 'LoadBalancerAttributes':
+        """
+        Creates attributes from a named performance profile.
+
+        :param profile: Performance profile.
+        :param overrides: Constructor arguments which override profile values.
+
+        :return: Loadbalancer attributes instance.
+        """
+        assert profile in cls.PROFILES, f'Unsupported profile {profile}.'
+
+        kwargs = dict(cls.PROFILES[profile])
+        kwargs.update(overrides)
+
+        return cls(**kwargs)
+
+    def validate(self) -> None:
+        """
+        Validates attribute values. Raises an assertion error if any value is not accepted by AWS.
+
+        :return: No return.
+        """
+        if self.idle_timeout_seconds is not None:
+            assert 1 <= self.idle_timeout_seconds <= 4000, 'Idle timeout must be between 1 and 4000 seconds.'
+
+        if self.desync_mitigation_mode is not None:
+            assert self.desync_mitigation_mode in self.DESYNC_MITIGATION_MODES, (
+                f'Desync mitigation mode must be one of {self.DESYNC_MITIGATION_MODES}.'
+            )
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Renders attributes as key/value pairs understood by AWS.
+
+        :return: Dictionary of attribute keys and values.
+        """
+        self.validate()
+
+        attributes = {
+            'idle_timeout.timeout_seconds': self.idle_timeout_seconds,
+            'routing.http2.enabled': self.http2_enabled,
+            'routing.http.desync_mitigation_mode': self.desync_mitigation_mode,
+            'routing.http.drop_invalid_header_fields.enabled': self.drop_invalid_header_fields,
+            'deletion_protection.enabled': self.deletion_protection_enabled,
+        }
+
+        return {
+            key: str(value).lower() if isinstance(value, bool) else str(value)
+            for key, value in attributes.items() if value is not None
+        }
+
+    def to_attributes(self) -> List['CfnLoadBalancer.LoadBalancerAttributeProperty']:
+        """
+        Renders attributes for a CloudFormation loadbalancer resource.
+
+        :return: A list of loadbalancer attribute properties.
+        """
+        from aws_cdk.aws_elasticloadbalancingv2 import CfnLoadBalancer
+
+        return [
+            CfnLoadBalancer.LoadBalancerAttributeProperty(key=key, value=value)
+            for key, value in self.to_dict().items()
+        ]
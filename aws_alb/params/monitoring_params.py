@@ -0,0 +1,105 @@
+import re
+from typing import List, Optional
+from aws_alb.latency_slo_preset import LatencySloPreset
+
+
+class MonitoringParams:
+    """
+    Parameters class for loadbalancer and target group alarms and dashboards.
+    """
+    PRESETS = {
+        LatencySloPreset.INTERACTIVE: dict(latency_percentile='p99', latency_threshold_seconds=0.5),
+        LatencySloPreset.STANDARD: dict(latency_percentile='p99', latency_threshold_seconds=1.0),
+        LatencySloPreset.BATCH: dict(latency_percentile='p95', latency_threshold_seconds=5.0),
+    }
+
+    # Extended statistic of CloudWatch e.g. p99 or p99.9.
+    PERCENTILE_PATTERN = re.compile(r'^p\d{1,2}(\.\d+)?$')
+
+    def __init__(
+            self,
+            latency_percentile: str = 'p99',
+            latency_threshold_seconds: float = 1.0,
+            elb_5xx_threshold: int = 10,
+            target_5xx_threshold: int = 10,
+            rejected_connections_threshold: int = 1,
+            unhealthy_hosts_threshold: int = 1,
+            consumed_lcus_threshold: Optional[float] = None,
+            period_seconds: int = 60,
+            evaluation_periods: int = 3,
+            alarm_actions: Optional[List[str]] = None,
+            create_dashboard: bool = True,
+    ) -> None:
+        """
+        Constructor.
+
+        :param latency_percentile: Percentile of target response time to alarm on e.g. p99.
+        :param latency_threshold_seconds: Target response time threshold.
+        :param elb_5xx_threshold: Number of 5XX responses generated by the loadbalancer per period.
+        :param target_5xx_threshold: Number of 5XX responses generated by targets per period.
+        :param rejected_connections_threshold: Number of connections rejected because the loadbalancer
+        reached its maximum number of connections per period.
+        :param unhealthy_hosts_threshold: Number of unhealthy targets in a target group.
+        :param consumed_lcus_threshold: Number of consumed loadbalancer capacity units per period.
+        If not given, no alarm is created.
+        :param period_seconds: Period over which metrics are evaluated (10, 30 or a multiple of 60 seconds).
+        :param evaluation_periods: Number of periods the threshold must be breached to trigger an alarm.
+        :param alarm_actions: ARNs of actions (e.g. SNS topics) to execute when an alarm is triggered.
+        :param create_dashboard: Whether a CloudWatch dashboard should be created.
+        """
+        self.latency_percentile = latency_percentile
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.elb_5xx_threshold = elb_5xx_threshold
+        self.target_5xx_threshold = target_5xx_threshold
+        self.rejected_connections_threshold = rejected_connections_threshold
+        self.unhealthy_hosts_threshold = unhealthy_hosts_threshold
+        self.consumed_lcus_threshold = consumed_lcus_threshold
+        self.period_seconds = period_seconds
+        self.evaluation_periods = evaluation_periods
+        self.alarm_actions = alarm_actions or []
+        self.create_dashboard = create_dashboard
+
+    @classmethod
+    def from_preset(cls, preset: LatencySloPreset, **overrides) -> 'MonitoringParams':
+        """
+        Creates monitoring parameters from a latency service level objective preset.
+
+        :param preset: Latency preset.
+        :param overrides: Constructor arguments which override preset values.
+
+        :return: Monitoring parameters instance.
+        """
+        assert preset in cls.PRESETS, f'Unsupported preset {preset}.'
+
+        kwargs = dict(cls.PRESETS[preset])
+        kwargs.update(overrides)
+
+        return cls(**kwargs)
+
+    def validate(self) -> None:
+        """
+        Validates parameters. Raises an assertion error if they are not accepted by CloudWatch.
+
+        :return: No return.
+        """
+        assert self.PERCENTILE_PATTERN.match(self.latency_percentile), (
+            f'Latency percentile must be between p0 and p99.99 e.g. p99, got {self.latency_percentile}.'
+        )
+
+        thresholds = dict(
+            latency_threshold_seconds=self.latency_threshold_seconds,
+            elb_5xx_threshold=self.elb_5xx_threshold,
+            target_5xx_threshold=self.target_5xx_threshold,
+            rejected_connections_threshold=self.rejected_connections_threshold,
+            unhealthy_hosts_threshold=self.unhealthy_hosts_threshold,
+            consumed_lcus_threshold=self.consumed_lcus_threshold,
+        )
+
+        for name, threshold in thresholds.items():
+            assert threshold is None or threshold > 0, f'{name} must be positive.'
+
+        # High resolution periods (10 and 30 seconds) are supported by alarms as well.
+        assert self.period_seconds in (10, 30) or (self.period_seconds > 0 and self.period_seconds % 60 == 0), (
+            'Period must be 10, 30 or a multiple of 60 seconds.'
+        )
+        assert self.evaluation_periods > 0, 'Evaluation periods must be positive.'
@@ -0,0 +1,169 @@
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aws_cdk.aws_elasticloadbalancingv2 import CfnTargetGroup
+
+
+class TargetGroupAttributes:
+    """
+    Parameters class for target group attributes.
+
+    More about target group attributes:
+    https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-target-groups.html#target-group-attributes
+    """
+    LOAD_BALANCING_ALGORITHMS = ('round_robin', 'least_outstanding_requests')
+    STICKINESS_TYPES = ('lb_cookie', 'app_cookie')
+    RESERVED_COOKIE_PREFIXES = ('AWSALB', 'AWSALBAPP', 'AWSALBTG')
+    # The only attribute supported by lambda target groups.
+    LAMBDA_ATTRIBUTES = ('lambda.multi_value_headers.enabled',)
+
+    def __init__(
+            self,
+            load_balancing_algorithm: Optional[str] = None,
+            slow_start_duration_seconds: Optional[int] = None,
+            deregistration_delay_seconds: Optional[int] = None,
+            stickiness_enabled: Optional[bool] = None,
+            stickiness_type: Optional[str] = None,
+            stickiness_duration_seconds: Optional[int] = None,
+            stickiness_cookie_name: Optional[str] = None,
+            cross_zone_enabled: Optional[bool] = None,
+            lambda_multi_value_headers_enabled: Optional[bool] = None,
+    ) -> None:
+        """
+        Constructor. Attributes which are not specified are left at AWS defaults.
+
+        :param load_balancing_algorithm: How the loadbalancer selects targets (round_robin or
+        least_outstanding_requests).
+        :param slow_start_duration_seconds: Time period during which a newly registered target receives
+        a linearly increasing share of the traffic (30-900 seconds, 0 disables slow start).
+        :param deregistration_delay_seconds: Time to wait for in-flight requests to complete
+        before deregistering a target (0-3600 seconds).
+        :param stickiness_enabled: Whether sticky sessions are enabled.
+        :param stickiness_type: Stickiness type (lb_cookie or app_cookie).
+        :param stickiness_duration_seconds: Time period during which requests from a client are routed
+        to the same target (1-604800 seconds).
+        :param stickiness_cookie_name: Application cookie name. Required for app_cookie stickiness.
+        :param cross_zone_enabled: Whether cross-zone load balancing is enabled for the target group.
+        :param lambda_multi_value_headers_enabled: Whether repeated request headers and query string parameters
+        are passed to a lambda function as lists (and the function must return multi-value headers).
+        Only for lambda target groups.
+        """
+        self.load_balancing_algorithm = load_balancing_algorithm
+        self.slow_start_duration_seconds = slow_start_duration_seconds
+        self.deregistration_delay_seconds = deregistration_delay_seconds
+        self.stickiness_enabled = stickiness_enabled
+        self.stickiness_type = stickiness_type
+        self.stickiness_duration_seconds = stickiness_duration_seconds
+        self.stickiness_cookie_name = stickiness_cookie_name
+        self.cross_zone_enabled = cross_zone_enabled
+        self.lambda_multi_value_headers_enabled = lambda_multi_value_headers_enabled
+
+    def validate(self) -> None:
+        """
+        Validates attribute values and their combinations. Raises an assertion error
+        if the configuration would be rejected by AWS.
+
+        :return: No return.
+        """
+        if self.load_balancing_algorithm is not None:
+            assert self.load_balancing_algorithm in self.LOAD_BALANCING_ALGORITHMS, (
+                f'Load balancing algorithm must be one of {self.LOAD_BALANCING_ALGORITHMS}.'
+            )
+
+        if self.slow_start_duration_seconds is not None:
+            assert (
+                self.slow_start_duration_seconds == 0 or 30 <= self.slow_start_duration_seconds <= 900
+            ), 'Slow start duration must be 0 or between 30 and 900 seconds.'
+
+        assert not (
+            self.slow_start_duration_seconds and self.load_balancing_algorithm == 'least_outstanding_requests'
+        ), 'Slow start can not be combined with least outstanding requests algorithm.'
+
+        if self.deregistration_delay_seconds is not None:
+            assert 0 <= self.deregistration_delay_seconds <= 3600, (
+                'Deregistration delay must be between 0 and 3600 seconds.'
+            )
+
+        if self.stickiness_type is not None:
+            assert self.stickiness_type in self.STICKINESS_TYPES, (
+                f'Stickiness type must be one of {self.STICKINESS_TYPES}.'
+            )
+
+        has_stickiness_settings = any(value is not None for value in (
+            self.stickiness_type,
+            self.stickiness_duration_seconds,
+            self.stickiness_cookie_name
+        ))
+
+        if has_stickiness_settings:
+            assert self.stickiness_enabled, 'Stickiness settings require stickiness to be enabled.'
+
+        if self.stickiness_duration_seconds is not None:
+            assert 1 <= self.stickiness_duration_seconds <= 604800, (
+                'Stickiness duration must be between 1 and 604800 seconds.'
+            )
+
+        if self.stickiness_type == 'app_cookie':
+            assert self.stickiness_cookie_name, 'Application cookie stickiness requires a cookie name.'
+            assert not self.stickiness_cookie_name.startswith(self.RESERVED_COOKIE_PREFIXES), (
+                f'Cookie name can not start with any of {self.RESERVED_COOKIE_PREFIXES}.'
+            )
+        else:
+            assert self.stickiness_cookie_name is None, 'Cookie name is only supported for app_cookie stickiness.'
+
+    def validate_target_type(self, target_type: str) -> None:
+        """
+        Validates that attributes are supported by a target type.
+
+        :param target_type: Target type of the target group (ip, instance or lambda).
+
+        :return: No return.
+        """
+        keys = set(self.to_dict())
+
+        if target_type == 'lambda':
+            unsupported = sorted(keys - set(self.LAMBDA_ATTRIBUTES))
+            assert not unsupported, f'Lambda target groups do not support {", ".join(unsupported)} attributes.'
+        else:
+            assert not keys & set(self.LAMBDA_ATTRIBUTES), 'Multi-value headers are supported only by lambda targets.'
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Renders attributes as key/value pairs understood by AWS.
+
+        :return: Dictionary of attribute keys and values.
+        """
+        self.validate()
+
+        # Load balancer cookie is the default stickiness type.
+        stickiness_type = self.stickiness_type or ('lb_cookie' if self.stickiness_enabled else None)
+
+        attributes = {
+            'load_balancing.algorithm.type': self.load_balancing_algorithm,
+            'slow_start.duration_seconds': self.slow_start_duration_seconds,
+            'deregistration_delay.timeout_seconds': self.deregistration_delay_seconds,
+            'stickiness.enabled': self.stickiness_enabled,
+            'stickiness.type': stickiness_type,
+            f'stickiness.{stickiness_type}.duration_seconds': self.stickiness_duration_seconds,
+            'stickiness.app_cookie.cookie_name': self.stickiness_cookie_name,
+            'load_balancing.cross_zone.enabled': self.cross_zone_enabled,
+            'lambda.multi_value_headers.enabled': self.lambda_multi_value_headers_enabled,
+        }
+
+        return {
+            key: str(value).lower() if isinstance(value, bool) else str(value)
+            for key, value in attributes.items() if value is not None
+        }
+
+    def to_attributes(self) -> List['CfnTargetGroup.TargetGroupAttributeProperty']:
+        """
+        Renders attributes for a CloudFormation target group resource.
+
+        :return: A list of target group attribute properties.
+        """
+        from aws_cdk.aws_elasticloadbalancingv2 import CfnTargetGroup
+
+        return [
+            CfnTargetGroup.TargetGroupAttributeProperty(key=key, value=value)
+            for key, value in self.to_dict().items()
+        ]
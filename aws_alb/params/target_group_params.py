@@ -1,5 +1,8 @@
-from typing import Optional, List
-from aws_cdk.aws_ec2 import IVpc
+from typing import Optional, List, Tuple, Union, TYPE_CHECKING
+from aws_alb.params.target_group_attributes import TargetGroupAttributes
+
+if TYPE_CHECKING:
+    from aws_cdk.aws_ec2 import IVpc
 
 
 class TargetGroupParams:
@@ -9,25 +12,57 @@ class TargetGroupParams:
     def __init__(
             self,
             prefix: str,
-            vpc: IVpc,
+            vpc: 'IVpc',
             healthy_http_codes: Optional[List[int]] = None,
             health_check_path: Optional[str] = None,
             target_group_port: int = 80,
             protocol: str = 'HTTP',
             target_type: str = 'ip',
+            attributes: Optional[TargetGroupAttributes] = None,
+            health_check_interval_seconds: Optional[int] = None,
+            health_check_timeout_seconds: Optional[int] = None,
+            healthy_threshold_count: Optional[int] = None,
+            unhealthy_threshold_count: Optional[int] = None,
+            protocol_version: Optional[str] = None,
+            healthy_grpc_codes: Optional[List[int]] = None,
+            health_check_enabled: Optional[bool] = None,
+            targets: Optional[List[Union[str, Tuple[str, int]]]] = None,
+            lambda_function_arn: Optional[str] = None,
     ) -> None:
         """
         Constructor.
 
         :param prefix: String prefix for target group name.
-        :param vpc: Virtual private cloud for the target group.
+        :param vpc: Virtual private cloud for the target group. Not used by lambda target groups.
         :param healthy_http_codes: The deployed instance is constantly pinged to determine if it is available
         (healthy) or not. Specify a list of http codes that your service can return and should be treated as healthy.
         :param health_check_path: The deployed instance is constantly pinged to determine if it is available
         (healthy) or not. Specify a path for that ping.
         :param target_group_port: A port for a communication between loadbalancer and the target group.
-        :param protocol: Protocol (http or https).
-        :param target_type: Resource in the target group target type (ip or instance).
+        Not used by lambda target groups.
+        :param protocol: Protocol (http or https). Not used by lambda target groups.
+        :param target_type: Resource in the target group target type (ip, instance or lambda).
+        :param attributes: Target group attributes e.g. routing algorithm, slow start, deregistration delay
+        or stickiness.
+        :param health_check_interval_seconds: Time between health checks of an individual target (5-300).
+        :param health_check_timeout_seconds: Time during which no response means a failed health check (2-120).
+        It must be shorter than the interval.
+        :param healthy_threshold_count: Consecutive successful health checks required to consider
+        an unhealthy target healthy (2-10).
+        :param unhealthy_threshold_count: Consecutive failed health checks required to consider
+        a target unhealthy (2-10).
+        :param protocol_version: Protocol version used to send requests to targets (HTTP1, HTTP2 or GRPC).
+        HTTP2 and GRPC require an https listener. If not given, HTTP1 is used.
+        :param healthy_grpc_codes: gRPC status codes (0-99) which should be treated as healthy.
+        Only for GRPC protocol version. If not given, 12 (unimplemented) is treated as healthy.
+        :param health_check_enabled: Whether targets are health checked. If not given, health checks are enabled
+        for ip and instance targets and disabled for lambda targets: every health check invokes the function,
+        hence probes of a low-traffic function would keep it warm at a cost or cause cold starts.
+        :param targets: Targets registered statically e.g. instance ids or ip addresses. A target is either
+        an id or an id and a port pair. If the port is not given, the target group port is used.
+        Not supported by lambda target groups.
+        :param lambda_function_arn: Arn of a function to invoke. Required for lambda target groups.
+        The loadbalancer is granted permission to invoke the function.
         """
         self.prefix = prefix
         self.vpc = vpc
@@ -36,3 +71,34 @@ class TargetGroupParams:
         self.target_group_port = target_group_port
         self.protocol = protocol
         self.target_type = target_type
+        self.attributes = attributes
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+        self.healthy_threshold_count = healthy_threshold_count
+        self.unhealthy_threshold_count = unhealthy_threshold_count
+        self.protocol_version = protocol_version
+        self.healthy_grpc_codes = healthy_grpc_codes
+        self.health_check_enabled = health_check_enabled
+        self.targets = targets or []
+        self.lambda_function_arn = lambda_function_arn
+
+    @property
+    def is_lambda(self) -> bool:
+        """
+        Whether targets of the target group are lambda functions.
+
+        :return: True for lambda target groups.
+        """
+        return self.target_type == 'lambda'
+
+    @property
+    def is_health_check_enabled(self) -> bool:
+        """
+        Whether targets are health checked. Health checks of lambda targets are disabled by default.
+
+        :return: True if health checks are enabled.
+        """
+        if self.health_check_enabled is None:
+            return not self.is_lambda
+
+        return self.health_check_enabled
@@ -0,0 +1,71 @@
+from typing import Optional
+
+
+class TemplateBudgetParams:
+    """
+    Parameters class for template budgets. Default budgets are CloudFormation and AWS default limits.
+
+    More about CloudFormation limits:
+    https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cloudformation-limits.html
+    """
+    # Maximum number of resources per stack.
+    MAX_RESOURCES = 500
+    # Maximum size of a template uploaded to S3.
+    MAX_TEMPLATE_BYTES = 1000000
+    # Default quota of inbound (and separately outbound) rules per security group.
+    MAX_SECURITY_GROUP_RULES = 60
+    # Maximum number of rules per listener (default rule excluded).
+    MAX_LISTENER_RULES = 100
+
+    def __init__(
+            self,
+            max_resources: int = MAX_RESOURCES,
+            max_template_bytes: int = MAX_TEMPLATE_BYTES,
+            max_loadbalancer_resources: Optional[int] = None,
+            max_loadbalancer_bytes: Optional[int] = None,
+            max_security_group_rules: int = MAX_SECURITY_GROUP_RULES,
+            max_listener_rules: int = MAX_LISTENER_RULES,
+            warning_ratio: float = 0.8,
+    ) -> None:
+        """
+        Constructor.
+
+        :param max_resources: Maximum number of resources per stack.
+        :param max_template_bytes: Maximum template size in bytes.
+        :param max_loadbalancer_resources: Maximum number of resources attributed to a single loadbalancer.
+        :param max_loadbalancer_bytes: Maximum template bytes attributed to a single loadbalancer.
+        :param max_security_group_rules: Maximum number of inbound or outbound rules per security group.
+        :param max_listener_rules: Maximum number of rules per listener.
+        :param warning_ratio: Share of a budget after which consolidations are suggested.
+        """
+        self.max_resources = max_resources
+        self.max_template_bytes = max_template_bytes
+        self.max_loadbalancer_resources = max_loadbalancer_resources
+        self.max_loadbalancer_bytes = max_loadbalancer_bytes
+        self.max_security_group_rules = max_security_group_rules
+        self.max_listener_rules = max_listener_rules
+        self.warning_ratio = warning_ratio
+
+    def validate(self) -> None:
+        """
+        Validates budgets.
+
+        :return: No return.
+        """
+        assert 0 < self.max_resources <= self.MAX_RESOURCES, (
+            f'Resources budget must be between 1 and {self.MAX_RESOURCES}.'
+        )
+        assert 0 < self.max_template_bytes <= self.MAX_TEMPLATE_BYTES, (
+            f'Template size budget must be between 1 and {self.MAX_TEMPLATE_BYTES} bytes.'
+        )
+        assert self.max_loadbalancer_resources is None or self.max_loadbalancer_resources > 0, (
+            'Loadbalancer resources budget must be positive.'
+        )
+        assert self.max_loadbalancer_bytes is None or self.max_loadbalancer_bytes > 0, (
+            'Loadbalancer size budget must be positive.'
+        )
+        assert self.max_security_group_rules > 0, 'Security group rules budget must be positive.'
+        assert 0 < self.max_listener_rules <= self.MAX_LISTENER_RULES, (
+            f'Listener rules budget must be between 1 and {self.MAX_LISTENER_RULES}.'
+        )
+        assert 0 < self.warning_ratio <= 1, 'Warning ratio must be between 0 and 1.'
@@ -0,0 +1,162 @@
+from typing import Optional, Tuple
+from aws_cdk.aws_applicationautoscaling import CfnScalingPolicy
+from aws_cdk.aws_elasticloadbalancingv2 import CfnListener, CfnLoadBalancer, CfnTargetGroup
+from aws_cdk.core import Fn, Stack
+
+
+class RequestCountScaling:
+    """
+    Factory class to create target tracking scaling configurations based on ALBRequestCountPerTarget metric.
+
+    For blue/green target groups create a policy for each colour and attach both policies to the same
+    scalable target (e.g. an ECS service). Application auto scaling scales out if any policy requires so
+    and scales in only if all policies agree. Hence after a CodeDeploy swap the policy of the colour
+    which receives traffic drives the capacity, while the policy of the idle colour never blocks it.
+
+    More about target tracking scaling:
+    https://docs.aws.amazon.com/autoscaling/application/userguide/application-auto-scaling-target-tracking.html
+    """
+    PREDEFINED_METRIC_TYPE = 'ALBRequestCountPerTarget'
+
+    @staticmethod
+    def resource_label(loadbalancer: CfnLoadBalancer, target_group: CfnTargetGroup) -> str:
+        """
+        Creates a resource label which identifies a target group of a loadbalancer
+        e.g. app/my-alb/778d41231b141a0f/targetgroup/my-tg/943f017f100becff.
+
+        :param loadbalancer: Loadbalancer.
+        :param target_group: Target group attached to the loadbalancer.
+
+        :return: Resource label.
+        """
+        return Fn.join('/', [loadbalancer.attr_load_balancer_full_name, target_group.attr_target_group_full_name])
+
+    @staticmethod
+    def create_configuration(
+            loadbalancer: CfnLoadBalancer,
+            target_group: CfnTargetGroup,
+            requests_per_target: float,
+            scale_in_cooldown_seconds: Optional[int] = None,
+            scale_out_cooldown_seconds: Optional[int] = None,
+            disable_scale_in: Optional[bool] = None
+    ) -> CfnScalingPolicy.TargetTrackingScalingPolicyConfigurationProperty:
+        """
+        Creates a target tracking scaling configuration for a target group.
+
+        :param loadbalancer: Loadbalancer.
+        :param target_group: Target group attached to the loadbalancer.
+        :param requests_per_target: Target number of requests per target per minute.
+        :param scale_in_cooldown_seconds: Time after a scale-in activity before another scale-in can start.
+        :param scale_out_cooldown_seconds: Time after a scale-out activity before another scale-out can start.
+        :param disable_scale_in: Whether scale-in by this configuration is disabled.
+
+        :return: Target tracking scaling configuration.
+        """
+        assert requests_per_target > 0, 'Requests per target must be positive.'
+
+        return CfnScalingPolicy.TargetTrackingScalingPolicyConfigurationProperty(
+            target_value=requests_per_target,
+            predefined_metric_specification=CfnScalingPolicy.PredefinedMetricSpecificationProperty(
+                predefined_metric_type=RequestCountScaling.PREDEFINED_METRIC_TYPE,
+                resource_label=RequestCountScaling.resource_label(loadbalancer, target_group)
+            ),
+            scale_in_cooldown=scale_in_cooldown_seconds,
+            scale_out_cooldown=scale_out_cooldown_seconds,
+            disable_scale_in=disable_scale_in
+        )
+
+    @staticmethod
+    def create_blue_green_configurations(
+            loadbalancer: CfnLoadBalancer,
+            blue_target_group: CfnTargetGroup,
+            green_target_group: CfnTargetGroup,
+            requests_per_target: float,
+            scale_in_cooldown_seconds: Optional[int] = None,
+            scale_out_cooldown_seconds: Optional[int] = None
+    ) -> Tuple[
+        CfnScalingPolicy.TargetTrackingScalingPolicyConfigurationProperty,
+        CfnScalingPolicy.TargetTrackingScalingPolicyConfigurationProperty
+    ]:
+        """
+        Creates target tracking scaling configurations for a blue/green target group pair
+        (e.g. created by LoadBalancerListeners.create_blue_green).
+
+        :param loadbalancer: Loadbalancer.
+        :param blue_target_group: Blue target group.
+        :param green_target_group: Green target group.
+        :param requests_per_target: Target number of requests per target per minute.
+        :param scale_in_cooldown_seconds: Time after a scale-in activity before another scale-in can start.
+        :param scale_out_cooldown_seconds: Time after a scale-out activity before another scale-out can start.
+
+        :return: Tuple of blue and green configurations.
+        """
+        blue, green = (
+            RequestCountScaling.create_configuration(
+                loadbalancer,
+                target_group,
+                requests_per_target,
+                scale_in_cooldown_seconds,
+                scale_out_cooldown_seconds
+            ) for target_group in (blue_target_group, green_target_group)
+        )
+
+        return blue, green
+
+    @staticmethod
+    def create_blue_green_policies(
+            scope: Stack,
+            prefix: str,
+            scalable_target_id: str,
+            loadbalancer: CfnLoadBalancer,
+            blue: Tuple[CfnTargetGroup, CfnListener],
+            green: Tuple[CfnTargetGroup, CfnListener],
+            requests_per_target: float,
+            scale_in_cooldown_seconds: Optional[int] = None,
+            scale_out_cooldown_seconds: Optional[int] = None
+    ) -> Tuple[CfnScalingPolicy, CfnScalingPolicy]:
+        """
+        Creates target tracking scaling policies for a blue/green target group pair
+        and attaches them to the same scalable target.
+
+        :param scope: A CloudFormation stack in which the resources should be added.
+        :param prefix: A prefix for newly created resources.
+        :param scalable_target_id: Id of a scalable target e.g. CfnScalableTarget.ref.
+        :param loadbalancer: Loadbalancer.
+        :param blue: Blue target group and listener pair as returned by LoadBalancerListeners.create_blue_green.
+        :param green: Green target group and listener pair as returned by LoadBalancerListeners.create_blue_green.
+        :param requests_per_target: Target number of requests per target per minute.
+        :param scale_in_cooldown_seconds: Time after a scale-in activity before another scale-in can start.
+        :param scale_out_cooldown_seconds: Time after a scale-out activity before another scale-out can start.
+
+        :return: Tuple of blue and green scaling policies.
+        """
+        (blue_target_group, blue_listener), (green_target_group, green_listener) = blue, green
+
+        blue_configuration, green_configuration = RequestCountScaling.create_blue_green_configurations(
+            loadbalancer,
+            blue_target_group,
+            green_target_group,
+            requests_per_target,
+            scale_in_cooldown_seconds,
+            scale_out_cooldown_seconds
+        )
+
+        policies = []
+        for colour, configuration, listener in (
+                ('Blue', blue_configuration, blue_listener),
+                ('Green', green_configuration, green_listener)
+        ):
+            policy = CfnScalingPolicy(
+                scope,
+                prefix + f'{colour}RequestCountScalingPolicy',
+                policy_name=prefix + f'{colour}RequestCountScalingPolicy',
+                policy_type='TargetTrackingScaling',
+                scaling_target_id=scalable_target_id,
+                target_tracking_scaling_policy_configuration=configuration
+            )
+
+            # The metric is available only when the target group is attached to the loadbalancer.
+            policy.add_depends_on(listener)
+            policies.append(policy)
+
+        return policies[0], policies[1]
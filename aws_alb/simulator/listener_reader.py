@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional
+from aws_cdk.aws_elasticloadbalancingv2 import CfnListener
+from aws_cdk.core import Stack, Token
+from aws_alb.simulator.routing_simulator import RoutingSimulator, SimulatedListener
+from aws_alb.simulator.simulated_action import SimulatedAction
+from aws_alb.simulator.simulated_rule import SimulatedRule
+
+
+class ListenerReader:
+    """
+    Class which converts listeners and listener rules created by this library into simulated ones.
+    Target groups are named by their logical ids.
+    """
+    def __init__(self, scope: Stack, listeners_manager) -> None:
+        """
+        Constructor.
+
+        :param scope: A CloudFormation stack in which the listeners were created.
+        :param listeners_manager: Listeners manager (LoadBalancerListeners) which created listener rules.
+        Type hint is not given to avoid python circular dependency.
+        """
+        self.__scope = scope
+        self.__listeners_manager = listeners_manager
+        self.__names: Dict[str, str] = {}
+
+    def read_simulator(self, listeners: List[CfnListener], seed: Optional[int] = None) -> RoutingSimulator:
+        """
+        Creates a simulator for given listeners.
+
+        :param listeners: Listeners e.g. default production and test listeners of a loadbalancer.
+        :param seed: Seed for weighted target group choices.
+
+        :return: Routing simulator.
+        """
+        return RoutingSimulator([self.read_listener(listener) for listener in listeners], seed)
+
+    def read_listener(self, listener: CfnListener) -> SimulatedListener:
+        """
+        Converts a listener and its rules. Current default actions of the listener are used.
+
+        :param listener: Listener.
+
+        :return: Simulated listener.
+        """
+        rules = [
+            SimulatedRule(
+                name=params.prefix,
+                priority=priority,
+                action=self.read_action(params.action),
+                path_patterns=params.path_patterns,
+                host_headers=params.host_headers,
+                http_headers=params.http_headers,
+                query_strings=params.query_strings,
+                source_ips=params.source_ips
+            )
+            for priority, params, _ in self.__listeners_manager.get_listener_rules(listener)
+        ]
+
+        # The default action is the last one. Preceding actions (e.g. authentication) are not simulated.
+        default_action = self.read_action(listener.default_actions[-1])
+
+        return SimulatedListener(listener.port, listener.protocol, default_action, rules)
+
+    def read_action(self, action: CfnListener.ActionProperty) -> SimulatedAction:
+        """
+        Converts an action.
+
+        :param action: Listener or listener rule action.
+
+        :return: Simulated action.
+        """
+        if action.type == SimulatedAction.REDIRECT:
+            config = action.redirect_config
+
+            return SimulatedAction.redirect_to(
+                protocol=config.protocol or '#{protocol}',
+                host=config.host or '#{host}',
+                port=config.port or '#{port}',
+                path=config.path or '/#{path}',
+                query=config.query if config.query is not None else '#{query}',
+                status_code=config.status_code
+            )
+
+        if action.type == SimulatedAction.FIXED_RESPONSE:
+            config = action.fixed_response_config
+            return SimulatedAction.fixed_response(int(config.status_code), config.message_body)
+
+        assert action.type == SimulatedAction.FORWARD, f'Action type {action.type} can not be simulated.'
+
+        if action.forward_config:
+            return SimulatedAction.forward([
+                (self.__name(group.target_group_arn), 1 if group.weight is None else group.weight)
+                for group in action.forward_config.target_groups
+            ])
+
+        return SimulatedAction.forward([(self.__name(action.target_group_arn), 1)])
+
+    def __name(self, target_group_arn: str) -> str:
+        if not Token.is_unresolved(target_group_arn):
+            return target_group_arn
+
+        if target_group_arn not in self.__names:
+            # A target group reference resolves to {'Ref': 'LogicalId'}.
+            resolved = self.__scope.resolve(target_group_arn)
+            name = resolved.get('Ref') if isinstance(resolved, dict) else None
+            self.__names[target_group_arn] = name or str(resolved)
+
+        return self.__names[target_group_arn]
@@ -0,0 +1,26 @@
+from typing import NamedTuple, Optional
+
+
+class RoutingDecision(NamedTuple):
+    """
+    Outcome of routing a single simulated request.
+    """
+    # Port of the listener which received the request.
+    listener_port: int
+    # Name (prefix) of the matched rule or None if the default action was applied.
+    rule: Optional[str]
+    # Priority of the matched rule or None if the default action was applied.
+    priority: Optional[int]
+    # Number of rules the loadbalancer evaluated: position of the matched rule in priority order
+    # or the number of all rules if the default action was applied.
+    depth: int
+    # Action type: forward, redirect or fixed-response.
+    action_type: str
+    # Target group which received the request. None if the request was not forwarded.
+    target_group: Optional[str] = None
+    # Status code returned by the loadbalancer itself. None if the request was forwarded.
+    status_code: Optional[int] = None
+    # Location header of a redirect.
+    location: Optional[str] = None
+    # Body of a fixed response.
+    body: Optional[str] = None
@@ -0,0 +1,92 @@
+from typing import Dict
+from aws_alb.simulator.routing_decision import RoutingDecision
+
+
+class RoutingReport:
+    """
+    Aggregated routing decisions of a replayed request stream.
+    """
+    # Name under which requests handled by listener default actions are counted.
+    DEFAULT_RULE = 'default'
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.requests_count = 0
+        # Number of requests matched by every rule.
+        self.rule_hits: Dict[str, int] = {}
+        # Number of requests which reached every depth (number of evaluated rules).
+        self.depths: Dict[int, int] = {}
+        # Number of requests received by every target group.
+        self.target_group_hits: Dict[str, int] = {}
+        # Number of requests answered by the loadbalancer itself grouped by status code.
+        self.status_codes: Dict[int, int] = {}
+
+    def add(self, decision: RoutingDecision) -> None:
+        """
+        Records a routing decision.
+
+        :param decision: Routing decision.
+
+        :return: No return.
+        """
+        self.requests_count += 1
+
+        rule = decision.rule or self.DEFAULT_RULE
+        self.rule_hits[rule] = self.rule_hits.get(rule, 0) + 1
+        self.depths[decision.depth] = self.depths.get(decision.depth, 0) + 1
+
+        if decision.target_group is not None:
+            self.target_group_hits[decision.target_group] = self.target_group_hits.get(decision.target_group, 0) + 1
+
+        if decision.status_code is not None:
+            self.status_codes[decision.status_code] = self.status_codes.get(decision.status_code, 0) + 1
+
+    @property
+    def mean_depth(self) -> float:
+        """
+        Average number of rules evaluated per request.
+
+        :return: Mean depth.
+        """
+        if not self.requests_count:
+            return 0.0
+
+        return sum(depth * count for depth, count in self.depths.items()) / self.requests_count
+
+    @property
+    def max_depth(self) -> int:
+        """
+        Maximum number of rules evaluated for a single request.
+
+        :return: Max depth.
+        """
+        return max(self.depths, default=0)
+
+    def to_text(self) -> str:
+        """
+        Renders the report as a human readable text.
+
+        :return: Report text.
+        """
+        lines = [
+            f'Requests: {self.requests_count}.',
+            f'Rule depth: mean {self.mean_depth:.2f}, max {self.max_depth}.',
+            '',
+            'Rule hits:',
+        ]
+
+        def counts(values: Dict) -> list:
+            return [
+                f'  {key}: {count} ({100 * count / self.requests_count:.1f}%)'
+                for key, count in sorted(values.items(), key=lambda item: item[1], reverse=True)
+            ]
+
+        lines.extend(counts(self.rule_hits))
+        lines.extend(['', 'Target groups:'])
+        lines.extend(counts(self.target_group_hits))
+        lines.extend(['', 'Loadbalancer responses:'])
+        lines.extend(counts(self.status_codes))
+
+        return '\n'.join(lines)
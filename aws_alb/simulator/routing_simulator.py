@@ -0,0 +1,154 @@
+from random import Random
+from typing import Dict, Iterable, List, Optional, Tuple
+from aws_alb.simulator.routing_decision import RoutingDecision
+from aws_alb.simulator.routing_report import RoutingReport
+from aws_alb.simulator.simulated_action import SimulatedAction
+from aws_alb.simulator.simulated_request import SimulatedRequest
+from aws_alb.simulator.simulated_rule import SimulatedRule
+
+
+class SimulatedListener:
+    """
+    A listener of a simulated loadbalancer with rules indexed by literal host names.
+    """
+    # Maximum number of cached (host, path) matches per listener.
+    MAX_CACHED_MATCHES = 100000
+
+    def __init__(self, port: int, protocol: str, default_action: SimulatedAction, rules: List[SimulatedRule]) -> None:
+        """
+        Constructor.
+
+        :param port: Listener port.
+        :param protocol: Listener protocol (HTTP or HTTPS).
+        :param default_action: Action applied when no rule matches.
+        :param rules: Listener rules.
+        """
+        priorities = [rule.priority for rule in rules]
+        assert len(priorities) == len(set(priorities)), f'Rule priorities of listener {port} must be unique.'
+
+        self.port = port
+        self.protocol = protocol
+        self.default_action = default_action
+        self.rules = sorted(rules, key=lambda rule: rule.priority)
+
+        # Rules with literal host conditions can match only their hosts. Other rules can match any host.
+        self.__host_index: Dict[str, List[Tuple[int, SimulatedRule]]] = {}
+        self.__any_host: List[Tuple[int, SimulatedRule]] = []
+
+        for depth, rule in enumerate(self.rules, start=1):
+            hosts = rule.literal_hosts
+
+            if hosts is None:
+                self.__any_host.append((depth, rule))
+            else:
+                for host in set(hosts):
+                    self.__host_index.setdefault(host, []).append((depth, rule))
+
+        self.__candidates: Dict[str, List[Tuple[int, SimulatedRule]]] = {}
+
+        # Results depend only on host and path, hence they can be cached.
+        self.__cacheable = not any(rule.uses_request_details for rule in self.rules)
+        self.__matches: Dict[Tuple[str, str], Optional[Tuple[int, SimulatedRule]]] = {}
+
+    def match(self, request: SimulatedRequest) -> Optional[Tuple[int, SimulatedRule]]:
+        """
+        Finds the first matching rule.
+
+        :param request: Simulated request.
+
+        :return: Depth and the matched rule or None if no rule matches.
+        """
+        host = request.host_name.lower()
+
+        if self.__cacheable:
+            key = (host, request.path)
+
+            if key in self.__matches:
+                return self.__matches[key]
+
+            match = self.__match(request, host)
+
+            if len(self.__matches) < self.MAX_CACHED_MATCHES:
+                self.__matches[key] = match
+
+            return match
+
+        return self.__match(request, host)
+
+    def __match(self, request: SimulatedRequest, host: str) -> Optional[Tuple[int, SimulatedRule]]:
+        candidates = self.__candidates.get(host)
+
+        if candidates is None:
+            # Merge host specific rules with the rules for any host keeping the priority order.
+            candidates = sorted(self.__host_index.get(host, []) + self.__any_host, key=lambda item: item[0])
+
+            if len(self.__candidates) < self.MAX_CACHED_MATCHES:
+                self.__candidates[host] = candidates
+
+        for depth, rule in candidates:
+            if rule.matches(request, host):
+                return depth, rule
+
+        return None
+
+
+class RoutingSimulator:
+    """
+    In-process simulator of loadbalancer routing. Evaluates listener rules in priority order,
+    applies default actions, renders redirects and splits traffic of weighted forward actions.
+
+    Use ListenerReader to build a simulator from listeners created by this library.
+    """
+    def __init__(self, listeners: Iterable[SimulatedListener], seed: Optional[int] = None) -> None:
+        """
+        Constructor.
+
+        :param listeners: Simulated listeners.
+        :param seed: Seed for weighted target group choices. Makes simulations repeatable.
+        """
+        self.__listeners = {listener.port: listener for listener in listeners}
+        self.__random = Random(seed)
+
+    @property
+    def listeners(self) -> Dict[int, SimulatedListener]:
+        """
+        Simulated listeners by port.
+
+        :return: A dictionary of port and listener.
+        """
+        return self.__listeners
+
+    def route(self, request: SimulatedRequest) -> RoutingDecision:
+        """
+        Routes a single request.
+
+        :param request: Simulated request.
+
+        :return: Routing decision.
+        """
+        listener = self.__listeners.get(request.port)
+        assert listener is not None, f'There is no listener on port {request.port}.'
+
+        match = listener.match(request)
+
+        if match is None:
+            depth = len(listener.rules)
+            return listener.default_action.apply(request, listener.protocol, self.__random, None, None, depth)
+
+        depth, rule = match
+        return rule.action.apply(request, listener.protocol, self.__random, rule.name, rule.priority, depth)
+
+    def replay(self, requests: Iterable[SimulatedRequest]) -> RoutingReport:
+        """
+        Routes a stream of requests and aggregates routing decisions.
+
+        :param requests: Simulated requests.
+
+        :return: Routing report with per rule hit counts and rule depths.
+        """
+        report = RoutingReport()
+
+        for request in requests:
+            report.add(self.route(request))
+
+        return report
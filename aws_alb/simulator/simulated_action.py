@@ -0,0 +1,189 @@
+from random import Random
+from typing import List, Optional, Tuple
+from aws_alb.simulator.routing_decision import RoutingDecision
+from aws_alb.simulator.simulated_request import SimulatedRequest
+
+
+class SimulatedAction:
+    """
+    A listener or listener rule action of a simulated loadbalancer.
+    Use the factory methods to create actions.
+    """
+    FORWARD = 'forward'
+    REDIRECT = 'redirect'
+    FIXED_RESPONSE = 'fixed-response'
+
+    def __init__(
+            self,
+            action_type: str,
+            target_groups: Optional[List[Tuple[str, int]]] = None,
+            redirect: Optional[dict] = None,
+            status_code: Optional[int] = None,
+            body: Optional[str] = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param action_type: Action type: forward, redirect or fixed-response.
+        :param target_groups: Target group names and weights of a forward action.
+        :param redirect: Redirect components (protocol, host, port, path, query) and a status code.
+        :param status_code: Status code of a fixed response.
+        :param body: Body of a fixed response.
+        """
+        self.action_type = action_type
+        self.target_groups = [(name, weight) for name, weight in target_groups or [] if weight > 0]
+        self.redirect = redirect or {}
+        self.status_code = status_code
+        self.body = body
+
+        # Cumulative weights for a fast weighted choice.
+        self.__cumulative_weights = []
+        total = 0
+        for _, weight in self.target_groups:
+            total += weight
+            self.__cumulative_weights.append(total)
+
+    @classmethod
+    def forward(cls, target_groups: List[Tuple[str, int]]) -> 'SimulatedAction':
+        """
+        Creates a forward action.
+
+        :param target_groups: Target group names and weights. A single target group can have any weight.
+
+        :return: Forward action.
+        """
+        assert target_groups, 'At least one target group must be specified.'
+        return cls(cls.FORWARD, target_groups=target_groups)
+
+    @classmethod
+    def redirect_to(
+            cls,
+            protocol: str = '#{protocol}',
+            host: str = '#{host}',
+            port: str = '#{port}',
+            path: str = '/#{path}',
+            query: str = '#{query}',
+            status_code: str = 'HTTP_301'
+    ) -> 'SimulatedAction':
+        """
+        Creates a redirect action. Components can use #{protocol}, #{host}, #{port}, #{path}
+        and #{query} templates just like loadbalancer redirects do.
+
+        :param protocol: Target protocol (HTTP or HTTPS).
+        :param host: Target host.
+        :param port: Target port.
+        :param path: Target path. #{path} does not contain the leading slash.
+        :param query: Target query string without the leading ?.
+        :param status_code: HTTP_301 or HTTP_302.
+
+        :return: Redirect action.
+        """
+        return cls(cls.REDIRECT, redirect=dict(
+            protocol=protocol,
+            host=host,
+            port=port,
+            path=path,
+            query=query,
+            status_code=status_code
+        ))
+
+    @classmethod
+    def fixed_response(cls, status_code: int, body: Optional[str] = None) -> 'SimulatedAction':
+        """
+        Creates a fixed response action.
+
+        :param status_code: Status code of the response.
+        :param body: Body of the response.
+
+        :return: Fixed response action.
+        """
+        return cls(cls.FIXED_RESPONSE, status_code=status_code, body=body)
+
+    def apply(
+            self,
+            request: SimulatedRequest,
+            protocol: str,
+            random: Random,
+            rule: Optional[str],
+            priority: Optional[int],
+            depth: int
+    ) -> RoutingDecision:
+        """
+        Applies the action to a request.
+
+        :param request: Simulated request.
+        :param protocol: Protocol of the listener which received the request.
+        :param random: Random number generator used for weighted target group choice.
+        :param rule: Name of the matched rule.
+        :param priority: Priority of the matched rule.
+        :param depth: Number of evaluated rules.
+
+        :return: Routing decision.
+        """
+        decision = RoutingDecision(request.port, rule, priority, depth, self.action_type)
+
+        if self.action_type == self.FORWARD:
+            return decision._replace(target_group=self.choose_target_group(random))
+
+        if self.action_type == self.REDIRECT:
+            return decision._replace(
+                status_code=302 if self.redirect.get('status_code') == 'HTTP_302' else 301,
+                location=self.render_location(request, protocol)
+            )
+
+        return decision._replace(status_code=self.status_code, body=self.body)
+
+    def choose_target_group(self, random: Random) -> Optional[str]:
+        """
+        Chooses a target group by weights.
+
+        :param random: Random number generator.
+
+        :return: Target group name or None if all weights are zero.
+        """
+        if len(self.target_groups) == 1:
+            return self.target_groups[0][0]
+
+        if not self.target_groups:
+            return None
+
+        point = random.random() * self.__cumulative_weights[-1]
+        for (name, _), cumulative in zip(self.target_groups, self.__cumulative_weights):
+            if point < cumulative:
+                return name
+
+        return self.target_groups[-1][0]
+
+    def render_location(self, request: SimulatedRequest, protocol: str) -> str:
+        """
+        Renders a Location header of a redirect.
+
+        :param request: Simulated request.
+        :param protocol: Protocol of the listener which received the request.
+
+        :return: Redirect URL.
+        """
+        values = {
+            '#{protocol}': protocol.lower(),
+            '#{host}': request.host_name,
+            '#{port}': str(request.port),
+            '#{path}': request.path.lstrip('/'),
+            '#{query}': request.query,
+        }
+
+        def render(template: str) -> str:
+            for key, value in values.items():
+                template = template.replace(key, value)
+            return template
+
+        target_protocol = render(self.redirect.get('protocol', '#{protocol}')).lower()
+        host = render(self.redirect.get('host', '#{host}'))
+        port = render(self.redirect.get('port', '#{port}'))
+        path = render(self.redirect.get('path', '/#{path}'))
+        query = render(self.redirect.get('query', '#{query}'))
+
+        default_port = {'http': '80', 'https': '443'}.get(target_protocol)
+        port_part = '' if port == default_port else f':{port}'
+        query_part = f'?{query}' if query else ''
+
+        return f'{target_protocol}://{host}{port_part}{path}{query_part}'
@@ -0,0 +1,38 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl
+
+
+class SimulatedRequest(NamedTuple):
+    """
+    A request sent to a simulated loadbalancer.
+    """
+    # Request path without query string e.g. /api/users.
+    path: str
+    # Host header. A port part (e.g. example.com:8080) is ignored when matching.
+    host: str = ''
+    # Listener port which receives the request.
+    port: int = 80
+    # Raw query string without the leading ? e.g. a=1&b=2.
+    query: str = ''
+    # Request headers.
+    headers: Optional[Dict[str, str]] = None
+    # Client IP address.
+    source_ip: str = '127.0.0.1'
+
+    @property
+    def host_name(self) -> str:
+        """
+        Host header without a port.
+
+        :return: Host name.
+        """
+        return self.host.rsplit(':', 1)[0] if ':' in self.host and not self.host.endswith(']') else self.host
+
+    @property
+    def query_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Decoded query string key/value pairs.
+
+        :return: A list of key and value pairs.
+        """
+        return parse_qsl(self.query, keep_blank_values=True)
@@ -0,0 +1,148 @@
+import re
+from ipaddress import ip_address, ip_network
+from typing import Dict, List, Optional, Pattern, Tuple
+from aws_alb.listener_rule_patterns import ListenerRulePatterns
+from aws_alb.simulator.simulated_action import SimulatedAction
+from aws_alb.simulator.simulated_request import SimulatedRequest
+
+
+class SimulatedRule:
+    """
+    A compiled listener rule of a simulated loadbalancer.
+    Condition values of a single condition are combined into one regular expression or
+    into a set of literal values, hence every condition is checked with a single operation.
+    """
+    def __init__(
+            self,
+            name: str,
+            priority: int,
+            action: SimulatedAction,
+            path_patterns: Optional[List[str]] = None,
+            host_headers: Optional[List[str]] = None,
+            http_headers: Optional[Dict[str, List[str]]] = None,
+            query_strings: Optional[List[Tuple[Optional[str], str]]] = None,
+            source_ips: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param name: Rule name.
+        :param priority: Rule priority. Rules with lower priority are evaluated first.
+        :param action: Action applied to matched requests.
+        :param path_patterns: Path patterns (case sensitive).
+        :param host_headers: Host names (case insensitive).
+        :param http_headers: Header names and values (case insensitive).
+        :param query_strings: Query string key/value pairs (case insensitive). A key can be None to match any key.
+        :param source_ips: Source IP addresses in CIDR format.
+        """
+        self.name = name
+        self.priority = priority
+        self.action = action
+        self.path_patterns = path_patterns or []
+        self.host_headers = host_headers or []
+        self.http_headers = http_headers or {}
+        self.query_strings = query_strings or []
+        self.source_ips = source_ips or []
+
+        self.__paths = self.__compile(self.path_patterns, case_sensitive=True)
+        self.__hosts = self.__compile(self.host_headers, case_sensitive=False)
+        self.__headers = [
+            (header.lower(), self.__compile(values, case_sensitive=False))
+            for header, values in self.http_headers.items()
+        ]
+        compile_pattern = ListenerRulePatterns.compile
+        self.__queries = [
+            (None if key is None else compile_pattern(key, False), compile_pattern(value, False))
+            for key, value in self.query_strings
+        ]
+        self.__networks = [ip_network(cidr, strict=False) for cidr in self.source_ips]
+
+    @property
+    def literal_hosts(self) -> Optional[List[str]]:
+        """
+        Lower case host names if the rule has a host condition without wildcards. Used for indexing.
+
+        :return: A list of host names or None if the rule can match other hosts.
+        """
+        if not self.host_headers or any(ListenerRulePatterns.has_wildcards(host) for host in self.host_headers):
+            return None
+
+        return [host.lower() for host in self.host_headers]
+
+    @property
+    def uses_request_details(self) -> bool:
+        """
+        Tells whether the rule looks at anything but host and path of a request.
+
+        :return: True if the rule has header, query string or source ip conditions.
+        """
+        return bool(self.http_headers or self.query_strings or self.source_ips)
+
+    def matches(self, request: SimulatedRequest, host: str) -> bool:
+        """
+        Tells whether the rule matches a request.
+
+        :param request: Simulated request.
+        :param host: Lower case host name of the request.
+
+        :return: True if all rule conditions match.
+        """
+        if self.__hosts and not self.__matches(self.__hosts, host):
+            return False
+
+        if self.__paths and not self.__matches(self.__paths, request.path):
+            return False
+
+        if self.__headers:
+            headers = {name.lower(): value for name, value in (request.headers or {}).items()}
+
+            for name, values in self.__headers:
+                if name not in headers or not self.__matches(values, headers[name].lower()):
+                    return False
+
+        if self.__queries:
+            pairs = request.query_pairs
+
+            # Any of the key/value pairs must match.
+            if not any(
+                (key is None or key.match(query_key)) and value.match(query_value)
+                for key, value in self.__queries
+                for query_key, query_value in pairs
+            ):
+                return False
+
+        if self.__networks:
+            address = ip_address(request.source_ip)
+
+            if not any(address in network for network in self.__networks):
+                return False
+
+        return True
+
+    @staticmethod
+    def __compile(values: List[str], case_sensitive: bool) -> Optional[Tuple[frozenset, Optional[Pattern]]]:
+        # A condition without values does not restrict anything.
+        if not values:
+            return None
+
+        # Literal values are checked with a set lookup, wildcard values with a single combined expression.
+        literals = frozenset(
+            value if case_sensitive else value.lower()
+            for value in values if not ListenerRulePatterns.has_wildcards(value)
+        )
+
+        wildcards = [value for value in values if ListenerRulePatterns.has_wildcards(value)]
+        expression = None
+
+        if wildcards:
+            expression = re.compile(
+                '|'.join(ListenerRulePatterns.compile(value, case_sensitive).pattern for value in wildcards),
+                0 if case_sensitive else re.IGNORECASE
+            )
+
+        return literals, expression
+
+    @staticmethod
+    def __matches(compiled: Tuple[frozenset, Optional[Pattern]], value: str) -> bool:
+        literals, expression = compiled
+        return value in literals or (expression is not None and expression.match(value) is not None)
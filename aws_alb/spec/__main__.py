@@ -0,0 +1,28 @@
+import argparse
+import sys
+from aws_alb.spec.spec_loader import SpecLoader
+from aws_alb.spec.spec_validator import SpecValidator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m aws_alb.spec',
+        description='Validates topology specs without importing CDK.'
+    )
+    parser.add_argument('paths', nargs='+', help='JSON or YAML spec files.')
+    args = parser.parse_args()
+
+    failed = False
+
+    for path in args.paths:
+        errors = SpecValidator.validate(SpecLoader.load(path))
+        failed = failed or bool(errors)
+
+        for error in errors:
+            print(f'{path}: {error}')
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
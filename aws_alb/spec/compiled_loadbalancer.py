@@ -0,0 +1,73 @@
+from typing import Dict, Tuple
+from aws_cdk.core import Fn
+
+
+class CompiledLoadbalancer:
+    """
+    References to resources of a loadbalancer compiled from a spec. Resources are included into a stack
+    as a CloudFormation fragment, hence they are referenced by their logical ids rather than by constructs.
+    """
+    def __init__(self, name: str, logical_ids: Dict[str, str], cache_hit: bool) -> None:
+        """
+        Constructor.
+
+        :param name: Loadbalancer name.
+        :param logical_ids: Logical ids of resources by their spec paths e.g. Api/blue_target_group.
+        :param cache_hit: Whether the fragment was taken from a cache.
+        """
+        self.name = name
+        self.logical_ids = logical_ids
+        self.cache_hit = cache_hit
+
+    @property
+    def loadbalancer_arn(self) -> str:
+        """
+        Loadbalancer arn.
+
+        :return: Arn token.
+        """
+        return Fn.ref(self.logical_ids['loadbalancer'])
+
+    @property
+    def dns_name(self) -> str:
+        """
+        DNS name of the loadbalancer.
+
+        :return: DNS name token.
+        """
+        return Fn.get_att(self.logical_ids['loadbalancer'], 'DNSName').to_string()
+
+    @property
+    def security_group_id(self) -> str:
+        """
+        Id of the loadbalancer security group.
+
+        :return: Security group id token.
+        """
+        return Fn.get_att(self.logical_ids['security_group'], 'GroupId').to_string()
+
+    def target_group_arns(self, service: str) -> Tuple[str, str]:
+        """
+        Target groups of a service.
+
+        :param service: Service name.
+
+        :return: Blue and green target group arn tokens.
+        """
+        return (
+            Fn.ref(self.logical_ids[f'{service}/blue_target_group']),
+            Fn.ref(self.logical_ids[f'{service}/green_target_group']),
+        )
+
+    def listener_arns(self, service: str) -> Tuple[str, str]:
+        """
+        Listeners of a service.
+
+        :param service: Service name.
+
+        :return: Production (blue) and test (green) listener arn tokens.
+        """
+        return (
+            Fn.ref(self.logical_ids[f'{service}/blue_listener']),
+            Fn.ref(self.logical_ids[f'{service}/green_listener']),
+        )
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+
+class FragmentCache:
+    """
+    Cache of rendered CloudFormation fragments of loadbalancers keyed by a content hash of their spec.
+    Fragments are kept in memory and, if a directory is given, on disk, hence they survive between synths.
+
+    Keys include a fingerprint of this library source code and of the installed CDK, hence fragments
+    rendered by other versions are never reused.
+    """
+    # Version of the cache entry format.
+    FORMAT_VERSION = 1
+
+    __fingerprint: Optional[str] = None
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        Constructor.
+
+        :param directory: Directory for cached fragments. If not given, fragments are cached in memory only.
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+        self.__entries: Dict[str, Dict[str, Any]] = {}
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, spec: Dict[str, Any], **context: Any) -> str:
+        """
+        Computes a cache key.
+
+        :param spec: Spec of a loadbalancer.
+        :param context: Other values which affect the rendered fragment e.g. number of subnets.
+
+        :return: Hex digest.
+        """
+        document = json.dumps(
+            dict(format=self.FORMAT_VERSION, fingerprint=self.fingerprint(), spec=spec, context=context),
+            sort_keys=True,
+            separators=(',', ':')
+        )
+
+        return hashlib.sha256(document.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets a cached entry.
+
+        :param key: Cache key.
+
+        :return: Cached entry or None if there is no entry for the key.
+        """
+        entry = self.__entries.get(key)
+
+        if entry is None and self.directory:
+            try:
+                with open(self.__path(key)) as file:
+                    entry = json.load(file)
+            except (OSError, ValueError):
+                # Missing or corrupted entries are rendered again.
+                entry = None
+
+            if entry is not None:
+                self.__entries[key] = entry
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Stores an entry.
+
+        :param key: Cache key.
+        :param entry: JSON serializable entry.
+
+        :return: No return.
+        """
+        self.__entries[key] = entry
+
+        if not self.directory:
+            return
+
+        # Written to a temporary file first, hence concurrent synths never read a partially written entry.
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'w') as file:
+            json.dump(entry, file, separators=(',', ':'))
+
+        os.replace(temporary_path, self.__path(key))
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """
+        Fingerprint of this library source code and of the installed CDK version.
+
+        :return: Hex digest.
+        """
+        if cls.__fingerprint is None:
+            digest = hashlib.sha256()
+            package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+            for directory, directories, files in sorted(os.walk(package)):
+                directories.sort()
+
+                for name in sorted(files):
+                    if name.endswith('.py'):
+                        path = os.path.join(directory, name)
+                        digest.update(os.path.relpath(path, package).encode())
+
+                        with open(path, 'rb') as file:
+                            digest.update(file.read())
+
+            digest.update(cls.__cdk_version().encode())
+            cls.__fingerprint = digest.hexdigest()
+
+        return cls.__fingerprint
+
+    @staticmethod
+    def __cdk_version() -> str:
+        try:
+            from importlib.metadata import version, PackageNotFoundError
+        except ImportError:
+            return 'unknown'
+
+        try:
+            return version('aws-cdk.core')
+        except PackageNotFoundError:
+            return 'unknown'
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.json')
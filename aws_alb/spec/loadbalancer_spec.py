@@ -0,0 +1,134 @@
+from typing import Any, Dict, List, Optional
+from aws_alb.alb_performance_profile import AlbPerformanceProfile
+from aws_alb.alb_traffic_enum import AlbTrafficEnum
+from aws_alb.alb_type import AlbType
+from aws_alb.params.access_logs_params import AccessLogsParams
+from aws_alb.params.loadbalancer_attributes import LoadBalancerAttributes
+from aws_alb.spec.service_spec import ServiceSpec
+
+
+class LoadbalancerSpec:
+    """
+    Spec of a loadbalancer with default listeners and blue/green services.
+    """
+    # Allowed spec fields and their types.
+    FIELDS = {
+        'name': str,
+        'type': str,
+        'subnets': str,
+        'inbound_traffic': str,
+        'prefix_list_ids': list,
+        'certificate_domain': str,
+        'ssl_policy': str,
+        'performance_profile': str,
+        'attributes': dict,
+        'access_logs': dict,
+        'services': list,
+    }
+
+    REQUIRED_FIELDS = ('name',)
+
+    # Subnet groups of a VPC in which a loadbalancer can live.
+    SUBNETS = ('public', 'private', 'isolated')
+
+    def __init__(
+            self,
+            name: str,
+            services: Optional[List[ServiceSpec]] = None,
+            loadbalancer_type: str = 'public',
+            subnets: str = 'public',
+            inbound_traffic: Optional[str] = None,
+            prefix_list_ids: Optional[List[str]] = None,
+            certificate_domain: Optional[str] = None,
+            ssl_policy: Optional[str] = None,
+            performance_profile: Optional[str] = None,
+            attributes: Optional[Dict[str, Any]] = None,
+            access_logs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param name: Loadbalancer name. Used as a prefix for all resources of the loadbalancer.
+        :param services: Blue/green services of the loadbalancer.
+        :param loadbalancer_type: Loadbalancer type (public or internal). Given by the type field of a spec.
+        :param subnets: VPC subnets for the loadbalancer (public, private or isolated).
+        :param inbound_traffic: Inbound traffic (AlbTrafficEnum name). Derived from the type if not given.
+        :param prefix_list_ids: Managed prefix list ids for prefix_list inbound traffic.
+        :param certificate_domain: If given, a DNS validated certificate is created and https listeners are used.
+        :param ssl_policy: Security policy of https listeners.
+        :param performance_profile: Performance profile (AlbPerformanceProfile name) of loadbalancer attributes.
+        :param attributes: Loadbalancer attributes (LoadBalancerAttributes arguments). Override the profile.
+        :param access_logs: Access logs settings (AccessLogsParams arguments).
+        """
+        self.name = name
+        self.services = services or []
+        self.loadbalancer_type = loadbalancer_type
+        self.subnets = subnets
+        self.inbound_traffic = inbound_traffic
+        self.prefix_list_ids = prefix_list_ids
+        self.certificate_domain = certificate_domain
+        self.ssl_policy = ssl_policy
+        self.performance_profile = performance_profile
+        self.attributes = attributes
+        self.access_logs = access_logs
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LoadbalancerSpec':
+        """
+        Creates a loadbalancer spec from a parsed spec document.
+
+        :param data: Loadbalancer section of a spec.
+
+        :return: Loadbalancer spec.
+        """
+        data = dict(data)
+        data['services'] = [ServiceSpec.from_dict(service) for service in data.get('services') or []]
+
+        if 'type' in data:
+            data['loadbalancer_type'] = data.pop('type')
+
+        return cls(**data)
+
+    @property
+    def alb_type(self) -> AlbType:
+        """
+        Loadbalancer type.
+
+        :return: Loadbalancer type enum.
+        """
+        return AlbType[self.loadbalancer_type.upper()]
+
+    @property
+    def inbound_traffic_enum(self) -> AlbTrafficEnum:
+        """
+        Inbound traffic of all listeners of the loadbalancer.
+
+        :return: Traffic enum.
+        """
+        if self.inbound_traffic:
+            return AlbTrafficEnum[self.inbound_traffic.upper()]
+
+        return AlbTrafficEnum.VPC if self.alb_type == AlbType.INTERNAL else AlbTrafficEnum.INTERNET
+
+    def loadbalancer_attributes(self) -> Optional[LoadBalancerAttributes]:
+        """
+        Creates loadbalancer attributes.
+
+        :return: Loadbalancer attributes or None if neither a profile nor attributes are given.
+        """
+        if self.performance_profile:
+            profile = AlbPerformanceProfile[self.performance_profile.upper()]
+            return LoadBalancerAttributes.from_profile(profile, **(self.attributes or {}))
+
+        if self.attributes:
+            return LoadBalancerAttributes(**self.attributes)
+
+        return None
+
+    def access_logs_params(self) -> Optional[AccessLogsParams]:
+        """
+        Creates access logs parameters.
+
+        :return: Access logs parameters or None if access logs are disabled.
+        """
+        return AccessLogsParams(**self.access_logs) if self.access_logs is not None else None
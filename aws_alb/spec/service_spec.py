@@ -0,0 +1,120 @@
+from typing import Any, Dict, List, Optional
+from aws_alb.params.target_group_attributes import TargetGroupAttributes
+from aws_alb.params.target_group_params import TargetGroupParams
+
+
+class ServiceSpec:
+    """
+    Spec of a blue/green service behind a loadbalancer: a pair of listeners (production and test ports)
+    which forward traffic to a pair of target groups.
+    """
+    # Allowed spec fields and their types.
+    FIELDS = {
+        'name': str,
+        'port': int,
+        'test_port': int,
+        'target_port': int,
+        'protocol': str,
+        'protocol_version': str,
+        'target_type': str,
+        'health_check_path': str,
+        'healthy_http_codes': list,
+        'healthy_grpc_codes': list,
+        'health_check_interval_seconds': int,
+        'health_check_timeout_seconds': int,
+        'healthy_threshold_count': int,
+        'unhealthy_threshold_count': int,
+        'attributes': dict,
+    }
+
+    REQUIRED_FIELDS = ('name', 'port', 'test_port')
+
+    def __init__(
+            self,
+            name: str,
+            port: int,
+            test_port: int,
+            target_port: int = 80,
+            protocol: str = 'HTTP',
+            protocol_version: Optional[str] = None,
+            target_type: str = 'ip',
+            health_check_path: Optional[str] = None,
+            healthy_http_codes: Optional[List[int]] = None,
+            healthy_grpc_codes: Optional[List[int]] = None,
+            health_check_interval_seconds: Optional[int] = None,
+            health_check_timeout_seconds: Optional[int] = None,
+            healthy_threshold_count: Optional[int] = None,
+            unhealthy_threshold_count: Optional[int] = None,
+            attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param name: Service name. Used as a part of resource names.
+        :param port: Production (blue) listener port.
+        :param test_port: Test (green) listener port.
+        :param target_port: Port on which targets receive traffic.
+        :param protocol: Target group protocol (HTTP or HTTPS).
+        :param protocol_version: Target group protocol version (HTTP1, HTTP2 or GRPC).
+        :param target_type: Target type (ip or instance).
+        :param health_check_path: Health check path.
+        :param healthy_http_codes: Healthy http codes.
+        :param healthy_grpc_codes: Healthy gRPC codes.
+        :param health_check_interval_seconds: Time between health checks.
+        :param health_check_timeout_seconds: Health check timeout.
+        :param healthy_threshold_count: Successful health checks to consider a target healthy.
+        :param unhealthy_threshold_count: Failed health checks to consider a target unhealthy.
+        :param attributes: Target group attributes (TargetGroupAttributes arguments).
+        """
+        self.name = name
+        self.port = port
+        self.test_port = test_port
+        self.target_port = target_port
+        self.protocol = protocol
+        self.protocol_version = protocol_version
+        self.target_type = target_type
+        self.health_check_path = health_check_path
+        self.healthy_http_codes = healthy_http_codes
+        self.healthy_grpc_codes = healthy_grpc_codes
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+        self.healthy_threshold_count = healthy_threshold_count
+        self.unhealthy_threshold_count = unhealthy_threshold_count
+        self.attributes = attributes
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ServiceSpec':
+        """
+        Creates a service spec from a parsed spec document.
+
+        :param data: Service section of a spec.
+
+        :return: Service spec.
+        """
+        return cls(**data)
+
+    def target_group_params(self, prefix: str, vpc: Any) -> TargetGroupParams:
+        """
+        Creates target group parameters of the service.
+
+        :param prefix: Target group prefix.
+        :param vpc: Virtual private cloud of the target group. Type hint is not given to avoid importing CDK.
+
+        :return: Target group parameters.
+        """
+        return TargetGroupParams(
+            prefix=prefix,
+            vpc=vpc,
+            healthy_http_codes=self.healthy_http_codes,
+            health_check_path=self.health_check_path,
+            target_group_port=self.target_port,
+            protocol=self.protocol,
+            target_type=self.target_type,
+            attributes=TargetGroupAttributes(**self.attributes) if self.attributes else None,
+            health_check_interval_seconds=self.health_check_interval_seconds,
+            health_check_timeout_seconds=self.health_check_timeout_seconds,
+            healthy_threshold_count=self.healthy_threshold_count,
+            unhealthy_threshold_count=self.unhealthy_threshold_count,
+            protocol_version=self.protocol_version,
+            healthy_grpc_codes=self.healthy_grpc_codes,
+        )
@@ -0,0 +1,222 @@
+from typing import Any, Dict, List, Optional
+from aws_cdk import core, aws_ec2
+from aws_cdk.aws_certificatemanager import CfnCertificate
+from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+from aws_alb.params.listener_params import ListenerParams
+from aws_alb.spec.compiled_loadbalancer import CompiledLoadbalancer
+from aws_alb.spec.fragment_cache import FragmentCache
+from aws_alb.spec.loadbalancer_spec import LoadbalancerSpec
+from aws_alb.spec.spec_validator import SpecValidator
+
+
+class SpecCompiler:
+    """
+    Compiles a topology spec into loadbalancers, listeners, target groups and security group rules.
+
+    Every loadbalancer is rendered in an isolated app into a CloudFormation fragment which is included
+    into the stack. Fragments are cached by a content hash of the loadbalancer spec, hence only changed
+    loadbalancers are built on every synth. VPC and subnet references are parameters of a fragment which
+    are bound to the given VPC when the fragment is included.
+
+    The VPC must be defined in the same stack or imported by its attributes.
+    """
+    # Placeholder parameters of rendered fragments.
+    VPC_ID_PARAMETER = 'SpecVpcId'
+    VPC_CIDR_PARAMETER = 'SpecVpcCidr'
+    SUBNET_PARAMETER = 'SpecSubnet'
+
+    # Template sections which are included into the stack.
+    SECTIONS = ('Mappings', 'Conditions', 'Resources', 'Outputs')
+
+    def __init__(self, scope: core.Stack, vpc: aws_ec2.IVpc, cache_directory: Optional[str] = None) -> None:
+        """
+        Constructor.
+
+        :param scope: A CloudFormation stack in which the resources should be added.
+        :param vpc: Virtual private cloud of the loadbalancers.
+        :param cache_directory: Directory for rendered fragments e.g. cdk.out/.aws-alb-cache. If not given,
+        fragments are cached in memory only.
+        """
+        self.__scope = scope
+        self.__vpc = vpc
+        self.__cache = FragmentCache(cache_directory)
+
+    @property
+    def cache(self) -> FragmentCache:
+        """
+        Fragment cache. Tells how many loadbalancers were reused and how many were rendered.
+
+        :return: Fragment cache.
+        """
+        return self.__cache
+
+    def compile(self, spec: Dict[str, Any]) -> Dict[str, CompiledLoadbalancer]:
+        """
+        Validates a spec and includes all its loadbalancers into the stack.
+
+        :param spec: Parsed spec document (see SpecLoader).
+
+        :return: Compiled loadbalancers by their names.
+        """
+        errors = SpecValidator.validate(spec)
+        assert not errors, 'Invalid spec:\n' + '\n'.join(errors)
+
+        return {
+            data['name']: self.compile_loadbalancer(data)
+            for data in spec['loadbalancers']
+        }
+
+    def compile_loadbalancer(self, data: Dict[str, Any]) -> CompiledLoadbalancer:
+        """
+        Includes a single loadbalancer into the stack. The spec must be validated beforehand.
+
+        :param data: Loadbalancer section of a spec.
+
+        :return: Compiled loadbalancer.
+        """
+        subnets = self.__get_subnets(data.get('subnets', 'public'))
+        assert subnets, f'VPC has no {data.get("subnets", "public")} subnets for loadbalancer {data["name"]}.'
+
+        key = self.__cache.key(data, subnets=len(subnets))
+        entry = self.__cache.get(key)
+        cache_hit = entry is not None
+
+        if entry is None:
+            entry = self.render(LoadbalancerSpec.from_dict(data), len(subnets))
+            self.__cache.put(key, entry)
+
+        resolve = self.__scope.resolve
+        values = {
+            self.VPC_ID_PARAMETER: resolve(self.__vpc.vpc_id),
+            self.VPC_CIDR_PARAMETER: resolve(self.__vpc.vpc_cidr_block),
+        }
+        values.update({
+            f'{self.SUBNET_PARAMETER}{index}': resolve(subnet.subnet_id)
+            for index, subnet in enumerate(subnets)
+        })
+
+        # Deprecated, and jsii warns about it on every include. cloudformation_include.CfnInclude reads the
+        # template from a file and builds a construct for every resource, which would undo the gain of caching.
+        core.CfnInclude(self.__scope, data['name'] + 'SpecFragment', template=self.__bind(entry['template'], values))
+
+        return CompiledLoadbalancer(data['name'], entry['logical_ids'], cache_hit)
+
+    @classmethod
+    def render(cls, spec: LoadbalancerSpec, subnets_count: int) -> Dict[str, Any]:
+        """
+        Renders a loadbalancer in an isolated app.
+
+        :param spec: Loadbalancer spec.
+        :param subnets_count: Number of loadbalancer subnets.
+
+        :return: A cache entry with a template fragment and logical ids of the main resources.
+        """
+        app = core.App(analytics_reporting=False, stack_traces=False)
+        stack = core.Stack(app, 'Fragment')
+
+        def parameter(name: str) -> str:
+            return core.CfnParameter(stack, name, type='String').value_as_string
+
+        vpc = aws_ec2.Vpc.from_vpc_attributes(
+            stack,
+            'Vpc',
+            vpc_id=parameter(cls.VPC_ID_PARAMETER),
+            vpc_cidr_block=parameter(cls.VPC_CIDR_PARAMETER),
+            availability_zones=core.Fn.get_azs()
+        )
+
+        subnets = [
+            aws_ec2.Subnet.from_subnet_id(stack, f'Subnet{index}', parameter(f'{cls.SUBNET_PARAMETER}{index}'))
+            for index in range(subnets_count)
+        ]
+
+        certificate = CfnCertificate(
+            stack,
+            spec.name + 'Certificate',
+            domain_name=spec.certificate_domain,
+            validation_method='DNS'
+        ) if spec.certificate_domain else None
+
+        inbound_traffic = spec.inbound_traffic_enum
+
+        loadbalancer = ApplicationLoadbalancer(
+            scope=stack,
+            prefix=spec.name,
+            vpc=vpc,
+            loadbalancer_subnets=subnets,
+            certificate=certificate,
+            alb_type=spec.alb_type,
+            attributes=spec.loadbalancer_attributes(),
+            ssl_policy=spec.ssl_policy,
+            access_logs=spec.access_logs_params(),
+            inbound_traffic=inbound_traffic,
+            prefix_list_ids=spec.prefix_list_ids
+        )
+
+        def ref(element: core.CfnRefElement) -> str:
+            return stack.resolve(element.ref)['Ref']
+
+        logical_ids = {
+            'loadbalancer': ref(loadbalancer),
+            'security_group': stack.get_logical_id(loadbalancer.security_group.node.default_child),
+        }
+
+        for service in spec.services:
+            def listener_params(port: int) -> ListenerParams:
+                return ListenerParams(
+                    prefix=spec.name + service.name,
+                    loadbalancer=loadbalancer,
+                    port=port,
+                    inbound_traffic=inbound_traffic,
+                    certificate=certificate,
+                    ssl_policy=spec.ssl_policy if certificate else None,
+                    prefix_list_ids=spec.prefix_list_ids
+                )
+
+            (blue_group, blue_listener), (green_group, green_listener) = loadbalancer.listeners.create_blue_green(
+                blue_listener_params=listener_params(service.port),
+                green_listener_params=listener_params(service.test_port),
+                blue_target_group_params=service.target_group_params(spec.name + service.name, vpc),
+                green_target_group_params=service.target_group_params(spec.name + service.name, vpc)
+            )
+
+            logical_ids.update({
+                f'{service.name}/blue_target_group': ref(blue_group),
+                f'{service.name}/green_target_group': ref(green_group),
+                f'{service.name}/blue_listener': ref(blue_listener),
+                f'{service.name}/green_listener': ref(green_listener),
+            })
+
+        template = app.synth().get_stack_by_name(stack.stack_name).template
+        parameters = set(template.get('Parameters', {}))
+        placeholders = {cls.VPC_ID_PARAMETER, cls.VPC_CIDR_PARAMETER}
+        placeholders.update(f'{cls.SUBNET_PARAMETER}{index}' for index in range(subnets_count))
+        assert parameters <= placeholders, f'Unexpected fragment parameters: {sorted(parameters - placeholders)}.'
+
+        return dict(
+            template={section: template[section] for section in cls.SECTIONS if section in template},
+            logical_ids=logical_ids
+        )
+
+    def __get_subnets(self, subnets: str) -> List[aws_ec2.ISubnet]:
+        if subnets == 'private':
+            return self.__vpc.private_subnets
+
+        if subnets == 'isolated':
+            return self.__vpc.isolated_subnets
+
+        return self.__vpc.public_subnets
+
+    @classmethod
+    def __bind(cls, value: Any, values: Dict[str, Any]) -> Any:
+        # Replaces references to placeholder parameters with the given values.
+        if isinstance(value, dict):
+            if len(value) == 1 and value.get('Ref') in values:
+                return values[value['Ref']]
+
+            return {key: cls.__bind(item, values) for key, item in value.items()}
+
+        if isinstance(value, list):
+            return [cls.__bind(item, values) for item in value]
+
+        return value
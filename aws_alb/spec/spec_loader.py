@@ -0,0 +1,43 @@
+import json
+import os
+from typing import Any
+
+
+class SpecLoader:
+    """
+    Loads topology specs from JSON or YAML files. YAML support requires PyYAML (pip install aws-alb[yaml]).
+    """
+    YAML_EXTENSIONS = ('.yaml', '.yml')
+
+    @classmethod
+    def load(cls, path: str) -> Any:
+        """
+        Loads a spec file.
+
+        :param path: Path to a .json, .yaml or .yml file.
+
+        :return: Parsed spec document.
+        """
+        with open(path) as file:
+            text = file.read()
+
+        if os.path.splitext(path)[1].lower() in cls.YAML_EXTENSIONS:
+            return cls.loads_yaml(text)
+
+        return json.loads(text)
+
+    @staticmethod
+    def loads_yaml(text: str) -> Any:
+        """
+        Parses a YAML spec.
+
+        :param text: YAML document.
+
+        :return: Parsed spec document.
+        """
+        try:
+            import yaml
+        except ImportError as error:
+            raise ImportError('YAML specs require PyYAML. Install it with: pip install aws-alb[yaml]') from error
+
+        return yaml.safe_load(text)
@@ -0,0 +1,251 @@
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from aws_alb.alb_performance_profile import AlbPerformanceProfile
+from aws_alb.alb_traffic_enum import AlbTrafficEnum
+from aws_alb.alb_type import AlbType
+from aws_alb.health_check_calculator import HealthCheckCalculator
+from aws_alb.params.target_group_attributes import TargetGroupAttributes
+from aws_alb.spec.loadbalancer_spec import LoadbalancerSpec
+from aws_alb.spec.service_spec import ServiceSpec
+
+
+class SpecValidator:
+    """
+    Validates a topology spec before anything is built. All errors are collected, hence a single run
+    reports every problem of a spec. Does not import CDK, hence it can be used by linters.
+    """
+    # Allowed top level fields and their types.
+    FIELDS = {
+        'loadbalancers': list,
+    }
+
+    # Loadbalancer and service names are used as resource name prefixes.
+    NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9]*$')
+
+    # AWS limits.
+    MAX_RESOURCE_NAME_LENGTH = 32
+    MAX_LISTENERS = 50
+
+    # Ports of default listeners (see LoadBalancerListeners.create_default_listeners).
+    DEFAULT_PORTS = (80, 8000)
+    DEFAULT_HTTPS_PORTS = (443, 44300)
+
+    PROTOCOLS = ('HTTP', 'HTTPS')
+    PROTOCOL_VERSIONS = ('HTTP1', 'HTTP2', 'GRPC')
+    TARGET_TYPES = ('ip', 'instance')
+
+    @classmethod
+    def validate(cls, spec: Any) -> List[str]:
+        """
+        Validates a spec.
+
+        :param spec: Parsed spec document.
+
+        :return: A list of errors. Empty if the spec is valid.
+        """
+        errors: List[str] = []
+
+        spec = cls.__check_fields(errors, 'spec', spec, cls.FIELDS, ('loadbalancers',))
+
+        if spec is None or 'loadbalancers' not in spec:
+            return errors
+
+        names: Set[str] = set()
+
+        for index, loadbalancer in enumerate(spec['loadbalancers']):
+            path = f'loadbalancers[{index}]'
+
+            loadbalancer = cls.__check_fields(
+                errors, path, loadbalancer, LoadbalancerSpec.FIELDS, LoadbalancerSpec.REQUIRED_FIELDS
+            )
+
+            if loadbalancer is None:
+                continue
+
+            name = loadbalancer.get('name')
+            if name in names:
+                errors.append(f'{path}.name: duplicate loadbalancer name {name}.')
+            elif name is not None:
+                names.add(name)
+
+            cls.__validate_loadbalancer(errors, path, loadbalancer)
+
+        return errors
+
+    @classmethod
+    def __validate_loadbalancer(cls, errors: List[str], path: str, data: Dict[str, Any]) -> None:
+        # Fields which are missing or of invalid types are already reported. Remaining fields are still validated.
+        name = data.get('name', '')
+        if 'name' in data:
+            cls.__check_name(errors, f'{path}.name', name, name + 'AppLoadBalancer')
+
+        cls.__check_choice(errors, f'{path}.type', data.get('type'), [alb_type.name.lower() for alb_type in AlbType])
+        cls.__check_choice(errors, f'{path}.subnets', data.get('subnets'), LoadbalancerSpec.SUBNETS)
+        cls.__check_choice(
+            errors,
+            f'{path}.inbound_traffic',
+            data.get('inbound_traffic'),
+            [traffic.name.lower() for traffic in AlbTrafficEnum]
+        )
+        cls.__check_choice(
+            errors,
+            f'{path}.performance_profile',
+            data.get('performance_profile'),
+            [profile.name.lower() for profile in AlbPerformanceProfile]
+        )
+
+        if (data.get('inbound_traffic') or '').upper() == AlbTrafficEnum.PREFIX_LIST.name:
+            if not data.get('prefix_list_ids'):
+                errors.append(f'{path}.prefix_list_ids: prefix_list inbound traffic requires prefix list ids.')
+
+        https = bool(data.get('certificate_domain'))
+
+        if data.get('ssl_policy') and not https:
+            errors.append(f'{path}.ssl_policy: ssl policy requires a certificate_domain.')
+
+        # Attributes can be created only for a known profile.
+        profile = data.get('performance_profile')
+
+        if profile is None or profile.upper() in AlbPerformanceProfile.__members__:
+            fields = {**dict.fromkeys(LoadbalancerSpec.REQUIRED_FIELDS, ''), **data, 'services': None}
+            spec = LoadbalancerSpec.from_dict(fields)
+            cls.__check(errors, f'{path}.attributes', lambda: cls.__validate_attributes(spec))
+            cls.__check(errors, f'{path}.access_logs', spec.access_logs_params)
+
+        services = data.get('services') or []
+        listeners = len(cls.DEFAULT_PORTS) + (len(cls.DEFAULT_HTTPS_PORTS) if https else 0) + 2 * len(services)
+
+        if listeners > cls.MAX_LISTENERS:
+            errors.append(f'{path}.services: {listeners} listeners exceed the limit of {cls.MAX_LISTENERS}.')
+
+        used_ports = {port: 'a default listener' for port in cls.DEFAULT_PORTS}
+        if https:
+            used_ports.update({port: 'a default listener' for port in cls.DEFAULT_HTTPS_PORTS})
+
+        service_names: Set[str] = set()
+
+        for index, service in enumerate(services):
+            service_path = f'{path}.services[{index}]'
+
+            service = cls.__check_fields(errors, service_path, service, ServiceSpec.FIELDS, ServiceSpec.REQUIRED_FIELDS)
+
+            if service is None:
+                continue
+
+            if service.get('name') in service_names:
+                errors.append(f'{service_path}.name: duplicate service name {service["name"]}.')
+            elif 'name' in service:
+                service_names.add(service['name'])
+
+            cls.__validate_service(errors, service_path, name, service, https, used_ports)
+
+    @classmethod
+    def __validate_service(
+            cls,
+            errors: List[str],
+            path: str,
+            loadbalancer_name: str,
+            data: Dict[str, Any],
+            https: bool,
+            used_ports: Dict[int, str]
+    ) -> None:
+        # Fields which are missing or of invalid types are already reported. Remaining fields are still validated.
+        prefix = loadbalancer_name + data.get('name', '')
+        owner = f'service {data["name"]}' if 'name' in data else path
+
+        if 'name' in data:
+            # The longest name is of the green target group (see LoadBalancerListeners.create_blue_green).
+            cls.__check_name(errors, f'{path}.name', data['name'], prefix + 'GreenTargetGroup')
+
+        for field in ('port', 'test_port'):
+            if field not in data:
+                continue
+
+            port = data[field]
+
+            if not 1 <= port <= 65535:
+                errors.append(f'{path}.{field}: port {port} must be between 1 and 65535.')
+            elif port in used_ports:
+                errors.append(f'{path}.{field}: port {port} is already used by {used_ports[port]}.')
+            else:
+                used_ports[port] = owner
+
+        cls.__check_choice(errors, f'{path}.protocol', data.get('protocol'), cls.PROTOCOLS)
+        cls.__check_choice(errors, f'{path}.protocol_version', data.get('protocol_version'), cls.PROTOCOL_VERSIONS)
+        cls.__check_choice(errors, f'{path}.target_type', data.get('target_type'), cls.TARGET_TYPES)
+
+        if data.get('protocol_version') in ('HTTP2', 'GRPC') and not https:
+            errors.append(f'{path}.protocol_version: {data["protocol_version"]} requires a certificate_domain.')
+
+        # Attributes and health checks are validated separately, hence an error in one does not hide the other.
+        attributes = data.get('attributes')
+        if attributes:
+            cls.__check(errors, f'{path}.attributes', lambda: TargetGroupAttributes(**attributes).validate())
+
+        # Health check settings do not depend on required fields.
+        fields = {**dict.fromkeys(ServiceSpec.REQUIRED_FIELDS), **data, 'attributes': None}
+        params = ServiceSpec.from_dict(fields).target_group_params(prefix, None)
+        cls.__check(errors, path, lambda: HealthCheckCalculator.validate(*HealthCheckCalculator.settings(params)))
+
+    @staticmethod
+    def __validate_attributes(spec: LoadbalancerSpec) -> None:
+        attributes = spec.loadbalancer_attributes()
+
+        if attributes:
+            attributes.validate()
+
+    @classmethod
+    def __check_fields(
+            cls,
+            errors: List[str],
+            path: str,
+            data: Any,
+            fields: Dict[str, type],
+            required: Tuple[str, ...]
+    ) -> Optional[Dict[str, Any]]:
+        # Returns known fields of valid types which can be validated further, or None if data is not a mapping.
+        # Missing required fields are reported, callers validate whatever is present.
+        if not isinstance(data, dict):
+            errors.append(f'{path}: must be a mapping.')
+            return None
+
+        valid_fields = {}
+
+        for field, value in data.items():
+            if field not in fields:
+                errors.append(f'{path}.{field}: unknown field. Allowed fields: {", ".join(fields)}.')
+            # Booleans are integers in python, hence they are rejected explicitly.
+            elif value is not None and (not isinstance(value, fields[field]) or isinstance(value, bool)):
+                errors.append(f'{path}.{field}: must be of type {fields[field].__name__}.')
+            elif value is not None:
+                valid_fields[field] = value
+
+        for field in required:
+            if data.get(field) is None:
+                errors.append(f'{path}.{field}: field is required.')
+
+        return valid_fields
+
+    @classmethod
+    def __check_name(cls, errors: List[str], path: str, name: str, longest_resource_name: str) -> None:
+        if not cls.NAME_PATTERN.match(name):
+            errors.append(f'{path}: {name} must be alphanumeric and start with a letter.')
+
+        if len(longest_resource_name) > cls.MAX_RESOURCE_NAME_LENGTH:
+            errors.append(
+                f'{path}: resource name {longest_resource_name} is longer '
+                f'than {cls.MAX_RESOURCE_NAME_LENGTH} characters.'
+            )
+
+    @staticmethod
+    def __check_choice(errors: List[str], path: str, value: Any, choices) -> None:
+        if value is not None and value not in choices:
+            errors.append(f'{path}: {value} must be one of {", ".join(choices)}.')
+
+    @staticmethod
+    def __check(errors: List[str], path: str, check: Callable) -> None:
+        # Params classes validate themselves with assertions.
+        try:
+            check()
+        except (AssertionError, TypeError, ValueError, KeyError) as error:
+            errors.append(f'{path}: {error}')
@@ -0,0 +1,531 @@
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
+from aws_alb.params.template_budget_params import TemplateBudgetParams
+
+
+class TemplateUsage:
+    """
+    Template resources attributed to a loadbalancer, a listener or a target group.
+    """
+    def __init__(self, logical_id: str, resource_type: str) -> None:
+        """
+        Constructor.
+
+        :param logical_id: Logical id of the loadbalancer, listener or target group.
+        :param resource_type: CloudFormation resource type.
+        """
+        self.logical_id = logical_id
+        self.resource_type = resource_type
+        # Logical ids of attributed resources (including the resource itself).
+        self.resources: List[str] = []
+        self.bytes = 0
+        self.security_group_rules = 0
+        self.listener_rules = 0
+
+    def add(self, logical_id: str, size: int) -> None:
+        """
+        Attributes a resource.
+
+        :param logical_id: Logical id of the resource.
+        :param size: Size of the rendered resource in bytes.
+
+        :return: No return.
+        """
+        self.resources.append(logical_id)
+        self.bytes += size
+
+
+class TemplateBudgetReport:
+    """
+    Report of a template budget analysis.
+    """
+    def __init__(self, stack_name: str) -> None:
+        """
+        Constructor.
+
+        :param stack_name: Name of the analyzed stack.
+        """
+        self.stack_name = stack_name
+        self.resources_count = 0
+        self.template_bytes = 0
+        # Usage of every loadbalancer includes usage of its listeners and target groups.
+        self.loadbalancers: Dict[str, TemplateUsage] = {}
+        self.listeners: Dict[str, TemplateUsage] = {}
+        self.target_groups: Dict[str, TemplateUsage] = {}
+        # Number of inbound and outbound rules of every security group.
+        self.security_group_rules: Dict[str, Tuple[int, int]] = {}
+        # Library resources which are shared by many loadbalancers (or by none).
+        self.unattributed: List[str] = []
+        self.violations: List[str] = []
+        self.suggestions: List[str] = []
+
+    def to_text(self) -> str:
+        """
+        Renders the report as a human readable text.
+
+        :return: Report text.
+        """
+        lines = [
+            f'Stack {self.stack_name}: {self.resources_count} resources, {self.template_bytes} bytes.',
+            '',
+            f'{"resource":<50} {"resources":>9} {"bytes":>9} {"sg rules":>9} {"rules":>6}',
+        ]
+
+        def row(usage: TemplateUsage, indent: str) -> str:
+            name = indent + usage.logical_id
+            return (
+                f'{name:<50} {len(usage.resources):>9} {usage.bytes:>9} '
+                f'{usage.security_group_rules:>9} {usage.listener_rules:>6}'
+            )
+
+        for loadbalancer in self.loadbalancers.values():
+            lines.append(row(loadbalancer, ''))
+
+        lines.append('')
+        lines.extend(row(listener, '  listener ') for listener in self.listeners.values())
+        lines.extend(row(group, '  target group ') for group in self.target_groups.values())
+
+        if self.unattributed:
+            lines.extend(['', f'Shared or unattributed: {", ".join(self.unattributed)}.'])
+
+        lines.extend(['', 'Violations:'] + [f'  {violation}' for violation in self.violations or ['none']])
+        lines.extend(['', 'Suggestions:'] + [f'  {suggestion}' for suggestion in self.suggestions or ['none']])
+
+        return '\n'.join(lines)
+
+
+class TemplateBudgetAnalyzer:
+    """
+    Attributes resources, security group rules, listener rules and bytes of a synthesized template
+    to loadbalancers, listeners and target groups, checks them against budgets and suggests consolidations.
+
+    Constructs of this library are created in a stack scope rather than under a loadbalancer construct,
+    hence resources are attributed by their references: a listener rule belongs to its listener, an alarm
+    to its target group, a security group to the loadbalancer which uses it and so on.
+    """
+    LOADBALANCER = 'AWS::ElasticLoadBalancingV2::LoadBalancer'
+    LISTENER = 'AWS::ElasticLoadBalancingV2::Listener'
+    LISTENER_RULE = 'AWS::ElasticLoadBalancingV2::ListenerRule'
+    TARGET_GROUP = 'AWS::ElasticLoadBalancingV2::TargetGroup'
+    SECURITY_GROUP = 'AWS::EC2::SecurityGroup'
+    SECURITY_GROUP_INGRESS = 'AWS::EC2::SecurityGroupIngress'
+    SECURITY_GROUP_EGRESS = 'AWS::EC2::SecurityGroupEgress'
+
+    # Resources are attributed to the most specific anchor they reference.
+    ANCHOR_PRIORITY = (LISTENER, TARGET_GROUP, LOADBALANCER)
+
+    # Resource types which this library creates. Other resources (e.g. VPC) are never attributed.
+    LIBRARY_TYPE_PREFIXES = (
+        'AWS::ElasticLoadBalancingV2::',
+        'AWS::EC2::SecurityGroup',
+        'AWS::CloudWatch::',
+        'AWS::S3::Bucket',
+        'AWS::ApplicationAutoScaling::ScalingPolicy',
+        'AWS::CertificateManager::',
+        'AWS::CloudFront::',
+        'AWS::Lambda::Permission',
+    )
+
+    def __init__(self, budget: Optional[TemplateBudgetParams] = None) -> None:
+        """
+        Constructor.
+
+        :param budget: Budgets. If not given, CloudFormation and AWS default limits are used.
+        """
+        self.budget = budget or TemplateBudgetParams()
+        self.budget.validate()
+
+    def synth(self, app: Any) -> Any:
+        """
+        Synthesizes an app and fails if any stack exceeds the budgets.
+
+        :param app: CDK app. Type hint is not given to avoid importing CDK.
+
+        :return: Cloud assembly.
+        """
+        assembly = app.synth()
+        reports = [self.analyze(stack.template, stack.stack_name) for stack in assembly.stacks]
+
+        violations = [f'{report.stack_name}: {violation}' for report in reports for violation in report.violations]
+        suggestions = [f'{report.stack_name}: {suggestion}' for report in reports for suggestion in report.suggestions]
+
+        assert not violations, '\n'.join(['Template budgets are exceeded:'] + violations + suggestions)
+
+        return assembly
+
+    def analyze(self, template: Dict[str, Any], stack_name: str = 'Stack') -> TemplateBudgetReport:
+        """
+        Analyzes a synthesized template.
+
+        :param template: CloudFormation template.
+        :param stack_name: Stack name used in the report.
+
+        :return: Budget report.
+        """
+        report = TemplateBudgetReport(stack_name)
+        resources: Dict[str, Dict[str, Any]] = template.get('Resources', {})
+
+        report.resources_count = len(resources)
+        report.template_bytes = len(json.dumps(template, separators=(',', ':')))
+
+        library = {
+            logical_id for logical_id, resource in resources.items()
+            if resource.get('Type', '').startswith(self.LIBRARY_TYPE_PREFIXES)
+        }
+        references = {
+            logical_id: self.__references(resources[logical_id], resources) & library
+            for logical_id in library
+        }
+        referrers: Dict[str, Set[str]] = {logical_id: set() for logical_id in library}
+        for logical_id, referenced in references.items():
+            for reference in referenced:
+                referrers[reference].add(logical_id)
+
+        attribution = _Attribution(resources, references, referrers, self.ANCHOR_PRIORITY)
+
+        for logical_id in sorted(library):
+            resource_type = resources[logical_id]['Type']
+
+            if resource_type == self.LOADBALANCER:
+                report.loadbalancers[logical_id] = TemplateUsage(logical_id, resource_type)
+            elif resource_type == self.LISTENER:
+                report.listeners[logical_id] = TemplateUsage(logical_id, resource_type)
+            elif resource_type == self.TARGET_GROUP:
+                report.target_groups[logical_id] = TemplateUsage(logical_id, resource_type)
+
+        for logical_id in sorted(library):
+            resource = resources[logical_id]
+            size = len(json.dumps({logical_id: resource}, separators=(',', ':')))
+            anchor = attribution.owner(logical_id)
+            loadbalancer = attribution.loadbalancer(anchor) if anchor else None
+
+            if anchor is None or (loadbalancer is None and resources[anchor]['Type'] != self.TARGET_GROUP):
+                report.unattributed.append(logical_id)
+
+            usages = [
+                usages[key]
+                for usages, key in (
+                    (report.listeners, anchor),
+                    (report.target_groups, anchor),
+                    (report.loadbalancers, loadbalancer),
+                )
+                if key in usages
+            ]
+
+            rules = self.__count_security_group_rules(resource)
+            listener_rules = 1 if resource['Type'] == self.LISTENER_RULE else 0
+
+            for usage in usages:
+                usage.add(logical_id, size)
+                usage.security_group_rules += rules
+                usage.listener_rules += listener_rules
+
+            self.__add_security_group_rules(report, logical_id, resource)
+
+        self.__check_budgets(report)
+        self.__suggest(report, resources)
+
+        return report
+
+    def __check_budgets(self, report: TemplateBudgetReport) -> None:
+        budget = self.budget
+
+        if report.resources_count > budget.max_resources:
+            report.violations.append(f'{report.resources_count} resources exceed the budget of {budget.max_resources}.')
+
+        if report.template_bytes > budget.max_template_bytes:
+            report.violations.append(
+                f'Template size {report.template_bytes} bytes exceeds the budget of {budget.max_template_bytes}.'
+            )
+
+        for usage in report.loadbalancers.values():
+            if budget.max_loadbalancer_resources and len(usage.resources) > budget.max_loadbalancer_resources:
+                report.violations.append(
+                    f'Loadbalancer {usage.logical_id} has {len(usage.resources)} resources, '
+                    f'the budget is {budget.max_loadbalancer_resources}.'
+                )
+
+            if budget.max_loadbalancer_bytes and usage.bytes > budget.max_loadbalancer_bytes:
+                report.violations.append(
+                    f'Loadbalancer {usage.logical_id} uses {usage.bytes} bytes, '
+                    f'the budget is {budget.max_loadbalancer_bytes}.'
+                )
+
+        for security_group, (inbound, outbound) in report.security_group_rules.items():
+            for direction, count in (('inbound', inbound), ('outbound', outbound)):
+                if count > budget.max_security_group_rules:
+                    report.violations.append(
+                        f'Security group {security_group} has {count} {direction} rules, '
+                        f'the budget is {budget.max_security_group_rules}.'
+                    )
+
+        for usage in report.listeners.values():
+            if usage.listener_rules > budget.max_listener_rules:
+                report.violations.append(
+                    f'Listener {usage.logical_id} has {usage.listener_rules} rules, '
+                    f'the budget is {budget.max_listener_rules}.'
+                )
+
+    def __suggest(self, report: TemplateBudgetReport, resources: Dict[str, Dict[str, Any]]) -> None:
+        budget = self.budget
+        ratio = budget.warning_ratio
+
+        if report.resources_count >= ratio * budget.max_resources or (
+                report.template_bytes >= ratio * budget.max_template_bytes
+        ):
+            largest = sorted(report.loadbalancers.values(), key=lambda usage: len(usage.resources), reverse=True)
+            details = ', '.join(f'{usage.logical_id} ({len(usage.resources)})' for usage in largest[:3])
+            report.suggestions.append(
+                f'Stack is close to CloudFormation limits. Move loadbalancers into separate stacks '
+                f'(largest by resources: {details or "none"}).'
+            )
+
+        # Security groups with identical rules can be replaced by a single shared security group.
+        signatures: Dict[str, List[str]] = {}
+        for logical_id, resource in resources.items():
+            if resource.get('Type') == self.SECURITY_GROUP and logical_id in report.security_group_rules:
+                properties = resource.get('Properties', {})
+                signature = json.dumps(
+                    [properties.get('SecurityGroupIngress', []), properties.get('SecurityGroupEgress', [])],
+                    sort_keys=True
+                )
+                signatures.setdefault(signature, []).append(logical_id)
+
+        for groups in signatures.values():
+            if len(groups) > 1:
+                report.suggestions.append(
+                    f'Security groups {", ".join(groups)} have identical rules. Share a single security group.'
+                )
+
+        for security_group, (inbound, outbound) in report.security_group_rules.items():
+            if max(inbound, outbound) >= ratio * budget.max_security_group_rules:
+                report.suggestions.append(
+                    f'Security group {security_group} is close to the rules quota ({inbound} inbound, '
+                    f'{outbound} outbound). Allocate listener ports from a port pool, hence they merge '
+                    f'into port ranges, or use prefix lists.'
+                )
+
+        # Rules of the same listener with the same actions can be merged by combining their conditions.
+        actions: Dict[Tuple[str, str], List[str]] = {}
+        for logical_id, resource in resources.items():
+            if resource.get('Type') == self.LISTENER_RULE:
+                properties = resource.get('Properties', {})
+                key = (
+                    json.dumps(properties.get('ListenerArn'), sort_keys=True),
+                    json.dumps(properties.get('Actions'), sort_keys=True)
+                )
+                actions.setdefault(key, []).append(logical_id)
+
+        for rules in actions.values():
+            if len(rules) > 1:
+                report.suggestions.append(
+                    f'Listener rules {", ".join(sorted(rules))} have identical actions. '
+                    f'Merge them with LoadBalancerListeners.create_optimized_listener_rules.'
+                )
+
+        for usage in report.listeners.values():
+            if usage.listener_rules >= ratio * budget.max_listener_rules:
+                report.suggestions.append(
+                    f'Listener {usage.logical_id} has {usage.listener_rules} rules. '
+                    f'Merge rules or move some of them to another listener.'
+                )
+
+    def __add_security_group_rules(self, report: TemplateBudgetReport, logical_id: str, resource: Dict) -> None:
+        resource_type = resource['Type']
+        properties = resource.get('Properties', {})
+
+        if resource_type == self.SECURITY_GROUP:
+            inbound, outbound = report.security_group_rules.get(logical_id, (0, 0))
+            report.security_group_rules[logical_id] = (
+                inbound + len(properties.get('SecurityGroupIngress', [])),
+                outbound + len(properties.get('SecurityGroupEgress', [])),
+            )
+        elif resource_type in (self.SECURITY_GROUP_INGRESS, self.SECURITY_GROUP_EGRESS):
+            group = properties.get('GroupId')
+            group = self.__referenced_id(group) or json.dumps(group)
+            inbound, outbound = report.security_group_rules.get(group, (0, 0))
+            ingress = resource_type == self.SECURITY_GROUP_INGRESS
+            report.security_group_rules[group] = (inbound + ingress, outbound + (not ingress))
+
+    def __count_security_group_rules(self, resource: Dict[str, Any]) -> int:
+        if resource['Type'] in (self.SECURITY_GROUP_INGRESS, self.SECURITY_GROUP_EGRESS):
+            return 1
+
+        if resource['Type'] == self.SECURITY_GROUP:
+            properties = resource.get('Properties', {})
+            return len(properties.get('SecurityGroupIngress', [])) + len(properties.get('SecurityGroupEgress', []))
+
+        return 0
+
+    @staticmethod
+    def __referenced_id(value: Any) -> Optional[str]:
+        if isinstance(value, dict) and len(value) == 1:
+            if 'Ref' in value:
+                return value['Ref']
+
+            if 'Fn::GetAtt' in value:
+                return value['Fn::GetAtt'][0]
+
+        return None
+
+    @classmethod
+    def __references(cls, value: Any, resources: Dict[str, Any]) -> Set[str]:
+        # Logical ids of resources referenced through Ref, Fn::GetAtt and DependsOn. The latter links resources
+        # which are not referenced e.g. a lambda invoke permission of a target group.
+        depends_on = value.get('DependsOn', [])
+        found = {depends_on} if isinstance(depends_on, str) else set(depends_on)
+        found &= set(resources)
+        stack = [value.get('Properties', {})]
+
+        while stack:
+            item = stack.pop()
+
+            if isinstance(item, dict):
+                referenced = cls.__referenced_id(item)
+
+                if referenced in resources:
+                    found.add(referenced)
+
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
+
+        return found
+
+
+class _Attribution:
+    """
+    Resolves owners (loadbalancers, listeners or target groups) of resources by their references.
+    """
+    def __init__(
+            self,
+            resources: Dict[str, Dict[str, Any]],
+            references: Dict[str, Set[str]],
+            referrers: Dict[str, Set[str]],
+            anchor_priority: Tuple[str, ...]
+    ) -> None:
+        self.__resources = resources
+        self.__references = references
+        self.__referrers = referrers
+        self.__anchor_priority = anchor_priority
+        self.__loadbalancers: Dict[str, Optional[str]] = {}
+        self.__owners = self.__resolve()
+
+    def owner(self, logical_id: str) -> Optional[str]:
+        """
+        Finds an anchor (loadbalancer, listener or target group) of a resource.
+
+        :param logical_id: Logical id of a resource.
+
+        :return: Logical id of the anchor or None if the resource is shared or not attributable.
+        """
+        return self.__owners.get(logical_id)
+
+    def loadbalancer(self, anchor: str) -> Optional[str]:
+        """
+        Finds a loadbalancer of an anchor.
+
+        :param anchor: Logical id of a loadbalancer, listener or target group.
+
+        :return: Logical id of the loadbalancer or None if the anchor is shared or not attached.
+        """
+        if anchor not in self.__loadbalancers:
+            resource_type = self.__type(anchor)
+
+            if resource_type == TemplateBudgetAnalyzer.LOADBALANCER:
+                loadbalancer = anchor
+            elif resource_type == TemplateBudgetAnalyzer.LISTENER:
+                loadbalancer = self.__single(
+                    reference for reference in self.__references[anchor]
+                    if self.__type(reference) == TemplateBudgetAnalyzer.LOADBALANCER
+                )
+            else:
+                # A target group belongs to the loadbalancer whose listeners or rules forward to it.
+                # Resources which reference a target group always reference an anchor, hence their
+                # owners are known without resolving the whole template.
+                self.__loadbalancers[anchor] = None
+                owners = {self.__anchor(referrer) for referrer in self.__referrers[anchor]}
+                loadbalancer = self.__single(
+                    self.loadbalancer(owner) for owner in owners
+                    if owner and owner != anchor and self.__type(owner) != TemplateBudgetAnalyzer.TARGET_GROUP
+                )
+
+            self.__loadbalancers[anchor] = loadbalancer
+
+        return self.__loadbalancers[anchor]
+
+    def __resolve(self) -> Dict[str, Optional[str]]:
+        # Owners are propagated from anchors round by round until nothing changes. At first, resources whose
+        # owners are not known yet are skipped, hence cycles (e.g. a security group and a standalone ingress
+        # which references it) are resolved through their other references. Then unresolved resources are
+        # considered shared and owners which depend on them are resolved again.
+        owners: Dict[str, Optional[str]] = {}
+
+        for pending_as_shared in (False, True):
+            if pending_as_shared:
+                owners = {logical_id: owners.get(logical_id) for logical_id in self.__references}
+
+            # Every round resolves resources one reference further, hence the number of rounds is bounded.
+            for _ in range(len(self.__references) + 1):
+                resolved = {logical_id: self.__owner(logical_id, owners) for logical_id in self.__references}
+
+                if not pending_as_shared:
+                    resolved = {logical_id: owner for logical_id, owner in resolved.items() if owner}
+
+                if resolved == owners:
+                    break
+
+                owners = resolved
+
+        return owners
+
+    def __owner(self, logical_id: str, owners: Dict[str, Optional[str]]) -> Optional[str]:
+        references = self.__references[logical_id]
+
+        # Anchors and resources which reference anchors do not depend on other owners.
+        if any(self.__type(resource) in self.__anchor_priority for resource in references | {logical_id}):
+            return self.__anchor(logical_id)
+
+        # Owners of referenced resources e.g. a security group of a security group ingress.
+        reference_owners = {owners.get(reference) for reference in references} - {None}
+        if reference_owners:
+            return self.__common(reference_owners)
+
+        # Owners of referring resources e.g. a loadbalancer which uses a security group.
+        # Referrers whose owners are not resolved yet are skipped.
+        referrer_owners = [owners[referrer] for referrer in self.__referrers[logical_id] if referrer in owners]
+        if referrer_owners and None not in referrer_owners:
+            return self.__common(referrer_owners)
+
+        return None
+
+    def __anchor(self, logical_id: str) -> Optional[str]:
+        if self.__type(logical_id) in self.__anchor_priority:
+            return logical_id
+
+        # The most specific directly referenced anchor e.g. a listener of a listener rule.
+        references = self.__references[logical_id]
+        for anchor_type in self.__anchor_priority:
+            anchors = [reference for reference in references if self.__type(reference) == anchor_type]
+
+            if anchors:
+                return self.__common(anchors)
+
+        return None
+
+    def __common(self, anchors) -> Optional[str]:
+        anchors = set(anchors)
+
+        if len(anchors) == 1:
+            return anchors.pop()
+
+        # Many anchors of the same loadbalancer e.g. listeners which share a certificate.
+        return self.__single(self.loadbalancer(anchor) for anchor in anchors)
+
+    @staticmethod
+    def __single(values) -> Optional[str]:
+        values = set(values)
+        return values.pop() if len(values) == 1 and None not in values else None
+
+    def __type(self, logical_id: str) -> str:
+        return self.__resources[logical_id].get('Type', '')
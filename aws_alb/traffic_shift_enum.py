@@ -0,0 +1,11 @@
+from enum import auto, Enum
+
+
+class TrafficShiftEnum(Enum):
+    """
+    Enum class which tells how traffic should be shifted from one target group to another.
+    """
+    # Shift an equal share of traffic on every step.
+    LINEAR = auto()
+    # Double the shifted share of traffic on every step (canary).
+    EXPONENTIAL = auto()
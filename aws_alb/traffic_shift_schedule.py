@@ -0,0 +1,35 @@
+from typing import List, Tuple
+from aws_alb.traffic_shift_enum import TrafficShiftEnum
+
+
+class TrafficShiftSchedule:
+    """
+    Calculates weights of a gradual traffic shift from a blue target group to a green one.
+    Does not import CDK, hence offline tools (e.g. the load test harness) can use it.
+    """
+    @staticmethod
+    def create_steps(steps: int, traffic_shift: TrafficShiftEnum = TrafficShiftEnum.LINEAR) -> List[Tuple[int, int]]:
+        """
+        Creates a schedule of weights to gradually shift traffic from a blue target group to a green one.
+
+        :param steps: Number of steps. The last step always sends all traffic to the green target group.
+        :param traffic_shift: Shape of the schedule. Linear shifts an equal share on every step,
+        exponential doubles the green share on every step (e.g. 6, 12, 25, 50, 100 percent).
+
+        :return: A list of (blue weight, green weight) pairs. Weights of each pair sum up to 100.
+        """
+        assert 1 <= steps <= 100, 'Number of steps must be between 1 and 100.'
+
+        weights = []
+        for step in range(1, steps + 1):
+            if traffic_shift == TrafficShiftEnum.EXPONENTIAL:
+                green = 100 * 2 ** (step - steps)
+            else:
+                green = 100 * step / steps
+
+            # Every step must shift at least one percent more traffic than the previous one.
+            previous = weights[-1][1] if weights else 0
+            green = max(int(round(green)), previous + 1)
+            weights.append((100 - green, green))
+
+        return weights
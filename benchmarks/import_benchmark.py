@@ -0,0 +1,165 @@
+"""
+Import-time budget check.
+
+Imports lightweight modules (the package itself, enums, params, calculators and offline tools) in fresh
+interpreters, verifies that they do not load CDK or jsii, and checks that their import time stays within
+a budget. Import time of construct modules (which load CDK) is reported for comparison.
+
+Modules are discovered in the package: a module is a construct module if it imports CDK, jsii or another
+construct module at its top level (imports under TYPE_CHECKING or inside functions do not count).
+Every other module is lightweight.
+
+Usage:
+    python benchmarks/import_benchmark.py                  # Fails if a budget is exceeded.
+    python benchmarks/import_benchmark.py --budget 0.3     # Custom budget in seconds.
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = 'aws_alb'
+
+# Top level packages which lightweight modules must not load.
+FORBIDDEN_PACKAGES = ('aws_cdk', 'jsii')
+# Default import time budget of a lightweight module in seconds.
+DEFAULT_BUDGET = 0.2
+
+# Runs in a fresh interpreter: imports a module and prints import time and loaded heavy packages.
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+loaded = sorted({{name.split('.')[0] for name in sys.modules if name.split('.')[0] in {forbidden!r}}})
+print(json.dumps({{'seconds': seconds, 'loaded': loaded}}))
+'''
+
+
+def top_level_imports(path: str) -> Set[str]:
+    """
+    Collects modules imported at the top level of a source file.
+
+    :param path: Path of a python source file.
+
+    :return: Imported module names.
+    """
+    with open(path) as file:
+        tree = ast.parse(file.read(), path)
+
+    imports = set()
+    statements = list(tree.body)
+
+    while statements:
+        statement = statements.pop()
+
+        if isinstance(statement, ast.Import):
+            imports.update(alias.name for alias in statement.names)
+        elif isinstance(statement, ast.ImportFrom) and statement.module and not statement.level:
+            imports.add(statement.module)
+            # "from package import module" imports a submodule.
+            imports.update(f'{statement.module}.{alias.name}' for alias in statement.names)
+        elif isinstance(statement, ast.Try):
+            statements.extend(statement.body + statement.orelse + statement.finalbody)
+
+    return imports
+
+
+def discover_modules() -> Tuple[List[str], List[str]]:
+    """
+    Discovers lightweight and construct modules of the package.
+
+    :return: Lightweight module names and construct module names.
+    """
+    imports: Dict[str, Set[str]] = {}
+
+    for directory, _, files in os.walk(os.path.join(ROOT, PACKAGE)):
+        package = os.path.relpath(directory, ROOT).replace(os.sep, '.')
+
+        for file in sorted(files):
+            if file.endswith('.py'):
+                module = package if file == '__init__.py' else f'{package}.{file[:-3]}'
+                imports[module] = top_level_imports(os.path.join(directory, file))
+
+    # A module which imports a construct module at its top level loads CDK as well.
+    constructs: Set[str] = set()
+    changed = True
+
+    while changed:
+        changed = False
+
+        for module, imported in imports.items():
+            loads_cdk = any(name.split('.')[0] in FORBIDDEN_PACKAGES or name in constructs for name in imported)
+
+            if module not in constructs and loads_cdk:
+                constructs.add(module)
+                changed = True
+
+    return sorted(set(imports) - constructs), sorted(constructs)
+
+
+def measure(module: str, runs: int) -> Dict:
+    """
+    Imports a module in fresh interpreters.
+
+    :param module: Module name.
+    :param runs: Number of imports. The median time is used.
+
+    :return: Median import time in seconds and heavy packages loaded by the import.
+    """
+    results = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module, forbidden=FORBIDDEN_PACKAGES)],
+            cwd=ROOT,
+            check=True,
+            stdout=subprocess.PIPE,
+            env=dict(os.environ, PYTHONPATH=ROOT, JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION='1'),
+        ).stdout
+        results.append(json.loads(output.decode().strip().splitlines()[-1]))
+
+    return {
+        'seconds': statistics.median(result['seconds'] for result in results),
+        'loaded': results[0]['loaded'],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Import-time budget check.')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help='Import time budget of a module in seconds.')
+    parser.add_argument('--runs', type=int, default=3, help='Number of imports per module.')
+    parser.add_argument('--skip-constructs', action='store_true', help='Do not report construct modules.')
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    lightweight_modules, construct_modules = discover_modules()
+
+    for module in lightweight_modules:
+        result = measure(module, args.runs)
+        print(f'{module:<45} {result["seconds"] * 1000:8.1f}ms  {", ".join(result["loaded"])}')
+
+        if result['loaded']:
+            failures.append(f'{module}: loads {", ".join(result["loaded"])}.')
+
+        if result['seconds'] > args.budget:
+            failures.append(f'{module}: {result["seconds"]:.3f}s exceeds the budget of {args.budget:.3f}s.')
+
+    if not args.skip_constructs:
+        for module in construct_modules:
+            result = measure(module, 1)
+            print(f'{module:<45} {result["seconds"] * 1000:8.1f}ms  {", ".join(result["loaded"])} (not budgeted)')
+
+    for failure in failures:
+        print(f'FAIL {failure}')
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Synth-time benchmark for large loadbalancer topologies.
+
+Builds parametrised topologies (N loadbalancers x M listeners x K blue/green pairs) through the public API
+and measures construction time, synth time, jsii kernel calls, peak python memory and template size.
+Results are compared against stored baselines to catch regressions. Only deterministic metrics (jsii calls,
+template size and resources) are gated by default: stored time and memory baselines come from a single
+machine, hence they are compared only on request.
+
+Usage:
+    python benchmarks/synth_benchmark.py                     # Compare deterministic metrics against baselines.
+    python benchmarks/synth_benchmark.py --check-timing      # Compare time and memory metrics as well.
+    python benchmarks/synth_benchmark.py --update-baseline   # Store current results as baselines.
+    python benchmarks/synth_benchmark.py --scenario large    # Run a single scenario.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jsii
+from aws_cdk import core, aws_ec2
+from jsii._kernel import Kernel
+from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+from aws_alb.listener_actions import ListenerActions
+from aws_alb.params.listener_params import ListenerParams
+from aws_alb.params.target_group_params import TargetGroupParams
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+# Kernel methods which make a round-trip to the jsii (node) process.
+KERNEL_METHODS = ('create', 'delete', 'get', 'set', 'sget', 'sset', 'invoke', 'sinvoke', 'ainvoke', 'complete')
+
+# Deterministic metrics must not grow at all. Time and memory metrics are noisy, hence they get a tolerance.
+EXACT_METRICS = ('jsii_calls', 'template_bytes', 'resources')
+NOISY_METRICS = ('construction_seconds', 'synth_seconds', 'peak_memory_mb')
+
+
+class Scenario(NamedTuple):
+    name: str
+    loadbalancers: int
+    listeners: int
+    blue_green_pairs: int
+
+
+SCENARIOS = [
+    Scenario('small', loadbalancers=1, listeners=2, blue_green_pairs=2),
+    Scenario('medium', loadbalancers=3, listeners=5, blue_green_pairs=5),
+    # Stays below the limit of 500 resources per CloudFormation stack.
+    Scenario('large', loadbalancers=6, listeners=10, blue_green_pairs=10),
+]
+
+
+@contextmanager
+def count_jsii_calls() -> Iterator[Dict[str, int]]:
+    """
+    Counts jsii kernel calls made within the context.
+
+    :return: A dictionary which is filled with call counts per kernel method.
+    """
+    counts = {method: 0 for method in KERNEL_METHODS}
+
+    # Generated bindings call module level aliases (jsii.invoke etc.) while the runtime itself
+    # calls kernel methods directly. Both are patched, neither goes through the other.
+    targets = [(Kernel, method) for method in KERNEL_METHODS]
+    targets += [(jsii, method) for method in KERNEL_METHODS if hasattr(jsii, method)]
+    originals = [(target, method, getattr(target, method)) for target, method in targets]
+
+    def counting(method, original):
+        def wrapper(*args, **kwargs):
+            counts[method] += 1
+            return original(*args, **kwargs)
+        return wrapper
+
+    for target, method, original in originals:
+        setattr(target, method, counting(method, original))
+
+    try:
+        yield counts
+    finally:
+        for target, method, original in originals:
+            setattr(target, method, original)
+
+
+def build_topology(stack: core.Stack, scenario: Scenario) -> None:
+    """
+    Builds a topology through the public API.
+
+    :param stack: Stack in which the topology is built.
+    :param scenario: Topology size.
+
+    :return: No return.
+    """
+    vpc = aws_ec2.Vpc(stack, 'Vpc', max_azs=2, nat_gateways=0)
+
+    for lb_index in range(scenario.loadbalancers):
+        prefix = f'Lb{lb_index}'
+        loadbalancer = ApplicationLoadbalancer(
+            scope=stack,
+            prefix=prefix,
+            vpc=vpc,
+            loadbalancer_subnets=vpc.public_subnets,
+        )
+
+        for listener_index in range(scenario.listeners):
+            loadbalancer.listeners.create_listener(ListenerParams(
+                prefix=f'{prefix}Extra{listener_index}',
+                loadbalancer=loadbalancer,
+                port=10000 + listener_index,
+                action=ListenerActions.fixed_404_action()
+            ))
+
+        for pair_index in range(scenario.blue_green_pairs):
+            service = f'{prefix}Svc{pair_index}'
+            loadbalancer.listeners.create_blue_green(
+                blue_listener_params=ListenerParams(service, loadbalancer, 20000 + 2 * pair_index),
+                green_listener_params=ListenerParams(service, loadbalancer, 20000 + 2 * pair_index + 1),
+                blue_target_group_params=TargetGroupParams(service, vpc),
+                green_target_group_params=TargetGroupParams(service, vpc),
+            )
+
+
+def run(scenario: Scenario) -> Dict[str, float]:
+    """
+    Runs a single benchmark scenario.
+
+    :param scenario: Topology size.
+
+    :return: Measured metrics.
+    """
+    tracemalloc.start()
+
+    with count_jsii_calls() as calls:
+        app = core.App()
+        stack = core.Stack(app, 'Benchmark', env=core.Environment(account='111111111111', region='eu-west-1'))
+
+        started = time.perf_counter()
+        build_topology(stack, scenario)
+        constructed = time.perf_counter()
+        template = app.synth().get_stack_by_name(stack.stack_name).template
+        synthesized = time.perf_counter()
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'construction_seconds': round(constructed - started, 3),
+        'synth_seconds': round(synthesized - constructed, 3),
+        'jsii_calls': sum(calls.values()),
+        'peak_memory_mb': round(peak / 1024 / 1024, 2),
+        'template_bytes': len(json.dumps(template)),
+        'resources': len(template.get('Resources', {})),
+    }
+
+
+def compare(
+        name: str,
+        result: Dict[str, float],
+        baseline: Dict[str, float],
+        tolerance: float,
+        check_timing: bool = False
+) -> List[str]:
+    """
+    Compares results against a baseline.
+
+    :param name: Scenario name.
+    :param result: Measured metrics.
+    :param baseline: Baseline metrics.
+    :param tolerance: Allowed relative growth of noisy metrics e.g. 0.5 for 50%.
+    :param check_timing: Whether noisy (time and memory) metrics are compared as well.
+
+    :return: A list of regression messages.
+    """
+    regressions = []
+
+    for metric in EXACT_METRICS + (NOISY_METRICS if check_timing else ()):
+        if metric not in baseline:
+            continue
+
+        allowed = baseline[metric] * (1 + tolerance) if metric in NOISY_METRICS else baseline[metric]
+
+        if result[metric] > allowed:
+            regressions.append(f'{name}: {metric} {result[metric]} > {allowed:.3f} (baseline {baseline[metric]}).')
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Synth-time benchmark for large loadbalancer topologies.')
+    parser.add_argument('--scenario', choices=[scenario.name for scenario in SCENARIOS], action='append')
+    parser.add_argument('--update-baseline', action='store_true', help='Store results as new baselines.')
+    parser.add_argument('--check-timing', action='store_true', help='Compare time and memory metrics as well.')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='Allowed growth of time and memory metrics.')
+    args = parser.parse_args()
+
+    scenarios = [scenario for scenario in SCENARIOS if not args.scenario or scenario.name in args.scenario]
+
+    baselines = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH) as file:
+            baselines = json.load(file)
+
+    regressions = []
+    for scenario in scenarios:
+        result = run(scenario)
+        print(f'{scenario.name} {tuple(scenario[1:])}: {json.dumps(result)}')
+
+        if args.update_baseline:
+            baselines[scenario.name] = result
+        elif scenario.name in baselines:
+            baseline = baselines[scenario.name]
+            regressions.extend(compare(scenario.name, result, baseline, args.tolerance, args.check_timing))
+
+    if args.update_baseline:
+        with open(BASELINES_PATH, 'w') as file:
+            json.dump(baselines, file, indent=4, sort_keys=True)
+            file.write('\n')
+
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
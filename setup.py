@@ -10,7 +10,7 @@ setup(
     name='aws_alb',
     version='4.3.0',
     license='GNU GENERAL PUBLIC LICENSE Version 3',
-    packages=find_packages(exclude=['venv', 'test']),
+    packages=find_packages(exclude=['venv', 'test', 'tests']),
     description=(
         'AWS CDK package that creates a highly opinionated application load balancer.'
     ),
@@ -18,10 +18,18 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=[
-        'aws_cdk.core>=1.60.0,<2.0.0',
-        'aws_cdk.aws_elasticloadbalancingv2>=1.60.0,<2.0.0',
-        'aws_cdk.aws_certificatemanager>=1.60.0,<2.0.0',
+        'aws_cdk.core>=1.92.0,<2.0.0',
+        'aws_cdk.aws_elasticloadbalancingv2>=1.92.0,<2.0.0',
+        'aws_cdk.aws_certificatemanager>=1.92.0,<2.0.0',
+        'aws_cdk.aws_applicationautoscaling>=1.92.0,<2.0.0',
+        'aws_cdk.aws_cloudwatch>=1.92.0,<2.0.0',
+        'aws_cdk.aws_s3>=1.92.0,<2.0.0',
+        'aws_cdk.aws_cloudfront>=1.92.0,<2.0.0',
+        'aws_cdk.aws_lambda>=1.92.0,<2.0.0',
     ],
+    extras_require={
+        'yaml': ['pyyaml'],
+    },
     author='Laimonas Sutkus',
     author_email='laimonas.sutkus@gmail.com (laimonas@idenfy.com)',
     keywords='AWS CDK ALB ELB LoadBalancer',
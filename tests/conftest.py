@@ -0,0 +1,52 @@
+import os
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+# Silences jsii warnings about the node version of the local environment.
+os.environ.setdefault('JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION', '1')
+
+
+@pytest.fixture
+def stack() -> Tuple[Any, Any]:
+    """
+    A stack with a VPC. Tests which build constructs are skipped if CDK is not installed.
+
+    :return: Stack and VPC.
+    """
+    core = pytest.importorskip('aws_cdk.core')
+    aws_ec2 = pytest.importorskip('aws_cdk.aws_ec2')
+
+    app = core.App()
+    stack = core.Stack(app, 'TestStack', env=core.Environment(account='111111111111', region='eu-west-1'))
+    vpc = aws_ec2.Vpc(stack, 'Vpc', max_azs=2)
+
+    return stack, vpc
+
+
+@pytest.fixture
+def synth() -> Callable[[Any], Dict[str, Any]]:
+    """
+    Synthesizes a stack.
+
+    :return: A function which returns a template of a given stack.
+    """
+    def synthesize(stack: Any) -> Dict[str, Any]:
+        return stack.node.root.synth().get_stack_by_name(stack.stack_name).template
+
+    return synthesize
+
+
+def resources_of_type(template: Dict[str, Any], resource_type: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Filters template resources by type.
+
+    :param template: Synthesized template.
+    :param resource_type: CloudFormation resource type.
+
+    :return: Logical ids and resources of the given type.
+    """
+    return {
+        logical_id: resource for logical_id, resource in template['Resources'].items()
+        if resource['Type'] == resource_type
+    }
@@ -0,0 +1,189 @@
+import gzip
+import math
+from random import Random
+
+import pytest
+
+from aws_alb.logs.access_log_analyzer import AccessLogAnalyzer, AccessLogReport
+from aws_alb.logs.access_log_parser import AccessLogParser
+from aws_alb.logs.latency_histogram import LatencyHistogram
+
+TARGET_GROUP_ARN = 'arn:aws:elasticloadbalancing:eu-west-1:111111111111:targetgroup/{}/73e2d6bc24d8a067'
+
+
+def log_line(
+        request_time='0.000',
+        target_time='0.001',
+        response_time='0.000',
+        elb_status='200',
+        target_status='200',
+        request='GET http://www.example.com:80/ HTTP/1.1',
+        user_agent='curl/7.46.0',
+        target_group='users',
+        request_type='http',
+        ssl='- -',
+):
+    target_group_arn = TARGET_GROUP_ARN.format(target_group) if target_group else '-'
+
+    return (
+        f'{request_type} 2018-07-02T22:23:00.186641Z app/my-loadbalancer/50dc6c495c0c9188 '
+        f'192.168.131.39:2817 10.0.0.1:80 {request_time} {target_time} {response_time} '
+        f'{elb_status} {target_status} 34 366 "{request}" "{user_agent}" {ssl} {target_group_arn} '
+        f'"Root=1-58337262-36d228ad5d99923122bbe354" "-" "-" 0 2018-07-02T22:22:48.364000Z '
+        f'"forward" "-" "-" "10.0.0.1:80" "200" "-" "-"\n'
+    )
+
+
+def test_parse_line():
+    entry = AccessLogParser.parse_line(log_line(
+        request_time='0.001',
+        target_time='0.250',
+        response_time='0.002',
+        request='GET http://www.example.com:80/api/users/1?page=2 HTTP/1.1'
+    ))
+
+    assert entry.type == 'http'
+    assert entry.time == '2018-07-02T22:23:00.186641Z'
+    assert (entry.request_processing_time, entry.target_processing_time, entry.response_processing_time) == (
+        0.001, 0.25, 0.002
+    )
+    assert entry.total_time == pytest.approx(0.253)
+    assert (entry.elb_status_code, entry.target_status_code) == ('200', '200')
+    assert (entry.method, entry.path) == ('GET', '/api/users/1')
+    assert entry.target_group_name == 'users'
+    assert entry.path_prefix(2) == '/api/users'
+
+
+def test_parse_line_with_quoted_fields():
+    entry = AccessLogParser.parse_line(log_line(
+        request_type='h2',
+        request='POST https://www.example.com:443/login HTTP/2.0',
+        user_agent=r'Mozilla/5.0 (X11; Linux x86_64) \"quoted\" agent',
+        ssl='ECDHE-RSA-AES128-GCM-SHA256 TLSv1.2'
+    ))
+
+    assert entry.type == 'h2'
+    assert (entry.method, entry.path) == ('POST', '/login')
+    assert entry.target_group_name == 'users'
+
+
+def test_undispatched_request_has_no_timings():
+    entry = AccessLogParser.parse_line(log_line(
+        request_time='-1',
+        target_time='-1',
+        response_time='-1',
+        elb_status='503',
+        target_status='-',
+        target_group=None
+    ))
+
+    assert (entry.request_processing_time, entry.target_processing_time, entry.response_processing_time) == (
+        None, None, None
+    )
+    assert entry.total_time is None
+    assert (entry.elb_status_code, entry.target_status_code) == ('503', '-')
+    assert entry.target_group_name == '-'
+
+
+def test_malformed_request_line():
+    entry = AccessLogParser.parse_line(log_line(request='- - - '))
+
+    assert (entry.method, entry.path) == ('-', '-')
+
+
+def test_malformed_lines_are_skipped():
+    lines = [log_line(), 'garbage\n', '', log_line(elb_status='404')]
+
+    assert [entry.elb_status_code for entry in AccessLogParser.parse_lines(lines)] == ['200', '404']
+
+
+def exact_percentile(values, percentile):
+    ordered = sorted(values)
+    return ordered[math.ceil(percentile / 100 * len(ordered)) - 1]
+
+
+@pytest.mark.parametrize('percentile', [50, 95, 99])
+def test_histogram_percentiles_are_within_relative_error(percentile):
+    random = Random(5)
+    values = [random.lognormvariate(-3, 1.5) for _ in range(20000)]
+
+    histogram = LatencyHistogram(relative_error=0.01)
+    for value in values:
+        histogram.add(value)
+
+    assert histogram.percentile(percentile) == pytest.approx(exact_percentile(values, percentile), rel=0.01)
+
+
+def test_histogram_zeros_and_max():
+    histogram = LatencyHistogram()
+    for value in [0.0] * 60 + [0.5] * 39 + [2.0]:
+        histogram.add(value)
+
+    assert histogram.percentile(50) == 0.0
+    assert histogram.percentile(95) == pytest.approx(0.5, rel=0.01)
+    assert histogram.percentile(100) == pytest.approx(2.0, rel=0.01)
+    assert histogram.max == 2.0
+    assert LatencyHistogram().percentile(99) == 0.0
+
+
+def test_merged_histograms_equal_a_single_histogram():
+    random = Random(9)
+    values = [random.expovariate(10) for _ in range(5000)]
+
+    single = LatencyHistogram()
+    first, second = LatencyHistogram(), LatencyHistogram()
+
+    for index, value in enumerate(values):
+        single.add(value)
+        (first if index % 2 else second).add(value)
+
+    first.merge(second)
+
+    assert (first.count, first.zero_count, first.max, first.buckets) == (
+        single.count, single.zero_count, single.max, single.buckets
+    )
+
+    with pytest.raises(AssertionError, match='same relative error'):
+        first.merge(LatencyHistogram(relative_error=0.05))
+
+
+def report_summary(report: AccessLogReport):
+    return report.entries_count, report.counts, {
+        dimension: report.percentiles(dimension) for dimension in AccessLogReport.DIMENSIONS
+    }
+
+
+def test_process_pool_results_are_merged(tmp_path):
+    random = Random(3)
+    lines = []
+    paths = []
+
+    for index in range(4):
+        file_lines = [
+            log_line(
+                target_time=f'{random.expovariate(20):.3f}',
+                target_group=random.choice(['users', 'orders']),
+                request=f'GET http://www.example.com:80/{random.choice(["api", "admin"])}/{index} HTTP/1.1',
+                elb_status=random.choice(['200', '500']),
+            )
+            for _ in range(250)
+        ]
+        file_lines.append(log_line(request_time='-1', target_time='-1', response_time='-1', elb_status='504'))
+        lines += file_lines
+
+        path = tmp_path / f'{index}.log.gz' if index % 2 else tmp_path / f'{index}.log'
+        opener = gzip.open if index % 2 else open
+        with opener(path, 'wt') as file:
+            file.writelines(file_lines)
+
+        paths.append(str(path))
+
+    pooled = AccessLogAnalyzer(workers=2).analyze(paths)
+    in_process = AccessLogAnalyzer(workers=1).analyze(paths)
+    expected = AccessLogAnalyzer().analyze_entries(AccessLogParser.parse_lines(lines))
+
+    assert pooled.entries_count == 1004
+    assert sum(pooled.counts['target_group'].values()) == 1004
+    assert pooled.counts['status_code']['504'] == 4
+    assert set(pooled.counts['path_prefix']) == {'/', '/api', '/admin'}
+    assert report_summary(pooled) == report_summary(in_process) == report_summary(expected)
@@ -0,0 +1,49 @@
+import pytest
+
+from aws_alb.params.access_logs_params import AccessLogsParams
+from conftest import resources_of_type
+
+
+def principal(template):
+    policy, = resources_of_type(template, 'AWS::S3::BucketPolicy').values()
+    statement, = policy['Properties']['PolicyDocument']['Statement']
+    return statement['Principal']
+
+
+def synth_with_access_logs(region=None):
+    core = pytest.importorskip('aws_cdk.core')
+    aws_ec2 = pytest.importorskip('aws_cdk.aws_ec2')
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    app = core.App()
+    env = core.Environment(account='111111111111', region=region) if region else None
+    stack = core.Stack(app, 'TestStack', env=env)
+    vpc = aws_ec2.Vpc(stack, 'Vpc', max_azs=2)
+    ApplicationLoadbalancer(stack, 'Test', vpc, vpc.public_subnets, access_logs=AccessLogsParams(retention_days=30))
+
+    return app.synth().get_stack_by_name('TestStack').template
+
+
+def test_known_region_uses_elb_account():
+    assert principal(synth_with_access_logs('eu-west-1')) == {
+        'AWS': {'Fn::Join': ['', ['arn:', {'Ref': 'AWS::Partition'}, ':iam::156460612806:root']]}
+    }
+
+
+def test_newer_region_uses_service_principal():
+    assert principal(synth_with_access_logs('eu-central-2')) == {
+        'Service': 'logdelivery.elasticloadbalancing.amazonaws.com'
+    }
+
+
+def test_region_agnostic_stack_falls_back_to_service_principal():
+    template = synth_with_access_logs()
+
+    condition, account_principal, service_principal = principal(template)['Fn::If']
+
+    assert condition == 'TestElbAccountRegion'
+    assert 'Fn::FindInMap' in str(account_principal)
+    assert service_principal == {'Service': 'logdelivery.elasticloadbalancing.amazonaws.com'}
+
+    expression = str(template['Conditions']['TestElbAccountRegion'])
+    assert all(f"'{region}'" in expression for region in ('us-east-1', 'eu-west-1', 'cn-northwest-1'))
@@ -0,0 +1,107 @@
+import pytest
+
+from aws_alb.params.cloudfront_params import CloudFrontParams
+from conftest import resources_of_type
+
+PREFIX_LIST_ID = 'pl-4fa04526'
+
+
+def cloudfront(**kwargs):
+    return CloudFrontParams(origin_secret='secret', prefix_list_id=PREFIX_LIST_ID, **kwargs)
+
+
+def certificate(scope):
+    from aws_cdk.aws_certificatemanager import CfnCertificate
+
+    return CfnCertificate(scope, 'Certificate', domain_name='app.example.com')
+
+
+def create(scope, vpc, params, **kwargs):
+    from aws_alb.cloudfront_loadbalancer import CloudFrontLoadbalancer
+    from aws_alb.listener_actions import ListenerActions
+    from aws_alb.params.target_group_params import TargetGroupParams
+
+    loadbalancer = CloudFrontLoadbalancer(scope, 'Cf', vpc, vpc.public_subnets, params, **kwargs)
+    target_group = loadbalancer.listeners.create_target_group(TargetGroupParams('Api', vpc))
+    loadbalancer.forward_origin_requests(ListenerActions.target_group_action(target_group))
+
+    return loadbalancer
+
+
+def ingress_ports(template):
+    ports = set()
+
+    for rule in resources_of_type(template, 'AWS::EC2::SecurityGroupIngress').values():
+        ports.add((rule['Properties']['FromPort'], rule['Properties'].get('SourcePrefixListId')))
+
+    for group in resources_of_type(template, 'AWS::EC2::SecurityGroup').values():
+        for rule in group['Properties'].get('SecurityGroupIngress', []):
+            ports.add((rule['FromPort'], rule.get('SourcePrefixListId')))
+
+    return ports
+
+
+def listeners_by_port(template):
+    return {
+        listener['Properties']['Port']: (logical_id, listener['Properties'])
+        for logical_id, listener in resources_of_type(template, 'AWS::ElasticLoadBalancingV2::Listener').items()
+    }
+
+
+@pytest.mark.parametrize('https, production_port', [(True, 443), (False, 80)])
+def test_origin_only_ingress_and_header_rule(stack, synth, https, production_port):
+    scope, vpc = stack
+    kwargs = {'certificate': certificate(scope)} if https else {}
+    create(scope, vpc, cloudfront(origin_domain_name='origin.example.com'), **kwargs)
+    template = synth(scope)
+
+    assert ingress_ports(template) == {(production_port, PREFIX_LIST_ID)}
+
+    listeners = listeners_by_port(template)
+    production_id, production = listeners[production_port]
+    assert production['DefaultActions'] == [{
+        'Type': 'fixed-response',
+        'FixedResponseConfig': {'StatusCode': '404', 'MessageBody': 'Not found.'},
+    }]
+
+    rule, = resources_of_type(template, 'AWS::ElasticLoadBalancingV2::ListenerRule').values()
+    assert rule['Properties']['ListenerArn'] == {'Ref': production_id}
+    assert rule['Properties']['Conditions'] == [{
+        'Field': 'http-header',
+        'HttpHeaderConfig': {'HttpHeaderName': CloudFrontParams.ORIGIN_HEADER_NAME, 'Values': ['secret']},
+    }]
+    assert rule['Properties']['Actions'][0]['Type'] == 'forward'
+
+
+def test_origin_uses_given_domain_name(stack, synth):
+    scope, vpc = stack
+    create(scope, vpc, cloudfront(origin_domain_name='origin.example.com'), certificate=certificate(scope))
+
+    distribution, = resources_of_type(synth(scope), 'AWS::CloudFront::Distribution').values()
+    origin, = distribution['Properties']['DistributionConfig']['Origins']
+
+    assert origin['DomainName'] == 'origin.example.com'
+    assert origin['CustomOriginConfig']['OriginProtocolPolicy'] == 'https-only'
+    assert origin['OriginCustomHeaders'] == [
+        {'HeaderName': CloudFrontParams.ORIGIN_HEADER_NAME, 'HeaderValue': 'secret'}
+    ]
+
+
+def test_https_requires_origin_domain_name(stack):
+    from aws_alb.cloudfront_loadbalancer import CloudFrontLoadbalancer
+
+    scope, vpc = stack
+
+    with pytest.raises(AssertionError, match='Origin domain name'):
+        CloudFrontLoadbalancer(scope, 'Cf', vpc, vpc.public_subnets, cloudfront(), certificate=certificate(scope))
+
+
+def test_traffic_can_not_be_configured(stack):
+    from aws_alb.alb_traffic_enum import AlbTrafficEnum
+    from aws_alb.cloudfront_loadbalancer import CloudFrontLoadbalancer
+
+    scope, vpc = stack
+    traffic = AlbTrafficEnum.INTERNET
+
+    with pytest.raises(AssertionError, match='can not be configured'):
+        CloudFrontLoadbalancer(scope, 'Cf', vpc, vpc.public_subnets, cloudfront(), inbound_traffic=traffic)
@@ -0,0 +1,105 @@
+import pytest
+
+from aws_alb.health_check_calculator import HealthCheckCalculator
+from aws_alb.params.target_group_params import TargetGroupParams
+
+
+@pytest.mark.parametrize('interval, timeout, unhealthy, seconds', [
+    (30, 5, 2, 65),
+    (10, 5, 3, 35),
+    (5, 2, 10, 52),
+])
+def test_time_to_detect_failure(interval, timeout, unhealthy, seconds):
+    assert HealthCheckCalculator.time_to_detect_failure(interval, timeout, unhealthy) == seconds
+
+
+@pytest.mark.parametrize('interval, healthy, seconds', [
+    (30, 5, 150),
+    (10, 2, 20),
+])
+def test_time_to_recover(interval, healthy, seconds):
+    assert HealthCheckCalculator.time_to_recover(interval, healthy) == seconds
+
+
+def test_valid_settings():
+    HealthCheckCalculator.validate(5, 2, 2, 10)
+    HealthCheckCalculator.validate(300, 120, 10, 2)
+
+
+@pytest.mark.parametrize('settings, message', [
+    ((4, 2, 2, 2), 'interval must be between 5 and 300'),
+    ((301, 5, 2, 2), 'interval must be between 5 and 300'),
+    ((30, 1, 2, 2), 'timeout must be between 2 and 120'),
+    ((200, 121, 2, 2), 'timeout must be between 2 and 120'),
+    ((10, 10, 2, 2), 'timeout must be shorter than the interval'),
+    ((10, 12, 2, 2), 'timeout must be shorter than the interval'),
+    ((30, 5, 1, 2), 'thresholds must be between 2 and 10'),
+    ((30, 5, 2, 11), 'thresholds must be between 2 and 10'),
+])
+def test_invalid_settings(settings, message):
+    with pytest.raises(AssertionError, match=message):
+        HealthCheckCalculator.validate(*settings)
+
+
+@pytest.mark.parametrize('params, times', [
+    # AWS defaults: 2 * 30 + 5 seconds to detect and 5 * 30 seconds to recover.
+    (TargetGroupParams('Api', None), (65, 150)),
+    (TargetGroupParams('Api', None, target_type='lambda'), (100, 175)),
+    (
+        TargetGroupParams(
+            'Api',
+            None,
+            health_check_interval_seconds=10,
+            health_check_timeout_seconds=5,
+            healthy_threshold_count=3,
+            unhealthy_threshold_count=3
+        ),
+        (35, 30)
+    ),
+    (TargetGroupParams('Api', None, health_check_interval_seconds=10), (25, 50)),
+])
+def test_for_target_group(params, times):
+    assert HealthCheckCalculator.for_target_group(params) == times
+
+
+def test_tune_picks_the_longest_interval():
+    settings = HealthCheckCalculator.tune(max_detection_seconds=60)
+
+    assert settings == dict(
+        health_check_interval_seconds=27,
+        health_check_timeout_seconds=5,
+        unhealthy_threshold_count=2,
+    )
+    assert HealthCheckCalculator.for_target_group(TargetGroupParams('Api', None, **settings))[0] == 59
+
+
+def test_tune_shortens_the_interval_to_recover_in_time():
+    settings = HealthCheckCalculator.tune(max_detection_seconds=60, max_recovery_seconds=30)
+
+    assert settings == dict(
+        health_check_interval_seconds=15,
+        health_check_timeout_seconds=5,
+        unhealthy_threshold_count=2,
+        healthy_threshold_count=2,
+    )
+    assert HealthCheckCalculator.for_target_group(TargetGroupParams('Api', None, **settings)) == (35, 30)
+
+
+def test_tune_shortens_the_timeout_only_if_no_interval_fits():
+    assert HealthCheckCalculator.tune(max_detection_seconds=12) == dict(
+        health_check_interval_seconds=5,
+        health_check_timeout_seconds=2,
+        unhealthy_threshold_count=2,
+    )
+
+
+@pytest.mark.parametrize('kwargs, message', [
+    (dict(max_detection_seconds=11), 'Can not detect a failed target within 11 seconds.'),
+    (
+        dict(max_detection_seconds=60, max_recovery_seconds=9),
+        'Can not detect a failed target within 60 seconds and recover within 9 seconds.'
+    ),
+])
+def test_tune_rejects_unreachable_goals(kwargs, message):
+    with pytest.raises(AssertionError, match=message):
+        HealthCheckCalculator.tune(**kwargs)
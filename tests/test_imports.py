@@ -0,0 +1,88 @@
+import importlib.util
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARK_PATH = os.path.join(ROOT, 'benchmarks', 'import_benchmark.py')
+
+spec = importlib.util.spec_from_file_location('import_benchmark', BENCHMARK_PATH)
+import_benchmark = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(import_benchmark)
+
+# Modules which must be importable without CDK. The list is kept by hand on purpose: a module which starts
+# importing CDK must fail the tests rather than silently move to construct modules.
+LIGHTWEIGHT_MODULES = [
+    'aws_alb',
+    'aws_alb.alb_performance_profile',
+    'aws_alb.alb_traffic_enum',
+    'aws_alb.alb_type',
+    'aws_alb.factories',
+    'aws_alb.health_check_calculator',
+    'aws_alb.latency_slo_preset',
+    'aws_alb.listener_port_pool',
+    'aws_alb.listener_rule_optimizer',
+    'aws_alb.listener_rule_patterns',
+    'aws_alb.loadtest',
+    'aws_alb.loadtest.__main__',
+    'aws_alb.loadtest.blue_green_load_test',
+    'aws_alb.loadtest.load_test_report',
+    'aws_alb.loadtest.stand_in_target',
+    'aws_alb.loadtest.target_group_model',
+    'aws_alb.logs',
+    'aws_alb.logs.__main__',
+    'aws_alb.logs.access_log_analyzer',
+    'aws_alb.logs.access_log_entry',
+    'aws_alb.logs.access_log_parser',
+    'aws_alb.logs.latency_histogram',
+    'aws_alb.params',
+    'aws_alb.params.access_logs_params',
+    'aws_alb.params.cache_behavior_params',
+    'aws_alb.params.cloudfront_params',
+    'aws_alb.params.listener_params',
+    'aws_alb.params.listener_rule_params',
+    'aws_alb.params.loadbalancer_attributes',
+    'aws_alb.params.monitoring_params',
+    'aws_alb.params.target_group_attributes',
+    'aws_alb.params.target_group_params',
+    'aws_alb.params.template_budget_params',
+    'aws_alb.simulator',
+    'aws_alb.simulator.routing_decision',
+    'aws_alb.simulator.routing_report',
+    'aws_alb.simulator.routing_simulator',
+    'aws_alb.simulator.simulated_action',
+    'aws_alb.simulator.simulated_request',
+    'aws_alb.simulator.simulated_rule',
+    'aws_alb.spec',
+    'aws_alb.spec.__main__',
+    'aws_alb.spec.fragment_cache',
+    'aws_alb.spec.loadbalancer_spec',
+    'aws_alb.spec.service_spec',
+    'aws_alb.spec.spec_loader',
+    'aws_alb.spec.spec_validator',
+    'aws_alb.template_budget_analyzer',
+    'aws_alb.traffic_shift_enum',
+    'aws_alb.traffic_shift_schedule',
+]
+
+
+def test_benchmark_discovers_the_expected_modules():
+    lightweight_modules, construct_modules = import_benchmark.discover_modules()
+
+    assert lightweight_modules == LIGHTWEIGHT_MODULES
+    assert 'aws_alb.application_loadbalancer' in construct_modules
+
+
+def test_package_import_is_within_the_budget():
+    # Every import runs in a fresh interpreter, hence modules already loaded by other tests do not count.
+    result = import_benchmark.measure('aws_alb', 3)
+
+    assert result['loaded'] == []
+    assert result['seconds'] <= import_benchmark.DEFAULT_BUDGET
+
+
+@pytest.mark.parametrize('module', LIGHTWEIGHT_MODULES)
+def test_lightweight_module_does_not_load_cdk(module):
+    result = import_benchmark.measure(module, 1)
+
+    assert result['loaded'] == [], f'{module} loads {", ".join(result["loaded"])}.'
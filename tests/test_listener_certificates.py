@@ -0,0 +1,95 @@
+import pytest
+
+from aws_alb.params.listener_params import ListenerParams
+from conftest import resources_of_type
+
+
+def certificates(scope, count, prefix='Certificate'):
+    from aws_cdk.aws_certificatemanager import CfnCertificate
+
+    return [
+        CfnCertificate(scope, f'{prefix}{index}', domain_name=f'{prefix.lower()}{index}.example.com')
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def loadbalancer(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    return ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+
+
+def test_one_listener_certificate_resource_per_additional_certificate(stack, synth, loadbalancer):
+    scope, _ = stack
+    default, *additional = certificates(scope, 3)
+
+    listener = loadbalancer.listeners.create_listener(ListenerParams(
+        'Api',
+        loadbalancer,
+        9443,
+        certificates=[default, *additional],
+        ssl_policy=ListenerParams.TLS13_SSL_POLICY
+    ))
+    template = synth(scope)
+    listener_id = scope.get_logical_id(listener)
+
+    properties = template['Resources'][listener_id]['Properties']
+    assert properties['Protocol'] == 'HTTPS'
+    assert properties['SslPolicy'] == ListenerParams.TLS13_SSL_POLICY
+    assert properties['Certificates'] == [{'CertificateArn': {'Ref': 'Certificate0'}}]
+
+    listener_certificates = resources_of_type(template, 'AWS::ElasticLoadBalancingV2::ListenerCertificate')
+    assert sorted(listener_certificates) == [listener_id + 'Certificates0', listener_id + 'Certificates1']
+    assert [
+        (resource['Properties']['ListenerArn'], resource['Properties']['Certificates'])
+        for resource in listener_certificates.values()
+    ] == [
+        ({'Ref': listener_id}, [{'CertificateArn': {'Ref': 'Certificate1'}}]),
+        ({'Ref': listener_id}, [{'CertificateArn': {'Ref': 'Certificate2'}}]),
+    ]
+
+
+def test_http_listener_has_no_ssl_policy(stack, synth, loadbalancer):
+    scope, _ = stack
+    loadbalancer.listeners.create_listener(ListenerParams('Api', loadbalancer, 9080))
+
+    properties = synth(scope)['Resources']['ApiHttpListener9080']['Properties']
+
+    assert properties['Protocol'] == 'HTTP'
+    assert 'SslPolicy' not in properties
+    assert 'Certificates' not in properties
+
+
+def test_ssl_policy_requires_a_certificate(loadbalancer):
+    params = ListenerParams('Api', loadbalancer, 9080, ssl_policy=ListenerParams.TLS13_SSL_POLICY)
+
+    with pytest.raises(AssertionError, match='ssl policy but no certificate'):
+        loadbalancer.listeners.create_listener(params)
+
+
+def create(loadbalancer, prefix, port, certificates):
+    return loadbalancer.listeners.create_listener(ListenerParams(prefix, loadbalancer, port, certificates=certificates))
+
+
+def test_certificates_shared_by_listeners_are_counted_once(stack, loadbalancer):
+    scope, _ = stack
+    shared = certificates(scope, 26)
+
+    create(loadbalancer, 'Api', 9443, shared)
+    create(loadbalancer, 'Admin', 9444, shared)
+
+
+def test_certificate_quota_is_per_loadbalancer(stack, loadbalancer):
+    scope, _ = stack
+    api = certificates(scope, 21)
+    other = certificates(scope, 6, prefix='Other')
+
+    create(loadbalancer, 'Api', 9443, api)
+
+    with pytest.raises(AssertionError, match='more than 25 additional certificates'):
+        create(loadbalancer, 'Admin', 9444, [api[0], *other])
+
+    # Default certificates of listeners are not counted.
+    create(loadbalancer, 'Admin', 9444, [other[5], *other[:5]])
@@ -0,0 +1,206 @@
+import pytest
+
+from aws_alb.listener_port_pool import ListenerPortPair, ListenerPortPool
+
+
+def test_ports_are_allocated_from_the_lowest_free_port():
+    pool = ListenerPortPool(10000, 10009)
+
+    assert pool.allocate('Users') == ListenerPortPair(10000, 10001)
+    assert pool.allocate('Orders') == ListenerPortPair(10002, 10003)
+    assert pool.allocated_range == (10000, 10003)
+    assert list(pool.allocations) == ['Users', 'Orders']
+
+
+def test_used_ports_are_skipped():
+    used_ports = {10000, 10002}
+    pool = ListenerPortPool(10000, 10009, used_ports)
+
+    assert pool.allocate('Users') == ListenerPortPair(10001, 10003)
+
+    # Used ports are read on every allocation.
+    used_ports.add(10004)
+    assert pool.allocate('Orders') == ListenerPortPair(10005, 10006)
+
+
+def test_allocation_fills_gaps_left_by_reservations():
+    pool = ListenerPortPool(10000, 10009)
+    pool.reserve('Users', 10002, 10003)
+
+    assert pool.allocate('Orders') == ListenerPortPair(10000, 10001)
+    assert pool.allocate('Payments') == ListenerPortPair(10004, 10005)
+
+
+@pytest.mark.parametrize('production_port, test_port, message', [
+    (10000, 10005, 'Port 10000 is already used'),
+    (10004, 10001, 'Port 10001 is already used'),
+    (10004, 10004, 'must differ'),
+    (9999, 10004, 'out of the pool'),
+    (10004, 10010, 'out of the pool'),
+])
+def test_reserve_conflicts(production_port, test_port, message):
+    pool = ListenerPortPool(10000, 10009)
+    pool.allocate('Users')
+
+    with pytest.raises(AssertionError, match=message):
+        pool.reserve('Orders', production_port, test_port)
+
+
+def test_reserve_rejects_ports_of_other_listeners():
+    pool = ListenerPortPool(10000, 10009, {10004})
+
+    with pytest.raises(AssertionError, match='Port 10004 is already used'):
+        pool.reserve('Users', 10004, 10005)
+
+
+def test_service_can_not_be_allocated_twice():
+    pool = ListenerPortPool(10000, 10009)
+    pool.allocate('Users')
+
+    with pytest.raises(AssertionError, match='already allocated'):
+        pool.allocate('Users')
+
+    with pytest.raises(AssertionError, match='already allocated'):
+        pool.reserve('Users', 10004, 10005)
+
+
+def test_exhausted_pool():
+    pool = ListenerPortPool(10000, 10004, {10002})
+    pool.allocate('Users')
+
+    # Only 10003 and 10004 are left, which is enough for one more service.
+    assert pool.allocate('Orders') == ListenerPortPair(10003, 10004)
+
+    with pytest.raises(AssertionError, match='Port pool 10000-10004 is exhausted'):
+        pool.allocate('Payments')
+
+
+def test_pool_with_a_single_free_port_is_exhausted():
+    pool = ListenerPortPool(10000, 10000)
+
+    with pytest.raises(AssertionError, match='exhausted'):
+        pool.allocate('Users')
+
+    assert pool.allocations == {}
+    assert pool.allocated_range is None
+
+
+def test_get_and_get_service():
+    pool = ListenerPortPool(10000, 10009)
+    pool.allocate('Users')
+    pool.reserve('Orders', 10008, 10009)
+
+    assert pool.get('Users') == ListenerPortPair(10000, 10001)
+    assert pool.get('Orders') == ListenerPortPair(10008, 10009)
+    assert pool.get('Payments') is None
+
+    assert pool.get_service(10001) == 'Users'
+    assert pool.get_service(10008) == 'Orders'
+    assert pool.get_service(10005) is None
+
+
+def test_released_ports_are_allocated_again():
+    pool = ListenerPortPool(10000, 10009)
+    pool.allocate('Users')
+    pool.allocate('Orders')
+
+    assert pool.release('Users') == ListenerPortPair(10000, 10001)
+    assert pool.get('Users') is None
+    assert pool.get_service(10000) is None
+    assert pool.allocated_range == (10002, 10003)
+
+    assert pool.allocate('Payments') == ListenerPortPair(10000, 10001)
+
+    with pytest.raises(AssertionError, match='Ports of service Users are not allocated'):
+        pool.release('Users')
+
+
+def test_invalid_pool():
+    with pytest.raises(AssertionError, match='Invalid port pool'):
+        ListenerPortPool(10010, 10000)
+
+
+@pytest.fixture
+def loadbalancer(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    return ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+
+
+def create_pooled(loadbalancer, vpc, service):
+    from aws_alb.params.listener_params import ListenerParams
+    from aws_alb.params.target_group_params import TargetGroupParams
+
+    return loadbalancer.listeners.create_pooled_blue_green(
+        service,
+        ListenerParams(service + 'Blue', loadbalancer, 0),
+        ListenerParams(service + 'Green', loadbalancer, 0),
+        TargetGroupParams(service + 'Blue', vpc),
+        TargetGroupParams(service + 'Green', vpc)
+    )
+
+
+def test_pool_skips_ports_of_listeners_created_by_hand(stack, loadbalancer):
+    from aws_alb.params.listener_params import ListenerParams
+
+    _, vpc = stack
+    loadbalancer.listeners.create_listener(ListenerParams('Manual', loadbalancer, 10001))
+
+    create_pooled(loadbalancer, vpc, 'Users')
+    pool = loadbalancer.listeners.get_port_pool(loadbalancer)
+
+    assert pool.get('Users') == ListenerPortPair(10000, 10002)
+    assert pool.get_service(10001) is None
+
+
+def test_pooled_services_merge_into_one_security_group_rule(stack, synth, loadbalancer):
+    scope, vpc = stack
+
+    for service in ('Users', 'Orders', 'Payments'):
+        create_pooled(loadbalancer, vpc, service)
+
+    template = synth(scope)
+    group = template['Resources'][scope.get_logical_id(loadbalancer.security_group.node.default_child)]
+    pooled = [
+        (rule['FromPort'], rule['ToPort']) for rule in group['Properties']['SecurityGroupIngress']
+        if rule['FromPort'] >= ListenerPortPool.DEFAULT_FIRST_PORT
+    ]
+
+    assert pooled == [(10000, 10005)]
+
+
+def test_port_pool_range_must_match_existing_pool(loadbalancer):
+    listeners = loadbalancer.listeners
+    pool = listeners.get_port_pool(loadbalancer, 20000, 20099)
+
+    assert listeners.get_port_pool(loadbalancer) is pool
+    assert listeners.get_port_pool(loadbalancer, 20000, 20099) is pool
+
+    with pytest.raises(AssertionError, match='already has a port pool 20000-20099'):
+        listeners.get_port_pool(loadbalancer, 10000, 10999)
+
+
+def test_ports_are_released_if_pooled_service_can_not_be_created(stack, loadbalancer):
+    from aws_alb.params.listener_params import ListenerParams
+    from aws_alb.params.target_group_params import TargetGroupParams
+
+    _, vpc = stack
+    listeners = loadbalancer.listeners
+    create_pooled(loadbalancer, vpc, 'Users')
+
+    # GRPC target groups require https listeners.
+    with pytest.raises(AssertionError, match='requires an https listener'):
+        listeners.create_pooled_blue_green(
+            'Orders',
+            ListenerParams('OrdersBlue', loadbalancer, 0),
+            ListenerParams('OrdersGreen', loadbalancer, 0),
+            TargetGroupParams('OrdersBlue', vpc, protocol_version='GRPC'),
+            TargetGroupParams('OrdersGreen', vpc, protocol_version='GRPC')
+        )
+
+    pool = listeners.get_port_pool(loadbalancer)
+    assert pool.get('Orders') is None
+
+    create_pooled(loadbalancer, vpc, 'Orders')
+    assert pool.get('Orders') == ListenerPortPair(10002, 10003)
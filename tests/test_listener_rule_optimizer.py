@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from aws_alb.listener_rule_optimizer import ListenerRuleOptimizer
+from aws_alb.params.listener_rule_params import ListenerRuleParams
+
+# The optimizer groups rules by listener paths and compares actions only, hence stand-ins replace CDK objects.
+LISTENER = SimpleNamespace(node=SimpleNamespace(path='Stack/Listener'))
+ACTION = object()
+OTHER_ACTION = object()
+
+
+def rule(prefix, action=ACTION, **kwargs):
+    return ListenerRuleParams(prefix, LISTENER, action, **kwargs)
+
+
+def test_rules_with_mixed_query_string_keys_are_merged():
+    query_strings = [(None, 'v'), ('k', 'w')]
+
+    rules, report = ListenerRuleOptimizer.optimize([
+        rule('First', path_patterns=['/first'], query_strings=list(query_strings)),
+        rule('Second', path_patterns=['/second'], query_strings=list(reversed(query_strings))),
+    ])
+
+    assert len(rules) == 1
+    assert sorted(rules[0].path_patterns) == ['/first', '/second']
+    assert [sorted(group) for group in report.merged] == [['First', 'Second']]
+
+
+def test_rules_with_different_query_strings_are_not_merged():
+    rules, _ = ListenerRuleOptimizer.optimize([
+        rule('First', path_patterns=['/first'], query_strings=[(None, 'v'), ('k', 'w')]),
+        rule('Second', path_patterns=['/second'], query_strings=[('k', 'v'), ('k', 'w')]),
+    ])
+
+    assert len(rules) == 2
+
+
+def test_rules_with_different_actions_are_not_merged():
+    rules, _ = ListenerRuleOptimizer.optimize([
+        rule('First', path_patterns=['/first']),
+        rule('Second', action=OTHER_ACTION, path_patterns=['/second']),
+    ])
+
+    assert len(rules) == 2
+
+
+def test_shadowed_rule_is_removed():
+    rules, report = ListenerRuleOptimizer.optimize([
+        rule('Api', path_patterns=['/api/*']),
+        rule('Copy', action=OTHER_ACTION, path_patterns=['/api/*']),
+    ])
+
+    assert [params.prefix for params in rules] == ['Api']
+    assert report.removed == [('Copy', 'Api')]
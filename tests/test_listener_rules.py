@@ -0,0 +1,81 @@
+import pytest
+
+from aws_alb.params.listener_rule_params import ListenerRuleParams
+from conftest import resources_of_type
+
+
+@pytest.fixture
+def loadbalancer(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    return ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+
+
+def rule(loadbalancer, prefix, path_patterns, **kwargs):
+    from aws_alb.listener_actions import ListenerActions
+
+    return ListenerRuleParams(
+        prefix,
+        loadbalancer.default_prod_listener,
+        ListenerActions.fixed_404_action(),
+        path_patterns=path_patterns,
+        **kwargs
+    )
+
+
+def priorities(template):
+    return {
+        logical_id: resource['Properties']['Priority']
+        for logical_id, resource in resources_of_type(template, 'AWS::ElasticLoadBalancingV2::ListenerRule').items()
+    }
+
+
+def test_more_specific_rules_come_first_within_a_call(stack, synth, loadbalancer):
+    loadbalancer.listeners.create_listener_rules([
+        rule(loadbalancer, 'Api', ['/api/*']),
+        rule(loadbalancer, 'ApiV2', ['/api/v2/*']),
+    ])
+
+    assert priorities(synth(stack[0])) == {'ApiV2ListenerRule': 1, 'ApiListenerRule': 2}
+
+
+def test_later_rule_shadowed_by_an_existing_rule_is_rejected(loadbalancer):
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Api', ['/api/*']))
+
+    with pytest.raises(AssertionError, match='covered by rule Api'):
+        loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'ApiV2', ['/api/v2/*']))
+
+
+def test_later_broader_rule_is_accepted(stack, synth, loadbalancer):
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'ApiV2', ['/api/v2/*']))
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Api', ['/api/*']))
+
+    assert priorities(synth(stack[0])) == {'ApiV2ListenerRule': 1, 'ApiListenerRule': 2}
+
+
+def test_explicit_priority_avoids_shadowing(stack, synth, loadbalancer):
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Api', ['/api/*'], priority=10))
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'ApiV2', ['/api/v2/*'], priority=5))
+
+    assert priorities(synth(stack[0])) == {'ApiV2ListenerRule': 5, 'ApiListenerRule': 10}
+
+
+def test_disjoint_rules_of_later_calls_are_accepted(loadbalancer):
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Api', ['/api/*']))
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Admin', ['/admin/*']))
+
+
+def test_automatic_rule_covering_a_later_explicit_rule_is_rejected(loadbalancer):
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'ApiV2', ['/api/v2/*'], priority=10))
+
+    with pytest.raises(AssertionError, match='would shadow rule ApiV2 \\(priority 10\\)'):
+        loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Api', ['/api/*']))
+
+
+def test_automatic_rule_with_a_later_explicit_disjoint_rule_is_accepted(stack, synth, loadbalancer):
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'ApiV2', ['/api/v2/*'], priority=10))
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Admin', ['/admin/*']))
+    loadbalancer.listeners.create_listener_rule(rule(loadbalancer, 'Api', ['/api/*'], priority=11))
+
+    assert priorities(synth(stack[0])) == {'ApiV2ListenerRule': 10, 'AdminListenerRule': 1, 'ApiListenerRule': 11}
@@ -0,0 +1,88 @@
+import pytest
+
+from aws_alb.params.listener_params import ListenerParams
+from conftest import resources_of_type
+
+
+@pytest.fixture
+def loadbalancer(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    return ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+
+
+@pytest.fixture
+def certificate(stack):
+    from aws_cdk.aws_certificatemanager import CfnCertificate
+
+    scope, _ = stack
+    return CfnCertificate(scope, 'Certificate', domain_name='www.example.com')
+
+
+def redirect(port, protocol):
+    from aws_alb.listener_actions import ListenerActions
+
+    return ListenerActions.redirect_action(port, protocol)
+
+
+def test_valid_batch_is_synthesized(stack, synth, loadbalancer, certificate):
+    scope, _ = stack
+
+    listeners = loadbalancer.listeners.create_listeners([
+        ListenerParams('Https', loadbalancer, 9443, certificate=certificate, ssl_policy=ListenerParams.TLS13_SSL_POLICY),
+        ListenerParams('Http', loadbalancer, 9080, action=redirect(9443, 'HTTPS')),
+    ])
+    template = synth(scope)
+
+    assert sorted(listeners) == [9080, 9443]
+    assert sorted(
+        (resource['Properties']['Port'], resource['Properties']['Protocol'])
+        for resource in resources_of_type(template, 'AWS::ElasticLoadBalancingV2::Listener').values()
+    ) == [(80, 'HTTP'), (8000, 'HTTP'), (9080, 'HTTP'), (9443, 'HTTPS')]
+
+
+def test_port_collision_within_a_batch(loadbalancer):
+    with pytest.raises(AssertionError, match='Listener Admin port 9080 is already used'):
+        loadbalancer.listeners.create_listeners([
+            ListenerParams('Api', loadbalancer, 9080),
+            ListenerParams('Admin', loadbalancer, 9080),
+        ])
+
+
+def test_port_collision_with_an_existing_listener(loadbalancer):
+    loadbalancer.listeners.create_listener(ListenerParams('Api', loadbalancer, 9080))
+
+    with pytest.raises(AssertionError, match='Listener Admin port 9080 is already used'):
+        loadbalancer.listeners.create_listener(ListenerParams('Admin', loadbalancer, 9080))
+
+
+def test_ssl_policy_without_a_certificate(loadbalancer):
+    params = ListenerParams('Api', loadbalancer, 9080, ssl_policy=ListenerParams.TLS13_SSL_POLICY)
+
+    with pytest.raises(AssertionError, match='Listener Api has a ssl policy but no certificate'):
+        loadbalancer.listeners.create_listeners([params])
+
+
+def test_redirect_protocol_mismatch(loadbalancer, certificate):
+    with pytest.raises(AssertionError, match='Listener Http redirects with HTTP to HTTPS port 9443'):
+        loadbalancer.listeners.create_listeners([
+            ListenerParams('Https', loadbalancer, 9443, certificate=certificate),
+            ListenerParams('Http', loadbalancer, 9080, action=redirect(9443, 'HTTP')),
+        ])
+
+
+def test_rejected_batch_creates_no_listeners(stack, synth, loadbalancer):
+    scope, _ = stack
+
+    with pytest.raises(AssertionError):
+        loadbalancer.listeners.create_listeners([
+            ListenerParams('Api', loadbalancer, 9080),
+            ListenerParams('Admin', loadbalancer, 9080),
+        ])
+
+    # Ports of a rejected batch stay free.
+    loadbalancer.listeners.create_listener(ListenerParams('Api', loadbalancer, 9080))
+
+    listeners = resources_of_type(synth(scope), 'AWS::ElasticLoadBalancingV2::Listener')
+    assert sorted(resource['Properties']['Port'] for resource in listeners.values()) == [80, 8000, 9080]
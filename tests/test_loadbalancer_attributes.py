@@ -0,0 +1,113 @@
+import pytest
+
+from aws_alb.alb_performance_profile import AlbPerformanceProfile
+from aws_alb.params.loadbalancer_attributes import LoadBalancerAttributes
+from conftest import resources_of_type
+
+
+@pytest.mark.parametrize('profile, expected', [
+    (AlbPerformanceProfile.LOW_LATENCY_API, {
+        'idle_timeout.timeout_seconds': '30',
+        'routing.http2.enabled': 'true',
+        'routing.http.desync_mitigation_mode': 'defensive',
+        'routing.http.drop_invalid_header_fields.enabled': 'true',
+    }),
+    (AlbPerformanceProfile.LONG_POLLING, {
+        'idle_timeout.timeout_seconds': '3600',
+        'routing.http2.enabled': 'true',
+        'routing.http.desync_mitigation_mode': 'defensive',
+        'routing.http.drop_invalid_header_fields.enabled': 'true',
+    }),
+    (AlbPerformanceProfile.BULK_UPLOAD, {
+        'idle_timeout.timeout_seconds': '900',
+        'routing.http2.enabled': 'false',
+        'routing.http.desync_mitigation_mode': 'defensive',
+        'routing.http.drop_invalid_header_fields.enabled': 'true',
+    }),
+])
+def test_profile_attributes(profile, expected):
+    assert LoadBalancerAttributes.from_profile(profile).to_dict() == expected
+
+
+def test_every_profile_has_attributes():
+    assert set(LoadBalancerAttributes.PROFILES) == set(AlbPerformanceProfile)
+
+
+def test_overrides_take_precedence_over_profile():
+    attributes = LoadBalancerAttributes.from_profile(
+        AlbPerformanceProfile.LOW_LATENCY_API,
+        idle_timeout_seconds=120,
+        deletion_protection_enabled=True
+    ).to_dict()
+
+    assert attributes['idle_timeout.timeout_seconds'] == '120'
+    assert attributes['deletion_protection.enabled'] == 'true'
+    assert attributes['routing.http2.enabled'] == 'true'
+
+
+def test_overrides_do_not_modify_profile():
+    LoadBalancerAttributes.from_profile(AlbPerformanceProfile.LONG_POLLING, idle_timeout_seconds=10)
+
+    assert LoadBalancerAttributes.PROFILES[AlbPerformanceProfile.LONG_POLLING]['idle_timeout_seconds'] == 3600
+
+
+def test_unspecified_attributes_are_left_at_defaults():
+    assert LoadBalancerAttributes().to_dict() == {}
+    assert LoadBalancerAttributes(http2_enabled=False).to_dict() == {'routing.http2.enabled': 'false'}
+
+
+@pytest.mark.parametrize('idle_timeout_seconds', [1, 4000])
+def test_idle_timeout_bounds_are_accepted(idle_timeout_seconds):
+    LoadBalancerAttributes(idle_timeout_seconds=idle_timeout_seconds).validate()
+
+
+@pytest.mark.parametrize('idle_timeout_seconds', [0, 4001])
+def test_idle_timeout_out_of_bounds_is_rejected(idle_timeout_seconds):
+    with pytest.raises(AssertionError):
+        LoadBalancerAttributes(idle_timeout_seconds=idle_timeout_seconds).validate()
+
+    with pytest.raises(AssertionError):
+        LoadBalancerAttributes(idle_timeout_seconds=idle_timeout_seconds).to_dict()
+
+
+@pytest.mark.parametrize('mode', LoadBalancerAttributes.DESYNC_MITIGATION_MODES)
+def test_desync_mitigation_modes_are_accepted(mode):
+    LoadBalancerAttributes(desync_mitigation_mode=mode).validate()
+
+
+def test_unknown_desync_mitigation_mode_is_rejected():
+    with pytest.raises(AssertionError):
+        LoadBalancerAttributes(desync_mitigation_mode='paranoid').validate()
+
+
+def test_synthesized_attribute_list(stack, synth):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    ApplicationLoadbalancer(
+        scope,
+        'Test',
+        vpc,
+        vpc.public_subnets,
+        attributes=LoadBalancerAttributes.from_profile(AlbPerformanceProfile.LONG_POLLING, idle_timeout_seconds=120)
+    )
+
+    loadbalancer, = resources_of_type(synth(scope), 'AWS::ElasticLoadBalancingV2::LoadBalancer').values()
+
+    assert loadbalancer['Properties']['LoadBalancerAttributes'] == [
+        {'Key': 'idle_timeout.timeout_seconds', 'Value': '120'},
+        {'Key': 'routing.http2.enabled', 'Value': 'true'},
+        {'Key': 'routing.http.desync_mitigation_mode', 'Value': 'defensive'},
+        {'Key': 'routing.http.drop_invalid_header_fields.enabled', 'Value': 'true'},
+    ]
+
+
+def test_no_attributes_are_synthesized_by_default(stack, synth):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+
+    loadbalancer, = resources_of_type(synth(scope), 'AWS::ElasticLoadBalancingV2::LoadBalancer').values()
+
+    assert 'LoadBalancerAttributes' not in loadbalancer['Properties']
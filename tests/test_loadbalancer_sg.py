@@ -0,0 +1,110 @@
+import pytest
+
+from conftest import resources_of_type
+
+
+def test_repeated_grants_create_a_single_ingress_rule(stack, synth):
+    from aws_cdk import aws_ec2
+    from aws_alb.loadbalancer_sg import LoadBalancerSecurityGroup
+
+    scope, vpc = stack
+    security_group = LoadBalancerSecurityGroup(scope=scope, prefix='Fleet', vpc=vpc)
+    tasks = aws_ec2.SecurityGroup(scope, 'Tasks', vpc=vpc)
+    workers = aws_ec2.SecurityGroup(scope, 'Workers', vpc=vpc)
+
+    security_group.grant_access(tasks, 8000, 8100)
+    security_group.grant_access(tasks, 8000, 8100)
+    security_group.grant_access(workers, 8000, 8100)
+
+    ingress = resources_of_type(synth(scope), 'AWS::EC2::SecurityGroupIngress').values()
+    ports = sorted((rule['Properties']['FromPort'], rule['Properties']['ToPort']) for rule in ingress)
+
+    assert ports == [(8000, 8100), (8000, 8100)]
+
+
+def open_port(stack, traffic, port=443, prefix_list_ids=None):
+    from aws_alb.loadbalancer_sg import LoadBalancerSecurityGroup
+
+    scope, vpc = stack
+    security_group = LoadBalancerSecurityGroup(scope=scope, prefix='Test', vpc=vpc)
+
+    for peer in security_group.get_peers(traffic, prefix_list_ids):
+        security_group.open_port(port, peer)
+
+    return security_group
+
+
+def ipv6_association(stack):
+    from aws_cdk.aws_ec2 import CfnVPCCidrBlock
+
+    scope, vpc = stack
+    return CfnVPCCidrBlock(scope, 'Ipv6CidrBlock', vpc_id=vpc.vpc_id, amazon_provided_ipv6_cidr_block=True)
+
+
+def security_group_resource(stack, synth, security_group):
+    scope, _ = stack
+    return synth(scope)['Resources'][scope.get_logical_id(security_group.node.default_child)]
+
+
+def peers(ingress):
+    return [{key: value for key, value in rule.items() if key not in ('Description', 'IpProtocol')} for rule in ingress]
+
+
+def test_internet_dualstack_traffic(stack, synth):
+    from aws_alb.alb_traffic_enum import AlbTrafficEnum
+
+    security_group = open_port(stack, AlbTrafficEnum.INTERNET_DUALSTACK)
+    properties = security_group_resource(stack, synth, security_group)['Properties']
+
+    assert peers(properties['SecurityGroupIngress']) == [
+        {'CidrIp': '0.0.0.0/0', 'FromPort': 443, 'ToPort': 443},
+        {'CidrIpv6': '::/0', 'FromPort': 443, 'ToPort': 443},
+    ]
+
+
+def test_vpc_dualstack_traffic_depends_on_the_ipv6_association(stack, synth):
+    from aws_alb.alb_traffic_enum import AlbTrafficEnum
+
+    association = ipv6_association(stack)
+    security_group = open_port(stack, AlbTrafficEnum.VPC_DUALSTACK)
+    resource = security_group_resource(stack, synth, security_group)
+    vpc_id = stack[0].get_logical_id(stack[1].node.default_child)
+
+    assert peers(resource['Properties']['SecurityGroupIngress']) == [
+        {'CidrIp': {'Fn::GetAtt': [vpc_id, 'CidrBlock']}, 'FromPort': 443, 'ToPort': 443},
+        {
+            'CidrIpv6': {'Fn::Select': [0, {'Fn::GetAtt': [vpc_id, 'Ipv6CidrBlocks']}]},
+            'FromPort': 443,
+            'ToPort': 443
+        },
+    ]
+    # The IPv6 CIDR block of the VPC is known only after the association is created.
+    assert resource['DependsOn'] == [stack[0].get_logical_id(association)]
+
+
+def test_vpc_ipv6_traffic_requires_an_ipv6_association(stack):
+    from aws_alb.alb_traffic_enum import AlbTrafficEnum
+
+    with pytest.raises(AssertionError, match='requires an Amazon provided IPv6 CIDR block'):
+        open_port(stack, AlbTrafficEnum.VPC_IPV6)
+
+
+def test_prefix_list_traffic(stack, synth):
+    from aws_alb.alb_traffic_enum import AlbTrafficEnum
+
+    open_port(stack, AlbTrafficEnum.PREFIX_LIST, prefix_list_ids=['pl-4fa04526', 'pl-12345678'])
+
+    # Prefix list rules are written by CDK as separate resources rather than inline rules.
+    ingress = resources_of_type(synth(stack[0]), 'AWS::EC2::SecurityGroupIngress').values()
+
+    assert sorted(
+        (rule['Properties']['SourcePrefixListId'], rule['Properties']['FromPort'], rule['Properties']['ToPort'])
+        for rule in ingress
+    ) == [('pl-12345678', 443, 443), ('pl-4fa04526', 443, 443)]
+
+
+def test_prefix_list_traffic_requires_prefix_list_ids(stack):
+    from aws_alb.alb_traffic_enum import AlbTrafficEnum
+
+    with pytest.raises(AssertionError, match='requires prefix list ids'):
+        open_port(stack, AlbTrafficEnum.PREFIX_LIST)
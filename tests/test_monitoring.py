@@ -0,0 +1,163 @@
+import pytest
+
+from aws_alb.latency_slo_preset import LatencySloPreset
+from aws_alb.params.monitoring_params import MonitoringParams
+from conftest import resources_of_type
+
+
+@pytest.mark.parametrize('preset, percentile, threshold', [
+    (LatencySloPreset.INTERACTIVE, 'p99', 0.5),
+    (LatencySloPreset.STANDARD, 'p99', 1.0),
+    (LatencySloPreset.BATCH, 'p95', 5.0),
+])
+def test_preset_values(preset, percentile, threshold):
+    params = MonitoringParams.from_preset(preset)
+
+    assert params.latency_percentile == percentile
+    assert params.latency_threshold_seconds == threshold
+
+
+def test_every_preset_has_values():
+    assert set(MonitoringParams.PRESETS) == set(LatencySloPreset)
+
+
+def test_overrides_take_precedence_over_preset():
+    params = MonitoringParams.from_preset(LatencySloPreset.BATCH, latency_threshold_seconds=2.0, period_seconds=300)
+
+    assert params.latency_percentile == 'p95'
+    assert params.latency_threshold_seconds == 2.0
+    assert params.period_seconds == 300
+
+
+
+@pytest.mark.parametrize('percentile', ['p0', 'p50', 'p99', 'p99.9', 'p99.99'])
+def test_valid_percentiles(percentile):
+    MonitoringParams(latency_percentile=percentile).validate()
+
+
+@pytest.mark.parametrize('kwargs, message', [
+    ({'latency_percentile': '99'}, 'Latency percentile'),
+    ({'latency_percentile': 'p100'}, 'Latency percentile'),
+    ({'latency_percentile': 'p99.'}, 'Latency percentile'),
+    ({'latency_percentile': 'P99'}, 'Latency percentile'),
+    ({'latency_threshold_seconds': 0}, 'latency_threshold_seconds must be positive'),
+    ({'elb_5xx_threshold': -1}, 'elb_5xx_threshold must be positive'),
+    ({'consumed_lcus_threshold': 0}, 'consumed_lcus_threshold must be positive'),
+    ({'period_seconds': 0}, 'Period must be 10, 30 or a multiple of 60 seconds'),
+    ({'period_seconds': 45}, 'Period must be 10, 30 or a multiple of 60 seconds'),
+    ({'period_seconds': 90}, 'Period must be 10, 30 or a multiple of 60 seconds'),
+    ({'period_seconds': -60}, 'Period must be 10, 30 or a multiple of 60 seconds'),
+    ({'evaluation_periods': 0}, 'Evaluation periods must be positive'),
+])
+def test_invalid_params(kwargs, message):
+    with pytest.raises(AssertionError, match=message):
+        MonitoringParams(**kwargs).validate()
+
+
+@pytest.mark.parametrize('period_seconds', [10, 30, 60, 300, 3600])
+def test_valid_periods(period_seconds):
+    MonitoringParams(period_seconds=period_seconds).validate()
+
+
+def alarms(template):
+    return {
+        resource['Properties']['AlarmName']: resource['Properties']
+        for resource in resources_of_type(template, 'AWS::CloudWatch::Alarm').values()
+    }
+
+
+def dimensions(alarm):
+    return {dimension['Name']: dimension['Value'] for dimension in alarm['Dimensions']}
+
+
+@pytest.fixture
+def monitored(stack, synth):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+    from aws_alb.params.target_group_params import TargetGroupParams
+
+    scope, vpc = stack
+    loadbalancer = ApplicationLoadbalancer(
+        scope,
+        'Test',
+        vpc,
+        vpc.public_subnets,
+        monitoring=MonitoringParams.from_preset(
+            LatencySloPreset.INTERACTIVE,
+            consumed_lcus_threshold=50,
+            alarm_actions=['arn:aws:sns:eu-west-1:111111111111:alarms']
+        )
+    )
+    loadbalancer.listeners.create_target_group(TargetGroupParams('Api', vpc))
+
+    return synth(scope)
+
+
+def test_loadbalancer_alarms(monitored):
+    created = alarms(monitored)
+
+    latency = created['TestLBLatencyAlarm']
+    assert latency['MetricName'] == 'TargetResponseTime'
+    assert latency['ExtendedStatistic'] == 'p99'
+    assert 'Statistic' not in latency
+    assert latency['Threshold'] == 0.5
+    assert latency['ComparisonOperator'] == 'GreaterThanThreshold'
+    assert latency['AlarmActions'] == ['arn:aws:sns:eu-west-1:111111111111:alarms']
+
+    assert created['TestLBElb5xxAlarm']['MetricName'] == 'HTTPCode_ELB_5XX_Count'
+    assert created['TestLBElb5xxAlarm']['Threshold'] == 10
+    assert created['TestLBRejectedConnectionsAlarm']['ComparisonOperator'] == 'GreaterThanOrEqualToThreshold'
+    assert created['TestLBConsumedLcusAlarm']['Threshold'] == 50
+
+    for name in ('TestLBLatencyAlarm', 'TestLBElb5xxAlarm', 'TestLBRejectedConnectionsAlarm'):
+        assert created[name]['Namespace'] == 'AWS/ApplicationELB'
+        assert created[name]['Period'] == 60
+        assert created[name]['EvaluationPeriods'] == 3
+        assert created[name]['TreatMissingData'] == 'notBreaching'
+        assert dimensions(created[name]) == {
+            'LoadBalancer': {'Fn::GetAtt': ['TestAppLoadBalancer', 'LoadBalancerFullName']}
+        }
+
+
+def test_target_group_alarms(monitored):
+    created = alarms(monitored)
+
+    expected_dimensions = {
+        'LoadBalancer': {'Fn::GetAtt': ['TestAppLoadBalancer', 'LoadBalancerFullName']},
+        'TargetGroup': {'Fn::GetAtt': ['ApiTargetGroup', 'TargetGroupFullName']},
+    }
+
+    assert created['ApiTargetGroupLatencyAlarm']['ExtendedStatistic'] == 'p99'
+    assert created['ApiTargetGroupLatencyAlarm']['Threshold'] == 0.5
+    assert created['ApiTargetGroupTarget5xxAlarm']['MetricName'] == 'HTTPCode_Target_5XX_Count'
+    assert created['ApiTargetGroupUnhealthyHostsAlarm']['Statistic'] == 'Maximum'
+    assert created['ApiTargetGroupUnhealthyHostsAlarm']['Threshold'] == 1
+
+    for name in ('ApiTargetGroupLatencyAlarm', 'ApiTargetGroupTarget5xxAlarm', 'ApiTargetGroupUnhealthyHostsAlarm'):
+        assert dimensions(created[name]) == expected_dimensions
+
+
+def test_dashboard_is_created(monitored):
+    dashboard, = resources_of_type(monitored, 'AWS::CloudWatch::Dashboard').values()
+
+    assert dashboard['Properties']['DashboardName'] == 'TestLoadBalancer'
+
+
+def test_no_lcu_alarm_and_dashboard_when_disabled(stack, synth):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets, monitoring=MonitoringParams(create_dashboard=False))
+    template = synth(scope)
+
+    assert 'TestLBConsumedLcusAlarm' not in alarms(template)
+    assert not resources_of_type(template, 'AWS::CloudWatch::Dashboard')
+
+
+def test_invalid_params_fail_at_synth_time(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    monitoring = MonitoringParams(latency_percentile='99')
+
+    with pytest.raises(AssertionError, match='Latency percentile'):
+        ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets, monitoring=monitoring)
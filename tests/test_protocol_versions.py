@@ -0,0 +1,110 @@
+import pytest
+
+from aws_alb.params.listener_params import ListenerParams
+from aws_alb.params.listener_rule_params import ListenerRuleParams
+from aws_alb.params.target_group_params import TargetGroupParams
+
+
+@pytest.fixture
+def loadbalancer(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    return ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+
+
+@pytest.fixture
+def certificate(stack):
+    from aws_cdk.aws_certificatemanager import CfnCertificate
+
+    scope, _ = stack
+    return CfnCertificate(scope, 'Certificate', domain_name='www.example.com')
+
+
+def forward(target_group):
+    from aws_alb.listener_actions import ListenerActions
+
+    return ListenerActions.target_group_action(target_group)
+
+
+def test_grpc_target_group_defaults(stack, synth):
+    from aws_alb.factories.target_group_factory import TargetGroupFactory
+
+    scope, vpc = stack
+    TargetGroupFactory(scope).create_target_group(TargetGroupParams('Api', vpc, protocol_version='GRPC'))
+    properties = synth(scope)['Resources']['ApiTargetGroup']['Properties']
+
+    assert properties['ProtocolVersion'] == 'GRPC'
+    # Code 12 (unimplemented) is healthy as the default path is not implemented by gRPC services.
+    assert properties['Matcher'] == {'GrpcCode': '12'}
+    assert properties['HealthCheckPath'] == '/AWS.ALB/healthcheck'
+
+
+def test_grpc_target_group_with_custom_codes(stack, synth):
+    from aws_alb.factories.target_group_factory import TargetGroupFactory
+
+    scope, vpc = stack
+    TargetGroupFactory(scope).create_target_group(TargetGroupParams(
+        'Api',
+        vpc,
+        protocol_version='GRPC',
+        healthy_grpc_codes=[0, 12],
+        health_check_path='/package.Service/Check'
+    ))
+    properties = synth(scope)['Resources']['ApiTargetGroup']['Properties']
+
+    assert properties['Matcher'] == {'GrpcCode': '0,12'}
+    assert properties['HealthCheckPath'] == '/package.Service/Check'
+
+
+@pytest.mark.parametrize('protocol_version', ['GRPC', 'HTTP2'])
+def test_blue_green_rejects_http_listeners(stack, loadbalancer, protocol_version):
+    _, vpc = stack
+
+    with pytest.raises(AssertionError, match=f'{protocol_version} target group Api requires an https listener'):
+        loadbalancer.listeners.create_blue_green(
+            ListenerParams('Api', loadbalancer, 9080),
+            ListenerParams('Api', loadbalancer, 9081),
+            TargetGroupParams('Api', vpc, protocol_version=protocol_version),
+            TargetGroupParams('Api', vpc, protocol_version=protocol_version),
+        )
+
+
+@pytest.mark.parametrize('protocol_version', ['GRPC', 'HTTP2'])
+def test_listener_rejects_forwarding_to_a_created_target_group(stack, loadbalancer, protocol_version):
+    _, vpc = stack
+    listeners = loadbalancer.listeners
+    target_group = listeners.create_target_group(TargetGroupParams('Api', vpc, protocol_version=protocol_version))
+
+    with pytest.raises(AssertionError, match=f'{protocol_version} target group Api requires an https listener'):
+        listeners.create_listener(ListenerParams('Api', loadbalancer, 9080, action=forward(target_group)))
+
+
+def test_listener_rule_rejects_forwarding_from_an_http_listener(stack, loadbalancer):
+    from aws_alb.listener_actions import ListenerActions
+
+    _, vpc = stack
+    listeners = loadbalancer.listeners
+    grpc = listeners.create_target_group(TargetGroupParams('Grpc', vpc, protocol_version='GRPC'))
+    http = listeners.create_target_group(TargetGroupParams('Http', vpc))
+
+    with pytest.raises(AssertionError, match='GRPC target group Grpc requires an https listener'):
+        listeners.create_listener_rule(ListenerRuleParams(
+            'Api',
+            loadbalancer.default_prod_listener,
+            ListenerActions.weighted_forward_action([(http, 1), (grpc, 1)]),
+            path_patterns=['/api/*']
+        ))
+
+
+def test_https_listener_and_rule_can_forward_to_grpc(stack, synth, loadbalancer, certificate):
+    scope, vpc = stack
+    listeners = loadbalancer.listeners
+    target_group = listeners.create_target_group(TargetGroupParams('Api', vpc, protocol_version='GRPC'))
+
+    listener = listeners.create_listener(ListenerParams(
+        'Api', loadbalancer, 9443, certificate=certificate, action=forward(target_group)
+    ))
+    listeners.create_listener_rule(ListenerRuleParams('Api', listener, forward(target_group), path_patterns=['/*']))
+
+    assert synth(scope)['Resources']['ApiTargetGroup']['Properties']['ProtocolVersion'] == 'GRPC'
@@ -0,0 +1,89 @@
+import pytest
+
+from aws_alb.params.listener_params import ListenerParams
+from aws_alb.params.target_group_params import TargetGroupParams
+from conftest import resources_of_type
+
+
+@pytest.fixture
+def blue_green(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+
+    scope, vpc = stack
+    loadbalancer = ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+    blue, green = loadbalancer.listeners.create_blue_green(
+        ListenerParams('Api', loadbalancer, 9080),
+        ListenerParams('Api', loadbalancer, 9081),
+        TargetGroupParams('Api', vpc),
+        TargetGroupParams('Api', vpc),
+    )
+
+    return loadbalancer, blue, green
+
+
+def test_blue_green_policies(stack, synth, blue_green):
+    from aws_cdk.aws_applicationautoscaling import CfnScalableTarget
+    from aws_alb.request_count_scaling import RequestCountScaling
+
+    scope, _ = stack
+    loadbalancer, blue, green = blue_green
+    scalable_target = CfnScalableTarget(
+        scope,
+        'ScalableTarget',
+        max_capacity=10,
+        min_capacity=1,
+        resource_id='service/cluster/api',
+        role_arn='arn:aws:iam::111111111111:role/scaling',
+        scalable_dimension='ecs:service:DesiredCount',
+        service_namespace='ecs'
+    )
+
+    RequestCountScaling.create_blue_green_policies(
+        scope,
+        'Api',
+        scalable_target.ref,
+        loadbalancer,
+        blue,
+        green,
+        requests_per_target=500,
+        scale_in_cooldown_seconds=300,
+        scale_out_cooldown_seconds=60
+    )
+
+    template = synth(scope)
+    policies = resources_of_type(template, 'AWS::ApplicationAutoScaling::ScalingPolicy')
+    loadbalancer_id = scope.get_logical_id(loadbalancer)
+
+    assert sorted(policies) == ['ApiBlueRequestCountScalingPolicy', 'ApiGreenRequestCountScalingPolicy']
+
+    for colour, (target_group, listener) in (('Blue', blue), ('Green', green)):
+        policy = policies[f'Api{colour}RequestCountScalingPolicy']
+        properties = policy['Properties']
+
+        assert properties['PolicyType'] == 'TargetTrackingScaling'
+        # Both colours scale the same scalable target, which is created before the policies.
+        assert properties['ScalingTargetId'] == {'Ref': 'ScalableTarget'}
+        # The metric exists only after the target group is attached to the loadbalancer.
+        assert scope.get_logical_id(listener) in policy['DependsOn']
+
+        assert properties['TargetTrackingScalingPolicyConfiguration'] == {
+            'PredefinedMetricSpecification': {
+                'PredefinedMetricType': 'ALBRequestCountPerTarget',
+                'ResourceLabel': {'Fn::Join': ['/', [
+                    {'Fn::GetAtt': [loadbalancer_id, 'LoadBalancerFullName']},
+                    {'Fn::GetAtt': [scope.get_logical_id(target_group), 'TargetGroupFullName']},
+                ]]},
+            },
+            'TargetValue': 500,
+            'ScaleInCooldown': 300,
+            'ScaleOutCooldown': 60,
+        }
+
+
+def test_requests_per_target_must_be_positive(blue_green):
+    from aws_alb.request_count_scaling import RequestCountScaling
+
+    loadbalancer, (target_group, _), _ = blue_green
+
+    with pytest.raises(AssertionError, match='Requests per target must be positive'):
+        RequestCountScaling.create_configuration(loadbalancer, target_group, 0)
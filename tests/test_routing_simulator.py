@@ -0,0 +1,224 @@
+import pytest
+
+from aws_alb.simulator.routing_simulator import RoutingSimulator, SimulatedListener
+from aws_alb.simulator.simulated_action import SimulatedAction
+from aws_alb.simulator.simulated_request import SimulatedRequest
+from aws_alb.simulator.simulated_rule import SimulatedRule
+
+NOT_FOUND = SimulatedAction.fixed_response(404, 'Not found.')
+
+
+def forward(name):
+    return SimulatedAction.forward([(name, 1)])
+
+
+def simulator(*rules, seed=None):
+    return RoutingSimulator([SimulatedListener(80, 'HTTP', NOT_FOUND, list(rules))], seed)
+
+
+def test_rules_are_evaluated_in_priority_order_across_host_and_any_host_rules():
+    routing = simulator(
+        SimulatedRule('ApiHost', 30, forward('ApiHost'), host_headers=['api.example.com']),
+        SimulatedRule('Health', 20, forward('Health'), path_patterns=['/health']),
+        SimulatedRule('ApiUsers', 10, forward('ApiUsers'), host_headers=['API.example.com'], path_patterns=['/users']),
+        SimulatedRule('Catch', 40, forward('Catch'), path_patterns=['*']),
+    )
+
+    def route(host, path):
+        decision = routing.route(SimulatedRequest(path, host=host))
+        return decision.rule, decision.priority, decision.depth
+
+    assert route('api.example.com', '/users') == ('ApiUsers', 10, 1)
+    # A rule for any host with a higher priority wins over a host specific one.
+    assert route('api.example.com', '/health') == ('Health', 20, 2)
+    assert route('api.example.com', '/orders') == ('ApiHost', 30, 3)
+    assert route('www.example.com', '/users') == ('Catch', 40, 4)
+    assert route('www.example.com', '/health') == ('Health', 20, 2)
+
+
+def test_default_action_is_applied_when_no_rule_matches():
+    routing = simulator(
+        SimulatedRule('Api', 1, forward('Api'), path_patterns=['/api/*']),
+        SimulatedRule('Admin', 2, forward('Admin'), path_patterns=['/admin/*']),
+    )
+
+    decision = routing.route(SimulatedRequest('/other'))
+
+    assert decision.rule is None
+    assert decision.depth == 2
+    assert decision.action_type == SimulatedAction.FIXED_RESPONSE
+    assert (decision.status_code, decision.body) == (404, 'Not found.')
+    assert decision.target_group is None
+
+
+def test_unknown_listener_port():
+    with pytest.raises(AssertionError, match='no listener on port 8080'):
+        simulator().route(SimulatedRequest('/', port=8080))
+
+
+def test_rule_priorities_must_be_unique():
+    with pytest.raises(AssertionError, match='must be unique'):
+        simulator(SimulatedRule('A', 1, forward('A')), SimulatedRule('B', 1, forward('B')))
+
+
+@pytest.mark.parametrize('path, matches', [
+    ('/api/users', True),
+    ('/api/', True),
+    ('/API/users', False),
+    ('/api', False),
+    ('/v1/img.png', True),
+    ('/v12/img.png', False),
+    ('/exact', True),
+    ('/Exact', False),
+    ('/exact/', False),
+])
+def test_path_patterns_are_case_sensitive(path, matches):
+    rule = SimulatedRule('Path', 1, forward('Path'), path_patterns=['/api/*', '/v?/img.png', '/exact'])
+
+    assert rule.matches(SimulatedRequest(path), '') is matches
+
+
+@pytest.mark.parametrize('host, matches', [
+    ('example.com', True),
+    ('EXAMPLE.com', True),
+    ('www.example.com', False),
+    ('api.Internal.Example.org', True),
+    ('internal.example.org', False),
+    ('example.com:8080', True),
+])
+def test_host_headers_are_case_insensitive(host, matches):
+    rule = SimulatedRule('Host', 1, forward('Host'), host_headers=['example.com', '*.internal.example.org'])
+    routing = simulator(rule)
+
+    assert (routing.route(SimulatedRequest('/', host=host)).rule == 'Host') is matches
+
+
+def test_literal_hosts_are_indexed():
+    assert SimulatedRule('A', 1, forward('A'), host_headers=['Example.com']).literal_hosts == ['example.com']
+    assert SimulatedRule('B', 2, forward('B'), host_headers=['*.example.com']).literal_hosts is None
+    assert SimulatedRule('C', 3, forward('C'), path_patterns=['/']).literal_hosts is None
+
+
+def test_http_headers_are_case_insensitive():
+    rule = SimulatedRule('Header', 1, forward('Header'), http_headers={'X-Env': ['blue', 'green*']})
+
+    assert rule.matches(SimulatedRequest('/', headers={'x-env': 'BLUE'}), '')
+    assert rule.matches(SimulatedRequest('/', headers={'X-ENV': 'green-2'}), '')
+    assert not rule.matches(SimulatedRequest('/', headers={'X-Env': 'red'}), '')
+    assert not rule.matches(SimulatedRequest('/'), '')
+
+
+def test_query_strings_with_and_without_keys():
+    rule = SimulatedRule('Query', 1, forward('Query'), query_strings=[('version', 'v2'), (None, 'beta*')])
+
+    def matches(query):
+        return rule.matches(SimulatedRequest('/', query=query), '')
+
+    assert matches('version=V2')
+    assert matches('a=1&version=v2')
+    # A pair without a key matches a value of any key.
+    assert matches('channel=beta-7')
+    assert matches('x=BETA')
+    assert not matches('version=v1')
+    assert not matches('beta=1')
+    assert not matches('')
+
+
+def test_source_ips():
+    rule = SimulatedRule('Office', 1, forward('Office'), source_ips=['10.0.0.0/16', '2001:db8::/32'])
+
+    assert rule.matches(SimulatedRequest('/', source_ip='10.0.12.1'), '')
+    assert rule.matches(SimulatedRequest('/', source_ip='2001:db8::1'), '')
+    assert not rule.matches(SimulatedRequest('/', source_ip='10.1.0.1'), '')
+
+
+@pytest.mark.parametrize('action, request_, location', [
+    (SimulatedAction.redirect_to(protocol='HTTPS', port='443'), SimulatedRequest('/a', 'example.com', 80, 'b=1'),
+     'https://example.com/a?b=1'),
+    (SimulatedAction.redirect_to(), SimulatedRequest('/a', 'example.com:80', 80),
+     'http://example.com/a'),
+    (SimulatedAction.redirect_to(protocol='HTTPS', port='8443'), SimulatedRequest('/a', 'example.com', 80),
+     'https://example.com:8443/a'),
+    (SimulatedAction.redirect_to(port='8080'), SimulatedRequest('/a', 'example.com', 80),
+     'http://example.com:8080/a'),
+    (SimulatedAction.redirect_to(host='new.example.com', path='/v2/#{path}', query='from=#{host}&#{query}'),
+     SimulatedRequest('/users/1', 'old.example.com', 80, 'page=2'),
+     'http://new.example.com/v2/users/1?from=old.example.com&page=2'),
+    (SimulatedAction.redirect_to(path='/', query=''), SimulatedRequest('/a', 'example.com', 80, 'b=1'),
+     'http://example.com/'),
+])
+def test_render_location(action, request_, location):
+    assert action.render_location(request_, 'HTTP') == location
+
+
+def test_redirect_decision():
+    action = SimulatedAction.redirect_to(status_code='HTTP_302')
+    routing = simulator(SimulatedRule('Old', 1, action, path_patterns=['/*']))
+    decision = routing.route(SimulatedRequest('/a', 'example.com'))
+
+    assert decision.action_type == SimulatedAction.REDIRECT
+    assert decision.status_code == 302
+    assert decision.location == 'http://example.com/a'
+
+
+def test_seeded_weighted_split():
+    action = SimulatedAction.forward([('Blue', 90), ('Green', 10), ('Drained', 0)])
+
+    def replay(seed):
+        routing = simulator(SimulatedRule('All', 1, action, path_patterns=['*']), seed=seed)
+        return routing.replay(SimulatedRequest('/') for _ in range(10000))
+
+    report = replay(42)
+
+    assert report.requests_count == 10000
+    assert set(report.target_group_hits) == {'Blue', 'Green'}
+    assert 8800 <= report.target_group_hits['Blue'] <= 9200
+    assert report.target_group_hits['Blue'] + report.target_group_hits['Green'] == 10000
+    assert replay(42).target_group_hits == report.target_group_hits
+
+
+def test_listener_reader_names_target_groups_by_logical_id(stack):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+    from aws_alb.listener_actions import ListenerActions
+    from aws_alb.params.listener_rule_params import ListenerRuleParams
+    from aws_alb.params.target_group_params import TargetGroupParams
+    from aws_alb.simulator.listener_reader import ListenerReader
+
+    scope, vpc = stack
+    loadbalancer = ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+    listeners = loadbalancer.listeners
+    blue = listeners.create_target_group(TargetGroupParams('Blue', vpc))
+    green = listeners.create_target_group(TargetGroupParams('Green', vpc))
+    listener = loadbalancer.default_prod_listener
+
+    listeners.create_listener_rules([
+        ListenerRuleParams(
+            'Api',
+            listener,
+            ListenerActions.weighted_forward_action([(blue, 1), (green, 0)]),
+            path_patterns=['/api/*'],
+            priority=1
+        ),
+        ListenerRuleParams(
+            'Admin',
+            listener,
+            ListenerActions.target_group_action(green),
+            host_headers=['admin.example.com'],
+            priority=2
+        ),
+    ])
+
+    routing = ListenerReader(scope, listeners).read_simulator([listener], seed=1)
+    simulated = routing.listeners[80]
+
+    assert [(rule.name, rule.priority) for rule in simulated.rules] == [('Api', 1), ('Admin', 2)]
+
+    api = routing.route(SimulatedRequest('/api/users', 'admin.example.com'))
+    assert (api.rule, api.target_group) == ('Api', 'BlueTargetGroup')
+
+    admin = routing.route(SimulatedRequest('/users', 'Admin.example.com'))
+    assert (admin.rule, admin.target_group, admin.depth) == ('Admin', 'GreenTargetGroup', 2)
+
+    other = routing.route(SimulatedRequest('/users', 'www.example.com'))
+    assert other.rule is None
+    assert other.status_code == 404
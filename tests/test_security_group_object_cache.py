@@ -0,0 +1,62 @@
+import pytest
+
+
+@pytest.fixture
+def cache():
+    pytest.importorskip('aws_cdk.aws_ec2')
+    from aws_alb.loadbalancer_sg_object_cache import SecurityGroupObjectCache
+
+    return SecurityGroupObjectCache()
+
+
+def counters(cache):
+    return cache.hits, cache.misses
+
+
+def test_repeated_peer_lookups_return_the_same_object(cache):
+    internet = cache.get_ipv4_peer()
+    vpc = cache.get_ipv4_peer('10.0.0.0/16')
+    internet_ipv6 = cache.get_ipv6_peer()
+    prefix_list = cache.get_prefix_list_peer('pl-4fa04526')
+
+    assert counters(cache) == (0, 4)
+
+    assert cache.get_ipv4_peer() is internet
+    assert cache.get_ipv4_peer('10.0.0.0/16') is vpc
+    assert cache.get_ipv6_peer() is internet_ipv6
+    assert cache.get_prefix_list_peer('pl-4fa04526') is prefix_list
+
+    assert counters(cache) == (4, 4)
+
+
+def test_peers_of_different_kinds_are_not_shared(cache):
+    internet = cache.get_ipv4_peer()
+
+    assert cache.get_ipv6_peer() is not internet
+    assert cache.get_ipv4_peer('10.1.0.0/16') is not cache.get_ipv4_peer('10.0.0.0/16')
+    assert counters(cache) == (0, 4)
+
+
+def test_repeated_port_lookups_return_the_same_object(cache):
+    port = cache.get_port(443, 443)
+
+    assert cache.get_port(443, 443) is port
+    assert cache.get_port(443, 443, ingress=True) is port
+    assert counters(cache) == (2, 1)
+
+    # Other ranges and directions are new keys.
+    assert cache.get_port(443, 443, ingress=False) is not port
+    assert cache.get_port(443, 444) is not port
+    assert counters(cache) == (2, 3)
+
+
+def test_port_description(cache):
+    assert cache.get_port(443, 443).to_string() == 'Ingress 443 rule.'
+    assert cache.get_port(9000, 9001, ingress=False).to_string() == 'Egress 9000-9001 rule.'
+
+
+def test_prefix_list_id_is_required(cache):
+    with pytest.raises(AssertionError, match='Prefix list id must be specified'):
+        cache.get_prefix_list_peer('')
+
+    assert counters(cache) == (0, 0)
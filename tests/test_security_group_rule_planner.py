@@ -0,0 +1,126 @@
+import pytest
+
+from conftest import resources_of_type
+
+
+@pytest.fixture
+def peers():
+    aws_ec2 = pytest.importorskip('aws_cdk.aws_ec2')
+
+    return aws_ec2.Peer.any_ipv4(), aws_ec2.Peer.ipv4('10.0.0.0/16')
+
+
+@pytest.fixture
+def planner():
+    pytest.importorskip('aws_cdk.aws_ec2')
+    from aws_alb.loadbalancer_sg_rule_planner import SecurityGroupRulePlanner
+
+    return SecurityGroupRulePlanner()
+
+
+def ranges(rules, peer=None, ingress=True):
+    return [
+        (rule.from_port, rule.to_port) for rule in rules
+        if rule.ingress is ingress and (peer is None or rule.peer is peer)
+    ]
+
+
+def test_duplicate_requests_are_dropped(planner, peers):
+    internet, _ = peers
+
+    for _ in range(3):
+        planner.add(443, internet)
+
+    assert ranges(planner.plan()) == [(443, 443)]
+    assert (planner.requested_rules_count, planner.planned_rules_count, planner.saved_rules_count) == (3, 1, 2)
+
+
+def test_adjacent_and_overlapping_ranges_are_merged(planner, peers):
+    internet, _ = peers
+
+    planner.add(9001, internet)
+    planner.add(9000, internet)
+    planner.add_range(9002, 9010, internet)
+    planner.add_range(9005, 9020, internet)
+    planner.add(9022, internet)
+
+    assert ranges(planner.plan()) == [(9000, 9020), (9022, 9022)]
+    assert planner.saved_rules_count == 3
+
+
+def test_ranges_are_merged_per_peer_and_direction(planner, peers):
+    internet, vpc = peers
+
+    planner.add(80, internet)
+    planner.add(81, vpc)
+    planner.add(81, internet, ingress=False)
+    planner.add(81, internet)
+
+    rules = planner.plan()
+
+    assert ranges(rules, internet) == [(80, 81)]
+    assert ranges(rules, vpc) == [(81, 81)]
+    assert ranges(rules, internet, ingress=False) == [(81, 81)]
+    assert planner.saved_rules_count == 1
+
+
+def test_equal_peer_objects_are_merged(planner):
+    from aws_cdk.aws_ec2 import Peer
+
+    planner.add(80, Peer.ipv4('10.0.0.0/16'))
+    planner.add(81, Peer.ipv4('10.0.0.0/16'))
+
+    assert ranges(planner.plan()) == [(80, 81)]
+
+
+def test_invalid_range_is_rejected(planner, peers):
+    with pytest.raises(AssertionError, match='Invalid port range 10-9'):
+        planner.add_range(10, 9, peers[0])
+
+
+def test_empty_plan(planner):
+    assert planner.plan() == []
+    assert planner.saved_rules_count == 0
+
+
+def test_adjacent_ports_are_written_as_single_rules_at_synth_time(stack, synth, peers):
+    from aws_alb.loadbalancer_sg import LoadBalancerSecurityGroup
+
+    scope, vpc = stack
+    internet, _ = peers
+    security_group = LoadBalancerSecurityGroup(scope=scope, prefix='Test', vpc=vpc)
+    cfn_security_group = security_group.node.default_child
+
+    for port in (9000, 9001):
+        security_group.open_port(port, internet)
+        security_group.open_port(port, internet, ingress=False)
+
+    # Rules are kept by the planner until the synthesis.
+    assert scope.resolve(cfn_security_group.security_group_ingress) is None
+    assert security_group.rule_planner.saved_rules_count == 2
+
+    properties = synth(scope)['Resources'][scope.get_logical_id(cfn_security_group)]['Properties']
+
+    assert [(rule['FromPort'], rule['ToPort']) for rule in properties['SecurityGroupIngress']] == [(9000, 9001)]
+    assert [(rule['FromPort'], rule['ToPort']) for rule in properties['SecurityGroupEgress']] == [(9000, 9001)]
+
+    with pytest.raises(AssertionError, match='already written'):
+        security_group.open_port(9002, internet)
+
+
+def test_loadbalancer_listeners_share_merged_rules(stack, synth):
+    from aws_alb.application_loadbalancer import ApplicationLoadbalancer
+    from aws_alb.params.listener_params import ListenerParams
+
+    scope, vpc = stack
+    loadbalancer = ApplicationLoadbalancer(scope, 'Test', vpc, vpc.public_subnets)
+    loadbalancer.listeners.create_listeners([
+        ListenerParams('Api', loadbalancer, 9000),
+        ListenerParams('Admin', loadbalancer, 9001),
+    ])
+
+    template = synth(scope)
+    group, = resources_of_type(template, 'AWS::EC2::SecurityGroup').values()
+    ports = [(rule['FromPort'], rule['ToPort']) for rule in group['Properties']['SecurityGroupIngress']]
+
+    assert ports == [(80, 80), (8000, 8000), (9000, 9001)]
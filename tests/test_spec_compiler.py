@@ -0,0 +1,139 @@
+import json
+import os
+
+import pytest
+
+from conftest import resources_of_type
+
+
+def spec_of(*loadbalancers):
+    return {'loadbalancers': list(loadbalancers)}
+
+
+def loadbalancer(name, *services):
+    return {'name': name, 'services': list(services)}
+
+
+def service(name, port):
+    return {'name': name, 'port': port, 'test_port': port + 1}
+
+
+def compile_spec(spec, cache_directory):
+    """
+    Compiles a spec in a new app as every synth does.
+
+    :return: Compiler, compiled loadbalancers and a synthesized template.
+    """
+    core = pytest.importorskip('aws_cdk.core')
+    aws_ec2 = pytest.importorskip('aws_cdk.aws_ec2')
+    from aws_alb.spec.spec_compiler import SpecCompiler
+
+    app = core.App()
+    stack = core.Stack(app, 'TestStack', env=core.Environment(account='111111111111', region='eu-west-1'))
+    vpc = aws_ec2.Vpc(stack, 'Vpc', max_azs=2)
+
+    compiler = SpecCompiler(stack, vpc, cache_directory)
+    compiled = compiler.compile(spec)
+
+    return compiler, compiled, app.synth().get_stack_by_name(stack.stack_name).template
+
+
+def references(value):
+    if isinstance(value, dict):
+        if 'Ref' in value:
+            yield value['Ref']
+
+        for item in value.values():
+            yield from references(item)
+
+    if isinstance(value, list):
+        for item in value:
+            yield from references(item)
+
+
+SPEC = spec_of(
+    loadbalancer('Api', service('Users', 9000)),
+    loadbalancer('Admin', service('Reports', 9100)),
+)
+
+
+def test_second_compilation_is_taken_from_cache(tmp_path):
+    first, compiled, first_template = compile_spec(SPEC, str(tmp_path))
+
+    assert (first.cache.hits, first.cache.misses) == (0, 2)
+    assert not any(loadbalancer.cache_hit for loadbalancer in compiled.values())
+    assert len(os.listdir(tmp_path)) == 2
+
+    second, compiled, second_template = compile_spec(SPEC, str(tmp_path))
+
+    assert (second.cache.hits, second.cache.misses) == (2, 0)
+    assert all(loadbalancer.cache_hit for loadbalancer in compiled.values())
+    assert second_template == first_template
+
+
+def test_placeholders_are_bound_to_the_vpc(tmp_path):
+    _, compiled, template = compile_spec(SPEC, str(tmp_path))
+
+    placeholders = [
+        reference for reference in references(template['Resources'])
+        if reference.startswith(('SpecVpcId', 'SpecVpcCidr', 'SpecSubnet'))
+    ]
+
+    assert 'Parameters' not in template
+    assert placeholders == []
+
+    security_group = template['Resources'][compiled['Api'].logical_ids['security_group']]
+    assert security_group['Properties']['VpcId'] == {'Ref': 'Vpc8378EB38'}
+
+    api = template['Resources'][compiled['Api'].logical_ids['loadbalancer']]
+    assert api['Properties']['Subnets'] == [
+        {'Ref': 'VpcPublicSubnet1Subnet5C2D37C4'},
+        {'Ref': 'VpcPublicSubnet2Subnet691E08A3'},
+    ]
+
+
+def test_compiled_logical_ids_exist_in_the_template(tmp_path):
+    _, compiled, template = compile_spec(SPEC, str(tmp_path))
+    target_groups = resources_of_type(template, 'AWS::ElasticLoadBalancingV2::TargetGroup')
+
+    assert set(compiled['Api'].logical_ids.values()) <= set(template['Resources'])
+    assert compiled['Api'].logical_ids['Users/blue_target_group'] in target_groups
+    assert compiled['Api'].logical_ids['Users/green_target_group'] in target_groups
+
+
+def test_changed_service_renders_only_its_loadbalancer(tmp_path):
+    compile_spec(SPEC, str(tmp_path))
+
+    changed = spec_of(
+        loadbalancer('Api', service('Users', 9000)),
+        loadbalancer('Admin', service('Reports', 9200)),
+    )
+    compiler, compiled, template = compile_spec(changed, str(tmp_path))
+
+    assert (compiler.cache.hits, compiler.cache.misses) == (1, 1)
+    assert compiled['Api'].cache_hit
+    assert not compiled['Admin'].cache_hit
+
+    ports = {
+        listener['Properties']['Port']
+        for listener in resources_of_type(template, 'AWS::ElasticLoadBalancingV2::Listener').values()
+    }
+    assert {9200, 9201} <= ports
+    assert not {9100, 9101} & ports
+
+
+def test_corrupted_cache_entry_is_rendered_again(tmp_path):
+    _, _, first_template = compile_spec(SPEC, str(tmp_path))
+
+    name = sorted(os.listdir(tmp_path))[0]
+    with open(tmp_path / name, 'w') as file:
+        file.write('{"template": ')
+
+    compiler, _, template = compile_spec(SPEC, str(tmp_path))
+
+    assert (compiler.cache.hits, compiler.cache.misses) == (1, 1)
+    assert template == first_template
+
+    with open(tmp_path / name) as file:
+        assert set(json.load(file)) == {'template', 'logical_ids'}
+
@@ -0,0 +1,66 @@
+from aws_alb.spec.spec_validator import SpecValidator
+
+
+def spec_of(*services, **loadbalancer):
+    return {'loadbalancers': [dict({'name': 'Api', 'services': list(services)}, **loadbalancer)]}
+
+
+def test_valid_spec_has_no_errors():
+    assert SpecValidator.validate(spec_of({'name': 'Users', 'port': 9000, 'test_port': 9001})) == []
+
+
+def test_ports_of_service_with_invalid_field_are_validated():
+    errors = SpecValidator.validate(spec_of({'name': 'Users', 'port': 80, 'test_port': 9001, 'target_port': 'x'}))
+
+    assert errors == [
+        'loadbalancers[0].services[0].target_port: must be of type int.',
+        'loadbalancers[0].services[0].port: port 80 is already used by a default listener.',
+    ]
+
+
+def test_ports_and_name_are_validated_without_other_required_fields():
+    errors = SpecValidator.validate(spec_of(
+        {'name': 'Users', 'port': 9000, 'test_port': 9001},
+        {'name': 'Users', 'port': 9001, 'test_port': '9002'},
+    ))
+
+    assert errors == [
+        'loadbalancers[0].services[1].test_port: must be of type int.',
+        'loadbalancers[0].services[1].name: duplicate service name Users.',
+        'loadbalancers[0].services[1].port: port 9001 is already used by service Users.',
+    ]
+
+
+def test_port_collision_with_service_without_name_is_reported():
+    errors = SpecValidator.validate(spec_of({'port': 9000, 'test_port': 9001}, {'name': 'Orders', 'port': 9000}))
+
+    assert 'loadbalancers[0].services[0].name: field is required.' in errors
+    assert 'loadbalancers[0].services[1].test_port: field is required.' in errors
+    assert (
+        'loadbalancers[0].services[1].port: port 9000 is already used by loadbalancers[0].services[0].'
+    ) in errors
+
+
+def test_attribute_errors_do_not_hide_health_check_errors():
+    errors = SpecValidator.validate(spec_of({
+        'name': 'Users',
+        'port': 9000,
+        'test_port': 9001,
+        'health_check_interval_seconds': 5,
+        'health_check_timeout_seconds': 10,
+        'attributes': {'deregistration_delay_seconds': 5000},
+    }))
+
+    assert len(errors) == 2
+    assert errors[0].startswith('loadbalancers[0].services[0].attributes: ')
+    assert errors[1] == 'loadbalancers[0].services[0]: Health check timeout must be shorter than the interval.'
+
+
+def test_services_of_loadbalancer_without_name_are_validated():
+    service = {'name': 'Users', 'port': 0, 'test_port': 9001}
+    errors = SpecValidator.validate({'loadbalancers': [{'services': [service]}]})
+
+    assert errors == [
+        'loadbalancers[0].name: field is required.',
+        'loadbalancers[0].services[0].port: port 0 must be between 1 and 65535.',
+    ]
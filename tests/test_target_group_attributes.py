@@ -0,0 +1,112 @@
+import pytest
+
+from aws_alb.params.target_group_attributes import TargetGroupAttributes
+from aws_alb.params.target_group_params import TargetGroupParams
+
+
+def test_defaults_render_no_attributes():
+    assert TargetGroupAttributes().to_dict() == {}
+
+
+def test_all_attributes_are_rendered():
+    attributes = TargetGroupAttributes(
+        load_balancing_algorithm='round_robin',
+        slow_start_duration_seconds=60,
+        deregistration_delay_seconds=30,
+        stickiness_enabled=True,
+        stickiness_type='app_cookie',
+        stickiness_duration_seconds=3600,
+        stickiness_cookie_name='session',
+        cross_zone_enabled=False,
+    )
+
+    assert attributes.to_dict() == {
+        'load_balancing.algorithm.type': 'round_robin',
+        'slow_start.duration_seconds': '60',
+        'deregistration_delay.timeout_seconds': '30',
+        'stickiness.enabled': 'true',
+        'stickiness.type': 'app_cookie',
+        'stickiness.app_cookie.duration_seconds': '3600',
+        'stickiness.app_cookie.cookie_name': 'session',
+        'load_balancing.cross_zone.enabled': 'false',
+    }
+
+
+def test_load_balancer_cookie_is_the_default_stickiness_type():
+    attributes = TargetGroupAttributes(stickiness_enabled=True, stickiness_duration_seconds=60)
+
+    assert attributes.to_dict() == {
+        'stickiness.enabled': 'true',
+        'stickiness.type': 'lb_cookie',
+        'stickiness.lb_cookie.duration_seconds': '60',
+    }
+
+
+@pytest.mark.parametrize('kwargs, message', [
+    (
+        dict(load_balancing_algorithm='least_outstanding_requests', slow_start_duration_seconds=30),
+        'Slow start can not be combined with least outstanding requests algorithm'
+    ),
+    (
+        dict(stickiness_enabled=True, stickiness_type='app_cookie'),
+        'Application cookie stickiness requires a cookie name'
+    ),
+    (
+        dict(stickiness_enabled=True, stickiness_type='app_cookie', stickiness_cookie_name='AWSALBsession'),
+        'Cookie name can not start with any of'
+    ),
+    (
+        dict(stickiness_enabled=True, stickiness_type='app_cookie', stickiness_cookie_name='AWSALBTGsession'),
+        'Cookie name can not start with any of'
+    ),
+    (
+        dict(stickiness_enabled=True, stickiness_cookie_name='session'),
+        'Cookie name is only supported for app_cookie stickiness'
+    ),
+    (dict(stickiness_type='lb_cookie'), 'Stickiness settings require stickiness to be enabled'),
+    (dict(load_balancing_algorithm='random'), 'Load balancing algorithm must be one of'),
+    (dict(slow_start_duration_seconds=10), 'Slow start duration must be 0 or between 30 and 900 seconds'),
+    (dict(deregistration_delay_seconds=3601), 'Deregistration delay must be between 0 and 3600 seconds'),
+])
+def test_invalid_attributes(kwargs, message):
+    attributes = TargetGroupAttributes(**kwargs)
+
+    with pytest.raises(AssertionError, match=message):
+        attributes.validate()
+
+    # Attributes are validated before they are rendered as well.
+    with pytest.raises(AssertionError, match=message):
+        attributes.to_dict()
+
+
+def test_disabled_slow_start_can_be_combined_with_least_outstanding_requests():
+    attributes = TargetGroupAttributes(
+        load_balancing_algorithm='least_outstanding_requests',
+        slow_start_duration_seconds=0
+    )
+
+    assert attributes.to_dict() == {
+        'load_balancing.algorithm.type': 'least_outstanding_requests',
+        'slow_start.duration_seconds': '0',
+    }
+
+
+def test_attributes_are_rendered_in_the_template(stack, synth):
+    from aws_alb.factories.target_group_factory import TargetGroupFactory
+
+    scope, vpc = stack
+    attributes = TargetGroupAttributes(
+        load_balancing_algorithm='least_outstanding_requests',
+        deregistration_delay_seconds=10,
+        stickiness_enabled=True,
+    )
+    TargetGroupFactory(scope).create_target_group(TargetGroupParams('Api', vpc, attributes=attributes))
+
+    properties = synth(scope)['Resources']['ApiTargetGroup']['Properties']
+
+    assert properties['TargetGroupAttributes'] == [
+        {'Key': 'load_balancing.algorithm.type', 'Value': 'least_outstanding_requests'},
+        {'Key': 'deregistration_delay.timeout_seconds', 'Value': '10'},
+        {'Key': 'stickiness.enabled', 'Value': 'true'},
+        {'Key': 'stickiness.type', 'Value': 'lb_cookie'},
+    ]
@@ -0,0 +1,125 @@
+from random import Random
+
+import pytest
+
+from aws_alb.loadtest.stand_in_target import StandInTarget
+from aws_alb.loadtest.target_group_model import TargetGroupModel
+from aws_alb.params.target_group_attributes import TargetGroupAttributes
+from aws_alb.params.target_group_params import TargetGroupParams
+
+
+class StartedTarget(StandInTarget):
+    """
+    Stand-in target which is considered running without listening on a port.
+    """
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.stopped = False
+
+    @property
+    def running(self) -> bool:
+        return not self.stopped
+
+
+def model(*names, **kwargs):
+    return TargetGroupModel('Blue', [StartedTarget(name) for name in names], **kwargs)
+
+
+def choices(group, now, count=10000, seed=7):
+    random = Random(seed)
+    chosen = [group.choose_target(now, random) for _ in range(count)]
+
+    return {target.name if target else None: chosen.count(target) for target in set(chosen)}
+
+
+def test_unregistered_targets_receive_no_traffic():
+    group = model('A', 'B')
+
+    assert group.target_weight(0, 100.0) == 0.0
+    assert group.choose_target(100.0, Random(1)) is None
+
+
+def test_targets_without_slow_start_share_traffic_equally():
+    group = model('A', 'B')
+    group.register(now=0.0)
+
+    assert [group.target_weight(index, 0.0) for index in range(2)] == [1.0, 1.0]
+
+    counts = choices(group, now=0.0)
+    assert set(counts) == {'A', 'B'}
+    assert 4800 <= counts['A'] <= 5200
+
+
+def test_slow_start_ramps_weight_up_linearly():
+    group = model('A', slow_start_seconds=100.0)
+    group.register(now=10.0)
+
+    assert group.target_weight(0, 5.0) == 0.0
+    # A target gets a minimal share right after the registration.
+    assert group.target_weight(0, 10.0) == 0.01
+    assert group.target_weight(0, 35.0) == pytest.approx(0.25)
+    assert group.target_weight(0, 60.0) == pytest.approx(0.5)
+    assert group.target_weight(0, 110.0) == 1.0
+    assert group.target_weight(0, 500.0) == 1.0
+
+
+def test_target_in_slow_start_receives_a_growing_share():
+    group = model('Old', 'New', slow_start_seconds=100.0)
+    group.register(now=0.0, interval_seconds=100.0)
+
+    # The old target has completed its slow start when the new one is registered.
+    assert group.choose_target(50.0, Random(1)).name == 'Old'
+
+    early = choices(group, now=110.0)
+    late = choices(group, now=175.0)
+
+    # Weights 1 and 0.1 give the new target about 9% of requests, weights 1 and 0.75 about 43%.
+    assert 700 <= early['New'] <= 1100
+    assert 4000 <= late['New'] <= 4600
+    assert late['New'] > early['New']
+
+
+def test_choices_are_repeatable_with_a_seed():
+    group = model('A', 'B', 'C', slow_start_seconds=30.0)
+    group.register(now=0.0, interval_seconds=10.0)
+
+    assert choices(group, now=25.0, count=100, seed=3) == choices(group, now=25.0, count=100, seed=3)
+
+
+def test_no_target_is_chosen_after_deregistration():
+    group = model('A', 'B')
+    group.register(now=0.0)
+    group.deregister(now=60.0)
+
+    assert group.choose_target(59.9, Random(1)) is not None
+    assert group.choose_target(60.0, Random(1)) is None
+    assert choices(group, now=1000.0, count=100) == {None: 100}
+
+
+def test_stopped_targets_receive_no_traffic():
+    group = model('A', 'B')
+    group.register(now=0.0)
+    group.targets[0].stopped = True
+
+    assert group.target_weight(0, 1.0) == 0.0
+    assert choices(group, now=1.0, count=100) == {'B': 100}
+
+
+def test_from_params_divides_delays_by_time_scale():
+    params = TargetGroupParams(
+        'Api',
+        None,
+        attributes=TargetGroupAttributes(slow_start_duration_seconds=120, deregistration_delay_seconds=60)
+    )
+
+    group = TargetGroupModel.from_params('Blue', params, [StartedTarget('A')], time_scale=60.0)
+
+    assert group.slow_start_seconds == 2.0
+    assert group.deregistration_delay_seconds == 1.0
+
+
+def test_from_params_uses_aws_defaults():
+    group = TargetGroupModel.from_params('Blue', TargetGroupParams('Api', None), [StartedTarget('A')], time_scale=10.0)
+
+    assert group.slow_start_seconds == 0.0
+    assert group.deregistration_delay_seconds == TargetGroupModel.DEFAULT_DEREGISTRATION_DELAY_SECONDS / 10.0
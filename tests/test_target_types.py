@@ -0,0 +1,111 @@
+import pytest
+
+from aws_alb.health_check_calculator import HealthCheckCalculator
+from aws_alb.params.target_group_attributes import TargetGroupAttributes
+from aws_alb.params.target_group_params import TargetGroupParams
+from conftest import resources_of_type
+
+FUNCTION_ARN = 'arn:aws:lambda:eu-west-1:111111111111:function:api'
+
+
+def create(stack, **kwargs):
+    from aws_alb.factories.target_group_factory import TargetGroupFactory
+
+    scope, vpc = stack
+    return TargetGroupFactory(scope).create_target_group(TargetGroupParams('Api', vpc, **kwargs))
+
+
+def lambda_target_group(stack, synth, **kwargs):
+    create(stack, target_type='lambda', lambda_function_arn=FUNCTION_ARN, **kwargs)
+    template = synth(stack[0])
+
+    return template, template['Resources']['ApiTargetGroup']
+
+
+def test_lambda_target_group_has_no_port_protocol_or_vpc(stack, synth):
+    _, target_group = lambda_target_group(stack, synth)
+    properties = target_group['Properties']
+
+    assert properties['TargetType'] == 'lambda'
+    assert properties['Targets'] == [{'Id': FUNCTION_ARN}]
+    assert not {'Port', 'Protocol', 'VpcId'} & set(properties)
+
+
+def test_lambda_health_checks_are_disabled_by_default(stack, synth):
+    _, target_group = lambda_target_group(stack, synth)
+    properties = target_group['Properties']
+
+    # Health checks of lambda target groups are disabled by AWS unless enabled explicitly.
+    assert 'HealthCheckEnabled' not in properties
+    assert not {
+        'HealthCheckPath', 'Matcher', 'HealthCheckIntervalSeconds', 'HealthCheckTimeoutSeconds'
+    } & set(properties)
+
+
+def test_enabled_lambda_health_checks_use_lambda_defaults(stack, synth):
+    _, target_group = lambda_target_group(stack, synth, health_check_enabled=True)
+    properties = target_group['Properties']
+
+    assert properties['HealthCheckEnabled'] is True
+    assert properties['HealthCheckIntervalSeconds'] == HealthCheckCalculator.DEFAULT_LAMBDA_INTERVAL_SECONDS
+    assert properties['HealthCheckTimeoutSeconds'] == HealthCheckCalculator.DEFAULT_LAMBDA_TIMEOUT_SECONDS
+    assert properties['HealthCheckPath'] == '/'
+    assert properties['Matcher'] == {'HttpCode': '200'}
+
+
+def test_lambda_multi_value_headers_attribute(stack, synth):
+    attributes = TargetGroupAttributes(lambda_multi_value_headers_enabled=True)
+    _, target_group = lambda_target_group(stack, synth, attributes=attributes)
+
+    assert target_group['Properties']['TargetGroupAttributes'] == [
+        {'Key': 'lambda.multi_value_headers.enabled', 'Value': 'true'}
+    ]
+
+
+def test_lambda_invoke_permission_is_scoped_to_the_account(stack, synth):
+    template, target_group = lambda_target_group(stack, synth)
+    (logical_id, permission), = resources_of_type(template, 'AWS::Lambda::Permission').items()
+
+    assert permission['Properties'] == {
+        'Action': 'lambda:InvokeFunction',
+        'FunctionName': FUNCTION_ARN,
+        'Principal': 'elasticloadbalancing.amazonaws.com',
+        'SourceAccount': '111111111111',
+    }
+    assert target_group['DependsOn'] == [logical_id]
+
+
+def test_static_instance_targets(stack, synth):
+    create(stack, target_type='instance', targets=['i-0123456789abcdef0', ('i-0fedcba9876543210', 8080)])
+    properties = synth(stack[0])['Resources']['ApiTargetGroup']['Properties']
+
+    assert properties['TargetType'] == 'instance'
+    assert properties['Port'] == 80
+    assert properties['Targets'] == [
+        {'Id': 'i-0123456789abcdef0'},
+        {'Id': 'i-0fedcba9876543210', 'Port': 8080},
+    ]
+
+
+def test_ip_target_groups_have_no_invoke_permission(stack, synth):
+    create(stack)
+    template = synth(stack[0])
+
+    assert not resources_of_type(template, 'AWS::Lambda::Permission')
+    assert 'Targets' not in template['Resources']['ApiTargetGroup']['Properties']
+
+
+@pytest.mark.parametrize('kwargs, message', [
+    ({'target_type': 'lambda'}, 'require a function arn'),
+    ({'target_type': 'lambda', 'lambda_function_arn': FUNCTION_ARN, 'targets': ['i-1']}, 'can not have static targets'),
+    ({'lambda_function_arn': FUNCTION_ARN}, 'only by lambda target groups'),
+    ({'target_type': 'instance', 'health_check_enabled': False}, 'can not be disabled'),
+])
+def test_invalid_target_configurations(stack, kwargs, message):
+    with pytest.raises(AssertionError, match=message):
+        create(stack, **kwargs)
+
+
+def test_multi_value_headers_require_lambda_targets(stack):
+    with pytest.raises(AssertionError, match='only by lambda targets'):
+        create(stack, attributes=TargetGroupAttributes(lambda_multi_value_headers_enabled=True))
@@ -0,0 +1,82 @@
+from aws_alb.params.template_budget_params import TemplateBudgetParams
+from aws_alb.template_budget_analyzer import TemplateBudgetAnalyzer
+
+
+def analyze(resources):
+    return TemplateBudgetAnalyzer(TemplateBudgetParams()).analyze({'Resources': resources}, 'Test')
+
+
+def security_group(*ingress):
+    return {
+        'Type': 'AWS::EC2::SecurityGroup',
+        'Properties': {'GroupDescription': 'Test', 'SecurityGroupIngress': list(ingress)},
+    }
+
+
+def loadbalancer(*security_groups):
+    return {
+        'Type': 'AWS::ElasticLoadBalancingV2::LoadBalancer',
+        'Properties': {'SecurityGroups': [{'Fn::GetAtt': [group, 'GroupId']} for group in security_groups]},
+    }
+
+
+def ingress(group, port):
+    return {
+        'Type': 'AWS::EC2::SecurityGroupIngress',
+        'Properties': {
+            'GroupId': {'Fn::GetAtt': [group, 'GroupId']},
+            'IpProtocol': 'tcp',
+            'FromPort': port,
+            'ToPort': port,
+            'CidrIp': '0.0.0.0/0',
+        },
+    }
+
+
+def test_standalone_ingress_belongs_to_loadbalancer_of_its_security_group():
+    report = analyze({
+        'Cert': {'Type': 'AWS::CertificateManager::Certificate', 'Properties': {'DomainName': 'example.com'}},
+        'Lb': loadbalancer('LbSg'),
+        'LbSg': security_group(),
+        'LbSgIn80': ingress('LbSg', 80),
+    })
+
+    usage = report.loadbalancers['Lb']
+
+    assert sorted(usage.resources) == ['Lb', 'LbSg', 'LbSgIn80']
+    assert usage.security_group_rules == 1
+    assert report.unattributed == ['Cert']
+
+
+def test_security_group_of_many_loadbalancers_is_shared_with_its_rules():
+    report = analyze({
+        'Lb1': loadbalancer('Sg'),
+        'Lb2': loadbalancer('Sg'),
+        'Sg': security_group(),
+        'SgIn80': ingress('Sg', 80),
+    })
+
+    assert report.unattributed == ['Sg', 'SgIn80']
+    assert report.loadbalancers['Lb1'].resources == ['Lb1']
+    assert report.loadbalancers['Lb2'].resources == ['Lb2']
+
+
+def test_listener_resources_are_attributed_to_listener_and_loadbalancer():
+    report = analyze({
+        'Lb': loadbalancer('LbSg'),
+        'LbSg': security_group({'IpProtocol': 'tcp', 'FromPort': 443, 'ToPort': 443, 'CidrIp': '0.0.0.0/0'}),
+        'Listener': {
+            'Type': 'AWS::ElasticLoadBalancingV2::Listener',
+            'Properties': {'LoadBalancerArn': {'Ref': 'Lb'}, 'Port': 443, 'DefaultActions': []},
+        },
+        'Rule': {
+            'Type': 'AWS::ElasticLoadBalancingV2::ListenerRule',
+            'Properties': {'ListenerArn': {'Ref': 'Listener'}, 'Priority': 1, 'Actions': [], 'Conditions': []},
+        },
+    })
+
+    assert sorted(report.listeners['Listener'].resources) == ['Listener', 'Rule']
+    assert report.listeners['Listener'].listener_rules == 1
+    assert sorted(report.loadbalancers['Lb'].resources) == ['Lb', 'LbSg', 'Listener', 'Rule']
+    assert report.loadbalancers['Lb'].security_group_rules == 1
+    assert report.unattributed == []
@@ -0,0 +1,27 @@
+import pytest
+
+from aws_alb.traffic_shift_enum import TrafficShiftEnum
+from aws_alb.traffic_shift_schedule import TrafficShiftSchedule
+
+
+def test_linear_schedule():
+    assert TrafficShiftSchedule.create_steps(4) == [(75, 25), (50, 50), (25, 75), (0, 100)]
+
+
+def test_exponential_schedule():
+    assert TrafficShiftSchedule.create_steps(5, TrafficShiftEnum.EXPONENTIAL) == [
+        (94, 6), (88, 12), (75, 25), (50, 50), (0, 100)
+    ]
+
+
+def test_every_step_shifts_traffic():
+    weights = TrafficShiftSchedule.create_steps(10, TrafficShiftEnum.EXPONENTIAL)
+
+    assert [green for _, green in weights] == sorted({green for _, green in weights})
+    assert weights[-1] == (0, 100)
+
+
+@pytest.mark.parametrize('steps', [0, 101])
+def test_invalid_number_of_steps_is_rejected(steps):
+    with pytest.raises(AssertionError):
+        TrafficShiftSchedule.create_steps(steps)